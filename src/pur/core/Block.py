@@ -2,7 +2,6 @@
 # Distributed under the MIT software license, see the accompanying
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 from collections import OrderedDict
-from statistics import median
 from typing import Optional
 
 from google.protobuf.json_format import MessageToJson, Parse
@@ -176,6 +175,10 @@ class Block(object):
         self._data.header.MergeFrom(self.blockheader.pbdata)
 
     def validate(self, chain_manager, future_blocks: OrderedDict) -> bool:
+        """
+        Validates the block against its parent, except the PoW, which is verified
+        by the caller, usually on the VerificationPool.
+        """
         if chain_manager.get_block_is_duplicate(self):
             logger.warning('Duplicate Block #%s %s', self.block_number, bin2hstr(self.headerhash))
             return False
@@ -196,10 +199,6 @@ class Block(object):
             logger.warning('Failed to validate blocks parent child relation')
             return False
 
-        if not chain_manager.validate_mining_nonce(self.blockheader, dev_config):
-            logger.warning('Failed PoW Validation')
-            return False
-
         if len(self.transactions) == 0:
             return False
 
@@ -270,39 +269,61 @@ class Block(object):
         return None
 
     @staticmethod
-    def get_block_size_limit(state: State, block, dev_config: DevConfig):
-        # NOTE: Miner
-        block_size_list = []
-        for _ in range(0, 10):
-            block = Block.get_block(state, block.prev_headerhash)
-            if not block:
-                return None
-            block_size_list.append(block.size)
-            if block.block_number == 0:
-                break
-        return max(dev_config.block_min_size_limit_in_bytes, dev_config.size_multiplier * median(block_size_list))
+    def generate_block_number_key(block_number: int) -> bytes:
+        """
+        Mainchain index key, fixed width big-endian so that the keys are
+        iterated in the block number order.
+        """
+        return b'block_number_' + block_number.to_bytes(8, byteorder='big', signed=False)
 
     @staticmethod
     def remove_blocknumber_mapping(state: State, block_number, batch):
-        state._db.delete(str(block_number).encode(), batch)
+        state._db.delete(Block.generate_block_number_key(block_number), batch)
 
     @staticmethod
     def put_block_number_mapping(state: State, block_number: int, block_number_mapping, batch):
-        state._db.put_raw(str(block_number).encode(), MessageToJson(block_number_mapping, sort_keys=True).encode(), batch)
+        state._db.put_raw(Block.generate_block_number_key(block_number), block_number_mapping.headerhash, batch)
 
     @staticmethod
     def get_block_number_mapping(state: State, block_number: int):
+        try:
+            data = state._db.get_raw(Block.generate_block_number_key(block_number))
+            return pur_pb2.BlockNumberMapping(headerhash=bytes(data))
+        except KeyError:
+            logger.debug('[get_block_number_mapping] Block #%s not found', block_number)
+        except Exception as e:
+            logger.error('[get_block_number_mapping] %s', e)
+
+        return None
+
+    @staticmethod
+    def get_legacy_block_number_mapping(state: State, block_number: int):
+        """
+        Reads the block number mapping stored as json by the State Version 2 and older.
+        """
         try:
             data = state._db.get_raw(str(block_number).encode())
             block_number_mapping = pur_pb2.BlockNumberMapping()
             return Parse(data, block_number_mapping)
         except KeyError:
-            logger.debug('[get_block_number_mapping] Block #%s not found', block_number)
+            logger.debug('[get_legacy_block_number_mapping] Block #%s not found', block_number)
         except Exception as e:
-            logger.error('[get_block_number_mapping] %s', e)
+            logger.error('[get_legacy_block_number_mapping] %s', e)
 
         return None
 
+    @staticmethod
+    def get_headerhashes(state: State, start_block_number: int, end_block_number: int) -> list:
+        """
+        Returns the mainchain headerhashes from start_block_number to end_block_number
+        included, read with a single iterator over the mainchain index.
+        """
+        if end_block_number < start_block_number:
+            return []
+        iterator = state._db.get_range_iterator(Block.generate_block_number_key(start_block_number),
+                                                Block.generate_block_number_key(end_block_number))
+        return [bytes(headerhash) for _, headerhash in iterator]
+
     @staticmethod
     def get_block_by_number(state: State, block_number: int):
         block_number_mapping = Block.get_block_number_mapping(state, block_number)
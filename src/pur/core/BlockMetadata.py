@@ -46,6 +46,25 @@ class BlockMetadata(object):
     def last_N_headerhashes(self):
         return self._data.last_N_headerhashes
 
+    @property
+    def timestamp(self):
+        return self._data.timestamp
+
+    @property
+    def last_N_timestamps(self):
+        return self._data.last_N_timestamps
+
+    @property
+    def has_last_N_timestamps(self) -> bool:
+        """
+        False for the block metadata stored by the older versions, without the timestamps.
+        """
+        return self._data.timestamp > 0 and len(self._data.last_N_timestamps) == len(self._data.last_N_headerhashes)
+
+    @property
+    def last_N_block_sizes(self):
+        return self._data.last_N_block_sizes
+
     def set_block_difficulty(self, value):
 
         if len(value) != 32:
@@ -74,6 +93,23 @@ class BlockMetadata(object):
                             len(self._data.last_N_headerhashes),
                             config.dev.N_measurement)
 
+    def set_timestamp(self, value: int):
+        self._data.timestamp = value
+
+    def update_last_timestamps(self, parent_last_N_timestamps, last_timestamp: int):
+        del self._data.last_N_timestamps[:]
+        self._data.last_N_timestamps.extend(parent_last_N_timestamps)
+        self._data.last_N_timestamps.append(last_timestamp)
+        if len(self._data.last_N_timestamps) > config.dev.N_measurement:
+            del self._data.last_N_timestamps[0]
+
+    def update_last_block_sizes(self, parent_last_N_block_sizes, block_size: int, number_of_blocks: int):
+        del self._data.last_N_block_sizes[:]
+        self._data.last_N_block_sizes.extend(parent_last_N_block_sizes)
+        self._data.last_N_block_sizes.append(block_size)
+        if len(self._data.last_N_block_sizes) > number_of_blocks:
+            del self._data.last_N_block_sizes[:len(self._data.last_N_block_sizes) - number_of_blocks]
+
     @staticmethod
     def create(block_difficulty=bytes([0] * 32),
                cumulative_difficulty=bytes([0] * 32),
@@ -6,6 +6,7 @@ import threading
 from collections import OrderedDict
 from typing import Optional, Tuple
 from math import ceil
+from statistics import median
 
 import functools
 from pypurlib.pypurlib import bin2hstr
@@ -24,6 +25,7 @@ from pur.core.PaginatedData import PaginatedData
 from pur.core.PaginatedBitfield import PaginatedBitfield
 from pur.core.Indexer import Indexer
 from pur.core.Block import Block
+from pur.core.ChainSnapshot import ChainSnapshot
 from pur.core.BlockMetadata import BlockMetadata
 from pur.core.DifficultyTracker import DifficultyTracker
 from pur.core.GenesisBlock import GenesisBlock
@@ -37,6 +39,8 @@ from pur.core.txs.TransferTokenTransaction import TransferTokenTransaction
 from pur.core.txs.multisig.MultiSigVote import MultiSigVote
 from pur.core.TransactionPool import TransactionPool
 from pur.core.misc import logger
+from pur.core.misc.lru_cache import LRUCache
+from pur.core.notification.Subscriptions import SubscriptionManager
 from pur.crypto.Qryptonight import Qryptonight
 from pur.generated import pur_pb2, purstateinfo_pb2
 
@@ -51,6 +55,24 @@ class ChainManager:
         self.trigger_miner = False
         self.lock = threading.RLock()
 
+        # Read-through cache of decoded blocks, block metadata and block number mappings.
+        # Keys written to a batch are invalidated and kept in _pending_cache_keys
+        # until the batch is written, so that the cache never serves stale data.
+        self._block_cache = LRUCache(config.user.block_cache_size)
+        self._pending_cache_keys = set()
+
+        # Read only view of the chain served to the public API without taking the lock,
+        # replaced each time a block has been added.
+        self._snapshot = None
+
+        # Events for the subscribers of the public API. Events queued while applying a block
+        # are kept with their batch in _pending_events, moved to _committed_events once the
+        # batch is written and published once the snapshot has been updated.
+        self.subscriptions = SubscriptionManager(config.user.public_api_max_subscribers,
+                                                 config.user.public_api_subscriber_queue_size)
+        self._pending_events = []
+        self._committed_events = []
+
     @property
     def re_org_limit(self):
         with self.lock:
@@ -68,29 +90,168 @@ class ChainManager:
         with self.lock:
             return self._last_block
 
+    @property
+    def snapshot(self) -> Optional[ChainSnapshot]:
+        return self._snapshot
+
+    def _update_snapshot(self):
+        self._snapshot = ChainSnapshot(self._state, self._last_block)
+
     @property
     def total_coin_supply(self):
         with self.lock:
             return self._state.total_coin_supply
 
+    def get_block_cache_stats(self) -> dict:
+        with self.lock:
+            return self._block_cache.get_stats()
+
+    def _invalidate_cache(self, key, batch):
+        self._block_cache.remove(key)
+        if batch is not None:
+            self._pending_cache_keys.add(key)
+
+    def _write_batch(self, batch):
+        self._state.write_batch(batch)
+        for key in self._pending_cache_keys:
+            self._block_cache.remove(key)
+        self._pending_cache_keys.clear()
+        if self._pending_events:
+            self._committed_events.extend(event[1:] for event in self._pending_events if event[0] is batch)
+            self._pending_events = [event for event in self._pending_events if event[0] is not batch]
+
+    def _queue_block_events(self, block: Block, added: bool, batch):
+        if self.subscriptions.has_subscribers(SubscriptionManager.TOPIC_BLOCKS):
+            event_type = pur_pb2.SubscribeBlocksResp.ADDED if added else pur_pb2.SubscribeBlocksResp.REMOVED
+            event = pur_pb2.SubscribeBlocksResp(event_type=event_type, header=block.blockheader.pbdata)
+            self._pending_events.append((batch, SubscriptionManager.TOPIC_BLOCKS, event, None))
+
+        if self.subscriptions.has_subscribers(SubscriptionManager.TOPIC_ADDRESSES):
+            event_type = pur_pb2.SubscribeAddressesResp.ADDED if added else pur_pb2.SubscribeAddressesResp.REMOVED
+            for proto_tx in block.transactions:
+                addresses_set = set()
+                Transaction.from_pbdata(proto_tx).set_affected_address(addresses_set)
+                event = pur_pb2.SubscribeAddressesResp(event_type=event_type,
+                                                       addresses=sorted(addresses_set),
+                                                       tx=proto_tx,
+                                                       header=block.blockheader.pbdata)
+                self._pending_events.append((batch, SubscriptionManager.TOPIC_ADDRESSES, event, addresses_set))
+
+    def _publish_events(self):
+        events = self._committed_events
+        self._committed_events = []
+        # Events of the batches that have not been written belong to failed blocks
+        self._pending_events = []
+        for topic, event, addresses in events:
+            self.subscriptions.publish(topic, event, addresses)
+
+    def publish_pool_transaction(self, tx: Transaction):
+        """
+        Publishes a transaction that has been added to the transaction pool.
+        """
+        if self.subscriptions.has_subscribers(SubscriptionManager.TOPIC_MEMPOOL):
+            self.subscriptions.publish(SubscriptionManager.TOPIC_MEMPOOL,
+                                       pur_pb2.SubscribeMempoolResp(tx=tx.pbdata))
+
+        if self.subscriptions.has_subscribers(SubscriptionManager.TOPIC_ADDRESSES):
+            addresses_set = set()
+            tx.set_affected_address(addresses_set)
+            event = pur_pb2.SubscribeAddressesResp(event_type=pur_pb2.SubscribeAddressesResp.MEMPOOL,
+                                                   addresses=sorted(addresses_set),
+                                                   tx=tx.pbdata)
+            self.subscriptions.publish(SubscriptionManager.TOPIC_ADDRESSES, event, addresses_set)
+
+    def _get_block(self, header_hash: bytes) -> Optional[Block]:
+        block = self._block_cache.get(header_hash)
+        if block is None:
+            block = Block.get_block(self._state, header_hash)
+            self._cache_block(header_hash, block)
+        return block
+
+    def _cache_block(self, header_hash: bytes, block: Optional[Block]):
+        if block is None or header_hash in self._pending_cache_keys:
+            return
+        if not isinstance(block.pbdata, pur_pb2.Block) or block.headerhash != header_hash:
+            return
+        self._block_cache.put(header_hash, block, block.size)
+
+    def _get_block_metadata(self, header_hash: bytes) -> Optional[BlockMetadata]:
+        # BlockMetadata is updated in place by its callers, so only its protobuf is cached
+        # and a new copy is returned every time.
+        key = b'metadata_' + header_hash
+        pbdata = self._block_cache.get(key)
+        if pbdata is None:
+            block_metadata = BlockMetadata.get_block_metadata(self._state, header_hash)
+            if block_metadata is None or not isinstance(block_metadata.pbdata, pur_pb2.BlockMetaData):
+                return block_metadata
+            pbdata = block_metadata.pbdata
+            if key not in self._pending_cache_keys:
+                cached_pbdata = pur_pb2.BlockMetaData()
+                cached_pbdata.CopyFrom(pbdata)
+                self._block_cache.put(key, cached_pbdata, pbdata.ByteSize())
+            return block_metadata
+
+        block_metadata_pbdata = pur_pb2.BlockMetaData()
+        block_metadata_pbdata.CopyFrom(pbdata)
+        return BlockMetadata(block_metadata_pbdata)
+
+    def _put_block_metadata(self, header_hash: bytes, block_metadata: BlockMetadata, batch):
+        self._invalidate_cache(b'metadata_' + header_hash, batch)
+        BlockMetadata.put_block_metadata(self._state, header_hash, block_metadata, batch)
+
+    def _get_block_number_mapping(self, block_number: int):
+        block_number_mapping = self._block_cache.get(block_number)
+        if block_number_mapping is None:
+            block_number_mapping = Block.get_block_number_mapping(self._state, block_number)
+            if isinstance(block_number_mapping, pur_pb2.BlockNumberMapping) and \
+                    block_number not in self._pending_cache_keys:
+                self._block_cache.put(block_number, block_number_mapping, block_number_mapping.ByteSize())
+        return block_number_mapping
+
+    def _put_block_number_mapping(self, block_number: int, block_number_mapping, batch):
+        self._invalidate_cache(block_number, batch)
+        Block.put_block_number_mapping(self._state, block_number, block_number_mapping, batch)
+
+    def _remove_block_number_mapping(self, block_number: int, batch):
+        self._invalidate_cache(block_number, batch)
+        Block.remove_blocknumber_mapping(self._state, block_number, batch)
+
+    def _get_block_by_number(self, block_number: int) -> Optional[Block]:
+        if block_number in self._block_cache:
+            return self._get_block(self._get_block_number_mapping(block_number).headerhash)
+
+        block = Block.get_block_by_number(self._state, block_number)
+        if block is not None:
+            self._cache_block(block.headerhash, block)
+        return block
+
+    def _get_block_header_hash_by_number(self, block_number: int) -> Optional[bytes]:
+        block_number_mapping = self._get_block_number_mapping(block_number)
+        if not block_number_mapping:
+            return None
+        return block_number_mapping.headerhash
+
     def get_cumulative_difficulty(self):
         with self.lock:
-            last_block_metadata = BlockMetadata.get_block_metadata(self._state,
-                                                                   self._last_block.headerhash)
+            last_block_metadata = self._get_block_metadata(self._last_block.headerhash)
             return last_block_metadata.cumulative_difficulty
 
     def get_block_by_number(self, block_number) -> Optional[Block]:
         with self.lock:
-            return Block.get_block_by_number(self._state, block_number)
+            return self._get_block_by_number(block_number)
 
     def get_block_header_hash_by_number(self, block_number) -> Optional[bytes]:
         with self.lock:
-            return Block.get_block_header_hash_by_number(self._state,
-                                                         block_number)
+            return self._get_block_header_hash_by_number(block_number)
+
+    def get_block_header_hashes_by_number(self, block_numbers) -> dict:
+        with self.lock:
+            return {block_number: self._get_block_header_hash_by_number(block_number)
+                    for block_number in set(block_numbers)}
 
     def get_block(self, header_hash: bytes) -> Optional[Block]:
         with self.lock:
-            return Block.get_block(self._state, header_hash)
+            return self._get_block(header_hash)
 
     def get_address_balance(self, address: bytes) -> int:
         with self.lock:
@@ -106,7 +267,7 @@ class ChainManager:
         This should only be used by API.
         """
         optimized_address_state = self.get_optimized_address_state(address)
-        ots_bitfield = [b'\x00'] * max(1024, int(ceil((2 ** optimized_address_state.height) / 8)))
+        ots_bitfield = bytearray(max(1024, int(ceil((2 ** optimized_address_state.height) / 8))))
         transaction_hashes = list()
         tokens = OrderedDict()
         slave_pks_access_type = OrderedDict()
@@ -114,13 +275,9 @@ class ChainManager:
         max_bitfield_page = ceil((2 ** optimized_address_state.height) / config.dev.ots_tracking_per_page)
 
         for page in range(1, max_bitfield_page + 1):
-            offset = (page - 1) * config.dev.ots_tracking_per_page
-            page_data = self.get_bitfield(address, page)
-            for data in page_data:
-                if offset >= len(ots_bitfield):
-                    break
-                ots_bitfield[offset] = data
-                offset += 1
+            offset = (page - 1) * config.dev.ots_bitfield_size
+            page_data = self.get_bitfield(address, page)[:max(0, len(ots_bitfield) - offset)]
+            ots_bitfield[offset:offset + len(page_data)] = page_data
 
         max_transaction_hash_page = ceil(optimized_address_state.transaction_hash_count() / config.dev.data_per_page)
 
@@ -154,7 +311,7 @@ class ChainManager:
         addr_state = AddressState.create(address=optimized_address_state.address,
                                          nonce=optimized_address_state.nonce,
                                          balance=optimized_address_state.balance,
-                                         ots_bitfield=ots_bitfield,
+                                         ots_bitfield=[ots_bitfield[i:i + 1] for i in range(len(ots_bitfield))],
                                          tokens=tokens,
                                          slave_pks_access_type=slave_pks_access_type,
                                          ots_counter=0)
@@ -166,6 +323,10 @@ class ChainManager:
         with self.lock:
             return OptimizedAddressState.get_optimized_address_state(self._state, address)
 
+    def get_optimized_addresses_state(self, addresses: list) -> list:
+        with self.lock:
+            return OptimizedAddressState.get_optimized_addresses_state(self._state, addresses)
+
     def get_multi_sig_address_state(self, address: bytes) -> MultiSigAddressState:
         with self.lock:
             return MultiSigAddressState.get_multi_sig_address_state_by_address(self._state._db, address)
@@ -221,6 +382,11 @@ class ChainManager:
         with self.lock:
             return p.get_paginated_data(address, item_index)
 
+    def get_paginated_data_reversed(self, name: bytes, address: bytes, end_item_index: int, count: int) -> list:
+        p = PaginatedData(name, False, self._state._db)
+        with self.lock:
+            return p.get_paginated_data_reversed(address, end_item_index, count)
+
     def get_vote_stats(self, multi_sig_spend_txn_hash: bytes) -> VoteStats:
         with self.lock:
             return VoteStats.get_state(state=self._state, shared_key=multi_sig_spend_txn_hash)
@@ -229,7 +395,7 @@ class ChainManager:
         with self.lock:
             return self._state.get_token(address, token_txhash)
 
-    def validate_all(self, tx: Transaction, check_nonce: bool) -> bool:
+    def validate_all(self, tx: Transaction, check_nonce: bool, verify_signature=True) -> bool:
         with self.lock:
             addresses_set = set()
             tx.set_affected_address(addresses_set)
@@ -238,7 +404,7 @@ class ChainManager:
                 return False
             if not self.update_state_container(tx, state_container):
                 return False
-            return tx.validate_all(state_container, check_nonce)
+            return tx.validate_all(state_container, check_nonce, verify_signature)
 
     def validate_tx(self,
                     tx: Transaction,
@@ -257,27 +423,27 @@ class ChainManager:
         with self.lock:
             return TransactionMetadata.get_tx_metadata(self._state, transaction_hash)
 
+    def get_tx_metadata_list(self, transaction_hashes: list) -> list:
+        with self.lock:
+            return TransactionMetadata.get_tx_metadata_list(self._state, transaction_hashes)
+
     def get_last_transactions(self):
         with self.lock:
             return LastTransactions.get_last_txs(self._state)
 
     def get_unconfirmed_transaction(self, transaction_hash) -> list:
         with self.lock:
-            for tx_set in self.tx_pool.transactions:
-                tx = tx_set[1].transaction
-                if tx.txhash == transaction_hash:
-                    return [tx, tx_set[1].timestamp]
-            if transaction_hash in self.tx_pool.pending_tx_pool_hash:
-                for tx_set in self.tx_pool.pending_tx_pool:
-                    tx = tx_set[1].transaction
-                    if tx.txhash == transaction_hash:
-                        return [tx, tx_set[1].timestamp]
-
-            return []
+            tx_info = self.tx_pool.get_tx_info_from_pool(transaction_hash)
+            if tx_info is None:
+                tx_info = self.tx_pool.get_pending_tx_info_from_pool(transaction_hash)
+            if tx_info is None:
+                return []
+
+            return [tx_info.transaction, tx_info.timestamp]
 
     def get_block_metadata(self, header_hash: bytes) -> Optional[BlockMetadata]:
         with self.lock:
-            return BlockMetadata.get_block_metadata(self._state, header_hash)
+            return self._get_block_metadata(header_hash)
 
     def get_blockheader_and_metadata(self, block_number=0) -> Tuple:
         with self.lock:
@@ -302,13 +468,36 @@ class ChainManager:
                                                last_block,
                                                last_block_metadata.block_difficulty)
 
+    def _get_last_block_sizes(self, block: Block, dev_config: DevConfig) -> Optional[list]:
+        """
+        Returns the sizes of the last number_of_blocks_to_analyze blocks before the block,
+        from the block metadata of its parent. Loads the blocks only if the parent
+        metadata has been stored by an older version, without the block sizes.
+        """
+        parent_metadata = self._get_block_metadata(block.prev_headerhash)
+        if parent_metadata and parent_metadata.last_N_block_sizes:
+            return list(parent_metadata.last_N_block_sizes)[-dev_config.number_of_blocks_to_analyze:]
+
+        block_size_list = []
+        for _ in range(0, dev_config.number_of_blocks_to_analyze):
+            block = self._get_block(block.prev_headerhash)
+            if not block:
+                return None
+            block_size_list.insert(0, block.size)
+            if block.block_number == 0:
+                break
+        return block_size_list
+
     def get_block_size_limit(self, block: Block, dev_config: DevConfig):
         with self.lock:
-            return Block.get_block_size_limit(self._state, block, dev_config)
+            block_size_list = self._get_last_block_sizes(block, dev_config)
+            if not block_size_list:
+                return None
+            return max(dev_config.block_min_size_limit_in_bytes, dev_config.size_multiplier * median(block_size_list))
 
     def get_block_is_duplicate(self, block: Block) -> bool:
         with self.lock:
-            return block.get_block(self._state, block.headerhash) is not None
+            return self._get_block(block.headerhash) is not None
 
     def get_config_by_block_number(self, block_number: int) -> config.DevConfig:
         dev_config = config.dev
@@ -322,50 +511,57 @@ class ChainManager:
             return dev_config
 
     def validate_mining_nonce(self, blockheader: BlockHeader, dev_config: config.DevConfig, enable_logging=True):
+        # Only the inputs are read under the lock, the hash is verified outside of it,
+        # so that PoW verifications on the VerificationPool do not block the reactor thread.
         with self.lock:
-            parent_metadata = BlockMetadata.get_block_metadata(self._state, blockheader.prev_headerhash)
-            parent_block = Block.get_block(self._state, blockheader.prev_headerhash)
+            parent_metadata = self._get_block_metadata(blockheader.prev_headerhash)
+            parent_block = self._get_block(blockheader.prev_headerhash)
+            if parent_metadata is None or parent_block is None:
+                logger.warning('Parent block not found in the state for PoW Validation')
+                return False
 
             measurement = self.get_measurement(dev_config,
                                                blockheader.timestamp,
                                                blockheader.prev_headerhash,
                                                parent_metadata)
-            diff, target = DifficultyTracker.get(
-                measurement=measurement,
-                parent_difficulty=parent_metadata.block_difficulty,
-                dev_config=dev_config)
 
-            mining_blob = blockheader.mining_blob(dev_config)
+            qn = Qryptonight()
+            seed_block = self._get_block_by_number(qn.get_seed_height(blockheader.block_number))
 
-            if enable_logging:
-                logger.debug('-----------------START--------------------')
-                logger.debug('Validate                #%s', blockheader.block_number)
-                logger.debug('block.timestamp         %s', blockheader.timestamp)
-                logger.debug('parent_block.timestamp  %s', parent_block.timestamp)
-                logger.debug('parent_block.difficulty %s', UInt256ToString(parent_metadata.block_difficulty))
-                logger.debug('diff                    %s', UInt256ToString(diff))
-                logger.debug('target                  %s', bin2hstr(target))
-                logger.debug('mining blob             %s', bin2hstr(mining_blob))
-                logger.debug('-------------------END--------------------')
+        diff, target = DifficultyTracker.get(
+            measurement=measurement,
+            parent_difficulty=parent_metadata.block_difficulty,
+            dev_config=dev_config)
 
-            qn = Qryptonight()
-            seed_block = self.get_block_by_number(qn.get_seed_height(blockheader.block_number))
-            if not PoWValidator().verify_input(blockheader.block_number,
-                                               seed_block.block_number,
-                                               seed_block.headerhash,
-                                               mining_blob,
-                                               target):
-                if enable_logging:
-                    logger.warning("PoW verification failed")
-                    tmp_hash = qn.hash(blockheader.block_number,
-                                       seed_block.block_number,
-                                       seed_block.headerhash,
-                                       blockheader.mining_blob(dev_config))
-                    logger.warning("{}".format(bin2hstr(tmp_hash)))
-                    logger.debug('%s', blockheader.to_json())
-                return False
+        mining_blob = blockheader.mining_blob(dev_config)
+
+        if enable_logging:
+            logger.debug('-----------------START--------------------')
+            logger.debug('Validate                #%s', blockheader.block_number)
+            logger.debug('block.timestamp         %s', blockheader.timestamp)
+            logger.debug('parent_block.timestamp  %s', parent_block.timestamp)
+            logger.debug('parent_block.difficulty %s', UInt256ToString(parent_metadata.block_difficulty))
+            logger.debug('diff                    %s', UInt256ToString(diff))
+            logger.debug('target                  %s', bin2hstr(target))
+            logger.debug('mining blob             %s', bin2hstr(mining_blob))
+            logger.debug('-------------------END--------------------')
+
+        if not PoWValidator().verify_input(blockheader.block_number,
+                                           seed_block.block_number,
+                                           seed_block.headerhash,
+                                           mining_blob,
+                                           target):
+            if enable_logging:
+                logger.warning("PoW verification failed")
+                tmp_hash = qn.hash(blockheader.block_number,
+                                   seed_block.block_number,
+                                   seed_block.headerhash,
+                                   blockheader.mining_blob(dev_config))
+                logger.warning("{}".format(bin2hstr(tmp_hash)))
+                logger.debug('%s', blockheader.to_json())
+            return False
 
-            return True
+        return True
 
     def get_headerhashes(self, start_blocknumber):
         with self.lock:
@@ -373,27 +569,9 @@ class ChainManager:
             end_blocknumber = min(self._last_block.block_number,
                                   start_blocknumber + 2 * config.dev.reorg_limit)
 
-            total_expected_headerhash = end_blocknumber - start_blocknumber + 1
-
             node_header_hash = pur_pb2.NodeHeaderHash()
             node_header_hash.block_number = start_blocknumber
-
-            block = Block.get_block_by_number(self._state, end_blocknumber)
-            block_headerhash = block.headerhash
-            node_header_hash.headerhashes.append(block_headerhash)
-            end_blocknumber -= 1
-
-            while end_blocknumber >= start_blocknumber:
-                block_metadata = BlockMetadata.get_block_metadata(self._state, block_headerhash)
-                for headerhash in block_metadata.last_N_headerhashes[-1::-1]:
-                    node_header_hash.headerhashes.append(headerhash)
-                end_blocknumber -= len(block_metadata.last_N_headerhashes)
-                if len(block_metadata.last_N_headerhashes) == 0:
-                    break
-                block_headerhash = block_metadata.last_N_headerhashes[0]
-
-            node_header_hash.headerhashes[:] = node_header_hash.headerhashes[-1::-1]
-            del node_header_hash.headerhashes[:len(node_header_hash.headerhashes) - total_expected_headerhash]
+            node_header_hash.headerhashes.extend(Block.get_headerhashes(self._state, start_blocknumber, end_blocknumber))
 
             return node_header_hash
 
@@ -427,9 +605,12 @@ class ChainManager:
         config.dev.update_from_pbdata(dev_config_pbdata)
 
         state_migration = StateMigration()
-        is_state_migration_needed = self._state.is_older_state_version()
+        is_state_migration_needed = self._state.get_state_version() == 0
         if is_state_migration_needed:
             state_migration.state_migration_step_1(self._state)
+        state_migration.state_migration_step_3(self._state)
+        state_migration.state_migration_step_4(self._state)
+        state_migration.state_migration_step_5(self._state)
 
         height = self._state.get_mainchain_height()
 
@@ -437,7 +618,7 @@ class ChainManager:
             Block.put_block(self._state, genesis_block, None)
             block_number_mapping = pur_pb2.BlockNumberMapping(headerhash=genesis_block.headerhash,
                                                               prev_headerhash=genesis_block.prev_headerhash)
-            Block.put_block_number_mapping(self._state, genesis_block.block_number, block_number_mapping, None)
+            self._put_block_number_mapping(genesis_block.block_number, block_number_mapping, None)
             parent_difficulty = StringToUInt256(str(config.user.genesis_difficulty))
 
             self.current_difficulty, _ = DifficultyTracker.get(
@@ -448,8 +629,10 @@ class ChainManager:
             block_metadata = BlockMetadata.create()
             block_metadata.set_block_difficulty(self.current_difficulty)
             block_metadata.set_cumulative_difficulty(self.current_difficulty)
+            block_metadata.update_last_block_sizes([], genesis_block.size, config.dev.number_of_blocks_to_analyze)
+            block_metadata.set_timestamp(genesis_block.timestamp)
 
-            BlockMetadata.put_block_metadata(self._state, genesis_block.headerhash, block_metadata, None)
+            self._put_block_metadata(genesis_block.headerhash, block_metadata, None)
             address_set = set()
 
             coinbase_tx = Transaction.from_pbdata(genesis_block.transactions[0])
@@ -490,11 +673,10 @@ class ChainManager:
             self._state.update_mainchain_height(0, None)
         else:
             self._last_block = self.get_block_by_number(height)
-            self.current_difficulty = BlockMetadata.get_block_metadata(self._state,
-                                                                       self._last_block.headerhash).block_difficulty
+            self.current_difficulty = self._get_block_metadata(self._last_block.headerhash).block_difficulty
             fork_state = self._state.get_fork_state()
             if fork_state:
-                block = Block.get_block(self._state, fork_state.initiator_headerhash)
+                block = self._get_block(fork_state.initiator_headerhash)
                 self._fork_recovery(block, fork_state)
 
         if is_state_migration_needed:
@@ -514,6 +696,9 @@ class ChainManager:
                 logger.warning("Migrated Block %s/%s", self.height, height)
             state_migration.state_migration_step_2(self._state)
 
+        self._update_snapshot()
+        self._publish_events()
+
     def _update_chainstate(self, block: Block, batch):
         self._last_block = block
         self._update_block_number_mapping(block, batch)
@@ -521,8 +706,9 @@ class ChainManager:
         self._state.update_mainchain_height(block.block_number, batch)
         self._state.update_re_org_limit(block.block_number, batch)
         TransactionMetadata.update_tx_metadata(self._state, block, batch)
+        self._queue_block_events(block, True, batch)
 
-    def _try_branch_add_block(self, block, dev_config: DevConfig, check_stale=True) -> bool:
+    def _try_branch_add_block(self, block, dev_config: DevConfig, check_stale=True, verify_signature=True) -> bool:
         """
         This function returns list of bool types. The first bool represent
         if the block has been added successfully and the second bool
@@ -535,26 +721,26 @@ class ChainManager:
         batch = self._state.batch
 
         if self._last_block.headerhash == block.prev_headerhash:
-            if not self._apply_state_changes(block, batch):
+            if not self._apply_state_changes(block, batch, verify_signature):
                 return False
 
         Block.put_block(self._state, block, batch)
 
-        last_block_metadata = BlockMetadata.get_block_metadata(self._state, self._last_block.headerhash)
+        last_block_metadata = self._get_block_metadata(self._last_block.headerhash)
         if last_block_metadata is None:
             logger.warning("Could not find log metadata for %s", bin2hstr(self._last_block.headerhash))
             return False
 
-        last_block_difficulty = int(UInt256ToString(last_block_metadata.cumulative_difficulty))
+        last_block_difficulty = DifficultyTracker.to_int(last_block_metadata.cumulative_difficulty)
 
         new_block_metadata = self._add_block_metadata(block, dev_config, batch)
-        new_block_difficulty = int(UInt256ToString(new_block_metadata.cumulative_difficulty))
+        new_block_difficulty = DifficultyTracker.to_int(new_block_metadata.cumulative_difficulty)
 
         if new_block_difficulty > last_block_difficulty:
             if self._last_block.headerhash != block.prev_headerhash:
                 fork_state = purstateinfo_pb2.ForkState(initiator_headerhash=block.headerhash)
                 self._state.put_fork_state(fork_state, batch)
-                self._state.write_batch(batch)
+                self._write_batch(batch)
                 return self._fork_recovery(block, fork_state)
 
             self._update_chainstate(block, batch)
@@ -564,7 +750,7 @@ class ChainManager:
                                              block.block_number)
             self.trigger_miner = True
 
-        self._state.write_batch(batch)
+        self._write_batch(batch)
 
         return True
 
@@ -583,7 +769,8 @@ class ChainManager:
         self.tx_pool.add_tx_from_block_to_pool(block, latest_block_number)
         self._state.update_mainchain_height(block.block_number - 1, batch)
         TransactionMetadata.rollback_tx_metadata(self._state, block, batch)
-        Block.remove_blocknumber_mapping(self._state, block.block_number, batch)
+        self._remove_block_number_mapping(block.block_number, batch)
+        self._queue_block_events(block, False, batch)
 
         return True
 
@@ -594,14 +781,14 @@ class ChainManager:
             if not block:
                 raise Exception('[get_state] No Block Found %s, Initiator %s', block.headerhash, tmp_block.headerhash)
 
-            mainchain_block = Block.get_block_by_number(self._state, block.block_number)
+            mainchain_block = self._get_block_by_number(block.block_number)
             if mainchain_block and mainchain_block.headerhash == block.headerhash:
                 break
 
             if block.block_number == 0:
                 raise Exception('[get_state] Alternate chain genesis is different, Initiator %s', tmp_block.headerhash)
             hash_path.append(block.headerhash)
-            block = Block.get_block(self._state, block.prev_headerhash)
+            block = self._get_block(block.prev_headerhash)
 
         return block.headerhash, hash_path
 
@@ -614,8 +801,8 @@ class ChainManager:
         """
         hash_path = []
         while self._last_block.headerhash != forked_header_hash:
-            block = Block.get_block(self._state, self._last_block.headerhash)
-            mainchain_block = Block.get_block_by_number(self._state, block.block_number)
+            block = self._get_block(self._last_block.headerhash)
+            mainchain_block = self._get_block_by_number(block.block_number)
 
             if block is None:
                 logger.warning("self.state.get_block(self.last_block.headerhash) returned None")
@@ -635,9 +822,9 @@ class ChainManager:
                 fork_state.old_mainchain_hash_path.extend([self._last_block.headerhash])
                 self._state.put_fork_state(fork_state, batch)
 
-            self._state.write_batch(batch)
+            self._write_batch(batch)
 
-            self._last_block = Block.get_block(self._state, self._last_block.prev_headerhash)
+            self._last_block = self._get_block(self._last_block.prev_headerhash)
 
         return hash_path, True
 
@@ -660,7 +847,7 @@ class ChainManager:
 
             for i in range(start, len(hash_path)):
                 header_hash = hash_path[i]
-                block = Block.get_block(self._state, header_hash)
+                block = self._get_block(header_hash)
 
                 batch = self._state.batch
 
@@ -670,7 +857,7 @@ class ChainManager:
                 self._update_chainstate(block, batch)
 
                 logger.debug('Apply block #%d - [batch %d | %s]', block.block_number, i, hash_path[i])
-                self._state.write_batch(batch)
+                self._write_batch(batch)
 
             self._state.delete_fork_state()
 
@@ -690,7 +877,7 @@ class ChainManager:
 
         rollback_done = False
         if fork_state.old_mainchain_hash_path:
-            b = Block.get_block(self._state, fork_state.old_mainchain_hash_path[-1])
+            b = self._get_block(fork_state.old_mainchain_hash_path[-1])
             if b and b.prev_headerhash == fork_state.fork_point_headerhash:
                 rollback_done = True
 
@@ -714,7 +901,7 @@ class ChainManager:
         self.trigger_miner = True
         return True
 
-    def _add_block(self, block, check_stale=True) -> bool:
+    def _add_block(self, block, check_stale=True, verify_signature=True) -> bool:
         dev_config = self.get_config_by_block_number(block.block_number)
         self.trigger_miner = False
 
@@ -723,9 +910,15 @@ class ChainManager:
             logger.info('Block Size greater than threshold limit %s > %s', block.size, block_size_limit)
             return False
 
-        return self._try_branch_add_block(block, dev_config, check_stale)
+        return self._try_branch_add_block(block, dev_config, check_stale, verify_signature)
 
-    def add_block(self, block: Block, check_stale=True) -> bool:
+    def add_block(self, block: Block, check_stale=True, verify_signature=True) -> bool:
+        """
+        Adds the block to the chain.
+        verify_signature must only be False, when the signatures of all the
+        transactions of the block has already been verified, for instance by
+        the VerificationPool.
+        """
         with self.lock:
             if block.block_number <= self.re_org_limit:
                 logger.debug('Skipping block #%s as beyond re-org limit', block.block_number)
@@ -735,7 +928,9 @@ class ChainManager:
                 logger.warning("Duplicate Block found #%s", block.block_number)
                 return False
 
-            block_flag = self._add_block(block, check_stale=check_stale)
+            block_flag = self._add_block(block, check_stale=check_stale, verify_signature=verify_signature)
+            self._update_snapshot()
+            self._publish_events()
             if not block_flag:
                 logger.warning("[ChainManager] Failed to Add Block #%s", block.block_number)
                 return False
@@ -747,16 +942,21 @@ class ChainManager:
                             block: Block,
                             dev_config: DevConfig,
                             batch):
-        block_metadata = BlockMetadata.get_block_metadata(self._state, block.headerhash)
+        block_metadata = self._get_block_metadata(block.headerhash)
         if not block_metadata:
             block_metadata = BlockMetadata.create()
 
-        parent_metadata = BlockMetadata.get_block_metadata(self._state, block.prev_headerhash)
+        parent_metadata = self._get_block_metadata(block.prev_headerhash)
 
         parent_block_difficulty = parent_metadata.block_difficulty
         parent_cumulative_difficulty = parent_metadata.cumulative_difficulty
 
         block_metadata.update_last_headerhashes(parent_metadata.last_N_headerhashes, block.prev_headerhash)
+        block_metadata.set_timestamp(block.timestamp)
+        self._update_last_timestamps(block_metadata, parent_metadata, block.prev_headerhash)
+        block_metadata.update_last_block_sizes(self._get_last_block_sizes(block, dev_config) or [],
+                                               block.size,
+                                               dev_config.number_of_blocks_to_analyze)
         measurement = self.get_measurement(dev_config, block.timestamp, block.prev_headerhash, parent_metadata)
 
         block_difficulty, _ = DifficultyTracker.get(
@@ -764,23 +964,41 @@ class ChainManager:
             parent_difficulty=parent_block_difficulty,
             dev_config=dev_config)
 
-        block_cumulative_difficulty = StringToUInt256(str(
-            int(UInt256ToString(block_difficulty)) +
-            int(UInt256ToString(parent_cumulative_difficulty))))
+        block_cumulative_difficulty = DifficultyTracker.from_int(DifficultyTracker.to_int(block_difficulty) +
+                                                                 DifficultyTracker.to_int(parent_cumulative_difficulty))
 
         block_metadata.set_block_difficulty(block_difficulty)
         block_metadata.set_cumulative_difficulty(block_cumulative_difficulty)
 
         parent_metadata.add_child_headerhash(block.headerhash)
-        BlockMetadata.put_block_metadata(self._state, block.prev_headerhash, parent_metadata, batch)
-        BlockMetadata.put_block_metadata(self._state, block.headerhash, block_metadata, batch)
+        self._put_block_metadata(block.prev_headerhash, parent_metadata, batch)
+        self._put_block_metadata(block.headerhash, block_metadata, batch)
 
         return block_metadata
 
+    def _update_last_timestamps(self, block_metadata: BlockMetadata, parent_metadata: BlockMetadata, parent_headerhash):
+        """
+        Keeps the timestamps of the last_N_headerhashes blocks in the block metadata,
+        so that the measurement needs no ancestor block. Ancestor blocks are loaded
+        only when the parent metadata has been stored by an older version.
+        """
+        if parent_metadata.has_last_N_timestamps:
+            block_metadata.update_last_timestamps(parent_metadata.last_N_timestamps, parent_metadata.timestamp)
+            return
+
+        del block_metadata.last_N_timestamps[:]
+        for headerhash in block_metadata.last_N_headerhashes:
+            block = self._get_block(headerhash)
+            if block is None:
+                logger.warning('[_update_last_timestamps] Block %s not found', bin2hstr(headerhash))
+                del block_metadata.last_N_timestamps[:]
+                return
+            block_metadata.last_N_timestamps.append(block.timestamp)
+
     def _update_block_number_mapping(self, block, batch):
         block_number_mapping = pur_pb2.BlockNumberMapping(headerhash=block.headerhash,
                                                           prev_headerhash=block.prev_headerhash)
-        Block.put_block_number_mapping(self._state, block.block_number, block_number_mapping, batch)
+        self._put_block_number_mapping(block.block_number, block_number_mapping, batch)
 
     @staticmethod
     def set_affected_address(block: Block) -> set:
@@ -902,7 +1120,60 @@ class ChainManager:
                                       multi_sig_spend_txs,
                                       votes_stats)
 
-    def _apply_state_changes(self, block, batch) -> bool:
+    def _prefetch_block_state(self, block):
+        """
+        Reads in one pass, from a single snapshot, the address states, tokens, slaves,
+        lattice pks and OTS bitfield pages affected by the block, so that building
+        the StateContainer is served from memory.
+        """
+        addresses_set = set()
+        keys = set()
+        tokens = Indexer(b'token', None)
+        slaves = Indexer(b'slave', None)
+        lattice_pk = Indexer(b'lattice_pk', None)
+        paginated_bitfield = PaginatedBitfield(False, None)
+        for proto_tx in block.transactions:
+            tx = Transaction.from_pbdata(proto_tx)
+            tx.set_affected_address(addresses_set)
+            if isinstance(tx, CoinBase):
+                continue
+
+            addr_from_pk = Transaction.get_slave(tx)
+            if addr_from_pk is not None:
+                keys.add(slaves.generate_key((tx.addr_from, tx.PK)))
+            else:
+                addr_from_pk = tx.addr_from
+            try:
+                page = tx.ots_key // config.dev.ots_tracking_per_page + 1
+                keys.add(paginated_bitfield.generate_bitfield_key(addr_from_pk, page))
+                keys.add(paginated_bitfield.generate_summary_key(addr_from_pk))
+            except ValueError:
+                # Invalid signature, the transaction is rejected by the validation
+                pass
+
+            if isinstance(tx, TransferTokenTransaction):
+                keys.add(tokens.generate_key((tx.addr_from, tx.token_txhash)))
+                for address in tx.addrs_to:
+                    keys.add(tokens.generate_key((address, tx.token_txhash)))
+            elif isinstance(tx, SlaveTransaction):
+                for slave_pk in tx.slave_pks:
+                    keys.add(slaves.generate_key((tx.addr_from, slave_pk)))
+            elif isinstance(tx, LatticeTransaction):
+                keys.add(lattice_pk.generate_key((tx.addr_from, tx.pk1, tx.pk2, tx.pk3)))
+
+        if not addresses_set:
+            return
+
+        self._state._db.prefetch(keys | addresses_set)
+
+    def _apply_state_changes(self, block, batch, verify_signature=True) -> bool:
+        self._prefetch_block_state(block)
+        try:
+            return self._apply_block_state_changes(block, batch, verify_signature)
+        finally:
+            self._state._db.clear_prefetched()
+
+    def _apply_block_state_changes(self, block, batch, verify_signature) -> bool:
         state_container = self.new_state_container(set(),
                                                    block.block_number,
                                                    True,
@@ -916,7 +1187,7 @@ class ChainManager:
             if not self.update_state_container(tx, state_container):
                 return False
 
-            if not tx.validate_all(state_container):
+            if not tx.validate_all(state_container, verify_signature=verify_signature):
                 return False
 
             tx.apply(self._state, state_container)
@@ -1090,31 +1361,45 @@ class ChainManager:
         addresses_state = []
 
         try:
-            for address, _ in self._state._db.db:
-                if AddressState.address_is_valid(address) or address == config.dev.coinbase_address:
-                    addresses_state.append(self.get_address_state(address).pbdata)
+            for address in OptimizedAddressState.get_addresses(self._state):
+                addresses_state.append(self.get_address_state(address).pbdata)
             return addresses_state
         except Exception as e:
             logger.error("Exception in get_all_address_state %s", e)
 
         return []
 
+    def get_optimized_addresses_state_chunks(self, max_chunk_size: int):
+        """
+        Yields the address states in chunks, read from a snapshot of the current state,
+        so that blocks can be added while the chunks are consumed.
+        """
+        with self.lock:
+            snapshot = ChainSnapshot(self._state, self._last_block)
+        return snapshot.get_optimized_addresses_state_chunks(max_chunk_size)
+
     def get_measurement(self,
                         dev_config: DevConfig,
                         block_timestamp,
                         parent_headerhash,
                         parent_metadata: BlockMetadata):
         count_headerhashes = len(parent_metadata.last_N_headerhashes)
+        has_last_N_timestamps = parent_metadata.has_last_N_timestamps
 
         if count_headerhashes == 0:
             return dev_config.block_timing_in_seconds
         elif count_headerhashes == 1:
-            nth_block = Block.get_block(self._state, parent_headerhash)
+            if has_last_N_timestamps:
+                nth_block_timestamp = parent_metadata.timestamp
+            else:
+                nth_block_timestamp = self._get_block(parent_headerhash).timestamp
             count_headerhashes += 1
         else:
-            nth_block = Block.get_block(self._state, parent_metadata.last_N_headerhashes[1])
+            if has_last_N_timestamps:
+                nth_block_timestamp = parent_metadata.last_N_timestamps[1]
+            else:
+                nth_block_timestamp = self._get_block(parent_metadata.last_N_headerhashes[1]).timestamp
 
-        nth_block_timestamp = nth_block.timestamp
         if count_headerhashes < dev_config.N_measurement:
             nth_block_timestamp -= dev_config.block_timing_in_seconds
 
@@ -1161,14 +1446,12 @@ class ChainManager:
         return data_point
 
     def get_unused_ots_index2(self, address, start_ots_index=0):
-        return self.get_unused_ots_index(addresses_bitfield=dict(),
-                                         addresses_state=dict(),
+        return self.get_unused_ots_index(addresses_state=dict(),
                                          address=address,
                                          paginated_bitfield=PaginatedBitfield(False, self._state._db),
                                          start_ots_index=start_ots_index)
 
     def get_unused_ots_index(self,
-                             addresses_bitfield: dict,
                              addresses_state: dict,
                              address,
                              paginated_bitfield: PaginatedBitfield,
@@ -1186,22 +1469,6 @@ class ChainManager:
         if address_state.ots_bitfield_used_page == max_page:
             return None
 
-        page = max(address_state.ots_bitfield_used_page, start_ots_index // config.dev.ots_tracking_per_page) + 1
-
-        for i in range((page - 1) * config.dev.ots_tracking_per_page // 8, ots_key_count // 8):
-            page = (i // config.dev.ots_tracking_per_page) + 1
-            key = paginated_bitfield.generate_bitfield_key(address, page)
-            if key not in addresses_bitfield:
-                addresses_bitfield[key] = paginated_bitfield.get_paginated_data(address, page)
-
-            ots_bitfield = addresses_bitfield[key]
-            index = i % config.dev.ots_tracking_per_page
-            if ots_bitfield[index][0] < 255:
-                offset = 8 * index + (page - 1) * config.dev.ots_tracking_per_page
-                bitfield = bytearray(ots_bitfield[index])
-                for relative in range(0, 8):
-                    if ((bitfield[0] >> relative) & 1) != 1:
-                        if offset + relative >= start_ots_index:
-                            return offset + relative
-
-        return None
+        start_ots_index = max(start_ots_index, address_state.ots_bitfield_used_page * config.dev.ots_tracking_per_page)
+
+        return paginated_bitfield.get_unused_ots_index(address, address_state.height, start_ots_index)
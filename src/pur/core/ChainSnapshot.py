@@ -0,0 +1,88 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from typing import Optional
+
+from pur.core.Block import Block
+from pur.core.MultiSigAddressState import MultiSigAddressState
+from pur.core.OptimizedAddressState import OptimizedAddressState
+from pur.core.PaginatedBitfield import PaginatedBitfield
+from pur.core.PaginatedData import PaginatedData
+from pur.core.State import State
+from pur.core.TransactionMetadata import TransactionMetadata
+from pur.core.VoteStats import VoteStats
+from pur.core.misc.db import SnapshotDB
+from pur.generated import pur_pb2
+
+
+class ChainSnapshot:
+    """
+    Read only view of the chain pinned at the last block committed by ChainManager.
+    Reads are served from a LevelDB snapshot, so they never take ChainManager.lock
+    and can run from any number of threads while blocks are being added.
+    The methods match the read methods of ChainManager with the same name.
+    """
+    def __init__(self, state: State, last_block: Block):
+        self._state = State(SnapshotDB(state._db))
+        self._last_block = last_block
+
+    @property
+    def height(self) -> int:
+        if not self._last_block:
+            return -1
+        return self._last_block.block_number
+
+    @property
+    def last_block(self) -> Block:
+        return self._last_block
+
+    def get_block(self, header_hash: bytes) -> Optional[Block]:
+        return Block.get_block(self._state, header_hash)
+
+    def get_block_by_number(self, block_number: int) -> Optional[Block]:
+        return Block.get_block_by_number(self._state, block_number)
+
+    def get_block_header_hash_by_number(self, block_number: int) -> Optional[bytes]:
+        return Block.get_block_header_hash_by_number(self._state, block_number)
+
+    def get_block_header_hashes_by_number(self, block_numbers) -> dict:
+        return {block_number: Block.get_block_header_hash_by_number(self._state, block_number)
+                for block_number in set(block_numbers)}
+
+    def get_address_balance(self, address: bytes) -> int:
+        return self.get_optimized_address_state(address).balance
+
+    def get_address_is_used(self, address: bytes) -> bool:
+        return self._state.get_address_is_used(address)
+
+    def get_optimized_address_state(self, address: bytes) -> OptimizedAddressState:
+        return OptimizedAddressState.get_optimized_address_state(self._state, address)
+
+    def get_optimized_addresses_state(self, addresses: list) -> list:
+        return OptimizedAddressState.get_optimized_addresses_state(self._state, addresses)
+
+    def get_optimized_addresses_state_chunks(self, max_chunk_size: int):
+        return OptimizedAddressState.get_optimized_addresses_state_chunks(self._state, max_chunk_size)
+
+    def get_multi_sig_address_state(self, address: bytes) -> MultiSigAddressState:
+        return MultiSigAddressState.get_multi_sig_address_state_by_address(self._state._db, address)
+
+    def get_bitfield(self, address: bytes, page: int):
+        p = PaginatedBitfield(False, self._state._db)
+        return p.get_paginated_data(address, page)
+
+    def get_paginated_data_reversed(self, name: bytes, address: bytes, end_item_index: int, count: int) -> list:
+        p = PaginatedData(name, False, self._state._db)
+        return p.get_paginated_data_reversed(address, end_item_index, count)
+
+    def get_tx_metadata(self, transaction_hash) -> list:
+        return TransactionMetadata.get_tx_metadata(self._state, transaction_hash)
+
+    def get_tx_metadata_list(self, transaction_hashes: list) -> list:
+        return TransactionMetadata.get_tx_metadata_list(self._state, transaction_hashes)
+
+    def get_token(self, address: bytes, token_txhash: bytes) -> pur_pb2.TokenBalance:
+        return self._state.get_token(address, token_txhash)
+
+    def get_vote_stats(self, multi_sig_spend_txn_hash: bytes) -> VoteStats:
+        return VoteStats.get_state(state=self._state, shared_key=multi_sig_spend_txn_hash)
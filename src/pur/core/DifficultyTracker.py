@@ -21,3 +21,15 @@ class DifficultyTracker(object):
 
         current_target = ph.getTarget(current_difficulty)
         return current_difficulty, current_target
+
+    @staticmethod
+    def to_int(difficulty) -> int:
+        """
+        Converts a UInt256 difficulty, big-endian bytes, into an int
+        without the decimal string round trip of UInt256ToString.
+        """
+        return int.from_bytes(bytes(difficulty), byteorder='big', signed=False)
+
+    @staticmethod
+    def from_int(difficulty: int) -> tuple:
+        return tuple(difficulty.to_bytes(32, byteorder='big', signed=False))
@@ -2,7 +2,7 @@
 # Distributed under the MIT software license, see the accompanying
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 
-from pypurlib.pypurlib import purHelper, bin2hstr
+from pypurlib.pypurlib import purHelper, bin2hstr, SHA2_256, SHAKE_128, SHAKE_256
 from collections import namedtuple
 
 from pur.core import config
@@ -258,6 +258,64 @@ class OptimizedAddressState(object):
             data = address_state.pbdata.SerializeToString()
             state._db.put_raw(address_state.address, data, batch)
 
+    @staticmethod
+    def get_optimized_addresses_state(state: State, addresses: list) -> list:
+        """
+        Reads the address states of all the addresses from a single snapshot of the db,
+        in the order of the keys, and returns them in the order of the addresses.
+        """
+        values = state._db.multi_get(sorted(set(addresses)))
+        addresses_state = []
+        for address in addresses:
+            if address not in values:
+                addresses_state.append(OptimizedAddressState.get_default(address))
+                continue
+            pbdata = pur_pb2.OptimizedAddressState()
+            pbdata.ParseFromString(bytes(values[address]))
+            addresses_state.append(OptimizedAddressState(pbdata))
+        return addresses_state
+
+    @staticmethod
+    def get_address_key_prefixes() -> list:
+        """
+        Address states are stored under the address, which starts with the descriptor,
+        so its first byte is made of the signature type XMSS (0) and the hash function.
+        """
+        return [bytes([hash_function]) for hash_function in sorted([SHA2_256, SHAKE_128, SHAKE_256])]
+
+    @staticmethod
+    def get_addresses(state: State):
+        """
+        Yields the addresses having an address state, including the coinbase address,
+        by iterating over the keys of the address keyspace only.
+        """
+        for prefix in OptimizedAddressState.get_address_key_prefixes():
+            for address in state._db.get_prefixed_iterator(prefix, include_value=False):
+                address = bytes(address)
+                if OptimizedAddressState.address_is_valid(address) or address == config.dev.coinbase_address:
+                    yield address
+
+    @staticmethod
+    def get_optimized_addresses_state_chunks(state: State, max_chunk_size: int):
+        """
+        Yields lists of OptimizedAddressState, serialized to at most max_chunk_size bytes
+        unless a single address state is larger, so that the whole state is never in memory.
+        """
+        chunk = []
+        chunk_size = 0
+        for address in OptimizedAddressState.get_addresses(state):
+            address_state = OptimizedAddressState.get_optimized_address_state(state, address)
+            size = address_state.pbdata.ByteSize()
+            if chunk and chunk_size + size > max_chunk_size:
+                yield chunk
+                chunk = []
+                chunk_size = 0
+            chunk.append(address_state)
+            chunk_size += size
+
+        if chunk:
+            yield chunk
+
     @staticmethod
     def get_optimized_address_state(state: State, address: bytes):
         try:
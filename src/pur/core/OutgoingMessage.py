@@ -6,10 +6,12 @@ from pur.core.misc import ntp
 
 
 class OutgoingMessage:
-    def __init__(self, priority, message):
+    def __init__(self, priority, message, wrapped_message: bytes = None):
         self.priority = priority
         self.timestamp = int(ntp.getTime())
         self.message = message
+        # Message already encoded for the wire, shared by all the peers it is broadcast to
+        self.wrapped_message = wrapped_message
 
     def is_expired(self):
         return self.timestamp - ntp.getTime() > config.user.outgoing_message_expiry
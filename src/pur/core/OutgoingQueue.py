@@ -0,0 +1,56 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from collections import deque
+from typing import Optional
+
+from pur.core.OutgoingMessage import OutgoingMessage
+
+
+class OutgoingQueue:
+    """
+    Outgoing messages of a peer, ordered by priority, 0 being the highest,
+    then in the order they were queued.
+    Each priority has its own deque, so that messages are queued and dequeued
+    without the locks of queue.PriorityQueue, all the accesses being made
+    from the reactor thread.
+    """
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._queues = []
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= self._size
+
+    def _get_queue(self, priority: int) -> deque:
+        while len(self._queues) <= priority:
+            self._queues.append(deque())
+        return self._queues[priority]
+
+    def put(self, outgoing_msg: OutgoingMessage) -> bool:
+        if self.full():
+            return False
+        self._get_queue(outgoing_msg.priority).append(outgoing_msg)
+        self._size += 1
+        return True
+
+    def put_front(self, outgoing_msg: OutgoingMessage):
+        """
+        Puts back a message that has just been taken from the queue, ahead of the messages of the same priority.
+        """
+        self._get_queue(outgoing_msg.priority).appendleft(outgoing_msg)
+        self._size += 1
+
+    def get(self) -> Optional[OutgoingMessage]:
+        for queue in self._queues:
+            if queue:
+                self._size -= 1
+                return queue.popleft()
+        return None
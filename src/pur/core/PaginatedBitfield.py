@@ -5,18 +5,36 @@
 from math import ceil
 
 from pur.core import config
+from pur.core.OptimizedAddressState import OptimizedAddressState
 from pur.core.PaginatedData import PaginatedData
 from pur.core.misc import logger
 from pur.generated import pur_pb2
 
 
 class PaginatedBitfield(PaginatedData):
+    """
+    OTS bitfield of an address, split into pages of ots_tracking_per_page OTS indexes.
+    Each page is kept as a single bytearray of ots_bitfield_size bytes, OTS index i
+    of the page being the bit (i % 8) of the byte (i // 8). Pages are stored as the
+    raw bytes, pages stored by the older nodes as a DataList are converted on load.
+
+    A summary bitfield is kept for each address, with the bit (page - 1) set once all
+    the OTS indexes of the page are used, so that finding an unused OTS index skips
+    the full pages without loading them.
+    """
     def __init__(self, write_access: bool, db):
         super(PaginatedBitfield, self).__init__(b'bitfield', write_access, db)
 
     def generate_bitfield_key(self, address, page):
         return self.name + b'_' + address + b'_' + page.to_bytes(8, byteorder='big', signed=False)
 
+    def generate_summary_key(self, address):
+        return self.name + b'summary_' + address
+
+    @staticmethod
+    def get_page_count(height) -> int:
+        return ceil(2 ** height / config.dev.ots_tracking_per_page)
+
     def load_bitfield_and_ots_key_reuse(self, address, ots_key_index) -> bool:
         page = (ots_key_index // config.dev.ots_tracking_per_page) + 1
         key = self.generate_bitfield_key(address, page)
@@ -29,14 +47,41 @@ class PaginatedBitfield(PaginatedData):
     def ots_key_reuse(ots_bitfield, ots_key_index) -> bool:
         offset = ots_key_index >> 3
         relative = ots_key_index % 8
-        bitfield = bytearray(ots_bitfield[offset])
-        bit_value = (bitfield[0] >> relative) & 1
+        bit_value = (ots_bitfield[offset] >> relative) & 1
 
         if bit_value:
             return True
 
         return False
 
+    @staticmethod
+    def count_used_ots_keys(ots_bitfield) -> int:
+        return bin(int.from_bytes(ots_bitfield, byteorder='little', signed=False)).count('1')
+
+    @staticmethod
+    def find_unused_ots_key(ots_bitfield, start_index=0):
+        """
+        Returns the lowest unused OTS index of the page which is >= start_index,
+        or None if all of them are used.
+        """
+        offset = start_index >> 3
+        if offset >= len(ots_bitfield):
+            return None
+
+        # Bits below start_index in the first byte are considered used
+        first_byte = ots_bitfield[offset] | ((1 << (start_index % 8)) - 1)
+        if first_byte == 0xff:
+            offset += 1
+            offset += len(ots_bitfield) - offset - len(ots_bitfield[offset:].lstrip(b'\xff'))
+            if offset >= len(ots_bitfield):
+                return None
+            first_byte = ots_bitfield[offset]
+
+        # Lowest unset bit of the byte
+        relative = ((first_byte ^ 0xff) & -(first_byte ^ 0xff)).bit_length() - 1
+
+        return offset * 8 + relative
+
     def set_ots_key(self, addresses_state: dict, address, ots_key_index):
         page = ots_key_index // config.dev.ots_tracking_per_page + 1
         key = self.generate_bitfield_key(address, page)
@@ -46,32 +91,83 @@ class PaginatedBitfield(PaginatedData):
         ots_key_index = ots_key_index % config.dev.ots_tracking_per_page
         offset = ots_key_index >> 3
         relative = ots_key_index % 8
-        bitfield = bytearray(ots_bitfield[offset])
-        ots_bitfield[offset] = bytes([bitfield[0] | (1 << relative)])
+        ots_bitfield[offset] |= 1 << relative
         address_state = addresses_state[address]
         address_state.used_ots_key_count += 1
+        self.update_summary(address, address_state.height, page, ots_bitfield)
         self.update_used_page_in_address_state(address, addresses_state, page)
 
     def update_used_page_in_address_state(self, address, addresses_state: dict, page: int):
-        # TODO: Write Unit Test
         address_state = addresses_state[address]
         if address_state.ots_bitfield_used_page == page - 1:
-            remaining_ots = 2 ** address_state.height - (page - 1) * config.dev.ots_tracking_per_page
-            while remaining_ots > 0:
-                key = self.generate_bitfield_key(address, page)
-                if key not in self.key_value:
-                    self.key_value[key] = self.get_paginated_data(address, page)
-                ots_bitfield = self.key_value[key]
-
-                for i in range(min(config.dev.ots_bitfield_size, ceil(remaining_ots / 8))):
-                    if ots_bitfield[i] != b'\xff':
-                        return
-                    if remaining_ots >= 8:
-                        remaining_ots -= 8
-                address_state.ots_bitfield_used_page = page  # TODO: Replace by setter function
-                page += 1
-                if page * config.dev.ots_tracking_per_page > 2 ** address_state.height:
-                    return
+            page_count = self.get_page_count(address_state.height)
+            summary = self.load_summary(address, address_state.height)
+            used_page = self.find_unused_ots_key(summary, page - 1)
+            if used_page is None or used_page > page_count:
+                used_page = page_count
+            address_state.ots_bitfield_used_page = used_page  # TODO: Replace by setter function
+
+    def is_page_full(self, ots_bitfield, height, page) -> bool:
+        ots_key_count = min(config.dev.ots_tracking_per_page,
+                            2 ** height - (page - 1) * config.dev.ots_tracking_per_page)
+        unused_ots_key = self.find_unused_ots_key(ots_bitfield)
+        return unused_ots_key is None or unused_ots_key >= ots_key_count
+
+    def get_summary(self, address, height) -> bytearray:
+        try:
+            return bytearray(self.db.get_raw(self.generate_summary_key(address)))
+        except KeyError:
+            return bytearray(ceil(self.get_page_count(height) / 8))
+        except Exception as e:
+            logger.error('[get_summary] Exception for %s', self.name)
+            logger.exception(e)
+            raise
+
+    def load_summary(self, address, height) -> bytearray:
+        key = self.generate_summary_key(address)
+        if key not in self.key_value:
+            self.key_value[key] = self.get_summary(address, height)
+        return self.key_value[key]
+
+    def update_summary(self, address, height, page, ots_bitfield):
+        if page > self.get_page_count(height):
+            return
+        summary = self.load_summary(address, height)
+        offset = (page - 1) >> 3
+        relative = (page - 1) % 8
+        if self.is_page_full(ots_bitfield, height, page):
+            summary[offset] |= 1 << relative
+        else:
+            summary[offset] &= ~(1 << relative) & 0xff
+
+    def get_unused_ots_index(self, address, height, start_ots_index=0):
+        """
+        Finds the lowest unused OTS index >= start_ots_index.
+        The full pages are skipped using the summary, so only the page having
+        start_ots_index and the next page which is not full are loaded.
+        """
+        ots_key_count = 2 ** height
+        summary = self.load_summary(address, height)
+        while start_ots_index < ots_key_count:
+            page_index = self.find_unused_ots_key(summary, start_ots_index // config.dev.ots_tracking_per_page)
+            if page_index is None:
+                return None
+            offset = page_index * config.dev.ots_tracking_per_page
+            if offset >= ots_key_count:
+                return None
+
+            page = page_index + 1
+            key = self.generate_bitfield_key(address, page)
+            if key not in self.key_value:
+                self.key_value[key] = self.get_paginated_data(address, page)
+
+            index = self.find_unused_ots_key(self.key_value[key], max(0, start_ots_index - offset))
+            if index is not None and offset + index < ots_key_count:
+                return offset + index
+
+            start_ots_index = page * config.dev.ots_tracking_per_page
+
+        return None
 
     def unset_ots_key(self, addresses_state: dict, address, ots_key_index):
         page = ots_key_index // config.dev.ots_tracking_per_page + 1
@@ -82,10 +178,10 @@ class PaginatedBitfield(PaginatedData):
         ots_key_index = ots_key_index % config.dev.ots_tracking_per_page
         offset = ots_key_index >> 3
         relative = ots_key_index % 8
-        bitfield = bytearray(ots_bitfield[offset])
-        ots_bitfield[offset] = bytes([bitfield[0] & ~(1 << relative)])
+        ots_bitfield[offset] &= ~(1 << relative) & 0xff
         address_state = addresses_state[address]
         address_state.used_ots_key_count -= 1
+        self.update_summary(address, address_state.height, page, ots_bitfield)
         if address_state.ots_bitfield_used_page >= page:
             address_state.ots_bitfield_used_page = page - 1  # TODO: Replace by setter function
 
@@ -95,14 +191,23 @@ class PaginatedBitfield(PaginatedData):
         if key not in self.key_value:
             self.key_value[key] = self.get_paginated_data(address, page)
 
-    def get_paginated_data(self, key, page):
+    @staticmethod
+    def from_data_list(data: bytes) -> bytearray:
+        """
+        Converts a page stored as DataList, with one value per 8 OTS indexes, into a bytearray.
+        """
+        data_list = pur_pb2.DataList()
+        data_list.ParseFromString(data)
+        return bytearray(b''.join(data_list.values))
+
+    def get_paginated_data(self, key, page) -> bytearray:
         try:
-            pbData = self.db.get_raw(self.name + b'_' + key + b'_' + page.to_bytes(8, byteorder='big', signed=False))
-            data_list = pur_pb2.DataList()
-            data_list.ParseFromString(bytes(pbData))
-            return list(data_list.values)
+            data = bytes(self.db.get_raw(self.generate_bitfield_key(key, page)))
+            if len(data) != config.dev.ots_bitfield_size:
+                return self.from_data_list(data)
+            return bytearray(data)
         except KeyError:
-            return [b'\x00'] * config.dev.ots_bitfield_size
+            return bytearray(config.dev.ots_bitfield_size)
         except Exception as e:
             logger.error('[get_paginated_data] Exception for %s', self.name)
             logger.exception(e)
@@ -112,7 +217,55 @@ class PaginatedBitfield(PaginatedData):
         if not self.write_access:
             return
         for key in self.key_value:
-            data_list = pur_pb2.DataList(values=self.key_value[key])
             self.db.put_raw(key,
-                            data_list.SerializeToString(),
+                            bytes(self.key_value[key]),
                             batch)
+
+    def migrate_bitfields(self, writes_per_batch=100) -> int:
+        """
+        Rewrites all the pages stored as DataList into raw bytes,
+        and writes the summary of every address having a page.
+        The pages are iterated grouped by address, so the summary of an address
+        is written as soon as its last page has been seen, and the writes are
+        flushed every writes_per_batch writes.
+        :return: number of pages migrated
+        """
+        count = 0
+        writes = 0
+        prefix = self.name + b'_'
+        batch = self.db.get_batch()
+        summary_address = None
+        summary = None
+        for key, value in self.db.get_prefixed_iterator(prefix):
+            address = key[len(prefix):-9]
+            page = int.from_bytes(key[-8:], byteorder='big', signed=False)
+            height = OptimizedAddressState.get_height_from_address(address)
+
+            if address != summary_address:
+                if summary_address is not None:
+                    self.db.put_raw(self.generate_summary_key(summary_address), bytes(summary), batch)
+                    writes += 1
+                summary_address = address
+                summary = bytearray(ceil(self.get_page_count(height) / 8))
+
+            ots_bitfield = bytearray(value)
+            if len(value) != config.dev.ots_bitfield_size:
+                ots_bitfield = self.from_data_list(bytes(value))
+                self.db.put_raw(key, bytes(ots_bitfield), batch)
+                writes += 1
+                count += 1
+
+            if page <= self.get_page_count(height) and self.is_page_full(ots_bitfield, height, page):
+                summary[(page - 1) >> 3] |= 1 << ((page - 1) % 8)
+
+            if writes >= writes_per_batch:
+                self.db.write_batch(batch)
+                batch = self.db.get_batch()
+                writes = 0
+                logger.warning("Migrated %s OTS Bitfield pages", count)
+
+        if summary_address is not None:
+            self.db.put_raw(self.generate_summary_key(summary_address), bytes(summary), batch)
+        self.db.write_batch(batch)
+
+        return count
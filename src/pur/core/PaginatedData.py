@@ -8,6 +8,14 @@ from pur.generated import pur_pb2
 
 
 class PaginatedData:
+    """
+    List of values per key, such as the transaction hashes of an address.
+    Each value is stored under its own db key, made of the key and the fixed width
+    big-endian index of the value, so that appending a value writes a single key,
+    removing the last value deletes a single key and a page of data_per_page values
+    is read with a single iterator.
+    key_value holds the values to be written, None being a value to be deleted.
+    """
     def __init__(self, name: bytes, write_access: bool, db):
         self.name = name
         self.key_value = dict()
@@ -17,74 +25,96 @@ class PaginatedData:
     def reset_key_value(self):
         self.key_value = dict()
 
-    def get_value(self, key: bytes, count: int) -> list:
+    def get_value(self, key: bytes, count: int):
         storage_key = self.generate_key(key, count)
         return self.key_value[storage_key]
 
     def insert(self, address_state, value: bytes):
-        key = address_state.address
         count = address_state.get_counter_by_name(self.name)
         storage_key = self.generate_key(address_state.address, count)
 
-        if storage_key not in self.key_value:
-            self.key_value[storage_key] = self.get_paginated_data(key, count)
-
-        self.key_value[storage_key].append(value)
+        self.key_value[storage_key] = value
 
         address_state.update_counter_by_name(self.name)
 
     def remove(self, address_state, value: bytes):
         address_state.update_counter_by_name(self.name, value=1, subtract=True)
 
-        key = address_state.address
         count = address_state.get_counter_by_name(self.name)
         storage_key = self.generate_key(address_state.address, count)
 
-        if storage_key not in self.key_value:
-            self.key_value[storage_key] = self.get_paginated_data(key, count)
+        if storage_key in self.key_value:
+            stored_value = self.key_value[storage_key]
+        else:
+            stored_value = self.get_stored_value(storage_key)
 
-        if self.key_value[storage_key][-1] != value:
-            logger.warning("Expected value %s", self.key_value[storage_key][-1])
+        if stored_value != value:
+            logger.warning("Expected value %s", stored_value)
             logger.warning("Found value %s", value)
             raise Exception("Unexpected value into storage")
 
-        del self.key_value[storage_key][-1]
+        self.key_value[storage_key] = None
+
+    def get_stored_value(self, storage_key):
+        try:
+            return bytes(self.db.get_raw(storage_key))
+        except KeyError:
+            return None
 
     def put_paginated_data(self, batch) -> bool:
         key_value = self.key_value
         self.key_value = dict()
         for storage_key in key_value:
             value = key_value[storage_key]
-            if len(value) == 0:
+            if value is None:
                 self.delete(storage_key, batch)
+                continue
             self.put(storage_key, value, batch)
 
         return True
 
     def get_paginated_data(self, key, count) -> list:
-        storage_key = self.generate_key(key, count)
+        """
+        Returns the values of the page having the value at index count.
+        """
+        page = count // config.dev.data_per_page
+        start_key = self.generate_key(key, page * config.dev.data_per_page)
+        end_key = self.generate_key(key, (page + 1) * config.dev.data_per_page - 1)
         try:
-            pbData = self.db.get_raw(storage_key)
-            data_list = pur_pb2.DataList()
-            data_list.ParseFromString(bytes(pbData))
-            return list(data_list.values)
-        except KeyError:
-            return []
+            return [bytes(value) for _, value in self.db.get_range_iterator(start_key, end_key)]
         except Exception as e:
             logger.error('[get_paginated_data] Exception for %s', self.name)
             logger.exception(e)
             raise
 
+    def get_paginated_data_reversed(self, key, end_index: int, count: int) -> list:
+        """
+        Returns at most count values, newest first, starting from the value at
+        index end_index - 1, regardless of the page boundaries.
+        """
+        start_index = max(0, end_index - count)
+        if end_index <= start_index:
+            return []
+        start_key = self.generate_key(key, start_index)
+        end_key = self.generate_key(key, end_index - 1)
+        try:
+            return [bytes(value) for _, value in self.db.get_range_iterator(start_key, end_key, reverse=True)]
+        except Exception as e:
+            logger.error('[get_paginated_data_reversed] Exception for %s', self.name)
+            logger.exception(e)
+            raise
+
+    def generate_prefix(self, key) -> bytes:
+        return self.name + b'_entry_' + key + b'_'
+
     def generate_key(self, key, count: int):
-        page = count // config.dev.data_per_page
-        return self.name + b'_' + key + b'_' + str(page).encode()
+        return self.generate_prefix(key) + count.to_bytes(8, byteorder='big', signed=False)
 
     def put(self, storage_key, value, batch):
         if not self.write_access:
             return
-        data_list = pur_pb2.DataList(values=value)
         self.db.put_raw(storage_key,
-                        data_list.SerializeToString(),
+                        value,
                         batch)
 
     def delete(self, storage_key, batch):
@@ -92,3 +122,24 @@ class PaginatedData:
             return
         self.db.delete(storage_key,
                        batch)
+
+    def migrate_page(self, storage_key: bytes, data: bytes, batch) -> bool:
+        """
+        Moves a page stored by the older versions as a DataList, under the key
+        name_key_page, into one db key per value.
+        :return: False if storage_key is not a page of the older versions
+        """
+        if storage_key.startswith(self.name + b'_entry_'):
+            return False
+
+        key, page = storage_key[len(self.name) + 1:].rsplit(b'_', 1)
+        data_list = pur_pb2.DataList()
+        data_list.ParseFromString(bytes(data))
+
+        index = int(page.decode()) * config.dev.data_per_page
+        for value in data_list.values:
+            self.db.put_raw(self.generate_key(key, index), value, batch)
+            index += 1
+        self.db.delete(storage_key, batch)
+
+        return True
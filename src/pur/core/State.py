@@ -14,7 +14,7 @@ class State:
         if not my_db:
             self._db = db.DB()  # generate db object here
         self._tmp_state = None  # Temporary State file which needs to be fetched during migration to new db
-        self._state_version = 1  # Change State Version, each time any change made to leveldb structure
+        self._state_version = 4  # Change State Version, each time any change made to leveldb structure
 
     def __enter__(self):
         return self
@@ -50,9 +50,11 @@ class State:
         except Exception:
             raise Exception("Exception while retrieving version")
 
-    def put_state_version(self):
+    def put_state_version(self, state_version: int = None):
+        if state_version is None:
+            state_version = self._state_version
         try:
-            self._db.put_raw(b'state_version', str(self._state_version).encode())
+            self._db.put_raw(b'state_version', str(state_version).encode())
         except Exception:
             raise Exception("Exception while Setting version")
 
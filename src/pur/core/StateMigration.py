@@ -4,6 +4,8 @@ from pur.core import config
 from pur.core.misc import db, logger
 from pur.core.State import State
 from pur.core.Block import Block
+from pur.core.PaginatedBitfield import PaginatedBitfield
+from pur.core.PaginatedData import PaginatedData
 
 
 # TODO: State Migration integration pending
@@ -16,7 +18,7 @@ class StateMigration:
         Migration Step from State Version 0 to 1
         :return:
         """
-        if state.is_older_state_version():
+        if state.get_state_version() == 0:
             db_dir_v1 = os.path.join(config.user.data_dir, config.dev.db_name + '2')
             self._tmp_state = State(state._db)  # DB Pointing to Older State
             state._db = db.DB(db_dir_v1)  # DB Pointing to Newer State
@@ -27,7 +29,10 @@ class StateMigration:
         return self._tmp_state.get_mainchain_height()
 
     def block_from_state_version_0(self, block_number):
-        return Block.get_block_by_number(self._tmp_state, block_number)
+        block_number_mapping = Block.get_legacy_block_number_mapping(self._tmp_state, block_number)
+        if not block_number_mapping:
+            return None
+        return Block.get_block(self._tmp_state, block_number_mapping.headerhash)
 
     def state_migration_step_2(self, state: State):
         """
@@ -47,3 +52,81 @@ class StateMigration:
                     db_dir)
         state._db = db.DB()
         logger.warning("State Migration Finished")
+
+    def state_migration_step_3(self, state: State):
+        """
+        Migration Step from State Version 1 to 2
+        OTS bitfield pages are converted in place from DataList into raw bytes.
+        :return:
+        """
+        if state.get_state_version() != 1:
+            return
+        logger.warning("Please Wait... Migrating OTS Bitfields to State Version 2")
+        count = PaginatedBitfield(True, state._db).migrate_bitfields()
+        state.put_state_version(2)
+        logger.warning("Migrated %s OTS Bitfield pages", count)
+
+    def state_migration_step_4(self, state: State):
+        """
+        Migration Step from State Version 2 to 3
+        Block number mappings stored as json keyed by str(block_number) are
+        moved into the binary mainchain index.
+        :return:
+        """
+        if state.get_state_version() != 2:
+            return
+        logger.warning("Please Wait... Migrating Block Number Mappings to State Version 3")
+        # The legacy keys are deleted only once all the binary mappings have been written,
+        # so that an interrupted migration can be run again without losing any mapping.
+        batch = state.batch
+        block_number = 0
+        while True:
+            block_number_mapping = Block.get_legacy_block_number_mapping(state, block_number)
+            if not block_number_mapping:
+                break
+            Block.put_block_number_mapping(state, block_number, block_number_mapping, batch)
+            block_number += 1
+            if block_number % 10000 == 0:
+                state.write_batch(batch)
+                batch = state.batch
+                logger.warning("Migrated %s Block Number Mappings", block_number)
+        state.write_batch(batch)
+        logger.warning("Migrated %s Block Number Mappings", block_number)
+
+        batch = state.batch
+        block_number = 0
+        while Block.get_block_number_mapping(state, block_number):
+            state._db.delete(str(block_number).encode(), batch)
+            block_number += 1
+            if block_number % 10000 == 0:
+                state.write_batch(batch)
+                batch = state.batch
+        state.write_batch(batch)
+        state.put_state_version(3)
+        logger.warning("Removed %s legacy Block Number Mappings", block_number)
+
+    def state_migration_step_5(self, state: State):
+        """
+        Migration Step from State Version 3 to 4
+        Paginated data stored as a DataList per page is moved into one key per value.
+        :return:
+        """
+        if state.get_state_version() != 3:
+            return
+        logger.warning("Please Wait... Migrating Paginated Data to State Version 4")
+        batch = state.batch
+        count = 0
+        for name in [b'p_tx_hash', b'p_tokens', b'p_slaves', b'p_lattice_pk',
+                     b'p_multisig_address', b'p_multi_sig_spend', b'p_inbox_message']:
+            paginated_data = PaginatedData(name, True, state._db)
+            for storage_key, data in state._db.get_prefixed_iterator(name + b'_'):
+                if not paginated_data.migrate_page(storage_key, data, batch):
+                    continue
+                count += 1
+                if count % 100 == 0:
+                    state.write_batch(batch)
+                    batch = state.batch
+                    logger.warning("Migrated %s Paginated Data pages", count)
+        state.write_batch(batch)
+        state.put_state_version(4)
+        logger.warning("Migrated %s Paginated Data pages", count)
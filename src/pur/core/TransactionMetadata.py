@@ -70,6 +70,21 @@ class TransactionMetadata:
         except Exception:
             return None
 
+    @staticmethod
+    def get_tx_metadata_list(state: State, txhashes: list) -> list:
+        """
+        Reads the metadata of all the txhashes from a single snapshot of the db.
+        :return: list of TransactionMetadata, None for the txhashes not found
+        """
+        values = state._db.multi_get(txhashes)
+        tx_metadata_list = []
+        for txhash in txhashes:
+            if txhash not in values:
+                tx_metadata_list.append(None)
+                continue
+            tx_metadata_list.append(TransactionMetadata.deserialize(values[txhash]))
+        return tx_metadata_list
+
     @staticmethod
     def rollback_tx_metadata(state: State, block, batch):
         fee_reward = 0
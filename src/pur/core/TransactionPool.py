@@ -18,13 +18,57 @@ class TransactionPool:
     # FIpurE: Remove tx pool from all method names
     def __init__(self, broadcast_tx):
         self.pending_tx_pool = []
-        self.pending_tx_pool_hash = set()
-        self.transaction_pool = []  # FIpurE: Everyone is touching this
+        self.pending_tx_pool_hash = dict()  # txhash -> TransactionInfo of the pending txn
+
+        # txhash -> [fee, TransactionInfo] of the txns waiting to be added into a block
+        self._tx_pool = dict()
+        # PK -> {txhash: [fee, TransactionInfo]}
+        self._tx_pool_by_pk = dict()
+        # Heap of [-fee, counter, txhash, [fee, TransactionInfo]], highest fee first.
+        # Entries of the removed txns are not deleted from the heap, but skipped
+        # while iterating and dropped once they outnumber the txns in the pool.
+        self._fee_heap = []
+        self._fee_heap_counter = 0
+        self._fee_heap_stale_entries = 0
+        self._sorted_transactions = None
+
         self.broadcast_tx = broadcast_tx
 
     @property
-    def transactions(self):
-        return heapq.nlargest(len(self.transaction_pool), self.transaction_pool)
+    def transaction_pool(self) -> list:
+        return list(self._tx_pool.values())
+
+    @property
+    def transactions(self) -> list:
+        """
+        List of [fee, TransactionInfo] sorted by highest fee first.
+        The list is cached until the transaction pool is updated.
+        """
+        if self._sorted_transactions is None:
+            self._sorted_transactions = list(self.iterate_transactions())
+        return self._sorted_transactions
+
+    def iterate_transactions(self):
+        """
+        Yields [fee, TransactionInfo] sorted by highest fee first.
+        Instead of sorting the whole pool, the fee heap is walked from its root,
+        so that the first k txns cost O(k log k).
+        """
+        fee_heap = self._fee_heap
+        if not fee_heap:
+            return
+
+        candidates = [(fee_heap[0][:2], 0)]
+        while candidates:
+            _, index = heapq.heappop(candidates)
+            _, _, txhash, tx_set = fee_heap[index]
+
+            for child_index in (2 * index + 1, 2 * index + 2):
+                if child_index < len(fee_heap):
+                    heapq.heappush(candidates, (fee_heap[child_index][:2], child_index))
+
+            if self._tx_pool.get(txhash) is tx_set:
+                yield tx_set
 
     def set_broadcast_tx(self, broadcast_tx):
         self.broadcast_tx = broadcast_tx
@@ -35,10 +79,13 @@ class TransactionPool:
         pending_tx_set = heapq.heappop(self.pending_tx_pool)
         pending_tx = pending_tx_set[1].transaction
         timestamp = pending_tx_set[1].timestamp
-        self.pending_tx_pool_hash.remove(pending_tx.txhash)
+        del self.pending_tx_pool_hash[pending_tx.txhash]
 
         return pending_tx, timestamp
 
+    def get_pending_tx_info_from_pool(self, txhash):
+        return self.pending_tx_pool_hash.get(txhash)
+
     def is_full_pending_transaction_pool(self, ignore_reserve=True) -> bool:
         max_pool_size = config.user.pending_transaction_pool_size
 
@@ -51,7 +98,7 @@ class TransactionPool:
         return False
 
     def is_full_transaction_pool(self) -> bool:
-        if len(self.transaction_pool) >= config.user.transaction_pool_size:
+        if len(self._tx_pool) >= config.user.transaction_pool_size:
             return True
 
         return False
@@ -60,8 +107,7 @@ class TransactionPool:
         if self.is_full_pending_transaction_pool(ignore_reserve):
             return False
 
-        idx = self.get_tx_index_from_pool(tx.txhash)
-        if idx > -1:
+        if tx.txhash in self._tx_pool:
             return False
 
         if isinstance(tx, CoinBase):
@@ -73,8 +119,9 @@ class TransactionPool:
 
         # Since its a min heap giving priority to lower number
         # So -1 multiplied to give higher priority to higher txn
-        heapq.heappush(self.pending_tx_pool, [tx.fee * -1, TransactionInfo(tx, -1), ip])
-        self.pending_tx_pool_hash.add(tx.txhash)
+        tx_info = TransactionInfo(tx, -1)
+        heapq.heappush(self.pending_tx_pool, [tx.fee * -1, tx_info, ip])
+        self.pending_tx_pool_hash[tx.txhash] = tx_info
 
         return True
 
@@ -82,44 +129,66 @@ class TransactionPool:
         if self.is_full_transaction_pool():
             return False
 
-        heapq.heappush(self.transaction_pool, [tx_class_obj.fee, TransactionInfo(tx_class_obj,
-                                                                                 block_number,
-                                                                                 timestamp)])
+        if tx_class_obj.txhash in self._tx_pool:
+            return False
+
+        tx_set = [tx_class_obj.fee, TransactionInfo(tx_class_obj,
+                                                    block_number,
+                                                    timestamp)]
+        self._tx_pool[tx_class_obj.txhash] = tx_set
+        self._tx_pool_by_pk.setdefault(tx_class_obj.PK, dict())[tx_class_obj.txhash] = tx_set
+
+        heapq.heappush(self._fee_heap, [-tx_class_obj.fee, self._fee_heap_counter, tx_class_obj.txhash, tx_set])
+        self._fee_heap_counter += 1
+        self._sorted_transactions = None
+
         return True
 
-    def get_tx_index_from_pool(self, txhash):
-        for i in range(len(self.transaction_pool)):
-            txn = self.transaction_pool[i][1].transaction
-            if txhash == txn.txhash:
-                return i
+    def get_tx_info_from_pool(self, txhash):
+        tx_set = self._tx_pool.get(txhash)
+        if tx_set is None:
+            return None
+        return tx_set[1]
 
-        return -1
+    def get_tx_pool_by_pk(self, pk: bytes) -> list:
+        """
+        List of [fee, TransactionInfo] of the txns in pool signed by pk
+        """
+        return list(self._tx_pool_by_pk.get(pk, dict()).values())
+
+    def _remove_txhash_from_pool(self, txhash):
+        tx_set = self._tx_pool.pop(txhash, None)
+        if tx_set is None:
+            return
+
+        pk = tx_set[1].transaction.PK
+        txs_by_pk = self._tx_pool_by_pk[pk]
+        del txs_by_pk[txhash]
+        if not txs_by_pk:
+            del self._tx_pool_by_pk[pk]
+
+        self._sorted_transactions = None
+        self._fee_heap_stale_entries += 1
+        if self._fee_heap_stale_entries > len(self._tx_pool):
+            # New list, so that an iterate_transactions in progress is not affected
+            self._fee_heap = [entry for entry in self._fee_heap if self._tx_pool.get(entry[2]) is entry[3]]
+            heapq.heapify(self._fee_heap)
+            self._fee_heap_stale_entries = 0
 
     def remove_tx_from_pool(self, tx: Transaction):
-        idx = self.get_tx_index_from_pool(tx.txhash)
-        if idx > -1:
-            del self.transaction_pool[idx]
-            heapq.heapify(self.transaction_pool)
+        self._remove_txhash_from_pool(tx.txhash)
 
     def remove_tx_in_block_from_pool(self, block_obj: Block):
         for protobuf_tx in block_obj.transactions[1:]:  # Ignore first transaction, as it is a coinbase txn
             tx = Transaction.from_pbdata(protobuf_tx)
             if tx.ots_key < config.dev.max_ots_tracking_index:
-                idx = self.get_tx_index_from_pool(tx.txhash)
-                if idx > -1:
-                    del self.transaction_pool[idx]
+                self._remove_txhash_from_pool(tx.txhash)
             else:
-                i = 0
-                while i < len(self.transaction_pool):
-                    txn = self.transaction_pool[i][1].transaction
-                    if txn.PK == tx.PK:
-                        if txn.ots_key >= config.dev.max_ots_tracking_index:
-                            if txn.ots_key <= tx.ots_key:
-                                del self.transaction_pool[i]
-                                continue
-                    i += 1
-
-        heapq.heapify(self.transaction_pool)
+                for fee, tx_info in self.get_tx_pool_by_pk(tx.PK):
+                    txn = tx_info.transaction
+                    if txn.ots_key >= config.dev.max_ots_tracking_index:
+                        if txn.ots_key <= tx.ots_key:
+                            self._remove_txhash_from_pool(txn.txhash)
 
     def add_tx_from_block_to_pool(self, block: Block, current_block_number):
         """
@@ -134,9 +203,7 @@ class TransactionPool:
                 return
 
     def check_stale_txn(self, new_state_container, update_state_container, current_block_number):
-        i = 0
-        while i < len(self.transaction_pool):
-            tx_info = self.transaction_pool[i][1]
+        for fee, tx_info in self.transaction_pool:
             if tx_info.is_stale(current_block_number):
                 if not tx_info.validate(new_state_container, update_state_container, current_block_number):
                     logger.warning('Txn validation failed for tx in tx_pool')
@@ -145,4 +212,3 @@ class TransactionPool:
 
                 tx_info.update_block_number(current_block_number)
                 self.broadcast_tx(tx_info.transaction)
-            i += 1
@@ -33,6 +33,7 @@ class UserConfig(object):
         self.mining_address = ''
         self.mining_thread_count = 0  # 0 to auto detect thread count based on CPU/GPU number of processors
         self.mining_pause = 0  # this will force a sleep (ms) while mining to reduce cpu usage. Only for mocknet
+        self.verification_thread_count = 0  # 0 to auto detect thread count for signature & PoW verification
 
         # Ephemeral Configuration
         self.accept_ephemeral = True
@@ -51,15 +52,22 @@ class UserConfig(object):
 
         self.peer_rate_limit = 500  # Max Number of messages per minute per peer
         self.p2p_q_size = 10000
+        self.block_download_window = 32  # Max Number of blocks requested in parallel across peers while syncing
+        self.block_download_timeout = 100  # Peer is banned if requested block is not received within 100 seconds
         self.outgoing_message_expiry = 90  # Outgoing message expires after 90 seconds
+        self.mr_batch_window = 0.1  # Seconds the message receipts are accumulated before being announced in a single MRB
+        self.known_inventory_size = 50000  # Min number of message hashes remembered per peer, to avoid relaying them again
+        self.known_inventory_fp_rate = 0.0001  # False positive rate of the known inventory of each peer
 
         self.ntp_servers = ['pool.ntp.org', 'ntp.ubuntu.com']
         self.ntp_refresh = 12 * 60 * 60  # 12 hours
         self.ntp_request_timeout = 10  # 10 seconds ntp timeout
         self.ban_minutes = 20  # Allows to ban a peer's IP who is breaking protocol
+        self.peers_flush_interval = 30  # Seconds the known and banned peers changes are kept in memory before being saved
 
         self.monitor_connections_interval = 30  # Monitor connection every 30 seconds
         self.max_peers_limit = 100  # Number of allowed peers
+        self.address_book_size = 1000  # Max number of peer ips whose connection quality metrics are kept
         self.chain_state_timeout = 180
         self.chain_state_broadcast_period = 30
         # must be less than ping_timeout
@@ -70,6 +78,7 @@ class UserConfig(object):
         # 1% of the pending_transaction_pool will be reserved for moving stale txn
         self.pending_transaction_pool_reserve = int(self.pending_transaction_pool_size * 0.01)
         self.stale_transaction_threshold = 15  # 15 Blocks
+        self.block_cache_size = 64 * 1024 * 1024  # Max bytes of decoded blocks, block metadata and block number mappings cached
 
         self._pur_dir = expanduser(os.path.join("~/.pur"))
 
@@ -88,8 +97,10 @@ class UserConfig(object):
         self.public_api_enabled = True
         self.public_api_host = "127.0.0.1"
         self.public_api_port = 19009
-        self.public_api_threads = 1
+        self.public_api_threads = os.cpu_count() or 1
         self.public_api_max_concurrent_rpc = 100
+        self.public_api_max_subscribers = 16  # Max concurrent Subscribe* streams, each one holding an api thread
+        self.public_api_subscriber_queue_size = 1000  # Max pending events per subscriber, before it gets dropped
 
         # ======================================
         #        MINING API CONFIGURATION
@@ -122,6 +133,9 @@ class UserConfig(object):
         self.wallet_daemon_host = "127.0.0.1"
         self.wallet_daemon_port = 18091
         self.number_of_slaves = 3
+        self.walletd_purss_cache_size = 64  # Max number of live purSS trees kept by walletd to sign without generating them
+        self.walletd_sign_processes = 0  # Worker processes signing the transactions of a RelayBatch, 0 for one per cpu
+        self.walletd_push_batch_size = 500  # Max signed transactions sent to the node per PushTransactions request
 
         # ======================================
         #        WALLET API CONFIGURATION
@@ -231,6 +245,7 @@ class DevConfig(object):
 
         self.message_q_size = 300
         self.message_receipt_timeout = 10  # request timeout for full message
+        self.mr_batch_max_size = 1000  # Max number of message receipts in a MRB or SFMB
         self.message_buffer_size = 64 * 1024 * 1024  # 64 MB
 
         self.timestamp_error = 5  # Error in second
@@ -68,6 +68,8 @@ class MessageReceipt(object):
         ######################
         purlegacy_pb2.LegacyMessage.MR: 'mrData',
         purlegacy_pb2.LegacyMessage.SFM: 'mrData',
+        purlegacy_pb2.LegacyMessage.MRB: 'mrBatchData',
+        purlegacy_pb2.LegacyMessage.SFMB: 'mrBatchData',
 
         purlegacy_pb2.LegacyMessage.BK: 'block',
         purlegacy_pb2.LegacyMessage.FB: 'fbData',
@@ -31,6 +31,10 @@ class DB:
                                 compression='snappy')
             self.db.put(b'state_version', str(1).encode())
 
+        # Values read by prefetch(), served by get_raw() until the next write.
+        # None is kept for the keys which are not in the db.
+        self._prefetched = dict()
+
     def close(self):
         del self.db
 
@@ -38,6 +42,7 @@ class DB:
         if db_dir:
             self.db_dir = db_dir
         self.db = plyvel.DB(self.db_dir, max_open_files=1000, lru_cache_size=5 * 1024)
+        self.clear_prefetched()
 
     def RangeIter(self, key_obj_start, key_obj_end):
         if not isinstance(key_obj_start, bytes):
@@ -51,22 +56,70 @@ class DB:
     def get_db_keys(self, include_value: bool):
         return self.db.RangeIter(include_value=include_value)
 
+    def get_prefixed_iterator(self, prefix: bytes, include_value=True):
+        return self.db.iterator(prefix=prefix, include_value=include_value)
+
+    def get_range_iterator(self, start: bytes, stop: bytes, include_value=True, reverse=False):
+        """
+        Iterates over the keys from start to stop, both included.
+        """
+        return self.db.iterator(start=start, stop=stop, include_stop=True, include_value=include_value, reverse=reverse)
+
+    def get_snapshot(self):
+        return self.db.snapshot()
+
+    def multi_get(self, keys, snapshot=None) -> dict:
+        """
+        Reads all the keys from the same snapshot of the db.
+        :return: dict of the keys found, with their values
+        """
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+
+        values = dict()
+        for key in keys:
+            value = snapshot.get(key)
+            if value is not None:
+                values[key] = value
+
+        return values
+
+    def prefetch(self, keys, snapshot=None) -> dict:
+        """
+        Reads all the keys with multi_get, get_raw then serves them from memory
+        until clear_prefetched is called or a batch is written.
+        :return: dict of the keys found, with their values
+        """
+        keys = [key for key in keys if key not in self._prefetched]
+        values = self.multi_get(keys, snapshot)
+        for key in keys:
+            self._prefetched[key] = values.get(key)
+        return values
+
+    def clear_prefetched(self):
+        self._prefetched = dict()
+
     def delete(self, key_obj: bytes, batch=None):
         if batch:
             batch.delete(key_obj)
         else:
+            self._prefetched.pop(key_obj, None)
             self.db.delete(key_obj)
 
     def put_raw(self, key, value, batch=None):
         if batch:
             batch.put(key, value)
         else:
+            self._prefetched.pop(key, None)
             self.db.put(key, value)
 
     def get_raw(self, key):
         if isinstance(key, str):
             key = bytes(key, 'utf-8')
-        value = self.db.get(key)
+        if key in self._prefetched:
+            value = self._prefetched[key]
+        else:
+            value = self.db.get(key)
         if value is None:
             raise KeyError
         return value
@@ -74,6 +127,38 @@ class DB:
     def get_batch(self):
         return self.db.write_batch()
 
-    @staticmethod
-    def write_batch(batch, sync=True):
+    def write_batch(self, batch, sync=True):
+        self.clear_prefetched()
         batch.write()
+
+
+class SnapshotDB(DB):
+    """
+    Read only view of a DB, pinned at the time it has been created.
+    It can be read from any thread while the DB is being written.
+    """
+    def __init__(self, parent_db: DB):
+        self.db_dir = parent_db.db_dir
+        self.db = parent_db.db.snapshot()
+        self._prefetched = dict()
+
+    def close(self):
+        self.db.close()
+
+    def open(self, db_dir=None):
+        raise NotImplementedError('SnapshotDB cannot be reopened')
+
+    def get_snapshot(self):
+        return self.db
+
+    def delete(self, key_obj: bytes, batch=None):
+        raise NotImplementedError('SnapshotDB is read only')
+
+    def put_raw(self, key, value, batch=None):
+        raise NotImplementedError('SnapshotDB is read only')
+
+    def get_batch(self):
+        raise NotImplementedError('SnapshotDB is read only')
+
+    def write_batch(self, batch, sync=True):
+        raise NotImplementedError('SnapshotDB is read only')
@@ -1,6 +1,9 @@
 # coding=utf-8
 # Distributed under the MIT software license, see the accompanying
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+import heapq
+import os
+import threading
 from collections import Set
 
 import simplejson as json
@@ -9,11 +12,20 @@ from pur.core.misc import ntp, logger
 
 
 class ExpiringSet(Set):
+    """
+    Set of items that expire after expiration_time seconds.
+    Expiration times are kept in a heap, so that checking for expired items only
+    pops the items that actually expired. Changes are only kept in memory until
+    flush() is called, so that adding or expiring items never touches the disk.
+    """
     def __init__(self, expiration_time, filename=None):
         super().__init__()
         self.expiration_time = expiration_time
         self._data = dict()
+        self._expiry_heap = []
         self._filename = filename
+        self._dirty = False
+        self._store_lock = threading.Lock()
         self._load()
 
     def __contains__(self, x: object) -> bool:
@@ -28,29 +40,54 @@ class ExpiringSet(Set):
         self._refresh()
         return self._data.keys().__iter__()
 
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
     def add(self, x):
         current_time = ntp.getTime()
-        self._data[x] = current_time + self.expiration_time
-        self._store()
+        self._set(x, current_time + self.expiration_time)
+        self._dirty = True
+
+    def _set(self, x, expiry):
+        self._data[x] = expiry
+        heapq.heappush(self._expiry_heap, (expiry, x))
 
     def _refresh(self):
-        # TODO: refactored from banned peers. Rework to use a priority queue instead
         current_time = ntp.getTime()
 
-        len_before = len(self._data)
-        self._data = {k: v for k, v in self._data.items() if v > current_time}
-        len_after = len(self._data)
+        while self._expiry_heap and self._expiry_heap[0][0] <= current_time:
+            expiry, x = heapq.heappop(self._expiry_heap)
+            # Entries of items added again since then are outdated
+            if self._data.get(x) == expiry:
+                del self._data[x]
+                self._dirty = True
 
         # FIpurE: Drop peers beyond configuration limit
 
-        if len_before != len_after:
-            self._store()
+    def snapshot(self) -> dict:
+        """
+        Returns a copy of the items and their expiration times, and marks them as stored.
+        """
+        self._refresh()
+        self._dirty = False
+        return dict(self._data)
+
+    def flush(self):
+        if self._dirty:
+            self.store(self.snapshot())
 
-    def _store(self):
+    def store(self, data: dict):
+        """
+        Writes a snapshot to the file. It does not access the set, so it can run in another thread.
+        """
         if self._filename is not None:
             try:
-                with open(self._filename, 'w') as f:
-                    json.dump(self._data, f)
+                with self._store_lock:
+                    tmp_filename = self._filename + '.tmp'
+                    with open(tmp_filename, 'w') as f:
+                        json.dump(data, f)
+                    os.replace(tmp_filename, self._filename)
             except Exception as e:
                 logger.error("not possible to save banned peers")
                 logger.exception(e)
@@ -59,7 +96,9 @@ class ExpiringSet(Set):
         if self._filename is not None:
             try:
                 with open(self._filename, 'r') as f:
-                    self._data = json.load(f)
+                    data = json.load(f)
+                for x, expiry in data.items():
+                    self._set(x, expiry)
                 self._refresh()
             except FileNotFoundError:
-                self._data = dict()
+                pass
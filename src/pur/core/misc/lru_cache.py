@@ -0,0 +1,61 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Least recently used cache bounded by the total size of its values.
+    The size of each value is given by the caller, usually its serialized size in bytes.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()  # key -> [value, size]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, size: int=1):
+        self.remove(key)
+        if size > self.max_size:
+            return
+
+        self._data[key] = [value, size]
+        self.size += size
+        while self.size > self.max_size:
+            _, (_, evicted_size) = self._data.popitem(last=False)
+            self.size -= evicted_size
+
+    def remove(self, key):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def clear(self):
+        self._data.clear()
+        self.size = 0
+
+    def get_stats(self) -> dict:
+        return {'entries': len(self._data),
+                'size': self.size,
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses}
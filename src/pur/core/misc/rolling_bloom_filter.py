@@ -0,0 +1,57 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+import hashlib
+import math
+import os
+
+
+class RollingBloomFilter:
+    """
+    Bounded set of the most recently added items, such as the message hashes known by a peer.
+    Items are added to the current generation of a bloom filter, which replaces the previous
+    generation once it holds capacity items. The last capacity items are always remembered,
+    membership tests may return false positives, at about twice fp_rate.
+    """
+
+    MAX_HASH_COUNT = 16  # Number of 4 bytes positions in a sha512 digest
+
+    def __init__(self, capacity: int, fp_rate: float):
+        self.capacity = capacity
+        self._bit_count = max(8, int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))))
+        self._hash_count = max(1, min(self.MAX_HASH_COUNT, int(round(self._bit_count / capacity * math.log(2)))))
+        # Random salt, so that peers cannot craft hashes colliding in the filter of another node
+        self._salt = os.urandom(16)
+        self._current = bytearray((self._bit_count + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._current_count = 0
+
+    def _positions(self, item: bytes) -> list:
+        digest = hashlib.sha512(self._salt + item).digest()
+        return [int.from_bytes(digest[i * 4:i * 4 + 4], byteorder='big') % self._bit_count
+                for i in range(self._hash_count)]
+
+    @staticmethod
+    def _contains(bits: bytearray, positions: list) -> bool:
+        for position in positions:
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __contains__(self, item: bytes) -> bool:
+        positions = self._positions(item)
+        return self._contains(self._current, positions) or self._contains(self._previous, positions)
+
+    def add(self, item: bytes):
+        positions = self._positions(item)
+        if self._contains(self._current, positions):
+            return
+
+        if self._current_count >= self.capacity:
+            self._previous = self._current
+            self._current = bytearray(len(self._previous))
+            self._current_count = 0
+
+        for position in positions:
+            self._current[position >> 3] |= 1 << (position & 7)
+        self._current_count += 1
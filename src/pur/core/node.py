@@ -213,7 +213,30 @@ class POW(ConsensusMechanism):
             self.pre_block_logic(block)
             del self.future_blocks[key]
 
-    def pre_block_logic(self, block: Block):
+    def block_received(self, block: Block):
+        """
+        Verifies the PoW and the signatures of a block received from a peer on the
+        verification pool, then adds it through pre_block_logic. The PoW requires the
+        parent block in the state, otherwise the block is left to pre_block_logic.
+        """
+        if not self.chain_manager.get_block(block.prev_headerhash):
+            self.pre_block_logic(block)
+            return
+
+        d = self.p2p_factory.verification_pool.verify_block(block, self.chain_manager)
+        d.addCallback(self.block_verified, block)
+
+    def block_verified(self, is_valid: bool, block: Block):
+        if not is_valid:
+            logger.warning('PoW or Signature Validation failed for #%s %s', block.block_number, bin2hstr(block.headerhash))
+            return
+
+        self.pre_block_logic(block, verified=True)
+
+    def pre_block_logic(self, block: Block, verified=False):
+        """
+        :param verified: True if the PoW and the signatures have already been verified on the verification pool
+        """
         logger.debug('LOCK - TRY - pre_block_logic')
         with self.miner.lock:
             logger.debug('LOCK - LOCKED - pre_block_logic')
@@ -223,6 +246,12 @@ class POW(ConsensusMechanism):
                 return False
 
             dev_config = self.chain_manager.get_config_by_block_number(block.block_number)
+
+            # Verified before caching a future block, so that future_blocks only holds blocks with a valid PoW
+            if not verified and not self.chain_manager.validate_mining_nonce(block.blockheader, dev_config):
+                logger.warning('Failed PoW Validation for #%s %s', block.block_number, bin2hstr(block.headerhash))
+                return False
+
             if block.is_future_block(dev_config):
                 delay = abs(block.timestamp - ntp.getTime()) + 1
                 reactor.callLater(delay, self.process_future_blocks)
@@ -230,7 +259,7 @@ class POW(ConsensusMechanism):
                 return True
 
             logger.debug('Inside add_block')
-            result = self.chain_manager.add_block(block)
+            result = self.chain_manager.add_block(block, verify_signature=not verified)
 
             logger.debug('trigger_miner %s', self.chain_manager.trigger_miner)
             if self.chain_manager.trigger_miner:
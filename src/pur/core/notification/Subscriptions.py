@@ -0,0 +1,111 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+import threading
+from queue import Queue, Full, Empty
+
+from pur.core.misc import logger
+
+
+class Subscriber(object):
+    """
+    Events published to a single subscriber, such as a server streaming rpc.
+    The events are kept in a bounded queue, a subscriber that does not consume
+    them fast enough is dropped instead of blocking the publisher.
+    """
+    def __init__(self, topic: str, queue_size: int, addresses: set = None):
+        self.topic = topic
+        self.addresses = addresses
+        self.dropped = False
+        self._queue = Queue(maxsize=queue_size)
+        self._closed = threading.Event()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def put(self, event) -> bool:
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(event)
+        except Full:
+            self.dropped = True
+            self.close()
+            return False
+        return True
+
+    def get(self, timeout=None):
+        """
+        Returns the next event, or None if no event has been published within
+        timeout seconds or if the subscriber has been closed.
+        """
+        if self.closed:
+            return None
+        try:
+            event = self._queue.get(timeout=timeout)
+        except Empty:
+            return None
+        if self.closed:
+            return None
+        return event
+
+    def close(self):
+        self._closed.set()
+        # Wakes up a pending get()
+        try:
+            self._queue.put_nowait(None)
+        except Full:
+            pass
+
+
+class SubscriptionManager(object):
+    TOPIC_BLOCKS = 'blocks'
+    TOPIC_MEMPOOL = 'mempool'
+    TOPIC_ADDRESSES = 'addresses'
+
+    def __init__(self, max_subscribers: int, queue_size: int):
+        self._max_subscribers = max_subscribers
+        self._queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = dict()
+
+    @property
+    def subscribers_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def has_subscribers(self, topic: str) -> bool:
+        return bool(self._subscribers.get(topic))
+
+    def subscribe(self, topic: str, addresses: set = None):
+        """
+        :return: the new Subscriber, None if the maximum number of subscribers has been reached
+        """
+        with self._lock:
+            if sum(len(subscribers) for subscribers in self._subscribers.values()) >= self._max_subscribers:
+                return None
+            subscriber = Subscriber(topic, self._queue_size, addresses)
+            # Subscriber lists are replaced rather than modified, so that they are published to without the lock
+            self._subscribers[topic] = self._subscribers.get(topic, []) + [subscriber]
+            return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        subscriber.close()
+        with self._lock:
+            subscribers = self._subscribers.get(subscriber.topic, [])
+            if subscriber in subscribers:
+                self._subscribers[subscriber.topic] = [s for s in subscribers if s is not subscriber]
+
+    def publish(self, topic: str, event, addresses: set = None):
+        """
+        Publishes the event to the subscribers of the topic. When addresses is given,
+        the event is only published to the subscribers of any of these addresses.
+        """
+        for subscriber in self._subscribers.get(topic, []):
+            if addresses is not None and subscriber.addresses is not None:
+                if subscriber.addresses.isdisjoint(addresses):
+                    continue
+            if not subscriber.put(event) and subscriber.dropped:
+                logger.info('Dropped slow %s subscriber', topic)
+                self.unsubscribe(subscriber)
@@ -0,0 +1,144 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+import time
+from collections import OrderedDict
+
+from pur.core.misc import ntp
+from pur.core.p2p.IPMetadata import IPMetadata
+
+
+class PeerStats(object):
+    """
+    Connection quality of a peer ip, kept across its connections.
+    Latency and download rate are exponential moving averages of the samples.
+    """
+    SMOOTHING = 0.2
+    DEFAULT_LATENCY = 1  # Seconds assumed until a P2P_ACK round trip has been measured
+    REFERENCE_RATE = 64 * 1024  # Bytes/s download rate scored 0.5, also assumed until a download has been measured
+    REFERENCE_UPTIME = 10 * 60  # Seconds of uptime after which a peer is considered stable
+
+    def __init__(self):
+        self.latency = None
+        self.download_rate = None
+        self.served_requests = 0
+        self.failed_requests = 0
+        self.connection_attempts = 0
+        self.connections = 0
+        self.connected_since = None
+        self._previous_uptime = 0
+
+    @property
+    def uptime(self) -> int:
+        if self.connected_since is None:
+            return self._previous_uptime
+        return self._previous_uptime + ntp.getTime() - self.connected_since
+
+    def _average(self, average, sample):
+        if average is None:
+            return sample
+        return average + self.SMOOTHING * (sample - average)
+
+    def add_latency(self, latency: float):
+        self.latency = self._average(self.latency, latency)
+
+    def add_download(self, size: int, duration: float):
+        self.download_rate = self._average(self.download_rate, size / max(duration, 0.001))
+
+    def connected(self):
+        self.connections += 1
+        self.connected_since = ntp.getTime()
+
+    def disconnected(self):
+        self._previous_uptime = self.uptime
+        self.connected_since = None
+
+    @property
+    def score(self) -> float:
+        """
+        Score of the peer as a source of requested messages and blocks, in [0, 1].
+        """
+        reliability = (self.served_requests + 1) / (self.served_requests + self.failed_requests + 2)
+        latency = self.latency if self.latency is not None else self.DEFAULT_LATENCY
+        download_rate = self.download_rate if self.download_rate is not None else self.REFERENCE_RATE
+        return reliability * download_rate / (download_rate + self.REFERENCE_RATE) / (1 + latency)
+
+    @property
+    def connection_score(self) -> float:
+        """
+        Score of the peer as an outbound connection candidate, in [0, 1].
+        """
+        availability = (self.connections + 1) / (self.connection_attempts + 2)
+        stability = (self.uptime + self.REFERENCE_UPTIME) / (self.uptime + 2 * self.REFERENCE_UPTIME)
+        return availability * stability * self.score
+
+
+class AddressBook(object):
+    """
+    Connection quality metrics of the peers, used to route requests around slow peers:
+    the P2P_ACK round trip latency, the download rate and the failures of the requested
+    blocks and messages, and the uptime of the connections.
+    """
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        # ip -> PeerStats, least recently used first
+        self._stats = OrderedDict()
+        # (ip, request key) -> (time of the request, channel)
+        self._pending_requests = dict()
+        # Scores of the peers without metrics yet
+        self._default_stats = PeerStats()
+
+    def __len__(self):
+        return len(self._stats)
+
+    def get(self, ip) -> PeerStats:
+        stats = self._stats.get(ip)
+        if stats is not None:
+            self._stats.move_to_end(ip)
+            return stats
+
+        if len(self._stats) >= self._max_size:
+            # Forgets the least recently used peer which is not connected
+            for old_ip, old_stats in self._stats.items():
+                if old_stats.connected_since is None:
+                    del self._stats[old_ip]
+                    break
+
+        stats = PeerStats()
+        self._stats[ip] = stats
+        return stats
+
+    def score(self, channel) -> float:
+        return self._stats.get(channel.peer.ip, self._default_stats).score
+
+    def connection_score(self, full_address: str) -> float:
+        ip = IPMetadata.from_full_address(full_address).ip
+        return self._stats.get(ip, self._default_stats).connection_score
+
+    def connection_attempted(self, ip):
+        self.get(ip).connection_attempts += 1
+
+    def connected(self, channel):
+        self.get(channel.peer.ip).connected()
+
+    def disconnected(self, channel):
+        self.get(channel.peer.ip).disconnected()
+        for key in [key for key, (_, pending_channel) in self._pending_requests.items() if pending_channel is channel]:
+            del self._pending_requests[key]
+
+    def add_latency(self, channel, latency: float):
+        self.get(channel.peer.ip).add_latency(latency)
+
+    def request_sent(self, channel, key):
+        self._pending_requests[(channel.peer.ip, key)] = (time.monotonic(), channel)
+
+    def request_served(self, channel, key, size: int = None):
+        stats = self.get(channel.peer.ip)
+        stats.served_requests += 1
+        pending_request = self._pending_requests.pop((channel.peer.ip, key), None)
+        if pending_request is not None and size is not None:
+            stats.add_download(size, time.monotonic() - pending_request[0])
+
+    def request_failed(self, channel, key):
+        self.get(channel.peer.ip).failed_requests += 1
+        self._pending_requests.pop((channel.peer.ip, key), None)
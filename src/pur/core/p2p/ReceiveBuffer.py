@@ -0,0 +1,76 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+import struct
+
+
+class ReceiveBuffer(object):
+    """
+    Bytes received from a peer and not parsed yet.
+    The bytes are appended to a preallocated bytearray and consumed by moving
+    the read offset, so that each frame is read from a memoryview slice, without
+    slicing or concatenating the rest of the buffer.
+    The unread bytes are moved back to the start of the bytearray only once its end
+    has been reached, and the bytearray is doubled when they fill more than half of it,
+    so that each received byte is copied a bounded number of times, however the
+    data is split into TCP chunks.
+    """
+    DEFAULT_CAPACITY = 64 * 1024
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._initial_capacity = capacity
+        self._data = bytearray(capacity)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __bytes__(self):
+        return bytes(self._data[self._start:self._end])
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def write(self, data: bytes):
+        size = len(data)
+        if self._end + size > len(self._data):
+            self._make_room(size)
+        self._data[self._end:self._end + size] = data
+        self._end += size
+
+    def _make_room(self, size: int):
+        length = len(self)
+        capacity = len(self._data)
+        if length + size > capacity // 2:
+            capacity = max(capacity * 2, length + size)
+            data = bytearray(capacity)
+            data[:length] = self._data[self._start:self._end]
+            self._data = data
+        else:
+            self._data[:length] = self._data[self._start:self._end]
+        self._start = 0
+        self._end = length
+
+    def unpack_uint32(self, offset: int = 0) -> int:
+        """
+        Reads a big-endian uint32 at offset from the first unread byte.
+        """
+        return struct.unpack_from('>L', self._data, self._start + offset)[0]
+
+    def view(self, offset: int, size: int) -> memoryview:
+        """
+        Returns the unread bytes from offset to offset + size, without copying them.
+        The memoryview must be released before the next write or consume.
+        """
+        start = self._start + offset
+        return memoryview(self._data)[start:min(start + size, self._end)]
+
+    def consume(self, size: int):
+        self._start = min(self._start + size, self._end)
+        if self._start == self._end:
+            self._start = self._end = 0
+            # Releases the memory used by a large message, such as a block
+            if len(self._data) > self._initial_capacity:
+                self._data = bytearray(self._initial_capacity)
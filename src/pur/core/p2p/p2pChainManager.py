@@ -79,7 +79,7 @@ class P2PChainManager(P2PBaseObserver):
         if not source.factory.master_mr.isRequested(block.headerhash, source, block):
             return
 
-        source.factory.pow.pre_block_logic(block)  # FIpurE: Ignores return value
+        source.factory.pow.block_received(block)
         source.factory.master_mr.register(purlegacy_pb2.LegacyMessage.BK, block.headerhash, message.block)
 
     def handle_block_height(self, source, message: purlegacy_pb2.LegacyMessage):
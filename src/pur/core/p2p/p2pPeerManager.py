@@ -2,12 +2,14 @@
 # Distributed under the MIT software license, see the accompanying
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 import os
+import threading
 from enum import Enum
 from typing import Callable, Set, List
 from ipaddress import IPv4Address
 
 import simplejson as json
 from pyqryptonight.pyqryptonight import UInt256ToString
+from twisted.internet import reactor
 
 from pur.core import config
 from pur.core.misc import logger, ntp
@@ -16,7 +18,7 @@ from pur.core.notification.Observable import Observable
 from pur.core.notification.ObservableEvent import ObservableEvent
 from pur.core.p2p.IPMetadata import IPMetadata
 from pur.core.p2p.p2pObserver import P2PBaseObserver
-from pur.core.p2p.p2pprotocol import P2PProtocol
+from pur.core.p2p.p2pprotocol import P2PProtocol, SUPPORTED_FEATURES
 from pur.generated import purlegacy_pb2, pur_pb2
 
 
@@ -33,6 +35,11 @@ class P2PPeerManager(P2PBaseObserver):
         self._peer_node_status = dict()
 
         self._known_peers = set()
+        # known_peers.json contents, ordered from the last connected peers to the disconnected ones
+        self._peer_order = []
+        self._peers_dirty = False
+        self._peers_store_lock = threading.Lock()
+        self._flush_call = None
         self.peers_path = os.path.join(config.user.data_dir,
                                        config.dev.peers_filename)
 
@@ -91,14 +98,20 @@ class P2PPeerManager(P2PBaseObserver):
     def save_known_peers(self, known_peers: List[str]):
         tmp = list(known_peers)[:3 * config.user.max_peers_limit]
         config.create_path(config.user.data_dir)
-        with open(self.peers_path, 'w') as outfile:
-            json.dump(tmp, outfile)
+        with self._peers_store_lock:
+            tmp_path = self.peers_path + '.tmp'
+            with open(tmp_path, 'w') as outfile:
+                json.dump(tmp, outfile)
+            os.replace(tmp_path, self.peers_path)
 
     def load_peer_addresses(self) -> None:
         known_peers = self.load_known_peers()
         self._known_peers = self.combine_peer_lists(known_peers, config.user.peer_list, )
         logger.info('Loaded known peers: %s', self._known_peers)
-        self.save_known_peers(self._known_peers)
+        self._peer_order = [p for p in known_peers if p in self._known_peers]
+        self._peer_order.extend(self._known_peers - set(self._peer_order))
+        self.save_known_peers(self._peer_order)
+        reactor.addSystemEventTrigger('before', 'shutdown', self.flush, False)
 
     def extend_known_peers(self, new_peer_addresses: set) -> None:
         new_addresses = set(new_peer_addresses) - self._known_peers
@@ -106,8 +119,47 @@ class P2PPeerManager(P2PBaseObserver):
         if self._p2p_factory is not None:
             self._p2p_factory.connect_peer(new_addresses)
 
-        self._known_peers |= set(new_peer_addresses)
-        self.save_known_peers(list(self._known_peers))
+        if new_addresses:
+            self._known_peers |= new_addresses
+            self._peer_order.extend(new_addresses)
+            self._peers_dirty = True
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flush_call is None:
+            self._flush_call = reactor.callLater(config.user.peers_flush_interval, self.flush)
+
+    def flush(self, threaded=True):
+        """
+        Writes the known peers and the banned peers changed since the last flush.
+        The files are written from the reactor thread pool, unless threaded is False,
+        so that the peer bookkeeping never blocks the handling of the messages.
+        """
+        if self._flush_call is not None:
+            if self._flush_call.active():
+                self._flush_call.cancel()
+            self._flush_call = None
+
+        writes = []
+        if self._peers_dirty:
+            self._peers_dirty = False
+            writes.append((self.save_known_peers, list(self._peer_order)))
+        if self._banned_peer_ips.dirty:
+            writes.append((self._banned_peer_ips.store, self._banned_peer_ips.snapshot()))
+
+        for write, data in writes:
+            if threaded:
+                reactor.callInThread(self._write, write, data)
+            else:
+                self._write(write, data)
+
+    @staticmethod
+    def _write(write, data):
+        try:
+            write(data)
+        except Exception as e:
+            logger.error('Could not save peers')
+            logger.exception(e)
 
     @staticmethod
     def combine_peer_lists(peer_ips, sender_full_addresses: List, check_global=False) -> Set[IPMetadata]:
@@ -139,7 +191,7 @@ class P2PPeerManager(P2PBaseObserver):
         return best_channel
 
     def insert_to_last_connected_peer(self, ip_public_port, connected_peer=False):
-        known_peers = self.load_known_peers()
+        known_peers = self._peer_order
         connection_set = set()
 
         if self._p2p_factory is not None:
@@ -163,7 +215,8 @@ class P2PPeerManager(P2PBaseObserver):
                     break
                 index += 1
             known_peers.insert(index, ip_public_port)
-            self.save_known_peers(known_peers)
+            self._peers_dirty = True
+            self._schedule_flush()
         except ValueError:
             pass
 
@@ -218,7 +271,8 @@ class P2PPeerManager(P2PBaseObserver):
                 func_name=purlegacy_pb2.LegacyMessage.VE,
                 veData=purlegacy_pb2.VEData(version=config.dev.version,
                                             genesis_prev_hash=config.user.genesis_prev_headerhash,
-                                            rate_limit=config.user.peer_rate_limit))
+                                            rate_limit=config.user.peer_rate_limit,
+                                            features=SUPPORTED_FEATURES))
 
             source.send(msg)
             return
@@ -237,6 +291,7 @@ class P2PPeerManager(P2PBaseObserver):
             return
 
         source.rate_limit = min(config.user.peer_rate_limit, message.veData.rate_limit)
+        source.peer_features = message.veData.features
 
         if message.veData.genesis_prev_hash != config.user.genesis_prev_headerhash:
             logger.warning('%s genesis_prev_headerhash mismatch', source.peer)
@@ -333,6 +388,9 @@ class P2PPeerManager(P2PBaseObserver):
         P2PBaseObserver._validate_message(message, purlegacy_pb2.LegacyMessage.P2P_ACK)
 
         source.bytes_sent -= message.p2pAckData.bytes_processed
+        round_trip_time = source.pop_round_trip_time()
+        if round_trip_time is not None:
+            source.factory.address_book.add_latency(source, round_trip_time)
         if source.bytes_sent < 0:
             logger.warning('Disconnecting Peer %s', source.peer)
             logger.warning('Reason: negative bytes_sent value')
@@ -351,6 +409,7 @@ class P2PPeerManager(P2PBaseObserver):
 
     def ban_channel(self, channel: P2PProtocol):
         self._banned_peer_ips.add(channel.peer.ip)
+        self._schedule_flush()
         logger.warning('Banned %s', channel.peer.ip)
         channel.loseConnection()
 
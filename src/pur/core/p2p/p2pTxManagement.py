@@ -16,6 +16,8 @@ class P2PTpuranagement(P2PBaseObserver):
     def new_channel(self, channel):
         channel.register(purlegacy_pb2.LegacyMessage.MR, self.handle_message_received)
         channel.register(purlegacy_pb2.LegacyMessage.SFM, self.handle_full_message_request)
+        channel.register(purlegacy_pb2.LegacyMessage.MRB, self.handle_message_receipt_batch)
+        channel.register(purlegacy_pb2.LegacyMessage.SFMB, self.handle_full_message_request_batch)
 
         channel.register(purlegacy_pb2.LegacyMessage.TX, self.handle_tx)
         channel.register(purlegacy_pb2.LegacyMessage.TK, self.handle_token_transaction)
@@ -37,46 +39,80 @@ class P2PTpuranagement(P2PBaseObserver):
         Otherwise the request is made to get the full message.
         :return:
         """
-        mr_data = message.mrData
+        if P2PTpuranagement._add_message_receipt(source, message.mrData):
+            source.factory.request_full_message(message.mrData)
+
+    @staticmethod
+    def handle_message_receipt_batch(source, message: purlegacy_pb2.LegacyMessage):
+        """
+        Message Receipt Batch
+        Each message receipt is processed as a MR, the full messages
+        are then requested together.
+        :return:
+        """
+        P2PBaseObserver._validate_message(message, purlegacy_pb2.LegacyMessage.MRB)
+
+        mr_data_list = message.mrBatchData.mr_data
+        if len(mr_data_list) > config.dev.mr_batch_max_size:
+            logger.warning('MRB with %s message receipts from %s', len(mr_data_list), source.peer)
+            return
+
+        # The MRB itself has already been counted as one message
+        if not source.count_in_messages(len(mr_data_list) - 1):
+            return
+
+        missing_mr_data_list = [mr_data for mr_data in mr_data_list
+                                if P2PTpuranagement._add_message_receipt(source, mr_data)]
+        if missing_mr_data_list:
+            source.factory.request_full_messages(missing_mr_data_list)
+
+    @staticmethod
+    def _add_message_receipt(source, mr_data: purlegacy_pb2.MRData) -> bool:
+        """
+        Registers the peer as having the message of the receipt.
+        :return: True if the full message has to be requested
+        """
         msg_hash = mr_data.hash
 
         # FIpurE: Separate into respective message handlers
 
         if mr_data.type not in MessageReceipt.allowed_types:
-            return
+            return False
+
+        source.known_inventory.add(msg_hash)
 
         if mr_data.type == purlegacy_pb2.LegacyMessage.TX and source.factory.sync_state.state != ESyncState.synced:
-            return
+            return False
 
         if mr_data.type == purlegacy_pb2.LegacyMessage.TX:
             if ntp.getTime() < source.factory.pow.suspend_mining_timestamp:
-                return
+                return False
 
             if source.factory._chain_manager.tx_pool.is_full_pending_transaction_pool():
                 logger.warning('TX pool size full, incoming tx dropped. mr hash: %s', bin2hstr(msg_hash))
-                return
+                return False
 
         if mr_data.type == purlegacy_pb2.LegacyMessage.BK:
             if mr_data.block_number > source.factory.chain_height + config.dev.max_margin_block_number:
                 logger.debug('Skipping block #%s as beyond lead limit', mr_data.block_number)
-                return
+                return False
             if mr_data.block_number < source.factory.chain_height - config.dev.min_margin_block_number:
                 logger.debug('Skipping block #%s as beyond the limit', mr_data.block_number)
-                return
+                return False
 
             if not source.factory.is_block_present(mr_data.prev_headerhash):
                 logger.debug('Skipping block #%s as prev_headerhash not found', mr_data.block_number)
-                return
+                return False
 
         if source.factory.master_mr.contains(msg_hash, mr_data.type):
-            return
+            return False
 
         source.factory.master_mr.add_peer(msg_hash, mr_data.type, source, mr_data)
 
         if source.factory.master_mr.is_callLater_active(msg_hash):  # Ignore if already requested
-            return
+            return False
 
-        source.factory.request_full_message(mr_data)
+        return True
 
     @staticmethod
     def handle_full_message_request(source, message: purlegacy_pb2.LegacyMessage):
@@ -87,8 +123,33 @@ class P2PTpuranagement(P2PBaseObserver):
         """
         msg = source.factory.master_mr.get(message.mrData.type, message.mrData.hash)
         if msg is not None:
+            source.known_inventory.add(message.mrData.hash)
             source.send(msg)
 
+    @staticmethod
+    def handle_full_message_request_batch(source, message: purlegacy_pb2.LegacyMessage):
+        """
+        Send Full Message Batch
+        Serves each request of the batch as a SFM.
+        :return:
+        """
+        P2PBaseObserver._validate_message(message, purlegacy_pb2.LegacyMessage.SFMB)
+
+        mr_data_list = message.mrBatchData.mr_data
+        if len(mr_data_list) > config.dev.mr_batch_max_size:
+            logger.warning('SFMB with %s requests from %s', len(mr_data_list), source.peer)
+            return
+
+        # The SFMB itself has already been counted as one message
+        if not source.count_in_messages(len(mr_data_list) - 1):
+            return
+
+        for mr_data in mr_data_list:
+            msg = source.factory.master_mr.get(mr_data.type, mr_data.hash)
+            if msg is not None:
+                source.known_inventory.add(mr_data.hash)
+                source.send(msg)
+
     ###################################################
     ###################################################
     ###################################################
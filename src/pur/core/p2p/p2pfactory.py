@@ -2,6 +2,7 @@
 # Distributed under the MIT software license, see the accompanying
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 import random
+from collections import OrderedDict
 
 from pypurlib.pypurlib import bin2hstr
 from pyqryptonight.pyqryptonight import UInt256ToString
@@ -14,10 +15,13 @@ from pur.core.ChainManager import ChainManager
 from pur.core.ESyncState import ESyncState
 from pur.core.messagereceipt import MessageReceipt
 from pur.core.misc import ntp, logger
+from pur.core.misc.rolling_bloom_filter import RollingBloomFilter
 from pur.core.node import SyncState
+from pur.core.p2p.AddressBook import AddressBook
 from pur.core.p2p.p2pprotocol import P2PProtocol
 from pur.core.p2p.IPMetadata import IPMetadata
 from pur.core.processors.TxnProcessor import TxnProcessor
+from pur.core.processors.VerificationPool import VerificationPool
 from pur.core.txs.MessageTransaction import MessageTransaction
 from pur.core.txs.SlaveTransaction import SlaveTransaction
 from pur.core.txs.LatticeTransaction import LatticeTransaction
@@ -37,6 +41,8 @@ p2p_msg_priority = {
             ######################
             purlegacy_pb2.LegacyMessage.MR: 2,
             purlegacy_pb2.LegacyMessage.SFM: 1,
+            purlegacy_pb2.LegacyMessage.MRB: 2,
+            purlegacy_pb2.LegacyMessage.SFMB: 1,
 
             purlegacy_pb2.LegacyMessage.BK: 1,
             purlegacy_pb2.LegacyMessage.FB: 0,
@@ -73,6 +79,9 @@ class P2PFactory(ServerFactory):
                  pur_node):
 
         self.master_mr = MessageReceipt()
+        # Hashes of the messages already received and relayed by this node. Unlike master_mr,
+        # it remembers at least config.user.known_inventory_size hashes, so they are not requested again.
+        self.known_inventory = RollingBloomFilter(config.user.known_inventory_size, config.user.known_inventory_fp_rate)
         self.pow = None
         self.sync_state = sync_state
 
@@ -81,13 +90,27 @@ class P2PFactory(ServerFactory):
         self._chain_manager = chain_manager
         self._chain_manager.set_broadcast_tx(self.broadcast_tx)
 
+        self.verification_pool = VerificationPool()
+
         self._syncing_enabled = False
         self._target_channel = None
         self._target_node_header_hash = None
-        self._last_requested_block_number = None
+        self._next_block_number = None
+
+        # Peers whose NodeHeaderHash agrees with the target, mapped to their NodeHeaderHash
+        self._sync_peers = dict()
+        # block_number -> [channel, download_monitor] for blocks requested but not yet received
+        self._requested_blocks = dict()
+        # block_number -> [channel, block, signatures_verified] for blocks received ahead of the chain height
+        self._received_blocks = dict()
+        # Next block in order, whose PoW is being verified on the verification pool
+        self._pow_pending_block = None
 
         self._genesis_processed = False
         self._peer_connections = []
+        # Connection quality of the peers, used to choose the sync targets,
+        # the full message sources and the outbound connection candidates
+        self.address_book = AddressBook(config.user.address_book_size)
         self._txn_processor_running = False
 
         self.peer_blockheight = dict()
@@ -146,6 +169,10 @@ class P2PFactory(ServerFactory):
         if len(selected_peer_connections) == 0 or max_cumulative_difficulty == 0:
             return None
 
+        best_score = max(self.address_book.score(peer_conn) for peer_conn in selected_peer_connections)
+        selected_peer_connections = [peer_conn for peer_conn in selected_peer_connections
+                                     if self.address_book.score(peer_conn) == best_score]
+
         return random.sample(selected_peer_connections, 1)[0]
 
     def update_peer_blockheight(self, addr_remote, block_number, headerhash, cumulative_difficulty):
@@ -219,18 +246,19 @@ class P2PFactory(ServerFactory):
         self.pow.last_pb_time = ntp.getTime()
         logger.info('>>> Received Block #%d %s', block.block_number, bin2hstr(block.headerhash))
 
-        if source != self._target_channel:
-            if self._target_channel is None:
-                logger.warning('Received block and target channel is None')
-            else:
-                logger.warning('Received block from unexpected peer')
-                logger.warning('Expected peer: %s', self._target_channel.peer)
-                logger.warning('Found peer: %s', source.peer)
+        if not self._syncing_enabled:
+            logger.warning('Received block while syncing is disabled')
             return
 
-        if block.block_number != self._last_requested_block_number:
-            logger.warning('Did not match %s', self._last_requested_block_number)
-            self._pur_node.peer_manager.ban_channel(source)
+        if block.block_number not in self._requested_blocks:
+            logger.warning('Did not match requested block number %s', block.block_number)
+            return
+
+        channel, download_monitor = self._requested_blocks[block.block_number]
+        if source != channel:
+            logger.warning('Received block from unexpected peer')
+            logger.warning('Expected peer: %s', channel.peer)
+            logger.warning('Found peer: %s', source.peer)
             return
 
         target_start_blocknumber = self._target_node_header_hash.block_number
@@ -239,41 +267,131 @@ class P2PFactory(ServerFactory):
             logger.warning('Did not match headerhash')
             logger.warning('Expected headerhash %s', expected_headerhash)
             logger.warning('Found headerhash %s', block.headerhash)
-            self._pur_node.peer_manager.ban_channel(source)
+            self.ban_sync_peer(source)
+            return
+
+        try:
+            download_monitor.cancel()
+        except Exception as e:
+            logger.warning("PB: %s", e)
+
+        self.address_book.request_served(source, (purlegacy_pb2.LegacyMessage.FB, block.block_number), block.size)
+        del self._requested_blocks[block.block_number]
+        if block.block_number < self._next_block_number:
+            return
+
+        self._received_blocks[block.block_number] = [source, block, False]
+
+        # Signatures are verified off the reactor thread, in parallel with other received blocks
+        d = self.verification_pool.verify_block(block, self._chain_manager, check_pow=False)
+        d.addCallback(self.block_verified, source, block)
+
+    def block_verified(self, is_valid: bool, source, block: Block):
+        if not self._syncing_enabled:
+            return
+
+        received_block = self._received_blocks.get(block.block_number)
+        if received_block is None or received_block[1] is not block:
             return
 
+        if not is_valid:
+            logger.warning('Syncing Failed: Signature Validation Failed')
+            self.ban_sync_peer(source)
+            return
+
+        received_block[2] = True
+
+        self.add_received_blocks()
+
+    def add_received_blocks(self) -> bool:
+        """
+        Adds the buffered blocks to the chain, strictly in order of block number,
+        starting from the next block the chain is waiting for. The PoW can only be
+        verified once the parent block is in the state, so the next block is validated
+        and its PoW is submitted to the verification pool, then pow_verified adds it
+        and continues with the following block.
+        :return: False if any block failed to be validated
+        """
+        if self._pow_pending_block is not None:
+            return True
+
+        received_block = self._received_blocks.get(self._next_block_number)
+        if received_block is None:
+            return True
+
+        source, block, signatures_verified = received_block
+        if not signatures_verified:
+            return True
+        del self._received_blocks[self._next_block_number]
+
         if not block.validate(self._chain_manager, self.pow.future_blocks):
             logger.warning('Syncing Failed: Block Validation Failed')
-            self._pur_node.peer_manager.ban_channel(source)
+            self.ban_sync_peer(source)
+            return False
+
+        self._pow_pending_block = block
+        d = self.verification_pool.verify_pow(block, self._chain_manager)
+        d.addCallback(self.pow_verified, source, block)
+
+        return True
+
+    def pow_verified(self, is_valid: bool, source, block: Block):
+        if block is not self._pow_pending_block:
+            return
+        self._pow_pending_block = None
+
+        if not self._syncing_enabled:
+            return
+
+        if not is_valid:
+            logger.warning('Syncing Failed: PoW Validation Failed')
+            self.ban_sync_peer(source)
             return
 
-        if self._chain_manager.add_block(block, check_stale=False):
+        if self._chain_manager.add_block(block, check_stale=False, verify_signature=False):
             if self._chain_manager.last_block.headerhash == block.headerhash:
                 self.pow.suspend_mining_timestamp = ntp.getTime() + config.dev.sync_delay_mining
         else:
             logger.warning('Failed to Add Block')
-            self._pur_node.peer_manager.ban_channel(source)
+            self.ban_sync_peer(source)
             return
 
-        try:
-            reactor.download_monitor.cancel()
-        except Exception as e:
-            logger.warning("PB: %s", e)
+        self._next_block_number += 1
+        self._drop_stale_received_blocks()
 
         if self.is_syncing_finished():
             return
 
-        self._last_requested_block_number += 1
+        if not self.add_received_blocks():
+            return
 
         self.peer_fetch_block()
 
+    def _drop_stale_received_blocks(self):
+        """
+        Drops the buffered blocks below the next block number, such as a block
+        requested again while its PoW was being verified.
+        """
+        for block_number in [block_number for block_number in self._received_blocks
+                             if block_number < self._next_block_number]:
+            del self._received_blocks[block_number]
+
     def is_syncing(self) -> bool:
         return self._syncing_enabled
 
     def is_syncing_finished(self, force_finish=False):
-        curr_index = self._last_requested_block_number - self._target_node_header_hash.block_number + 1
+        curr_index = self._next_block_number - self._target_node_header_hash.block_number
         if curr_index == len(self._target_node_header_hash.headerhashes) or force_finish:
-            self._last_requested_block_number = None
+            for _, download_monitor in self._requested_blocks.values():
+                try:
+                    download_monitor.cancel()
+                except Exception:  # No need to log this exception
+                    pass
+            self._requested_blocks = dict()
+            self._received_blocks = dict()
+            self._pow_pending_block = None
+            self._sync_peers = dict()
+            self._next_block_number = None
             self._target_node_header_hash = None
             self._target_channel = None
             self._syncing_enabled = False
@@ -281,34 +399,139 @@ class P2PFactory(ServerFactory):
 
         return False
 
-    def peer_fetch_block(self, retry=0):
+    def get_sync_peer(self, block_number: int, requests_per_peer: dict):
+        """
+        Selects the least busy peer relative to its score, whose NodeHeaderHash
+        agrees with the target headerhash for the block_number.
+        """
+        target_start_blocknumber = self._target_node_header_hash.block_number
+        expected_headerhash = self._target_node_header_hash.headerhashes[block_number - target_start_blocknumber]
+
+        selected_channel = None
+        selected_load = None
+        for channel, node_header_hash in self._sync_peers.items():
+            index = block_number - node_header_hash.block_number
+            if not 0 <= index < len(node_header_hash.headerhashes):
+                continue
+            if node_header_hash.headerhashes[index] != expected_headerhash:
+                continue
+            load = (requests_per_peer[channel] + 1) / self.address_book.score(channel)
+            if selected_channel is None or load < selected_load:
+                selected_channel = channel
+                selected_load = load
+
+        return selected_channel
+
+    def peer_fetch_block(self):
+        """
+        Keeps up to block_download_window blocks requested, spread across
+        all the peers agreeing with the target NodeHeaderHash.
+        """
         node_header_hash = self._target_node_header_hash
-        curr_index = self._last_requested_block_number - node_header_hash.block_number
 
-        block_headerhash = node_header_hash.headerhashes[curr_index]
-        block = self._chain_manager.get_block(block_headerhash)
+        curr_index = self._next_block_number - node_header_hash.block_number
+        while curr_index < len(node_header_hash.headerhashes):
+            if not self._chain_manager.get_block(node_header_hash.headerhashes[curr_index]):
+                break
+            self._next_block_number += 1
+            curr_index += 1
+        self._drop_stale_received_blocks()
 
-        if retry >= 1:
-            logger.debug('Retry Limit Hit')
-            self._pur_node.peer_manager.ban_channel(self._target_channel)
+        if self.is_syncing_finished():
+            return
+
+        requests_per_peer = {channel: 0 for channel in self._sync_peers}
+        for channel, _ in self._requested_blocks.values():
+            requests_per_peer[channel] += 1
+
+        last_block_number = min(node_header_hash.block_number + len(node_header_hash.headerhashes) - 1,
+                                self._next_block_number + config.user.block_download_window - 1)
+
+        for block_number in range(self._next_block_number, last_block_number + 1):
+            if block_number in self._requested_blocks or block_number in self._received_blocks:
+                continue
+            if self._pow_pending_block is not None and block_number == self._pow_pending_block.block_number:
+                continue
+
+            channel = self.get_sync_peer(block_number, requests_per_peer)
+            if channel is None:
+                break
+
+            channel.send_fetch_block(block_number)
+            self.address_book.request_sent(channel, (purlegacy_pb2.LegacyMessage.FB, block_number))
+            download_monitor = reactor.callLater(config.user.block_download_timeout,
+                                                 self.block_download_timeout,
+                                                 channel,
+                                                 block_number)
+            self._requested_blocks[block_number] = [channel, download_monitor]
+            requests_per_peer[channel] += 1
+
+        if not self._requested_blocks and not self._received_blocks and self._pow_pending_block is None:
+            logger.warning('No peer available to fetch block #%s', self._next_block_number)
             self.is_syncing_finished(force_finish=True)
+
+    def block_download_timeout(self, channel, block_number: int):
+        if block_number not in self._requested_blocks:
+            return
+        if self._requested_blocks[block_number][0] != channel:
             return
 
-        while block and curr_index + 1 < len(node_header_hash.headerhashes):
-            self._last_requested_block_number += 1
-            curr_index = self._last_requested_block_number - node_header_hash.block_number
-            block_headerhash = node_header_hash.headerhashes[curr_index]
-            block = self._chain_manager.get_block(block_headerhash)
+        logger.debug('Retry Limit Hit')
+        self.address_book.request_failed(channel, (purlegacy_pb2.LegacyMessage.FB, block_number))
+        self.ban_sync_peer(channel)
 
-        if block and self.is_syncing_finished():
+    def ban_sync_peer(self, channel):
+        self._pur_node.peer_manager.ban_channel(channel)
+        self.remove_sync_peer(channel)
+
+    def remove_sync_peer(self, channel):
+        """
+        Removes the peer from syncing and reassigns the blocks
+        which were requested from it to the remaining peers.
+        """
+        if not self._syncing_enabled:
             return
 
-        self._target_channel.send_fetch_block(self._last_requested_block_number)
-        reactor.download_monitor = reactor.callLater(100, self.peer_fetch_block, retry + 1)
+        self._sync_peers.pop(channel, None)
+
+        for block_number in list(self._requested_blocks.keys()):
+            requested_channel, download_monitor = self._requested_blocks[block_number]
+            if requested_channel != channel:
+                continue
+            try:
+                download_monitor.cancel()
+            except Exception:  # No need to log this exception
+                pass
+            del self._requested_blocks[block_number]
+
+        for block_number in list(self._received_blocks.keys()):
+            if self._received_blocks[block_number][0] == channel:
+                del self._received_blocks[block_number]
+
+        if channel == self._target_channel:
+            self._target_channel = None
+
+        self.peer_fetch_block()
+
+    def add_sync_peer(self, source_peer, node_header_hash: pur_pb2.NodeHeaderHash):
+        target_start_blocknumber = self._target_node_header_hash.block_number
+        for i, headerhash in enumerate(node_header_hash.headerhashes):
+            index = node_header_hash.block_number + i - target_start_blocknumber
+            if not 0 <= index < len(self._target_node_header_hash.headerhashes):
+                continue
+            if self._target_node_header_hash.headerhashes[index] != headerhash:
+                logger.info('>> Ignoring NodeHeaderHash from %s, disagrees with target', source_peer.peer)
+                return
+
+        self._sync_peers[source_peer] = node_header_hash
+        self.peer_fetch_block()
 
     def compare_and_sync(self, source_peer, node_header_hash: pur_pb2.NodeHeaderHash):
         if self._syncing_enabled:
-            logger.info('>> Ignoring compare_and_sync Syncing Enabled')
+            if source_peer in self._sync_peers:
+                logger.info('>> Ignoring compare_and_sync Syncing Enabled')
+                return
+            self.add_sync_peer(source_peer, node_header_hash)
             return
         last_block = self.get_last_block()
         node_last_block_number = node_header_hash.block_number + len(node_header_hash.headerhashes) - 1
@@ -328,10 +551,16 @@ class P2PFactory(ServerFactory):
         if fork_found or (last_block.block_number < node_last_block_number):
             self._target_channel = source_peer
             self._target_node_header_hash = node_header_hash
-            self._last_requested_block_number = fork_block_number
+            self._next_block_number = fork_block_number
+            self._sync_peers = {source_peer: node_header_hash}
             self._syncing_enabled = True
             self.peer_fetch_block()
 
+            # Other peers on the same chain are added to syncing once their NodeHeaderHash is received
+            for peer in self._peer_connections:
+                if peer != source_peer:
+                    peer.send_get_headerhash_list(self._chain_manager.height)
+
     ###################################################
     ###################################################
     ###################################################
@@ -351,32 +580,79 @@ class P2PFactory(ServerFactory):
         # FIpurE: Huge amount of lookups in dictionaries
         msg_hash = mr_data.hash
 
-        if msg_hash in self.master_mr._hash_msg:
+        if msg_hash in self.master_mr._hash_msg or self._is_known_message(mr_data):
             if msg_hash in self.master_mr.requested_hash:
+                already_requested_peers = self.master_mr.requested_hash[msg_hash].already_requested_peers
+                if already_requested_peers:
+                    self.address_book.request_served(already_requested_peers[-1],
+                                                     (purlegacy_pb2.LegacyMessage.SFM, msg_hash))
                 del self.master_mr.requested_hash[msg_hash]
             return
 
         if msg_hash not in self.master_mr.requested_hash:
             return
 
+        peer = self._next_full_message_peer(mr_data)
+        if peer is not None:
+            msg = purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.SFM,
+                                              mrData=purlegacy_pb2.MRData(hash=mr_data.hash, type=mr_data.type))
+            peer.send(msg)
+
+    def request_full_messages(self, mr_data_list: list):
+        """
+        Request Full Messages
+        Same as request_full_message for many Message Receipts, the requests
+        made to the same peer are sent together.
+        :return:
+        """
+        peers_mr_data = OrderedDict()
+        for mr_data in mr_data_list:
+            if mr_data.hash in self.master_mr._hash_msg or self._is_known_message(mr_data):
+                if mr_data.hash in self.master_mr.requested_hash:
+                    del self.master_mr.requested_hash[mr_data.hash]
+                continue
+
+            if mr_data.hash not in self.master_mr.requested_hash:
+                continue
+
+            peer = self._next_full_message_peer(mr_data)
+            if peer is not None:
+                peers_mr_data.setdefault(peer, []).append(mr_data)
+
+        for peer, peer_mr_data_list in peers_mr_data.items():
+            peer.send_full_message_requests(peer_mr_data_list)
+
+    def _is_known_message(self, mr_data: purlegacy_pb2.MRData) -> bool:
+        # Blocks are always requested, so that a false positive never makes the node miss a block
+        if mr_data.type == purlegacy_pb2.LegacyMessage.BK:
+            return False
+        return mr_data.hash in self.known_inventory
+
+    def _next_full_message_peer(self, mr_data: purlegacy_pb2.MRData):
+        """
+        Selects the next peer to request the full message from, the best scored first,
+        and schedules the request to the following peer in case of timeout.
+        :return: the peer, None if all the peers have already been requested
+        """
+        msg_hash = mr_data.hash
         peers_list = self.master_mr.requested_hash[msg_hash].peers_connection_list
         message_request = self.master_mr.requested_hash[msg_hash]
-        for peer in peers_list:
+        if message_request.already_requested_peers:
+            # The previous request timed out
+            self.address_book.request_failed(message_request.already_requested_peers[-1],
+                                             (purlegacy_pb2.LegacyMessage.SFM, msg_hash))
+
+        for peer in sorted(peers_list, key=self.address_book.score, reverse=True):
             if peer in message_request.already_requested_peers:
                 continue
             message_request.already_requested_peers.append(peer)
 
-            msg = purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.SFM,
-                                              mrData=purlegacy_pb2.MRData(hash=mr_data.hash, type=mr_data.type))
-
-            peer.send(msg)
-
             call_later_obj = reactor.callLater(config.dev.message_receipt_timeout,
                                                self.request_full_message,
                                                mr_data)
 
             message_request.callLater = call_later_obj
-            return
+            return peer
 
         # If execution reach to this line, then it means no peer was able to provide
         # Full message for this hash thus the hash has to be deleted.
@@ -384,6 +660,8 @@ class P2PFactory(ServerFactory):
         if msg_hash in self.master_mr.requested_hash:
             del self.master_mr.requested_hash[msg_hash]
 
+        return None
+
     ##############################################
     ##############################################
     ##############################################
@@ -409,7 +687,8 @@ class P2PFactory(ServerFactory):
         if not self._txn_processor_running:
             txn_processor = TxnProcessor(chain_manager=self._chain_manager,
                                          transaction_pool_obj=self._chain_manager.tx_pool,
-                                         broadcast_tx=self.broadcast_tx)
+                                         broadcast_tx=self.broadcast_tx,
+                                         verification_pool=self.verification_pool)
 
             task_defer = TxnProcessor.create_cooperate(txn_processor).whenDone()
             task_defer.addCallback(self.reset_processor_flag) \
@@ -459,6 +738,7 @@ class P2PFactory(ServerFactory):
 
     def register_and_broadcast(self, msg_type, msg_hash: bytes, pbdata, data=None):
         self.master_mr.register(msg_type, msg_hash, pbdata)
+        self.known_inventory.add(msg_hash)
         self.broadcast(msg_type, msg_hash, data)
 
     def broadcast(self, msg_type, msg_hash: bytes, mr_data=None):
@@ -478,10 +758,18 @@ class P2PFactory(ServerFactory):
         mr_data.type = msg_type
         data = purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.MR,
                                            mrData=mr_data)
+        # Encoded once for all the peers
+        wrapped_message = P2PProtocol._wrap_message(data)
 
         for peer in self._peer_connections:
-            if peer not in ignore_peers:
-                peer.send(data)
+            if peer in ignore_peers:
+                continue
+            if msg_type == purlegacy_pb2.LegacyMessage.BK:
+                # Blocks are announced right away, even to the peers which may know them
+                peer.known_inventory.add(msg_hash)
+                peer.send(data, wrapped_message)
+            elif msg_hash not in peer.known_inventory:
+                peer.send_message_receipt(mr_data, wrapped_message)
 
     def broadcast_get_synced_state(self):
         # Request all peers to update their synced status
@@ -495,6 +783,7 @@ class P2PFactory(ServerFactory):
     # Event handlers / Comms related
 
     def start_listening(self):
+        self.verification_pool.start()
         reactor.listenTCP(config.user.p2p_local_port, self)
 
     def clientConnectionLost(self, connector, reason):  # noqa
@@ -533,6 +822,7 @@ class P2PFactory(ServerFactory):
             return False
 
         self._peer_connections.append(conn_protocol)
+        self.address_book.connected(conn_protocol)
 
         logger.debug('>>> new connection: %s ', conn_protocol.peer)
         return True
@@ -540,6 +830,10 @@ class P2PFactory(ServerFactory):
     def remove_connection(self, conn_protocol):
         if conn_protocol in self._peer_connections:
             self._peer_connections.remove(conn_protocol)
+            self.address_book.disconnected(conn_protocol)
+
+        if conn_protocol in self._sync_peers:
+            self.remove_sync_peer(conn_protocol)
 
         if conn_protocol.peer.full_address in self.peer_blockheight:
             del self.peer_blockheight[conn_protocol.peer.full_address]
@@ -569,10 +863,12 @@ class P2PFactory(ServerFactory):
         if len(self._peer_q) == 0:
             return
 
-        peer_address_list = []
+        # Tries the best scored candidates first, the sort is stable so that the others are tried in order
+        self._peer_q.sort(key=self.address_book.connection_score, reverse=True)
+
         max_length = min(10, config.user.max_peers_limit)
-        while len(self._peer_q) > 0 and len(peer_address_list) != max_length:
-            peer_address_list.append(self._peer_q.pop(0))
+        peer_address_list = self._peer_q[:max_length]
+        del self._peer_q[:max_length]
 
         self.connect_peer(peer_address_list)
 
@@ -585,6 +881,7 @@ class P2PFactory(ServerFactory):
                 should_connect = addr.full_address not in connected_peers
 
                 if should_connect:
+                    self.address_book.connection_attempted(addr.ip)
                     reactor.connectTCP(addr.ip, addr.port, self)
 
             except Exception as e:
@@ -2,28 +2,35 @@
 # Distributed under the MIT software license, see the accompanying
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 import struct
-from queue import PriorityQueue
-from typing import Callable, Optional
+import time
+from typing import Callable, Optional, Tuple
 
 from google.protobuf.json_format import MessageToJson
 from pypurlib.pypurlib import bin2hstr  # noqa
+from twisted.internet import reactor
 from twisted.internet.protocol import Protocol, connectionDone
 
 from pur.core import config
 from pur.core.OutgoingMessage import OutgoingMessage
+from pur.core.OutgoingQueue import OutgoingQueue
 from pur.core.misc import logger, ntp
+from pur.core.misc.rolling_bloom_filter import RollingBloomFilter
 from pur.core.p2p.IPMetadata import IPMetadata
+from pur.core.p2p.ReceiveBuffer import ReceiveBuffer
 from pur.core.p2p.p2pObservable import P2PObservable
 from pur.generated import purlegacy_pb2, pur_pb2
 
 OUT_FACTOR = 0.9
 IN_FACTOR = 2.2
 
+# Optional features announced in VEData, so that older peers keep receiving the messages they know
+SUPPORTED_FEATURES = purlegacy_pb2.VEData.MR_BATCH
+
 
 # Rename to p2p channel
 class P2PProtocol(Protocol):
     def __init__(self):
-        self._buffer = bytes()
+        self._buffer = ReceiveBuffer()
 
         # Need to use composition instead of inheritance here
         self._observable = P2PObservable(self)
@@ -34,7 +41,19 @@ class P2PProtocol(Protocol):
         self.out_counter = 0
 
         self.bytes_sent = 0
-        self.outgoing_queue = PriorityQueue(maxsize=config.user.p2p_q_size)
+        # Time of the first message written since the last P2P_ACK received, to measure the round trip latency
+        self._ack_pending_since = None
+        self.outgoing_queue = OutgoingQueue(maxsize=config.user.p2p_q_size)
+        # Messages sent during a reactor iteration are written together at the next one
+        self._flush_call = None
+
+        # Features announced by the peer in its VEData
+        self.peer_features = purlegacy_pb2.VEData.NO_FEATURE
+        # Message receipts announced together in a MRB, once config.user.mr_batch_window has elapsed
+        self._mr_batch = []
+        self._mr_batch_call = None
+        # Hashes of the messages announced by the peer or to the peer, which are not relayed to it again
+        self.known_inventory = RollingBloomFilter(config.user.known_inventory_size, config.user.known_inventory_fp_rate)
 
         self._connected_at = ntp.getTime()
         self._valid_message_count = 0
@@ -104,29 +123,33 @@ class P2PProtocol(Protocol):
     def connectionLost(self, reason=connectionDone):
         logger.debug('%s disconnected. remainder connected: %d', self.peer, self.factory.num_connections)
 
+        if self._flush_call is not None and self._flush_call.active():
+            self._flush_call.cancel()
+        self._flush_call = None
+        if self._mr_batch_call is not None and self._mr_batch_call.active():
+            self._mr_batch_call.cancel()
+        self._mr_batch_call = None
+
         self.factory.remove_connection(self)
         if self.peer_manager:
             self.peer_manager.remove_channel(self)
 
     def dataReceived(self, data: bytes) -> None:
-        self._buffer += data
-        total_read = len(self._buffer)
+        total_read = len(self._buffer) + len(data)
 
         if total_read > config.dev.max_bytes_out:
             logger.warning('Disconnecting peer %s', self.peer)
-            logger.warning('Buffer Size %s', len(self._buffer))
+            logger.warning('Buffer Size %s', total_read)
             self.loseConnection()
             return
 
+        self._buffer.write(data)
+
         read_bytes = [0]
 
         msg = None
         for msg in self._parse_buffer(read_bytes):
-            self.update_counters()
-            self.in_counter += 1
-            if self.in_counter > self.rate_limit * IN_FACTOR:
-                logger.warning("Rate Limit hit by %s %s", self.peer.ip, self.peer.port)
-                self.peer_manager.ban_channel(self)
+            if not self.count_in_messages(1):
                 return
 
             if self._valid_message_count < config.dev.trust_min_mspurount * 2:
@@ -141,6 +164,20 @@ class P2PProtocol(Protocol):
                                               p2pAckData=p2p_ack)
             self.send(msg)
 
+    def count_in_messages(self, count: int) -> bool:
+        """
+        Counts the received messages against the peer rate limit, the peer is banned once it is exceeded.
+        The items of a batch message are counted as the messages they replace.
+        :return: False if the peer has been banned
+        """
+        self.update_counters()
+        self.in_counter += count
+        if self.in_counter > self.rate_limit * IN_FACTOR:
+            logger.warning("Rate Limit hit by %s %s", self.peer.ip, self.peer.port)
+            self.peer_manager.ban_channel(self)
+            return False
+        return True
+
     def update_counters(self):
         time_diff = ntp.getTime() - self.last_rate_limit_update
         if time_diff > 60:
@@ -155,38 +192,69 @@ class P2PProtocol(Protocol):
             return
 
         if self.bytes_sent < config.dev.max_bytes_out:
-            outgoing_bytes = self.get_bytes_from_q()
+            outgoing_frames, outgoing_size = self.get_frames_from_q()
 
-            if outgoing_bytes:
-                self.bytes_sent += len(outgoing_bytes)
-                self.transport.write(outgoing_bytes)
+            if outgoing_frames:
+                self.bytes_sent += outgoing_size
+                self.transport.writeSequence(outgoing_frames)
 
-    def get_bytes_from_q(self):
-        outgoing_bytes = b''
+    def get_frames_from_q(self) -> Tuple[list, int]:
+        """
+        Takes the encoded messages to be written from the outgoing queue.
+        :return: the list of encoded messages and their total size
+        """
+        outgoing_frames = []
+        outgoing_size = 0
         while not self.outgoing_queue.empty():
-            outgoing_msg = self.outgoing_queue.get()[2]
+            outgoing_msg = self.outgoing_queue.get()
             if not outgoing_msg.is_expired():
-                wrapped_message = self._wrap_message(outgoing_msg.message)
+                wrapped_message = outgoing_msg.wrapped_message
+                if wrapped_message is None:
+                    wrapped_message = self._wrap_message(outgoing_msg.message)
                 if wrapped_message is not None:
-                    if len(wrapped_message) + len(outgoing_bytes) > config.dev.max_bytes_out:
-                        self.outgoing_queue.put((outgoing_msg.priority, outgoing_msg.timestamp, outgoing_msg))
+                    if len(wrapped_message) + outgoing_size > config.dev.max_bytes_out:
+                        self.outgoing_queue.put_front(outgoing_msg)
                         break
-                    outgoing_bytes += wrapped_message
+                    outgoing_frames.append(wrapped_message)
+                    outgoing_size += len(wrapped_message)
+                    # The peer does not acknowledge the bytes of a P2P_ACK alone
+                    if self._ack_pending_since is None and outgoing_msg.message.func_name != purlegacy_pb2.LegacyMessage.P2P_ACK:
+                        self._ack_pending_since = time.monotonic()
 
                     self.out_counter += 1
                     if self.out_counter >= self.rate_limit * OUT_FACTOR:
                         break
 
-        return outgoing_bytes
+        return outgoing_frames, outgoing_size
 
-    def send(self, message: purlegacy_pb2.LegacyMessage):
+    def pop_round_trip_time(self) -> Optional[float]:
+        """
+        Called when a P2P_ACK is received.
+        :return: the seconds elapsed since the first message written after the previous P2P_ACK, None if there is none
+        """
+        if self._ack_pending_since is None:
+            return None
+        round_trip_time = time.monotonic() - self._ack_pending_since
+        self._ack_pending_since = None
+        return round_trip_time
+
+    def _flush(self):
+        self._flush_call = None
+        self.send_next()
+
+    def send(self, message: purlegacy_pb2.LegacyMessage, wrapped_message: bytes = None):
+        """
+        Queues the message, it is written at the next reactor iteration along with
+        the other messages queued in the meantime.
+        :param wrapped_message: message already encoded by _wrap_message, when it is broadcast to several peers
+        """
         priority = self.factory.p2p_msg_priority[message.func_name]
-        outgoing_msg = OutgoingMessage(priority, message)
-        if self.outgoing_queue.full():
+        outgoing_msg = OutgoingMessage(priority, message, wrapped_message)
+        if not self.outgoing_queue.put(outgoing_msg):
             logger.info("Outgoing Queue Full: Skipping Message Type %s", message.WhichOneof('data'))
             return
-        self.outgoing_queue.put((outgoing_msg.priority, outgoing_msg.timestamp, outgoing_msg))
-        self.send_next()
+        if self._flush_call is None:
+            self._flush_call = reactor.callLater(0, self._flush)
 
     def loseConnection(self):
         self.transport.loseConnection()
@@ -231,8 +299,8 @@ class P2PProtocol(Protocol):
         """
         >>> from pypurlib.pypurlib import hstr2bin
         >>> p=P2PProtocol()
-        >>> p._buffer = bytes(hstr2bin('000000191a170a0776657273696f6e120c67656e657369735f68617368'+ \
-                                       '000000191a170a0776657273696f6e120c67656e657369735f68617368'))
+        >>> p._buffer.write(bytes(hstr2bin('000000191a170a0776657273696f6e120c67656e657369735f68617368'+ \
+                                           '000000191a170a0776657273696f6e120c67656e657369735f68617368')))
         >>> messages = p._parse_buffer([0])
         >>> len(list(messages))
         2
@@ -248,11 +316,10 @@ class P2PProtocol(Protocol):
             ignore_skip = False
 
             try:
-                chunk_size_raw = self._buffer[:4]
-                chunk_size = struct.unpack('>L', chunk_size_raw)[0]  # is m length encoded correctly?
+                chunk_size = self._buffer.unpack_uint32()  # is m length encoded correctly?
 
                 if chunk_size <= 0:
-                    logger.debug("<X< %s", bin2hstr(self._buffer))
+                    logger.debug("<X< %s", bin2hstr(bytes(self._buffer)))
                     raise Exception("Invalid chunk size <= 0")
 
                 if chunk_size > config.dev.message_buffer_size:
@@ -262,9 +329,11 @@ class P2PProtocol(Protocol):
                     ignore_skip = True  # Buffer is still incomplete as it doesn't have message so skip moving buffer
                     return
 
-                message_raw = self._buffer[4:4 + chunk_size]
                 message = purlegacy_pb2.LegacyMessage()
-                message.ParseFromString(message_raw)
+                # The view is released before yielding, as the buffer cannot be resized while it is exported.
+                # protobuf 3.6 only parses bytes, so the frame alone is copied out of the buffer.
+                with self._buffer.view(4, chunk_size) as message_raw:
+                    message.ParseFromString(bytes(message_raw))
                 yield message
 
             except Exception as e:  # no qa
@@ -274,8 +343,8 @@ class P2PProtocol(Protocol):
 
             finally:
                 if not ignore_skip:
-                    skip = 4 + chunk_size
-                    self._buffer = self._buffer[skip:]
+                    skip = min(4 + chunk_size, len(self._buffer))
+                    self._buffer.consume(skip)
                     total_read[0] += skip
 
     ###################################################
@@ -323,6 +392,61 @@ class P2PProtocol(Protocol):
                                           fbData=purlegacy_pb2.FBData(index=block_idx))
         self.send(msg)
 
+    def supports(self, feature) -> bool:
+        return bool(self.peer_features & feature)
+
+    def send_message_receipt(self, mr_data: purlegacy_pb2.MRData, wrapped_message: bytes = None):
+        """
+        Message Receipt
+        Announces a message to the peer. The peers supporting MR_BATCH receive the message
+        receipts announced within config.user.mr_batch_window seconds in a single MRB.
+        :param wrapped_message: MR already encoded by _wrap_message, shared by the peers not supporting MR_BATCH
+        """
+        self.known_inventory.add(mr_data.hash)
+
+        if not self.supports(purlegacy_pb2.VEData.MR_BATCH):
+            msg = purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.MR,
+                                              mrData=mr_data)
+            self.send(msg, wrapped_message)
+            return
+
+        self._mr_batch.append(mr_data)
+        if len(self._mr_batch) >= config.dev.mr_batch_max_size:
+            self.flush_message_receipts()
+        elif self._mr_batch_call is None:
+            self._mr_batch_call = reactor.callLater(config.user.mr_batch_window, self.flush_message_receipts)
+
+    def flush_message_receipts(self):
+        if self._mr_batch_call is not None and self._mr_batch_call.active():
+            self._mr_batch_call.cancel()
+        self._mr_batch_call = None
+
+        if not self._mr_batch:
+            return
+
+        msg = purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.MRB,
+                                          mrBatchData=purlegacy_pb2.MRBatchData(mr_data=self._mr_batch))
+        self._mr_batch = []
+        self.send(msg)
+
+    def send_full_message_requests(self, mr_data_list: list):
+        """
+        Send Full Message
+        Requests the full messages of the message receipts, in a single SFMB
+        when the peer supports MR_BATCH.
+        """
+        mr_data_list = [purlegacy_pb2.MRData(hash=mr_data.hash, type=mr_data.type) for mr_data in mr_data_list]
+
+        if not self.supports(purlegacy_pb2.VEData.MR_BATCH):
+            for mr_data in mr_data_list:
+                self.send(purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.SFM, mrData=mr_data))
+            return
+
+        for i in range(0, len(mr_data_list), config.dev.mr_batch_max_size):
+            mr_batch_data = purlegacy_pb2.MRBatchData(mr_data=mr_data_list[i:i + config.dev.mr_batch_max_size])
+            self.send(purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.SFMB,
+                                                  mrBatchData=mr_batch_data))
+
     def send_get_headerhash_list(self, current_block_height):
         start_blocknumber = max(0, current_block_height - config.dev.reorg_limit)
         node_header_hash = pur_pb2.NodeHeaderHash(block_number=start_blocknumber,
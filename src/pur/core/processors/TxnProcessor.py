@@ -7,21 +7,27 @@ from twisted.internet.task import cooperate
 from pur.core import ChainManager
 from pur.core.TransactionPool import TransactionPool
 from pur.core.misc import logger
+from pur.core.processors.VerificationPool import VerificationPool
 
 
 class TxnProcessor:
     def __init__(self,
                  chain_manager: ChainManager,
                  transaction_pool_obj: TransactionPool,
-                 broadcast_tx):
+                 broadcast_tx,
+                 verification_pool: VerificationPool = None):
         self.chain_manager = chain_manager
         self.transaction_pool_obj = transaction_pool_obj
         self.broadcast_tx = broadcast_tx
+        self.verification_pool = verification_pool
 
     def __iter__(self):
         return self
 
     def __next__(self):
+        if self.verification_pool:
+            return self._next_batch()
+
         tx_timestamp = self.transaction_pool_obj.get_pending_transaction()
 
         if not tx_timestamp:
@@ -29,10 +35,43 @@ class TxnProcessor:
 
         tx, timestamp = tx_timestamp
 
-        if not self.chain_manager.validate_all(tx, check_nonce=False):
+        return self._process(tx, timestamp, verify_signature=True)
+
+    def _next_batch(self):
+        """
+        Verifies the signatures of a batch of pending transactions in parallel
+        on the VerificationPool, the stateful validation is then done one by one.
+        :return: Deferred firing with the list of results of the batch
+        """
+        txs_timestamp = []
+        while len(txs_timestamp) < self.verification_pool.thread_count:
+            tx_timestamp = self.transaction_pool_obj.get_pending_transaction()
+            if not tx_timestamp:
+                break
+            txs_timestamp.append(tx_timestamp)
+
+        if not txs_timestamp:
+            raise StopIteration
+
+        d = self.verification_pool.verify_transactions([tx for tx, _ in txs_timestamp])
+        d.addCallback(self._process_batch, txs_timestamp)
+        return d
+
+    def _process_batch(self, signatures_valid: list, txs_timestamp: list) -> list:
+        results = []
+        for is_valid, (tx, timestamp) in zip(signatures_valid, txs_timestamp):
+            if not is_valid:
+                logger.info('>>>TX %s failed signature verification', bin2hstr(tx.txhash))
+                results.append(False)
+                continue
+            results.append(self._process(tx, timestamp, verify_signature=False))
+        return results
+
+    def _process(self, tx, timestamp, verify_signature: bool) -> bool:
+        if not self.chain_manager.validate_all(tx, check_nonce=False, verify_signature=verify_signature):
             return False
 
-        is_valid_pool_state = tx.validate_transaction_pool(self.transaction_pool_obj.transaction_pool)
+        is_valid_pool_state = tx.validate_transaction_pool(self.transaction_pool_obj.get_tx_pool_by_pk(tx.PK))
 
         if not is_valid_pool_state:
             logger.info('>>>TX %s failed is_valid_pool_state', bin2hstr(tx.txhash))
@@ -41,13 +80,15 @@ class TxnProcessor:
         logger.info('A TXN has been Processed %s', bin2hstr(tx.txhash))
         self.transaction_pool_obj.add_tx_to_pool(tx, self.chain_manager.last_block.block_number, timestamp)
         self.broadcast_tx(tx)
+        self.chain_manager.publish_pool_transaction(tx)
 
         return True
 
     @staticmethod
     def iterator(iterObj):
-        for _ in iterObj:
-            yield None
+        # A yielded Deferred suspends the cooperative task until it fires
+        for result in iterObj:
+            yield result
 
     @staticmethod
     def create_cooperate(iterObj):
@@ -0,0 +1,99 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from multiprocessing import cpu_count
+
+from twisted.internet import reactor
+from twisted.internet.defer import DeferredList
+from twisted.internet.threads import deferToThreadPool
+from twisted.python.threadpool import ThreadPool
+
+from pur.core import config
+from pur.core.txs.Transaction import Transaction
+
+
+class VerificationPool:
+    """
+    Runs the stateless part of the validation, i.e. purss signatures and PoW,
+    on a pool of threads, so that the reactor thread is not blocked by the
+    native crypto. Every verification returns a Deferred fired on the reactor
+    thread. The stateful validation and the state apply must still be done
+    by the caller, under ChainManager.lock.
+    """
+
+    def __init__(self, thread_count: int = None):
+        if not thread_count:
+            thread_count = config.user.verification_thread_count or cpu_count()
+
+        self._threadpool = ThreadPool(minthreads=1,
+                                      maxthreads=thread_count,
+                                      name='VerificationPool')
+
+    @property
+    def thread_count(self) -> int:
+        return self._threadpool.max
+
+    def start(self):
+        if self._threadpool.started:
+            return
+        self._threadpool.start()
+        reactor.addSystemEventTrigger('before', 'shutdown', self.stop)
+
+    def stop(self):
+        if self._threadpool.started:
+            self._threadpool.stop()
+
+    def submit(self, f, *args, **kwargs):
+        return deferToThreadPool(reactor, self._threadpool, f, *args, **kwargs)
+
+    @staticmethod
+    def _all_valid(results: list) -> bool:
+        for success, result in results:
+            if not success or not result:
+                return False
+        return True
+
+    @staticmethod
+    def _each_valid(results: list) -> list:
+        return [bool(success and result) for success, result in results]
+
+    def verify_transactions(self, txs: list):
+        """
+        Verifies the txhash and the signature of all the transactions in parallel.
+        :return: Deferred firing with a list of bool, in the same order as txs
+        """
+        deferreds = [self.submit(tx.validate, True) for tx in txs]
+        d = DeferredList(deferreds, consumeErrors=True)
+        d.addCallback(self._each_valid)
+        return d
+
+    def verify_pow(self, block, chain_manager):
+        """
+        Verifies the PoW of the block. Requires the parent block to be already in the state.
+        :return: Deferred firing with True if the PoW is valid
+        """
+        dev_config = chain_manager.get_config_by_block_number(block.block_number)
+        d = DeferredList([self.submit(chain_manager.validate_mining_nonce, block.blockheader, dev_config)],
+                         consumeErrors=True)
+        d.addCallback(self._all_valid)
+        return d
+
+    def verify_block(self, block, chain_manager, check_pow=True):
+        """
+        Verifies the PoW of the block and the signatures of all its
+        transactions in parallel. Coinbase transaction has no signature.
+        PoW verification requires the parent block to be already in the
+        state, check_pow must be False for the blocks received out of order.
+        :return: Deferred firing with True if the PoW and all signatures are valid
+        """
+        deferreds = []
+        if check_pow:
+            dev_config = chain_manager.get_config_by_block_number(block.block_number)
+            deferreds.append(self.submit(chain_manager.validate_mining_nonce, block.blockheader, dev_config))
+        for proto_tx in block.transactions[1:]:
+            tx = Transaction.from_pbdata(proto_tx)
+            deferreds.append(self.submit(tx.validate, True))
+
+        d = DeferredList(deferreds, consumeErrors=True)
+        d.addCallback(self._all_valid)
+        return d
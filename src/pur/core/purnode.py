@@ -17,6 +17,7 @@ from pur.core.ESyncState import ESyncState
 from pur.core.misc import ntp
 from pur.core.misc.logger import logger
 from pur.core.node import POW, SyncState
+from pur.core.notification.Subscriptions import Subscriber
 from pur.core.p2p.p2pChainManager import P2PChainManager
 from pur.core.p2p.p2pPeerManager import P2PPeerManager
 from pur.core.p2p.p2pTpuranagement import P2PTpuranagement
@@ -29,6 +30,7 @@ from pur.core.txs.LatticeTransaction import LatticeTransaction
 from pur.core.txs.MessageTransaction import MessageTransaction
 from pur.core.txs.SlaveTransaction import SlaveTransaction
 from pur.core.txs.TokenTransaction import TokenTransaction
+from pur.core.txs.Transaction import Transaction
 from pur.core.txs.TransferTokenTransaction import TransferTokenTransaction
 from pur.core.txs.TransferTransaction import TransferTransaction
 from pur.generated import pur_pb2
@@ -89,9 +91,20 @@ class purNode:
     def uptime(self):
         return ntp.getTime() - self.start_time
 
+    @property
+    def _chain_reader(self):
+        """
+        Read only view of the chain used by the public API. Once ChainManager has
+        added a block, reads are served from its snapshot without taking its lock.
+        """
+        snapshot = self._chain_manager.snapshot
+        if snapshot is not None:
+            return snapshot
+        return self._chain_manager
+
     @property
     def block_height(self):
-        return self._chain_manager.height
+        return self._chain_reader.height
 
     @property
     def epoch(self):
@@ -370,7 +383,7 @@ class purNode:
         if not OptimizedAddressState.address_is_valid(address):
             raise ValueError("Invalid Address")
 
-        return self._chain_manager.get_address_is_used(address)
+        return self._chain_reader.get_address_is_used(address)
 
     def get_address_state(self, address: bytes) -> AddressState:
         if address != config.dev.coinbase_address and not AddressState.address_is_valid(address):
@@ -384,15 +397,22 @@ class purNode:
         if address != config.dev.coinbase_address and not OptimizedAddressState.address_is_valid(address):
             raise ValueError("Invalid Address")
 
-        address_state = self._chain_manager.get_optimized_address_state(address)
+        address_state = self._chain_reader.get_optimized_address_state(address)
 
         return address_state
 
+    def get_optimized_addresses_state(self, addresses: list) -> list:
+        for address in addresses:
+            if address != config.dev.coinbase_address and not OptimizedAddressState.address_is_valid(address):
+                raise ValueError("Invalid Address")
+
+        return self._chain_reader.get_optimized_addresses_state(addresses)
+
     def get_multi_sig_address_state(self, address: bytes) -> MultiSigAddressState:
         if not MultiSigAddressState.address_is_valid(address):
             raise ValueError("Invalid Address")
 
-        multi_sig_address_state = self._chain_manager.get_multi_sig_address_state(address)
+        multi_sig_address_state = self._chain_reader.get_multi_sig_address_state(address)
 
         return multi_sig_address_state
 
@@ -412,7 +432,8 @@ class purNode:
         bitfields = list()
         for page in range(page_from, max_pages + 1):
             bitfield = self._chain_manager.get_bitfield(address, page)
-            bitfields.append(pur_pb2.OTSBitfieldByPage(ots_bitfield=bitfield, page_number=page))
+            bitfields.append(pur_pb2.OTSBitfieldByPage(ots_bitfield=[bitfield[i:i + 1] for i in range(len(bitfield))],
+                                                       page_number=page))
 
         unused_ots_index = self._chain_manager.get_unused_ots_index2(address, unused_ots_index_from)
         unused_ots_index_found = unused_ots_index is not None
@@ -422,23 +443,93 @@ class purNode:
     def is_slave(self, master_address: bytes, slave_pk: bytes):
         return self._chain_manager.is_slave(master_address, slave_pk)
 
+    def get_slaves_state(self, master_address: bytes, slaves: list) -> list:
+        """
+        :param slaves: list of (slave_pk, unused_ots_index_from)
+        :return: the access type and the next unused OTS index of each slave, without loading the address states
+        """
+        if not OptimizedAddressState.address_is_valid(master_address):
+            raise ValueError("Invalid Address")
+
+        slaves_state = []
+        for slave_pk, unused_ots_index_from in slaves:
+            slave_address = bytes(purHelper.getAddress(slave_pk))
+            slave_state = pur_pb2.SlaveState(slave_pk=slave_pk)
+
+            slave_metadata = self._chain_manager.get_slave_pk_access_type(master_address, slave_pk)
+            if slave_metadata:
+                slave_state.is_slave = True
+                slave_state.access_type = slave_metadata.access_type
+
+            unused_ots_index = self._chain_manager.get_unused_ots_index2(slave_address, unused_ots_index_from)
+            if unused_ots_index is not None:
+                slave_state.next_unused_ots_index = unused_ots_index
+                slave_state.unused_ots_index_found = True
+
+            slaves_state.append(slave_state)
+
+        return slaves_state
+
     def get_all_address_state(self) -> list:
         return self._chain_manager.get_all_address_state()
 
-    def _load_transaction_hashes(self, address: bytes, item_per_page: int, page_number: int) -> list:
-        address_state = self._chain_manager.get_optimized_address_state(address)
-        start_item_index = max(0, address_state.transaction_hash_count() - item_per_page * page_number)
-        end_item_index = min(address_state.transaction_hash_count(), start_item_index + item_per_page)
-
-        transaction_hashes = self._chain_manager.get_transaction_hashes(address,
-                                                                        start_item_index)
-        actual_start_item_index = (start_item_index // config.dev.data_per_page) * config.dev.data_per_page
-        transaction_hashes = transaction_hashes[start_item_index - actual_start_item_index:]
-        while actual_start_item_index < end_item_index:
-            actual_start_item_index += config.dev.data_per_page
-            transaction_hashes.extend(self._chain_manager.get_transaction_hashes(address,
-                                                                                 actual_start_item_index))
-        return transaction_hashes[:item_per_page][-1::-1]
+    def get_optimized_addresses_state_chunks(self, max_chunk_size: int):
+        return self._chain_manager.get_optimized_addresses_state_chunks(max_chunk_size)
+
+    def subscribe(self, topic: str, addresses: list = None) -> Optional[Subscriber]:
+        """
+        :return: the Subscriber of the topic, None if there are already too many subscribers
+        """
+        addresses_set = None
+        if addresses is not None:
+            if not addresses:
+                raise ValueError("No Address")
+            for address in addresses:
+                if address != config.dev.coinbase_address and not OptimizedAddressState.address_is_valid(address):
+                    raise ValueError("Invalid Address")
+            addresses_set = set(addresses)
+
+        return self._chain_manager.subscriptions.subscribe(topic, addresses_set)
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self._chain_manager.subscriptions.unsubscribe(subscriber)
+
+    @staticmethod
+    def _encode_history_cursor(item_index: int) -> bytes:
+        return item_index.to_bytes(8, byteorder='big', signed=False)
+
+    @staticmethod
+    def _decode_history_cursor(cursor: bytes) -> int:
+        if len(cursor) != 8:
+            raise ValueError("Invalid cursor")
+        return int.from_bytes(cursor, byteorder='big', signed=False)
+
+    def _load_history(self,
+                      name: bytes,
+                      address: bytes,
+                      item_count: int,
+                      item_per_page: int,
+                      page_number: int,
+                      cursor: bytes = b'') -> (list, bytes):
+        """
+        Reads at most item_per_page values of the paginated data name of the address, newest first.
+        Values are read backwards from the cursor if provided, otherwise from the page_number.
+        :return: values and the cursor to the next older values, empty once the oldest value has been read
+        """
+        if cursor:
+            end_item_index = min(item_count, self._decode_history_cursor(cursor))
+            start_item_index = max(0, end_item_index - item_per_page)
+        else:
+            start_item_index = max(0, item_count - item_per_page * page_number)
+            end_item_index = min(item_count, start_item_index + item_per_page)
+
+        values = self._chain_reader.get_paginated_data_reversed(name,
+                                                                address,
+                                                                end_item_index,
+                                                                end_item_index - start_item_index)
+        if start_item_index == 0:
+            return values, b''
+        return values, self._encode_history_cursor(start_item_index)
 
     def _load_multi_sig_spend_txn_hashes(self,
                                          address: bytes,
@@ -446,117 +537,44 @@ class purNode:
                                          page_number: int,
                                          mode: int) -> list:
         if OptimizedAddressState.address_is_valid(address):
-            address_state = self._chain_manager.get_optimized_address_state(address)
+            address_state = self._chain_reader.get_optimized_address_state(address)
         elif MultiSigAddressState.address_is_valid(address):
-            address_state = self._chain_manager.get_multi_sig_address_state(address)
+            address_state = self._chain_reader.get_multi_sig_address_state(address)
         else:
             return []
 
-        start_item_index = max(0, address_state.multi_sig_spend_count() - item_per_page * page_number)
-        end_item_index = min(address_state.multi_sig_spend_count(), start_item_index + item_per_page)
-
+        item_count = address_state.multi_sig_spend_count()
         if mode > 0:
-            start_item_index = 0
-            end_item_index = address_state.multi_sig_spend_count()
-
-        transaction_hashes = self._chain_manager.get_multi_sig_spend_txn_hashes(address,
-                                                                                start_item_index)
-        actual_start_item_index = (start_item_index // config.dev.data_per_page) * config.dev.data_per_page
-        multi_sig_spend_txn_hashes = transaction_hashes[start_item_index - actual_start_item_index:]
-        while actual_start_item_index < end_item_index and len(multi_sig_spend_txn_hashes) < item_per_page:
-            actual_start_item_index += config.dev.data_per_page
-            multi_sig_spend_txn_hashes.extend(self._chain_manager.get_multi_sig_spend_txn_hashes(address,
-                                                                                                 actual_start_item_index))
-        return multi_sig_spend_txn_hashes[:item_per_page][-1::-1]
-
-    def _load_token_transaction_hashes(self, address: bytes, item_per_page: int, page_number: int) -> list:
-        address_state = self._chain_manager.get_optimized_address_state(address)
-        start_item_index = max(0, address_state.tokens_count() - item_per_page * page_number)
-        end_item_index = min(address_state.tokens_count(), start_item_index + item_per_page)
-
-        transaction_hashes = self._chain_manager.get_token_transaction_hashes(address,
-                                                                              start_item_index)
-        actual_start_item_index = (start_item_index // config.dev.data_per_page) * config.dev.data_per_page
-        token_transaction_hashes = transaction_hashes[start_item_index - actual_start_item_index:]
-        while actual_start_item_index < end_item_index:
-            actual_start_item_index += config.dev.data_per_page
-            token_transaction_hashes.extend(self._chain_manager.get_token_transaction_hashes(address,
-                                                                                             actual_start_item_index))
-        return token_transaction_hashes[:item_per_page][-1::-1]
-
-    def _load_slave_transaction_hashes(self, address: bytes, item_per_page: int, page_number: int) -> list:
-        address_state = self._chain_manager.get_optimized_address_state(address)
-        start_item_index = max(0, address_state.slaves_count() - item_per_page * page_number)
-        end_item_index = min(address_state.slaves_count(), start_item_index + item_per_page)
-
-        if start_item_index < 0:
-            return []
-
-        transaction_hashes = self._chain_manager.get_slave_transaction_hashes(address,
-                                                                              start_item_index)
-        actual_start_item_index = (start_item_index // config.dev.data_per_page) * config.dev.data_per_page
-        token_transaction_hashes = transaction_hashes[start_item_index - actual_start_item_index:]
-        while actual_start_item_index < end_item_index:
-            actual_start_item_index += config.dev.data_per_page
-            token_transaction_hashes.extend(self._chain_manager.get_slave_transaction_hashes(address,
-                                                                                             actual_start_item_index))
-        return token_transaction_hashes[:item_per_page][-1::-1]
-
-    def _load_lattice_pks_transaction_hashes(self, address: bytes, item_per_page: int, page_number: int) -> list:
-        address_state = self._chain_manager.get_optimized_address_state(address)
-        start_item_index = max(0, address_state.lattice_pk_count() - item_per_page * page_number)
-        end_item_index = min(address_state.lattice_pk_count(), start_item_index + item_per_page)
-
-        transaction_hashes = self._chain_manager.get_lattice_pks_transaction_hashes(address,
-                                                                                    start_item_index)
-        actual_start_item_index = (start_item_index // config.dev.data_per_page) * config.dev.data_per_page
-        lattice_pks_transaction_hashes = transaction_hashes[start_item_index - actual_start_item_index:]
-        while actual_start_item_index < end_item_index:
-            actual_start_item_index += config.dev.data_per_page
-            lattice_pks_transaction_hashes.extend(self._chain_manager.get_lattice_pks_transaction_hashes(address,
-                                                                                                         actual_start_item_index))
-        return lattice_pks_transaction_hashes[:item_per_page][-1::-1]
-
-    def _load_multi_sig_addresses(self, address: bytes, item_per_page: int, page_number: int) -> list:
-        address_state = self._chain_manager.get_optimized_address_state(address)
-        start_item_index = max(0, address_state.multi_sig_address_count() - item_per_page * page_number)
-        end_item_index = min(address_state.multi_sig_address_count(), start_item_index + item_per_page)
-
-        multi_sig_addresses = self._chain_manager.get_multi_sig_addresses(address,
-                                                                          start_item_index)
-        actual_start_item_index = (start_item_index // config.dev.data_per_page) * config.dev.data_per_page
-        multi_sig_addresses = multi_sig_addresses[start_item_index - actual_start_item_index:]
-        while actual_start_item_index < end_item_index:
-            actual_start_item_index += config.dev.data_per_page
-            multi_sig_addresses.extend(self._chain_manager.get_multi_sig_addresses(address,
-                                                                                   actual_start_item_index))
-        return multi_sig_addresses[:item_per_page][-1::-1]
-
-    def _load_inbox_message_transaction_hashes(self, address: bytes, item_per_page: int, page_number: int) -> list:
-        address_state = self._chain_manager.get_optimized_address_state(address)
-        start_item_index = max(0, address_state.inbox_message_count() - item_per_page * page_number)
-        end_item_index = min(address_state.inbox_message_count(), start_item_index + item_per_page)
-
-        transaction_hashes = self._chain_manager.get_inbox_message_transaction_hashes(address,
-                                                                                      start_item_index)
-        actual_start_item_index = (start_item_index // config.dev.data_per_page) * config.dev.data_per_page
-        inbox_message_transaction_hashes = transaction_hashes[start_item_index - actual_start_item_index:]
-        while actual_start_item_index < end_item_index:
-            actual_start_item_index += config.dev.data_per_page
-            inbox_message_transaction_hashes.extend(self._chain_manager.get_inbox_message_transaction_hashes(address,
-                                                                                                             actual_start_item_index))
-        return inbox_message_transaction_hashes[:item_per_page][-1::-1]
-
-    def get_mini_transactions_by_address(self, address: bytes, item_per_page: int, page_number: int):
+            # Filters are applied on the oldest item_per_page transactions
+            item_count = min(item_count, item_per_page)
+            page_number = 1
+
+        transaction_hashes, _ = self._load_history(b'p_multi_sig_spend',
+                                                   address,
+                                                   item_count,
+                                                   item_per_page,
+                                                   page_number)
+        return transaction_hashes
+
+    def get_mini_transactions_by_address(self, address: bytes, item_per_page: int, page_number: int, cursor: bytes = b''):
         if item_per_page == 0:
             return None
         mini_transactions = []
-        transaction_hashes = self._load_transaction_hashes(address, item_per_page, page_number)
+        address_state = self._chain_reader.get_optimized_address_state(address)
+        transaction_hashes, next_cursor = self._load_history(b'p_tx_hash',
+                                                             address,
+                                                             address_state.transaction_hash_count(),
+                                                             item_per_page,
+                                                             page_number,
+                                                             cursor)
         response = pur_pb2.GetMiniTransactionsByAddressResp()
-        for tx_hash in transaction_hashes:
+        tx_metadata_list = self._chain_reader.get_tx_metadata_list(transaction_hashes)
+        for tx_hash, tx_metadata in zip(transaction_hashes, tx_metadata_list):
+            if tx_metadata is None:
+                continue
             mini_transaction = pur_pb2.MiniTransaction()
             mini_transaction.transaction_hash = bin2hstr(tx_hash)
-            tx, _ = self._chain_manager.get_tx_metadata(tx_hash)
+            tx = Transaction.from_pbdata(tx_metadata.transaction)
             amount = 0
             if tx.addr_from == address:
                 amount -= tx.fee
@@ -586,29 +604,52 @@ class purNode:
             mini_transactions.append(mini_transaction)
 
         response.mini_transactions.extend(mini_transactions)
-        response.balance = self._chain_manager.get_address_balance(address)
+        response.balance = self._chain_reader.get_address_balance(address)
+        response.next_cursor = next_cursor
         return response
 
-    def get_transactions_by_address(self, address: bytes, item_per_page: int, page_number: int):
+    def get_transactions_by_address(self, address: bytes, item_per_page: int, page_number: int, cursor: bytes = b''):
         if item_per_page == 0:
             return None
-        transaction_hashes = self._load_transaction_hashes(address,
-                                                           item_per_page,
-                                                           page_number)
+        address_state = self._chain_reader.get_optimized_address_state(address)
+        transaction_hashes, next_cursor = self._load_history(b'p_tx_hash',
+                                                             address,
+                                                             address_state.transaction_hash_count(),
+                                                             item_per_page,
+                                                             page_number,
+                                                             cursor)
 
         response = pur_pb2.GetTransactionsByAddressResp()
-        for tx_hash in transaction_hashes:
-            tx, block_number = self._chain_manager.get_tx_metadata(tx_hash)
-            b = self.get_block_from_index(block_number)
+        response.transactions_detail.extend(self._get_transactions_detail(transaction_hashes))
+        response.next_cursor = next_cursor
+
+        return response
+
+    def _get_transactions_detail(self, transaction_hashes: list) -> list:
+        """
+        Resolves the metadata of all the transaction_hashes and the header hashes of
+        their blocks in batch, without loading the blocks.
+        """
+        chain_reader = self._chain_reader
+        tx_metadata_list = [tx_metadata
+                            for tx_metadata in chain_reader.get_tx_metadata_list(transaction_hashes)
+                            if tx_metadata is not None]
+        header_hashes = chain_reader.get_block_header_hashes_by_number(
+            [tx_metadata.block_number for tx_metadata in tx_metadata_list])
+
+        transactions_detail = []
+        for tx_metadata in tx_metadata_list:
+            tx = Transaction.from_pbdata(tx_metadata.transaction)
+            block_number = tx_metadata.block_number
             transaction_detail = pur_pb2.GetTransactionResp(tx=tx.pbdata,
-                                                            confirmations=self.block_height - block_number + 1,
+                                                            confirmations=chain_reader.height - block_number + 1,
                                                             block_number=block_number,
-                                                            block_header_hash=b.headerhash,
-                                                            timestamp=b.timestamp,
+                                                            block_header_hash=header_hashes[block_number],
+                                                            timestamp=tx_metadata.timestamp,
                                                             addr_from=tx.addr_from)
-            response.transactions_detail.extend([transaction_detail])
+            transactions_detail.append(transaction_detail)
 
-        return response
+        return transactions_detail
 
     def get_multi_sig_spend_txs_by_address(self,
                                            address: bytes,
@@ -635,14 +676,14 @@ class purNode:
 
         for tx_hash in transaction_hashes:
             if filter_type in (1, 2, 5, 6):
-                vote_stats = self._chain_manager.get_vote_stats(tx_hash)
+                vote_stats = self._chain_reader.get_vote_stats(tx_hash)
                 if filter_type == 1 and not vote_stats.executed:
                     continue
                 if filter_type in (2, 5, 6) and vote_stats.executed:
                     continue
-            tx, block_number = self._chain_manager.get_tx_metadata(tx_hash)
+            tx, block_number = self._chain_reader.get_tx_metadata(tx_hash)
 
-            current_block_number = self._chain_manager.height
+            current_block_number = self._chain_reader.height
 
             is_expired = tx.expiry_block_number <= current_block_number
             if filter_type in (4, 6):
@@ -665,39 +706,38 @@ class purNode:
         return response
 
     def get_vote_stats(self, multi_sig_spend_tx_hash: bytes):
-        vote_stats = self._chain_manager.get_vote_stats(multi_sig_spend_tx_hash)
+        vote_stats = self._chain_reader.get_vote_stats(multi_sig_spend_tx_hash)
         return pur_pb2.GetVoteStatsResp(vote_stats=vote_stats.pbdata)
 
     def get_inbox_messages_by_address(self, address: bytes, item_per_page: int, page_number: int):
         if item_per_page == 0:
             return None
-        transaction_hashes = self._load_inbox_message_transaction_hashes(address,
-                                                                         item_per_page,
-                                                                         page_number)
+        address_state = self._chain_reader.get_optimized_address_state(address)
+        transaction_hashes, _ = self._load_history(b'p_inbox_message',
+                                                   address,
+                                                   address_state.inbox_message_count(),
+                                                   item_per_page,
+                                                   page_number)
 
         response = pur_pb2.GetTransactionsByAddressResp()
-        for tx_hash in transaction_hashes:
-            tx, block_number = self._chain_manager.get_tx_metadata(tx_hash)
-            b = self.get_block_from_index(block_number)
-            transaction_detail = pur_pb2.GetTransactionResp(tx=tx.pbdata,
-                                                            confirmations=self.block_height - block_number + 1,
-                                                            block_number=block_number,
-                                                            block_header_hash=b.headerhash,
-                                                            timestamp=b.timestamp,
-                                                            addr_from=tx.addr_from)
-            response.transactions_detail.extend([transaction_detail])
+        response.transactions_detail.extend(self._get_transactions_detail(transaction_hashes))
 
         return response
 
     def get_tokens_by_address(self, address: bytes, item_per_page: int, page_number: int):
         if item_per_page == 0:
             return None
-        token_hashes = self._load_token_transaction_hashes(address, item_per_page, page_number)
+        address_state = self._chain_reader.get_optimized_address_state(address)
+        token_hashes, _ = self._load_history(b'p_tokens',
+                                             address,
+                                             address_state.tokens_count(),
+                                             item_per_page,
+                                             page_number)
 
         response = pur_pb2.GetTokensByAddressResp()
         for tx_hash in token_hashes:
-            tx, _ = self._chain_manager.get_tx_metadata(tx_hash)
-            balance = self._chain_manager.get_token(address, tx.txhash)
+            tx, _ = self._chain_reader.get_tx_metadata(tx_hash)
+            balance = self._chain_reader.get_token(address, tx.txhash)
             transaction_detail = pur_pb2.TokenDetail(token_txhash=tx.txhash,
                                                      name=tx.name,
                                                      symbol=tx.symbol,
@@ -709,11 +749,16 @@ class purNode:
     def get_slaves_by_address(self, address: bytes, item_per_page: int, page_number: int):
         if item_per_page > config.dev.data_per_page or item_per_page == 0:
             return None
-        slave_hashes = self._load_slave_transaction_hashes(address, item_per_page, page_number)
+        address_state = self._chain_reader.get_optimized_address_state(address)
+        slave_hashes, _ = self._load_history(b'p_slaves',
+                                             address,
+                                             address_state.slaves_count(),
+                                             item_per_page,
+                                             page_number)
 
         response = pur_pb2.GetSlavesByAddressResp()
         for tx_hash in slave_hashes:
-            tx, _ = self._chain_manager.get_tx_metadata(tx_hash)
+            tx, _ = self._chain_reader.get_tx_metadata(tx_hash)
             for index in range(0, len(tx.slave_pks)):
                 transaction_detail = pur_pb2.SlaveDetail(slave_address=bytes(purHelper.getAddress(tx.slave_pks[index])),
                                                          access_type=tx.access_types[index])
@@ -724,11 +769,16 @@ class purNode:
     def get_lattice_pks_by_address(self, address: bytes, item_per_page: int, page_number: int):
         if item_per_page > config.dev.data_per_page or item_per_page == 0:
             return None
-        lattice_pk_hashes = self._load_lattice_pks_transaction_hashes(address, item_per_page, page_number)
+        address_state = self._chain_reader.get_optimized_address_state(address)
+        lattice_pk_hashes, _ = self._load_history(b'p_lattice_pk',
+                                                  address,
+                                                  address_state.lattice_pk_count(),
+                                                  item_per_page,
+                                                  page_number)
 
         response = pur_pb2.GetLatticePKsByAddressResp()
         for tx_hash in lattice_pk_hashes:
-            tx, _ = self._chain_manager.get_tx_metadata(tx_hash)
+            tx, _ = self._chain_reader.get_tx_metadata(tx_hash)
             transaction_detail = pur_pb2.LatticePKsDetail(pk1=tx.pk1,
                                                           pk2=tx.pk2,
                                                           pk3=tx.pk3,
@@ -740,15 +790,18 @@ class purNode:
     def get_multi_sig_addresses_by_address(self, address: bytes, item_per_page: int, page_number: int):
         if item_per_page > config.dev.data_per_page or item_per_page == 0:
             return None
-        multi_sig_addresses = self._load_multi_sig_addresses(address,
-                                                             item_per_page,
-                                                             page_number)
+        address_state = self._chain_reader.get_optimized_address_state(address)
+        multi_sig_addresses, _ = self._load_history(b'p_multisig_address',
+                                                    address,
+                                                    address_state.multi_sig_address_count(),
+                                                    item_per_page,
+                                                    page_number)
 
         response = pur_pb2.GetMultiSigAddressesByAddressResp()
         for multi_sig_address in multi_sig_addresses:
             multi_sig_detail = pur_pb2.MultiSigDetail(
                 address=multi_sig_address,
-                balance=self._chain_manager.get_multi_sig_address_state(multi_sig_address).balance,
+                balance=self._chain_reader.get_multi_sig_address_state(multi_sig_address).balance,
             )
             response.multi_sig_detail.extend([multi_sig_detail])
 
@@ -762,11 +815,11 @@ class purNode:
         # TODO: Search tx hash
         # FIpurE: We dont need searches, etc.. getting a protobuf indexed by hash from DB should be enough
         # FIpurE: This is just a workaround to provide functionality
-        result = self._chain_manager.get_tx_metadata(query_hash)
+        result = self._chain_reader.get_tx_metadata(query_hash)
         return result
 
     def get_block_header_hash_by_number(self, query_block_number: int):
-        return self._chain_manager.get_block_header_hash_by_number(query_block_number)
+        return self._chain_reader.get_block_header_hash_by_number(query_block_number)
 
     def get_unconfirmed_transaction(self, query_hash: bytes):
         result = self._chain_manager.get_unconfirmed_transaction(query_hash)
@@ -776,22 +829,22 @@ class purNode:
         """
         This method returns an object that matches the query hash
         """
-        return self._chain_manager.last_block
+        return self._chain_reader.last_block
 
     def get_block_from_hash(self, query_hash: bytes) -> Optional[Block]:
         """
         This method returns an object that matches the query hash
         """
-        return self._chain_manager.get_block(query_hash)
+        return self._chain_reader.get_block(query_hash)
 
     def get_block_from_index(self, index: int) -> Block:
         """
         This method returns an object that matches the query hash
         """
-        return self._chain_manager.get_block_by_number(index)
+        return self._chain_reader.get_block_by_number(index)
 
     def get_blockidx_from_txhash(self, transaction_hash):
-        result = self._chain_manager.get_tx_metadata(transaction_hash)
+        result = self._chain_reader.get_tx_metadata(transaction_hash)
         if result:
             return result[1]
         return None
@@ -801,7 +854,7 @@ class purNode:
         end = self.block_height - offset
         start = max(0, end - count + 1)
         for blk_idx in range(start, end + 1):
-            answer.append(self._chain_manager.get_block_by_number(blk_idx))
+            answer.append(self._chain_reader.get_block_by_number(blk_idx))
 
         return answer
 
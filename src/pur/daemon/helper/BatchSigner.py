@@ -0,0 +1,43 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from multiprocessing import get_context
+
+from pur.core.txs.Transaction import Transaction
+from pur.crypto.purss import purSS
+from pur.generated import pur_pb2
+
+
+def sign_transactions(extended_seed: bytes, ots_index: int, transactions: list) -> list:
+    """
+    Signs serialized transactions with consecutive OTS indexes of a single tree, starting from ots_index.
+    It runs in a worker process, so that the trees of several addresses are generated and used in parallel.
+    :return: the serialized signed transactions
+    """
+    purss = purSS.from_extended_seed(extended_seed)
+    purss.set_ots_index(ots_index)
+
+    signed_transactions = []
+    for data in transactions:
+        pbdata = pur_pb2.Transaction()
+        pbdata.ParseFromString(data)
+        tx = Transaction.from_pbdata(pbdata)
+        tx.sign(purss)
+        if not tx.validate(True):
+            raise Exception("Invalid Transaction")
+        signed_transactions.append(tx.pbdata.SerializeToString())
+
+    return signed_transactions
+
+
+def sign_batch(chunks: list, processes: int) -> list:
+    """
+    :param chunks: list of (extended_seed, ots_index, serialized transactions), one per address
+    :return: the serialized signed transactions of each chunk
+    """
+    if len(chunks) == 1:
+        return [sign_transactions(*chunks[0])]
+
+    # Spawned workers do not inherit the grpc threads of walletd
+    with get_context('spawn').Pool(processes=min(processes, len(chunks))) as pool:
+        return pool.starmap(sign_transactions, chunks)
@@ -1,7 +1,6 @@
 # coding=utf-8
 # Distributed under the MIT software license, see the accompanying
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
-import functools
 import os
 from collections import namedtuple
 from typing import List, Optional
@@ -13,6 +12,7 @@ from pur.core import config
 from pur.core.misc import logger
 from pur.crypto.AESHelper import AESHelper
 from pur.crypto.purss import purSS
+from pur.daemon.helper.purSSCache import purSSCache
 
 AddressItem = namedtuple('AddressItem',
                          'qaddress pk hexseed mnemonic height hashFunction signatureType index encrypted slaves')
@@ -45,6 +45,7 @@ class Wallet:
         self.wallet_path = wallet_path
         self._address_items = []
         self.version = 1
+        self._purss_cache = purSSCache(config.user.walletd_purss_cache_size)
 
         self.load()
 
@@ -81,14 +82,20 @@ class Wallet:
         # FIpurE: slow, makes 2 passes over address_items.
         return any([item.encrypted for item in self.address_items]) and not self.encrypted
 
-    @functools.lru_cache(maxsize=20)
     def get_purss_by_index(self, idx, passphrase=None) -> Optional[purSS]:
         """
-        Generates an purSS tree based on the information contained in the wallet
+        Generates an purSS tree based on the information contained in the wallet,
+        unless the tree of the address is cached
         :param idx: The index of the address item
         :param passphrase: passphrase to decrypt
         :return: An purSS tree object
         """
+        if idx < len(self._address_items):
+            item = self._address_items[idx]
+            purss = self._purss_cache.take(item.qaddress, item.index)
+            if purss is not None:
+                return purss
+
         if passphrase:
             self.decrypt_item(idx, passphrase)
 
@@ -115,11 +122,15 @@ class Wallet:
 
     def get_purss_by_item(self, item: AddressItem, ots_index=-1) -> purSS:
         """
-        Generates an purSS tree based on the given AddressItem
+        Generates an purSS tree based on the given AddressItem,
+        unless the tree of the address is cached
         :param item:
         :param ots_index:
         :return:
         """
+        purss = self._purss_cache.take(item.qaddress, ots_index if ots_index > -1 else item.index)
+        if purss is not None:
+            return purss
 
         extended_seed = mnemonic2bin(item.mnemonic.strip())
         tmp_purss = purSS.from_extended_seed(extended_seed)
@@ -153,6 +164,16 @@ class Wallet:
 
         return self.get_purss_by_item(self._address_items[idx])
 
+    def release_purss(self, purss: purSS):
+        """
+        Caches a tree obtained from the wallet once it has signed,
+        so that the next signature of the address does not generate it again
+        """
+        self._purss_cache.put(purss)
+
+    def clear_purss_cache(self):
+        self._purss_cache.clear()
+
     @staticmethod
     def _get_Qaddress(addr: bytes) -> str:
         """
@@ -211,7 +232,7 @@ class Wallet:
         )
         self.save()
 
-    def set_slave_ots_index(self, index, group_index, slave_index, ots_index):
+    def set_slave_ots_index(self, index, group_index, slave_index, ots_index, save=True):
         item = self._address_items[index].slaves[group_index][slave_index]
         self._address_items[index].slaves[group_index][slave_index] = AddressItem(
             qaddress=item.qaddress,
@@ -225,7 +246,8 @@ class Wallet:
             encrypted=item.encrypted,
             slaves=item.slaves
         )
-        self.save()
+        if save:
+            self.save()
 
     def verify_wallet(self):
         """
@@ -470,6 +492,7 @@ class Wallet:
             if item.qaddress == addr:
                 try:
                     self._address_items.remove(item)
+                    self._purss_cache.remove(addr)
                     self.save_wallet(self.wallet_path)
                     return True
                 except ValueError:
@@ -0,0 +1,65 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from pur.crypto.purss import purSS
+
+
+class purSSCache(object):
+    """
+    Live purSS trees of the wallet addresses, so that each signature does not generate the tree again.
+    A tree is taken out of the cache while it is used, so that two signatures never share its OTS index,
+    and is put back once it has signed. The least recently used trees are evicted first.
+    """
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # qaddress -> purSS
+        self._trees = OrderedDict()
+
+    def __len__(self):
+        return len(self._trees)
+
+    def take(self, qaddress: str, ots_index: int) -> Optional[purSS]:
+        """
+        :return: the cached tree of the address moved to ots_index, None if there is none
+        """
+        with self._lock:
+            purss = self._trees.pop(qaddress, None)
+
+        if purss is None:
+            return None
+
+        # A tree can only be moved forward, the tree is generated again for a lower OTS index
+        if ots_index < purss.ots_index:
+            return None
+
+        if ots_index > purss.ots_index:
+            purss.set_ots_index(ots_index)
+
+        return purss
+
+    def put(self, purss: purSS):
+        if self._max_size <= 0:
+            return
+
+        # The next OTS index does not exist once the tree is exhausted
+        if purss.ots_index >= 2 ** purss.height:
+            return
+
+        with self._lock:
+            self._trees[purss.qaddress] = purss
+            self._trees.move_to_end(purss.qaddress)
+            while len(self._trees) > self._max_size:
+                self._trees.popitem(last=False)
+
+    def remove(self, qaddress: str):
+        with self._lock:
+            self._trees.pop(qaddress, None)
+
+    def clear(self):
+        with self._lock:
+            self._trees.clear()
@@ -16,6 +16,7 @@ from pypurlib.pypurlib import hstr2bin, mnemonic2bin, bin2hstr, purHelper
 from pur.core import config
 from pur.core.AddressState import AddressState
 from pur.daemon.helper import logger
+from pur.daemon.helper.BatchSigner import sign_batch
 from pur.daemon.helper.DaemonHelper import WalletDecryptionError, Wallet, UNRESERVED_OTS_INDEX_START
 from pur.services.WalletAPIService import WalletAPIService
 from pur.generated import pur_pb2, pur_pb2_grpc, purwallet_pb2
@@ -293,29 +294,32 @@ class WalletD:
 
         return self._wallet.wallet_info()
 
-    def get_address_state(self, qaddress: str) -> AddressState:
-        request = pur_pb2.GetAddressStateReq(address=bytes(hstr2bin(qaddress[1:])))
-
-        resp = self._public_stub.GetAddressState(request=request)
-        return AddressState(resp.state)
-
     def sign_and_push_transaction(self,
                                   tx,
                                   purss,
                                   index,
                                   group_index=None,
                                   slave_index=None,
-                                  enable_save=True):
+                                  enable_save=True,
+                                  release=True):
+        """
+        :param release: False if the caller keeps using the purss tree after signing,
+        it must then release the tree to the wallet once done with it
+        """
         logger.info("Signing %s transaction by %s | OTS index %s", tx.type, purss.qaddress, purss.ots_index)
-        tx.sign(purss)
-        if not tx.validate(True):
-            raise Exception("Invalid Transaction")
-
-        if enable_save:
-            if slave_index is None:  # noqa
-                self._wallet.set_ots_index(index, purss.ots_index)  # Move to next OTS index before broadcasting txn
-            else:
-                self._wallet.set_slave_ots_index(index, group_index, slave_index, purss.ots_index)
+        try:
+            tx.sign(purss)
+            if not tx.validate(True):
+                raise Exception("Invalid Transaction")
+
+            if enable_save:
+                if slave_index is None:  # noqa
+                    self._wallet.set_ots_index(index, purss.ots_index)  # Move to next OTS index before broadcasting txn
+                else:
+                    self._wallet.set_slave_ots_index(index, group_index, slave_index, purss.ots_index)
+        finally:
+            if release:
+                self._wallet.release_purss(purss)
 
         push_transaction_req = pur_pb2.PushTransactionReq(transaction_signed=tx.pbdata)
         push_transaction_resp = self._public_stub.PushTransaction(push_transaction_req, timeout=CONNECTION_TIMEOUT)
@@ -330,9 +334,7 @@ class WalletD:
             return None
 
         slave_index = len(item.slaves[group_index]) - 1
-        slave_address_state = self.get_address_state(slave.qaddress)
-
-        ots_index = slave_address_state.get_unused_ots_index(slave.index)
+        ots_index = self.get_unused_ots_index(self.qaddress_to_address(slave.qaddress), slave.index)
 
         if ots_index is None:  # noqa
             self._wallet.set_slave_ots_index(index,
@@ -365,17 +367,28 @@ class WalletD:
             return None
         return resp.next_unused_ots_index
 
+    def get_slaves_state(self, master_address: bytes, slaves: list) -> list:
+        """
+        :return: the access type and the next unused OTS index from slave.index of each slave
+        """
+        request = pur_pb2.GetSlavesStateReq(master_address=master_address,
+                                            slaves=[pur_pb2.GetSlavesStateReq.Slave(slave_pk=bytes(hstr2bin(slave.pk)),
+                                                                                    unused_ots_index_from=slave.index)
+                                                    for slave in slaves])
+        resp = self._public_stub.GetSlavesState(request=request)
+        return list(resp.slaves_state)
+
     def get_slave(self, master_qaddress):
         index, item = self._wallet.get_address_item(master_qaddress)
         if index is None:
             raise Exception("Signer Address Not Found ", master_qaddress)
 
         # Should we check available OTS for master
-        # Get slave list using address state
-        address_state = self.get_address_state(master_qaddress)
+        # Access types and unused OTS indexes of the last slave group, in a single request
+        last_slaves = item.slaves[-1]
+        slaves_state = self.get_slaves_state(self.qaddress_to_address(master_qaddress), last_slaves)
 
-        slave = item.slaves[-1][0]
-        if not address_state.validate_slave_with_access_type(str(bytes(hstr2bin(slave.pk))), [0]):
+        if not slaves_state[0].is_slave or slaves_state[0].access_type != 0:
             if len(item.slaves) == 1:
                 qaddress = item.qaddress
                 target_address_item = item
@@ -385,10 +398,9 @@ class WalletD:
                 target_address_item = item.slaves[-2][-1]
                 group_index = -2
 
-            address_state = self.get_address_state(qaddress)
-            ots_index = address_state.get_unused_ots_index()
+            ots_index = self.get_unused_ots_index(self.qaddress_to_address(qaddress), 0)
 
-            if ots_index >= UNRESERVED_OTS_INDEX_START:
+            if ots_index is None or ots_index >= UNRESERVED_OTS_INDEX_START:
                 raise Exception('Fatal Error!!! No reserved OTS index found')
 
             if self._passphrase:
@@ -401,15 +413,19 @@ class WalletD:
                                         slaves_pk,
                                         self.qaddress_to_address(master_qaddress))
 
+            # The tree is not released while it may still be returned to sign with the last slave
             self.sign_and_push_transaction(tx,
                                            purss,
                                            index,
-                                           enable_save=False)
+                                           enable_save=False,
+                                           release=False)
 
             if len(item.slaves) > 1:
                 if self.try_txn_with_last_slave(item, index, group_index, purss):
                     return index, len(item.slaves) - 2, len(item.slaves[group_index]) - 1, purss
 
+            self._wallet.release_purss(purss)
+
         else:
             if len(item.slaves) > 1:
                 group_index = len(item.slaves) - 2
@@ -417,8 +433,7 @@ class WalletD:
                 if purss:
                     return index, group_index, len(item.slaves[group_index]) - 1, purss
             group_index = len(item.slaves) - 1
-            last_slaves = item.slaves[-1]
-            for slave_index, slave in enumerate(last_slaves):
+            for slave_index, (slave, slave_state) in enumerate(zip(last_slaves, slaves_state)):
                 # Check if all ots index has been marked as used
                 if slave.index > 2 ** slave.height - 1:
                     continue
@@ -430,12 +445,10 @@ class WalletD:
                 if self._passphrase:
                     slave = self._wallet.decrypt_address_item(slave, self._passphrase)
 
-                slave_address_state = self.get_address_state(slave.qaddress)
-
                 if slave_index + 1 == len(last_slaves) and slave.index > 2 ** slave.height - 100:
 
-                    ots_index = slave_address_state.get_unused_ots_index(0)
-                    if ots_index >= UNRESERVED_OTS_INDEX_START:
+                    ots_index = self.get_unused_ots_index(self.qaddress_to_address(slave.qaddress), 0)
+                    if ots_index is None or ots_index >= UNRESERVED_OTS_INDEX_START:
                         raise Exception("Fatal Error, no unused reserved OTS index")
 
                     curr_slave_purss = self._wallet.get_purss_by_item(slave, ots_index)
@@ -456,16 +469,14 @@ class WalletD:
                                                    index,
                                                    enable_save=False)
 
-                ots_index = slave_address_state.get_unused_ots_index(slave.index)
-
-                if ots_index is None:  # noqa
+                if not slave_state.unused_ots_index_found:
                     self._wallet.set_slave_ots_index(index,
                                                      group_index,
                                                      slave_index,
                                                      2 ** slave.height)
                     continue
 
-                slave_purss = self._wallet.get_purss_by_item(slave, ots_index)
+                slave_purss = self._wallet.get_purss_by_item(slave, slave_state.next_unused_ots_index)
 
                 return index, group_index, slave_index, slave_purss
 
@@ -592,9 +603,7 @@ class WalletD:
         return addr_item.slaves
 
     def verify_ots(self, signer_address, purss, user_ots_index):
-        addr_state = self.get_address_state(signer_address)
-
-        verified_ots_index = self.get_unused_ots_index(addr_state.address, purss.ots_index)
+        verified_ots_index = self.get_unused_ots_index(self.qaddress_to_address(signer_address), purss.ots_index)
 
         if verified_ots_index is None:  # noqa
             raise Exception("No Unused OTS key found")
@@ -648,6 +657,112 @@ class WalletD:
 
         return self.to_plain_transaction(tx.pbdata)
 
+    def relay_batch(self, transfers: list, master_qaddress) -> list:
+        """
+        Signs a batch of transfers with the slaves of the last slave group of master_qaddress and pushes them to the node.
+        Each slave signs its share of the batch with a contiguous range of its unused OTS indexes, in its own worker
+        process. The OTS indexes are saved to the wallet once, before the transactions are pushed.
+        :param transfers: list of (qaddresses_to, amounts, fee)
+        :return: list of (plain transaction, error) of each transfer, error is None if the node accepted the transaction
+        """
+        self.authenticate()
+        index, item = self._wallet.get_address_item(master_qaddress)
+        if index is None:
+            raise Exception("Signer Address Not Found ", master_qaddress)
+
+        if not transfers:
+            return []
+
+        master_address = self.qaddress_to_address(master_qaddress)
+        group_index = len(item.slaves) - 1
+        last_slaves = item.slaves[group_index]
+        slaves_state = self.get_slaves_state(master_address, last_slaves)
+
+        # Reserves the OTS indexes [ots_index_from, ots_index_to) of each slave
+        reserved_ranges = []
+        for slave_index, (slave, slave_state) in enumerate(zip(last_slaves, slaves_state)):
+            if not slave_state.is_slave or slave_state.access_type != 0 or not slave_state.unused_ots_index_found:
+                continue
+
+            ots_index_to = 2 ** slave.height
+            # Ignore usage of last 5 ots indexes for the last slave in slave group
+            if slave_index + 1 == len(last_slaves):
+                ots_index_to -= 5
+
+            if slave_state.next_unused_ots_index < ots_index_to:
+                reserved_ranges.append((slave_index, slave_state.next_unused_ots_index, ots_index_to))
+
+        if not reserved_ranges:
+            raise Exception("No Slave Found")
+
+        available_ots = sum(ots_index_to - ots_index_from for _, ots_index_from, ots_index_to in reserved_ranges)
+        if available_ots < len(transfers):
+            raise Exception("Not enough unused OTS indexes in the slaves, {} required, {} available".format(
+                len(transfers), available_ots))
+
+        # Spreads the transfers over the slaves, so that they are signed in parallel
+        positions_by_slave = [[] for _ in reserved_ranges]
+        position = 0
+        while position < len(transfers):
+            for positions, (_, ots_index_from, ots_index_to) in zip(positions_by_slave, reserved_ranges):
+                if position < len(transfers) and ots_index_from + len(positions) < ots_index_to:
+                    positions.append(position)
+                    position += 1
+
+        chunks = []
+        signers = []
+        for positions, (slave_index, ots_index_from, _) in zip(positions_by_slave, reserved_ranges):
+            if not positions:
+                continue
+
+            slave = last_slaves[slave_index]
+            if self._passphrase:
+                slave = self._wallet.decrypt_address_item(slave, self._passphrase)
+
+            unsigned_txs = []
+            for position in positions:
+                qaddresses_to, amounts, fee = transfers[position]
+                tx = TransferTransaction.create(addrs_to=self.qaddresses_to_address(qaddresses_to),
+                                                amounts=amounts,
+                                                message_data=None,
+                                                fee=fee,
+                                                purss_pk=bytes(hstr2bin(slave.pk)),
+                                                master_addr=master_address)
+                unsigned_txs.append(tx.pbdata.SerializeToString())
+
+            chunks.append((mnemonic2bin(slave.mnemonic.strip()), ots_index_from, unsigned_txs))
+            signers.append((slave_index, ots_index_from, positions))
+
+        logger.info("Signing %s transactions by %s slaves of %s", len(transfers), len(chunks), master_qaddress)
+        signed_chunks = sign_batch(chunks, config.user.walletd_sign_processes or os.cpu_count() or 1)
+
+        signed_txs = [None] * len(transfers)
+        for (slave_index, ots_index_from, positions), signed_chunk in zip(signers, signed_chunks):
+            # Move to next OTS index before broadcasting txns
+            self._wallet.set_slave_ots_index(index, group_index, slave_index, ots_index_from + len(positions), save=False)
+            for position, data in zip(positions, signed_chunk):
+                signed_txs[position] = pur_pb2.Transaction()
+                signed_txs[position].ParseFromString(data)
+        self._wallet.save()
+
+        results = []
+        push_batch_size = config.user.walletd_push_batch_size
+        for offset in range(0, len(signed_txs), push_batch_size):
+            batch = signed_txs[offset:offset + push_batch_size]
+            try:
+                push_transactions_req = pur_pb2.PushTransactionsReq(transactions_signed=batch)
+                push_transactions_resp = self._public_stub.PushTransactions(push_transactions_req,
+                                                                            timeout=CONNECTION_TIMEOUT)
+                errors = [None if push_transaction_resp.error_code == pur_pb2.PushTransactionResp.SUBMITTED
+                          else push_transaction_resp.error_description
+                          for push_transaction_resp in push_transactions_resp.results]
+            except grpc.RpcError as e:
+                errors = [str(e)] * len(batch)
+
+            results.extend((self.to_plain_transaction(tx), error) for tx, error in zip(batch, errors))
+
+        return results
+
     def relay_message_txn(self,
                           message: str,
                           fee: int,
@@ -860,6 +975,7 @@ class WalletD:
             raise Exception('You cannot lock an unencrypted Wallet')
 
         self._passphrase = None
+        self._wallet.clear_purss_cache()
         logger.info("Wallet Locked")
 
     def unlock_wallet(self, passphrase: str):
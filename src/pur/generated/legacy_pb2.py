@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='purlegacy.proto',
   package='pur',
   syntax='proto3',
-  serialized_pb=_b('\n\x0fpurlegacy.proto\x12\x03pur\x1a\tpur.proto\"\xf2\x08\n\rLegacyMessage\x12.\n\tfunc_name\x18\x01 \x01(\x0e\x32\x1b.pur.LegacyMessage.FuncName\x12\x1d\n\x06noData\x18\x02 \x01(\x0b\x32\x0b.pur.NoDataH\x00\x12\x1d\n\x06veData\x18\x03 \x01(\x0b\x32\x0b.pur.VEDataH\x00\x12\x1d\n\x06plData\x18\x04 \x01(\x0b\x32\x0b.pur.PLDataH\x00\x12!\n\x08pongData\x18\x05 \x01(\x0b\x32\r.pur.PONGDataH\x00\x12\x1d\n\x06mrData\x18\x06 \x01(\x0b\x32\x0b.pur.MRDataH\x00\x12\x1b\n\x05\x62lock\x18\x07 \x01(\x0b\x32\n.pur.BlockH\x00\x12\x1d\n\x06\x66\x62\x44\x61ta\x18\x08 \x01(\x0b\x32\x0b.pur.FBDataH\x00\x12\x1d\n\x06pbData\x18\t \x01(\x0b\x32\x0b.pur.PBDataH\x00\x12&\n\x06\x62hData\x18\n \x01(\x0b\x32\x14.pur.BlockHeightDataH\x00\x12\"\n\x06txData\x18\x0b \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06mtData\x18\x0c \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06tkData\x18\r \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06ttData\x18\x0e \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06ltData\x18\x0f \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06slData\x18\x10 \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\x31\n\x07\x65phData\x18\x11 \x01(\x0b\x32\x1e.pur.EncryptedEphemeralMessageH\x00\x12!\n\x08syncData\x18\x12 \x01(\x0b\x32\r.pur.SYNCDataH\x00\x12-\n\x0e\x63hainStateData\x18\x13 \x01(\x0b\x32\x13.pur.NodeChainStateH\x00\x12-\n\x0enodeHeaderHash\x18\x14 \x01(\x0b\x32\x13.pur.NodeHeaderHashH\x00\x12-\n\np2pAckData\x18\x15 \x01(\x0b\x32\x17.pur.P2PAcknowledgementH\x00\x12\"\n\x06mcData\x18\x16 \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06msData\x18\x17 \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06mvData\x18\x18 \x01(\x0b\x32\x10.pur.TransactionH\x00\"\xdf\x01\n\x08\x46uncName\x12\x06\n\x02VE\x10\x00\x12\x06\n\x02PL\x10\x01\x12\x08\n\x04PONG\x10\x02\x12\x06\n\x02MR\x10\x03\x12\x07\n\x03SFM\x10\x04\x12\x06\n\x02\x42K\x10\x05\x12\x06\n\x02\x46\x42\x10\x06\x12\x06\n\x02PB\x10\x07\x12\x06\n\x02\x42H\x10\x08\x12\x06\n\x02TX\x10\t\x12\x06\n\x02LT\x10\n\x12\x07\n\x03\x45PH\x10\x0b\x12\x06\n\x02MT\x10\x0c\x12\x06\n\x02TK\x10\r\x12\x06\n\x02TT\x10\x0e\x12\x06\n\x02SL\x10\x0f\x12\x08\n\x04SYNC\x10\x10\x12\x0e\n\nCHAINSTATE\x10\x11\x12\x10\n\x0cHEADERHASHES\x10\x12\x12\x0b\n\x07P2P_ACK\x10\x13\x12\x06\n\x02MC\x10\x14\x12\x06\n\x02MS\x10\x15\x12\x06\n\x02MV\x10\x16\x42\x06\n\x04\x64\x61ta\"\x08\n\x06NoData\"H\n\x06VEData\x12\x0f\n\x07version\x18\x01 \x01(\t\x12\x19\n\x11genesis_prev_hash\x18\x02 \x01(\x0c\x12\x12\n\nrate_limit\x18\x03 \x01(\x04\"/\n\x06PLData\x12\x10\n\x08peer_ips\x18\x01 \x03(\t\x12\x13\n\x0bpublic_port\x18\x02 \x01(\r\"\n\n\x08PONGData\"\x9d\x01\n\x06MRData\x12\x0c\n\x04hash\x18\x01 \x01(\x0c\x12)\n\x04type\x18\x02 \x01(\x0e\x32\x1b.pur.LegacyMessage.FuncName\x12\x16\n\x0estake_selector\x18\x03 \x01(\x0c\x12\x14\n\x0c\x62lock_number\x18\x04 \x01(\x04\x12\x17\n\x0fprev_headerhash\x18\x05 \x01(\x0c\x12\x13\n\x0breveal_hash\x18\x06 \x01(\x0c\"@\n\x06\x42KData\x12\x1b\n\x06mrData\x18\x01 \x01(\x0b\x32\x0b.pur.MRData\x12\x19\n\x05\x62lock\x18\x02 \x01(\x0b\x32\n.pur.Block\"\x17\n\x06\x46\x42\x44\x61ta\x12\r\n\x05index\x18\x01 \x01(\x04\"#\n\x06PBData\x12\x19\n\x05\x62lock\x18\x01 \x01(\x0b\x32\n.pur.Block\"\x19\n\x08SYNCData\x12\r\n\x05state\x18\x01 \x01(\tb\x06proto3')
+  serialized_pb=_b('\n\x0fpurlegacy.proto\x12\x03pur\x1a\tpur.proto\"\xae\t\n\rLegacyMessage\x12.\n\tfunc_name\x18\x01 \x01(\x0e\x32\x1b.pur.LegacyMessage.FuncName\x12\x1d\n\x06noData\x18\x02 \x01(\x0b\x32\x0b.pur.NoDataH\x00\x12\x1d\n\x06veData\x18\x03 \x01(\x0b\x32\x0b.pur.VEDataH\x00\x12\x1d\n\x06plData\x18\x04 \x01(\x0b\x32\x0b.pur.PLDataH\x00\x12!\n\x08pongData\x18\x05 \x01(\x0b\x32\r.pur.PONGDataH\x00\x12\x1d\n\x06mrData\x18\x06 \x01(\x0b\x32\x0b.pur.MRDataH\x00\x12\x1b\n\x05\x62lock\x18\x07 \x01(\x0b\x32\n.pur.BlockH\x00\x12\x1d\n\x06\x66\x62\x44\x61ta\x18\x08 \x01(\x0b\x32\x0b.pur.FBDataH\x00\x12\x1d\n\x06pbData\x18\t \x01(\x0b\x32\x0b.pur.PBDataH\x00\x12&\n\x06\x62hData\x18\n \x01(\x0b\x32\x14.pur.BlockHeightDataH\x00\x12\"\n\x06txData\x18\x0b \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06mtData\x18\x0c \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06tkData\x18\r \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06ttData\x18\x0e \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06ltData\x18\x0f \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06slData\x18\x10 \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\x31\n\x07\x65phData\x18\x11 \x01(\x0b\x32\x1e.pur.EncryptedEphemeralMessageH\x00\x12!\n\x08syncData\x18\x12 \x01(\x0b\x32\r.pur.SYNCDataH\x00\x12-\n\x0e\x63hainStateData\x18\x13 \x01(\x0b\x32\x13.pur.NodeChainStateH\x00\x12-\n\x0enodeHeaderHash\x18\x14 \x01(\x0b\x32\x13.pur.NodeHeaderHashH\x00\x12-\n\np2pAckData\x18\x15 \x01(\x0b\x32\x17.pur.P2PAcknowledgementH\x00\x12\"\n\x06mcData\x18\x16 \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06msData\x18\x17 \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\"\n\x06mvData\x18\x18 \x01(\x0b\x32\x10.pur.TransactionH\x00\x12\'\n\x0bmrBatchData\x18\x19 \x01(\x0b\x32\x10.pur.MRBatchDataH\x00\"\xf2\x01\n\x08\x46uncName\x12\x06\n\x02VE\x10\x00\x12\x06\n\x02PL\x10\x01\x12\x08\n\x04PONG\x10\x02\x12\x06\n\x02MR\x10\x03\x12\x07\n\x03SFM\x10\x04\x12\x06\n\x02\x42K\x10\x05\x12\x06\n\x02\x46\x42\x10\x06\x12\x06\n\x02PB\x10\x07\x12\x06\n\x02\x42H\x10\x08\x12\x06\n\x02TX\x10\t\x12\x06\n\x02LT\x10\n\x12\x07\n\x03\x45PH\x10\x0b\x12\x06\n\x02MT\x10\x0c\x12\x06\n\x02TK\x10\r\x12\x06\n\x02TT\x10\x0e\x12\x06\n\x02SL\x10\x0f\x12\x08\n\x04SYNC\x10\x10\x12\x0e\n\nCHAINSTATE\x10\x11\x12\x10\n\x0cHEADERHASHES\x10\x12\x12\x0b\n\x07P2P_ACK\x10\x13\x12\x06\n\x02MC\x10\x14\x12\x06\n\x02MS\x10\x15\x12\x06\n\x02MV\x10\x16\x12\x07\n\x03MRB\x10\x17\x12\x08\n\x04SFMB\x10\x18\x42\x06\n\x04\x64\x61ta\"\x08\n\x06NoData\"\x83\x01\n\x06VEData\x12\x0f\n\x07version\x18\x01 \x01(\t\x12\x19\n\x11genesis_prev_hash\x18\x02 \x01(\x0c\x12\x12\n\nrate_limit\x18\x03 \x01(\x04\x12\x10\n\x08\x66\x65\x61tures\x18\x04 \x01(\x04\"\'\n\x07\x46\x65\x61ture\x12\x0e\n\nNO_FEATURE\x10\x00\x12\x0c\n\x08MR_BATCH\x10\x01\"/\n\x06PLData\x12\x10\n\x08peer_ips\x18\x01 \x03(\t\x12\x13\n\x0bpublic_port\x18\x02 \x01(\r\"\n\n\x08PONGData\"\x9d\x01\n\x06MRData\x12\x0c\n\x04hash\x18\x01 \x01(\x0c\x12)\n\x04type\x18\x02 \x01(\x0e\x32\x1b.pur.LegacyMessage.FuncName\x12\x16\n\x0estake_selector\x18\x03 \x01(\x0c\x12\x14\n\x0c\x62lock_number\x18\x04 \x01(\x04\x12\x17\n\x0fprev_headerhash\x18\x05 \x01(\x0c\x12\x13\n\x0breveal_hash\x18\x06 \x01(\x0c\"@\n\x06\x42KData\x12\x1b\n\x06mrData\x18\x01 \x01(\x0b\x32\x0b.pur.MRData\x12\x19\n\x05\x62lock\x18\x02 \x01(\x0b\x32\n.pur.Block\"\x17\n\x06\x46\x42\x44\x61ta\x12\r\n\x05index\x18\x01 \x01(\x04\"+\n\x0bMRBatchData\x12\x1c\n\x07mr_data\x18\x01 \x03(\x0b\x32\x0b.pur.MRData\"#\n\x06PBData\x12\x19\n\x05\x62lock\x18\x01 \x01(\x0b\x32\n.pur.Block\"\x19\n\x08SYNCData\x12\r\n\x05state\x18\x01 \x01(\tb\x06proto3')
   ,
   dependencies=[pur__pb2.DESCRIPTOR,])
 
@@ -124,14 +124,44 @@ _LEGACYMESSAGE_FUNCNAME = _descriptor.EnumDescriptor(
       name='MV', index=22, number=22,
       options=None,
       type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MRB', index=23, number=23,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SFMB', index=24, number=24,
+      options=None,
+      type=None),
   ],
   containing_type=None,
   options=None,
-  serialized_start=943,
-  serialized_end=1166,
+  serialized_start=984,
+  serialized_end=1226,
 )
 _sym_db.RegisterEnumDescriptor(_LEGACYMESSAGE_FUNCNAME)
 
+_VEDATA_FEATURE = _descriptor.EnumDescriptor(
+  name='Feature',
+  full_name='pur.VEData.Feature',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='NO_FEATURE', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MR_BATCH', index=1, number=1,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=1339,
+  serialized_end=1378,
+)
+_sym_db.RegisterEnumDescriptor(_VEDATA_FEATURE)
+
 
 _LEGACYMESSAGE = _descriptor.Descriptor(
   name='LegacyMessage',
@@ -308,6 +338,13 @@ _LEGACYMESSAGE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mrBatchData', full_name='pur.LegacyMessage.mrBatchData', index=24,
+      number=25, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -325,7 +362,7 @@ _LEGACYMESSAGE = _descriptor.Descriptor(
       index=0, containing_type=None, fields=[]),
   ],
   serialized_start=36,
-  serialized_end=1174,
+  serialized_end=1234,
 )
 
 
@@ -348,8 +385,8 @@ _NODATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1176,
-  serialized_end=1184,
+  serialized_start=1236,
+  serialized_end=1244,
 )
 
 
@@ -381,11 +418,19 @@ _VEDATA = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='features', full_name='pur.VEData.features', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
+    _VEDATA_FEATURE,
   ],
   options=None,
   is_extendable=False,
@@ -393,8 +438,8 @@ _VEDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1186,
-  serialized_end=1258,
+  serialized_start=1247,
+  serialized_end=1378,
 )
 
 
@@ -431,8 +476,8 @@ _PLDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1260,
-  serialized_end=1307,
+  serialized_start=1380,
+  serialized_end=1427,
 )
 
 
@@ -455,8 +500,8 @@ _PONGDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1309,
-  serialized_end=1319,
+  serialized_start=1429,
+  serialized_end=1439,
 )
 
 
@@ -521,8 +566,8 @@ _MRDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1322,
-  serialized_end=1479,
+  serialized_start=1442,
+  serialized_end=1599,
 )
 
 
@@ -559,8 +604,8 @@ _BKDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1481,
-  serialized_end=1545,
+  serialized_start=1601,
+  serialized_end=1665,
 )
 
 
@@ -590,8 +635,39 @@ _FBDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1547,
-  serialized_end=1570,
+  serialized_start=1667,
+  serialized_end=1690,
+)
+
+
+_MRBATCHDATA = _descriptor.Descriptor(
+  name='MRBatchData',
+  full_name='pur.MRBatchData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='mr_data', full_name='pur.MRBatchData.mr_data', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1692,
+  serialized_end=1735,
 )
 
 
@@ -621,8 +697,8 @@ _PBDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1572,
-  serialized_end=1607,
+  serialized_start=1737,
+  serialized_end=1772,
 )
 
 
@@ -652,8 +728,8 @@ _SYNCDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1609,
-  serialized_end=1634,
+  serialized_start=1774,
+  serialized_end=1799,
 )
 
 _LEGACYMESSAGE.fields_by_name['func_name'].enum_type = _LEGACYMESSAGE_FUNCNAME
@@ -680,6 +756,7 @@ _LEGACYMESSAGE.fields_by_name['p2pAckData'].message_type = pur__pb2._P2PACKNOWLE
 _LEGACYMESSAGE.fields_by_name['mcData'].message_type = pur__pb2._TRANSACTION
 _LEGACYMESSAGE.fields_by_name['msData'].message_type = pur__pb2._TRANSACTION
 _LEGACYMESSAGE.fields_by_name['mvData'].message_type = pur__pb2._TRANSACTION
+_LEGACYMESSAGE.fields_by_name['mrBatchData'].message_type = _MRBATCHDATA
 _LEGACYMESSAGE_FUNCNAME.containing_type = _LEGACYMESSAGE
 _LEGACYMESSAGE.oneofs_by_name['data'].fields.append(
   _LEGACYMESSAGE.fields_by_name['noData'])
@@ -750,9 +827,14 @@ _LEGACYMESSAGE.fields_by_name['msData'].containing_oneof = _LEGACYMESSAGE.oneofs
 _LEGACYMESSAGE.oneofs_by_name['data'].fields.append(
   _LEGACYMESSAGE.fields_by_name['mvData'])
 _LEGACYMESSAGE.fields_by_name['mvData'].containing_oneof = _LEGACYMESSAGE.oneofs_by_name['data']
+_LEGACYMESSAGE.oneofs_by_name['data'].fields.append(
+  _LEGACYMESSAGE.fields_by_name['mrBatchData'])
+_LEGACYMESSAGE.fields_by_name['mrBatchData'].containing_oneof = _LEGACYMESSAGE.oneofs_by_name['data']
+_VEDATA_FEATURE.containing_type = _VEDATA
 _MRDATA.fields_by_name['type'].enum_type = _LEGACYMESSAGE_FUNCNAME
 _BKDATA.fields_by_name['mrData'].message_type = _MRDATA
 _BKDATA.fields_by_name['block'].message_type = pur__pb2._BLOCK
+_MRBATCHDATA.fields_by_name['mr_data'].message_type = _MRDATA
 _PBDATA.fields_by_name['block'].message_type = pur__pb2._BLOCK
 DESCRIPTOR.message_types_by_name['LegacyMessage'] = _LEGACYMESSAGE
 DESCRIPTOR.message_types_by_name['NoData'] = _NODATA
@@ -762,6 +844,7 @@ DESCRIPTOR.message_types_by_name['PONGData'] = _PONGDATA
 DESCRIPTOR.message_types_by_name['MRData'] = _MRDATA
 DESCRIPTOR.message_types_by_name['BKData'] = _BKDATA
 DESCRIPTOR.message_types_by_name['FBData'] = _FBDATA
+DESCRIPTOR.message_types_by_name['MRBatchData'] = _MRBATCHDATA
 DESCRIPTOR.message_types_by_name['PBData'] = _PBDATA
 DESCRIPTOR.message_types_by_name['SYNCData'] = _SYNCDATA
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
@@ -822,6 +905,13 @@ FBData = _reflection.GeneratedProtocolMessageType('FBData', (_message.Message,),
   ))
 _sym_db.RegisterMessage(FBData)
 
+MRBatchData = _reflection.GeneratedProtocolMessageType('MRBatchData', (_message.Message,), dict(
+  DESCRIPTOR = _MRBATCHDATA,
+  __module__ = 'purlegacy_pb2'
+  # @@protoc_insertion_point(class_scope:pur.MRBatchData)
+  ))
+_sym_db.RegisterMessage(MRBatchData)
+
 PBData = _reflection.GeneratedProtocolMessageType('PBData', (_message.Message,), dict(
   DESCRIPTOR = _PBDATA,
   __module__ = 'purlegacy_pb2'
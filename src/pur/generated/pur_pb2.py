@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='pur.proto',
   package='pur',
   syntax='proto3',
-  serialized_pb=_b('\n\tpur.proto\x12\x03pur\x1a\x1cgoogle/api/annotations.proto\"\x07\n\x05\x45mpty\"\x11\n\x0fGetNodeStateReq\"/\n\x10GetNodeStateResp\x12\x1b\n\x04info\x18\x01 \x01(\x0b\x32\r.pur.NodeInfo\"\x12\n\x10GetKnownPeersReq\"U\n\x11GetKnownPeersResp\x12 \n\tnode_info\x18\x01 \x01(\x0b\x32\r.pur.NodeInfo\x12\x1e\n\x0bknown_peers\x18\x02 \x03(\x0b\x32\t.pur.Peer\"\x11\n\x0fGetPeersStatReq\"5\n\x10GetPeersStatResp\x12!\n\npeers_stat\x18\x01 \x03(\x0b\x32\r.pur.PeerStat\"\x12\n\x10GetChainStatsReq\"U\n\x11GetChainStatsResp\x12\x12\n\nstate_size\x18\x01 \x01(\x04\x12\x15\n\rstate_size_mb\x18\x02 \x01(\t\x12\x15\n\rstate_size_gb\x18\x03 \x01(\t\")\n\x0bGetStatsReq\x12\x1a\n\x12include_timeseries\x18\x01 \x01(\x08\"\x84\x02\n\x0cGetStatsResp\x12 \n\tnode_info\x18\x01 \x01(\x0b\x32\r.pur.NodeInfo\x12\r\n\x05\x65poch\x18\x02 \x01(\x04\x12\x16\n\x0euptime_network\x18\x03 \x01(\x04\x12\x19\n\x11\x62lock_last_reward\x18\x04 \x01(\x04\x12\x17\n\x0f\x62lock_time_mean\x18\x05 \x01(\x04\x12\x15\n\rblock_time_sd\x18\x06 \x01(\x04\x12\x1a\n\x12\x63oins_total_supply\x18\x07 \x01(\x04\x12\x15\n\rcoins_emitted\x18\x08 \x01(\x04\x12-\n\x10\x62lock_timeseries\x18\t \x03(\x0b\x32\x13.pur.BlockDataPoint\"!\n\x13GetAddressFromPKReq\x12\n\n\x02pk\x18\x01 \x01(\x0c\"\'\n\x14GetAddressFromPKResp\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\"\xb2\x01\n\x0e\x42lockDataPoint\x12\x0e\n\x06number\x18\x01 \x01(\x04\x12\x12\n\ndifficulty\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\x04\x12\x11\n\ttime_last\x18\x04 \x01(\x04\x12\x13\n\x0btime_movavg\x18\x05 \x01(\x04\x12\x12\n\nhash_power\x18\x06 \x01(\x02\x12\x13\n\x0bheader_hash\x18\x07 \x01(\x0c\x12\x18\n\x10header_hash_prev\x18\x08 \x01(\x0c\"g\n\x12GetAddressStateReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x1c\n\x14\x65xclude_ots_bitfield\x18\x02 \x01(\x08\x12\"\n\x1a\x65xclude_transaction_hashes\x18\x03 \x01(\x08\"7\n\x13GetAddressStateResp\x12 \n\x05state\x18\x01 \x01(\x0b\x32\x11.pur.AddressState\"I\n\x1cGetOptimizedAddressStateResp\x12)\n\x05state\x18\x01 \x01(\x0b\x32\x1a.pur.OptimizedAddressState\"-\n\x1aGetMultiSigAddressStateReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\"G\n\x1bGetMultiSigAddressStateResp\x12(\n\x05state\x18\x01 \x01(\x0b\x32\x19.pur.MultiSigAddressState\"6\n\nIsSlaveReq\x12\x16\n\x0emaster_address\x18\x01 \x01(\x0c\x12\x10\n\x08slave_pk\x18\x02 \x01(\x0c\"\x1d\n\x0bIsSlaveResp\x12\x0e\n\x06result\x18\x01 \x01(\x08\"\"\n\x0fParseAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\"J\n\x10ParseAddressResp\x12\x10\n\x08is_valid\x18\x01 \x01(\x08\x12$\n\x04\x64\x65sc\x18\x02 \x01(\x0b\x32\x16.pur.AddressDescriptor\"\x1d\n\x0cGetObjectReq\x12\r\n\x05query\x18\x01 \x01(\x0c\"\xbc\x01\n\rGetObjectResp\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\x12\x33\n\raddress_state\x18\x02 \x01(\x0b\x32\x1a.pur.OptimizedAddressStateH\x00\x12/\n\x0btransaction\x18\x03 \x01(\x0b\x32\x18.pur.TransactionExtendedH\x00\x12,\n\x0e\x62lock_extended\x18\x04 \x01(\x0b\x32\x12.pur.BlockExtendedH\x00\x42\x08\n\x06result\"\xb7\x01\n\x10GetLatestDataReq\x12,\n\x06\x66ilter\x18\x01 \x01(\x0e\x32\x1c.pur.GetLatestDataReq.Filter\x12\x0e\n\x06offset\x18\x02 \x01(\r\x12\x10\n\x08quantity\x18\x03 \x01(\r\"S\n\x06\x46ilter\x12\x07\n\x03\x41LL\x10\x00\x12\x10\n\x0c\x42LOCKHEADERS\x10\x01\x12\x10\n\x0cTRANSACTIONS\x10\x02\x12\x1c\n\x18TRANSACTIONS_UNCONFIRMED\x10\x03\"\xaf\x01\n\x11GetLatestDataResp\x12.\n\x0c\x62lockheaders\x18\x01 \x03(\x0b\x32\x18.pur.BlockHeaderExtended\x12.\n\x0ctransactions\x18\x02 \x03(\x0b\x32\x18.pur.TransactionExtended\x12:\n\x18transactions_unconfirmed\x18\x03 \x03(\x0b\x32\x18.pur.TransactionExtended\"\x82\x01\n\x10TransferCoinsReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x02 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x12\x14\n\x0cmessage_data\x18\x04 \x01(\x0c\x12\x0b\n\x03\x66\x65\x65\x18\x05 \x01(\x04\x12\x0f\n\x07purss_pk\x18\x06 \x01(\x0c\"T\n\x11TransferCoinsResp\x12?\n\x1d\x65xtended_transaction_unsigned\x18\x01 \x01(\x0b\x32\x18.pur.TransactionExtended\"B\n\x12PushTransactionReq\x12,\n\x12transaction_signed\x18\x01 \x01(\x0b\x32\x10.pur.Transaction\"\xca\x01\n\x13PushTransactionResp\x12\x39\n\nerror_code\x18\x01 \x01(\x0e\x32%.pur.PushTransactionResp.ResponseCode\x12\x19\n\x11\x65rror_description\x18\x02 \x01(\t\x12\x0f\n\x07tx_hash\x18\x03 \x01(\x0c\"L\n\x0cResponseCode\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05\x45RROR\x10\x01\x12\x15\n\x11VALIDATION_FAILED\x10\x02\x12\r\n\tSUBMITTED\x10\x03\"\x82\x01\n\x14MultiSigCreateTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x13\n\x0bsignatories\x18\x02 \x03(\x0c\x12\x0f\n\x07weights\x18\x03 \x03(\r\x12\x11\n\tthreshold\x18\x04 \x01(\r\x12\x0b\n\x03\x66\x65\x65\x18\x05 \x01(\x04\x12\x0f\n\x07purss_pk\x18\x06 \x01(\x0c\"\xa3\x01\n\x13MultiSigSpendTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x19\n\x11multi_sig_address\x18\x02 \x01(\x0c\x12\x10\n\x08\x61\x64\x64rs_to\x18\x03 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x04 \x03(\x04\x12\x1b\n\x13\x65xpiry_block_number\x18\x05 \x01(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x06 \x01(\x04\x12\x0f\n\x07purss_pk\x18\x07 \x01(\x0c\"k\n\x12MultiSigVoteTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x12\n\nshared_key\x18\x02 \x01(\x0c\x12\x0e\n\x06unvote\x18\x03 \x01(\x08\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x0f\n\x07purss_pk\x18\x05 \x01(\x0c\"d\n\rMessageTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x0f\n\x07message\x18\x02 \x01(\x0c\x12\x0f\n\x07\x61\x64\x64r_to\x18\x03 \x01(\x0c\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x0f\n\x07purss_pk\x18\x05 \x01(\x0c\"\xad\x01\n\x0bTokenTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x0e\n\x06symbol\x18\x02 \x01(\x0c\x12\x0c\n\x04name\x18\x03 \x01(\x0c\x12\r\n\x05owner\x18\x04 \x01(\x0c\x12\x10\n\x08\x64\x65\x63imals\x18\x05 \x01(\x04\x12,\n\x10initial_balances\x18\x06 \x03(\x0b\x32\x12.pur.AddressAmount\x12\x0b\n\x03\x66\x65\x65\x18\x07 \x01(\x04\x12\x0f\n\x07purss_pk\x18\x08 \x01(\x0c\"\x85\x01\n\x13TransferTokenTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x02 \x03(\x0c\x12\x14\n\x0ctoken_txhash\x18\x03 \x01(\x0c\x12\x0f\n\x07\x61mounts\x18\x04 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x05 \x01(\x04\x12\x0f\n\x07purss_pk\x18\x06 \x01(\x0c\"i\n\x0bSlaveTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x11\n\tslave_pks\x18\x02 \x03(\x0c\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x03 \x03(\r\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x0f\n\x07purss_pk\x18\x05 \x01(\x0c\"i\n\rLatticeTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x0b\n\x03pk1\x18\x02 \x01(\x0c\x12\x0b\n\x03pk2\x18\x03 \x01(\x0c\x12\x0b\n\x03pk3\x18\x04 \x01(\x0c\x12\x0b\n\x03\x66\x65\x65\x18\x05 \x01(\x04\x12\x0f\n\x07purss_pk\x18\x06 \x01(\x0c\"H\n\x0fMiniTransaction\x12\x18\n\x10transaction_hash\x18\x01 \x01(\t\x12\x0b\n\x03out\x18\x02 \x01(\x08\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x04\"$\n\x11GetTransactionReq\x12\x0f\n\x07tx_hash\x18\x01 \x01(\x0c\"\xa0\x01\n\x12GetTransactionResp\x12\x1c\n\x02tx\x18\x01 \x01(\x0b\x32\x10.pur.Transaction\x12\x15\n\rconfirmations\x18\x02 \x01(\x04\x12\x14\n\x0c\x62lock_number\x18\x03 \x01(\x04\x12\x19\n\x11\x62lock_header_hash\x18\x04 \x01(\x0c\x12\x11\n\ttimestamp\x18\x05 \x01(\x04\x12\x11\n\taddr_from\x18\x06 \x01(\x0c\"^\n\x1fGetMiniTransactionsByAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x15\n\ritem_per_page\x18\x02 \x01(\x04\x12\x13\n\x0bpage_number\x18\x03 \x01(\x04\"d\n GetMiniTransactionsByAddressResp\x12/\n\x11mini_transactions\x18\x01 \x03(\x0b\x32\x14.pur.MiniTransaction\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\"Z\n\x1bGetTransactionsByAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x15\n\ritem_per_page\x18\x02 \x01(\x04\x12\x13\n\x0bpage_number\x18\x03 \x01(\x04\"T\n\x1cGetTransactionsByAddressResp\x12\x34\n\x13transactions_detail\x18\x01 \x03(\x0b\x32\x17.pur.GetTransactionResp\"\xb8\x02\n\x1fGetMultiSigSpendTxsByAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x15\n\ritem_per_page\x18\x02 \x01(\x04\x12\x13\n\x0bpage_number\x18\x03 \x01(\x04\x12\x44\n\x0b\x66ilter_type\x18\x04 \x01(\x0e\x32/.pur.GetMultiSigSpendTxsByAddressReq.FilterType\"\x91\x01\n\nFilterType\x12\x08\n\x04NONE\x10\x00\x12\x11\n\rEXECUTED_ONLY\x10\x01\x12\x10\n\x0cNON_EXECUTED\x10\x02\x12\x0b\n\x07\x45XPIRED\x10\x03\x12\x0f\n\x0bNON_EXPIRED\x10\x04\x12\x18\n\x14NON_EXECUTED_EXPIRED\x10\x05\x12\x1c\n\x18NON_EXECUTED_NON_EXPIRED\x10\x06\"X\n GetMultiSigSpendTxsByAddressResp\x12\x34\n\x13transactions_detail\x18\x01 \x03(\x0b\x32\x17.pur.GetTransactionResp\"2\n\x0fGetVoteStatsReq\x12\x1f\n\x17multi_sig_spend_tx_hash\x18\x01 \x01(\x0c\"6\n\x10GetVoteStatsResp\x12\"\n\nvote_stats\x18\x01 \x01(\x0b\x32\x0e.pur.VoteStats\"U\n\x1dGetInbopuressagesByAddressResp\x12\x34\n\x13transactions_detail\x18\x01 \x03(\x0b\x32\x17.pur.GetTransactionResp\"l\n\x0cInbopuressage\x12\x11\n\taddr_from\x18\x01 \x01(\x0c\x12\x11\n\ttimestamp\x18\x02 \x01(\x04\x12\x0f\n\x07message\x18\x03 \x01(\x0c\x12\x0f\n\x07tx_hash\x18\x04 \x01(\x0c\x12\x14\n\x0c\x62lock_number\x18\x05 \x01(\x04\"R\n\x0bTokenDetail\x12\x14\n\x0ctoken_txhash\x18\x01 \x01(\x0c\x12\x0c\n\x04name\x18\x02 \x01(\x0c\x12\x0e\n\x06symbol\x18\x03 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x04 \x01(\x04\"A\n\x16GetTokensByAddressResp\x12\'\n\rtokens_detail\x18\x01 \x03(\x0b\x32\x10.pur.TokenDetail\"9\n\x0bSlaveDetail\x12\x15\n\rslave_address\x18\x01 \x01(\x0c\x12\x13\n\x0b\x61\x63\x63\x65ss_type\x18\x02 \x01(\x04\"A\n\x16GetSlavesByAddressResp\x12\'\n\rslaves_detail\x18\x01 \x03(\x0b\x32\x10.pur.SlaveDetail\"J\n\x10LatticePKsDetail\x12\x0b\n\x03pk1\x18\x01 \x01(\x0c\x12\x0b\n\x03pk2\x18\x02 \x01(\x0c\x12\x0b\n\x03pk3\x18\x03 \x01(\x0c\x12\x0f\n\x07tx_hash\x18\x04 \x01(\x0c\"O\n\x1aGetLatticePKsByAddressResp\x12\x31\n\x12lattice_pks_detail\x18\x01 \x03(\x0b\x32\x15.pur.LatticePKsDetail\"2\n\x0eMultiSigDetail\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\"R\n!GetMultiSigAddressesByAddressResp\x12-\n\x10multi_sig_detail\x18\x01 \x03(\x0b\x32\x13.pur.MultiSigDetail\" \n\rGetBalanceReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\"!\n\x0eGetBalanceResp\x12\x0f\n\x07\x62\x61lance\x18\x01 \x01(\x04\"\'\n\x12GetTotalBalanceReq\x12\x11\n\taddresses\x18\x01 \x03(\x0c\"&\n\x13GetTotalBalanceResp\x12\x0f\n\x07\x62\x61lance\x18\x01 \x01(\x04\"b\n\tGetOTSReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x11\n\tpage_from\x18\x02 \x01(\x04\x12\x12\n\npage_count\x18\x03 \x01(\x04\x12\x1d\n\x15unused_ots_index_from\x18\x04 \x01(\x04\">\n\x11OTSBitfieldByPage\x12\x14\n\x0cots_bitfield\x18\x01 \x03(\x0c\x12\x13\n\x0bpage_number\x18\x02 \x01(\x04\"\x81\x01\n\nGetOTSResp\x12\x34\n\x14ots_bitfield_by_page\x18\x01 \x03(\x0b\x32\x16.pur.OTSBitfieldByPage\x12\x1d\n\x15next_unused_ots_index\x18\x02 \x01(\x04\x12\x1e\n\x16unused_ots_index_found\x18\x03 \x01(\x08\"\x0e\n\x0cGetHeightReq\"\x1f\n\rGetHeightResp\x12\x0e\n\x06height\x18\x01 \x01(\x04\"\"\n\x0bGetBlockReq\x12\x13\n\x0bheader_hash\x18\x01 \x01(\x0c\")\n\x0cGetBlockResp\x12\x19\n\x05\x62lock\x18\x01 \x01(\x0b\x32\n.pur.Block\"+\n\x13GetBlockByNumberReq\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\"1\n\x14GetBlockByNumberResp\x12\x19\n\x05\x62lock\x18\x01 \x01(\x0b\x32\n.pur.Block\"\x16\n\x14GetLocalAddressesReq\"*\n\x15GetLocalAddressesResp\x12\x11\n\taddresses\x18\x01 \x03(\x0c\"\x8d\x02\n\x08NodeInfo\x12\x0f\n\x07version\x18\x01 \x01(\t\x12\"\n\x05state\x18\x02 \x01(\x0e\x32\x13.pur.NodeInfo.State\x12\x17\n\x0fnum_connections\x18\x03 \x01(\r\x12\x17\n\x0fnum_known_peers\x18\x04 \x01(\r\x12\x0e\n\x06uptime\x18\x05 \x01(\x04\x12\x14\n\x0c\x62lock_height\x18\x06 \x01(\x04\x12\x17\n\x0f\x62lock_last_hash\x18\x07 \x01(\x0c\x12\x12\n\nnetwork_id\x18\x08 \x01(\t\"G\n\x05State\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0c\n\x08UNSYNCED\x10\x01\x12\x0b\n\x07SYNCING\x10\x02\x12\n\n\x06SYNCED\x10\x03\x12\n\n\x06\x46ORKED\x10\x04\"\x85\x01\n\x11\x41\x64\x64ressDescriptor\x12\x15\n\rhash_function\x18\x01 \x01(\t\x12\x18\n\x10signature_scheme\x18\x02 \x01(\t\x12\x13\n\x0btree_height\x18\x03 \x01(\r\x12\x12\n\nsignatures\x18\x04 \x01(\r\x12\x16\n\x0e\x61\x64\x64ress_format\x18\x05 \x01(\t\"\'\n\x0bStoredPeers\x12\x18\n\x05peers\x18\x01 \x03(\x0b\x32\t.pur.Peer\"\x12\n\x04Peer\x12\n\n\x02ip\x18\x01 \x01(\t\"\x91\x03\n\x0c\x41\x64\x64ressState\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\x12\r\n\x05nonce\x18\x03 \x01(\x04\x12\x14\n\x0cots_bitfield\x18\x04 \x03(\x0c\x12\x1a\n\x12transaction_hashes\x18\x05 \x03(\x0c\x12-\n\x06tokens\x18\x06 \x03(\x0b\x32\x1d.pur.AddressState.TokensEntry\x12&\n\x0elatticePK_list\x18\x07 \x03(\x0b\x32\x0e.pur.LatticePK\x12H\n\x15slave_pks_access_type\x18\x08 \x03(\x0b\x32).pur.AddressState.SlavePksAccessTypeEntry\x12\x13\n\x0bots_counter\x18\t \x01(\x04\x1a-\n\x0bTokensEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\x1a\x39\n\x17SlavePksAccessTypeEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\xe0\x03\n\x15OptimizedAddressState\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\x12\r\n\x05nonce\x18\x03 \x01(\x04\x12\x1e\n\x16ots_bitfield_used_page\x18\x04 \x01(\x04\x12\x1a\n\x12used_ots_key_count\x18\x05 \x01(\x04\x12\x1e\n\x16transaction_hash_count\x18\x06 \x01(\x04\x12\x14\n\x0ctokens_count\x18\x07 \x01(\x04\x12\x14\n\x0cslaves_count\x18\x08 \x01(\x04\x12\x18\n\x10lattice_pk_count\x18\t \x01(\x04\x12\x1f\n\x17multi_sig_address_count\x18\n \x01(\x04\x12\x1d\n\x15multi_sig_spend_count\x18\x0b \x01(\x04\x12\x1b\n\x13inbox_message_count\x18\x0c \x01(\x04\x12+\n#foundation_multi_sig_spend_txn_hash\x18\r \x03(\x0c\x12*\n\"foundation_multi_sig_vote_txn_hash\x18\x0e \x03(\x0c\x12\x0f\n\x07unvotes\x18\x0f \x03(\x0c\x12-\n\x13proposal_vote_stats\x18\x10 \x03(\x0b\x32\x10.pur.Transaction\"\x93\x03\n\x14MultiSigAddressState\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x18\n\x10\x63reation_tx_hash\x18\x02 \x01(\x0c\x12\r\n\x05nonce\x18\x03 \x01(\x04\x12\x0f\n\x07\x62\x61lance\x18\x04 \x01(\x04\x12\x13\n\x0bsignatories\x18\x05 \x03(\x0c\x12\x0f\n\x07weights\x18\x06 \x03(\r\x12\x11\n\tthreshold\x18\x07 \x01(\r\x12\x1e\n\x16transaction_hash_count\x18\x08 \x01(\x04\x12\x1d\n\x15multi_sig_spend_count\x18\t \x01(\x04\x12\x1f\n\x17multi_sig_address_count\x18\n \x01(\x04\x12+\n#foundation_multi_sig_spend_txn_hash\x18\x0b \x03(\x0c\x12*\n\"foundation_multi_sig_vote_txn_hash\x18\x0c \x03(\x0c\x12\x0f\n\x07unvotes\x18\r \x03(\x0c\x12-\n\x13proposal_vote_stats\x18\x0e \x03(\x0b\x32\x10.pur.Transaction\"\'\n\x15MultiSigAddressesList\x12\x0e\n\x06hashes\x18\x01 \x03(\x0c\"\x1a\n\x08\x44\x61taList\x12\x0e\n\x06values\x18\x01 \x03(\x0c\"\x1d\n\x08\x42itfield\x12\x11\n\tbitfields\x18\x01 \x03(\x0c\"%\n\x13TransactionHashList\x12\x0e\n\x06hashes\x18\x01 \x03(\x0c\"3\n\tLatticePK\x12\x10\n\x08kyber_pk\x18\x01 \x01(\x0c\x12\x14\n\x0c\x64ilithium_pk\x18\x02 \x01(\x0c\"0\n\rAddressAmount\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x04\"\xd7\x01\n\x0b\x42lockHeader\x12\x13\n\x0bhash_header\x18\x01 \x01(\x0c\x12\x14\n\x0c\x62lock_number\x18\x02 \x01(\x04\x12\x19\n\x11timestamp_seconds\x18\x03 \x01(\x04\x12\x18\n\x10hash_header_prev\x18\x04 \x01(\x0c\x12\x14\n\x0creward_block\x18\x05 \x01(\x04\x12\x12\n\nreward_fee\x18\x06 \x01(\x04\x12\x13\n\x0bmerkle_root\x18\x07 \x01(\x0c\x12\x14\n\x0cmining_nonce\x18\x08 \x01(\r\x12\x13\n\x0b\x65xtra_nonce\x18\t \x01(\x04\"i\n\x13\x42lockHeaderExtended\x12 \n\x06header\x18\x01 \x01(\x0b\x32\x10.pur.BlockHeader\x12\x30\n\x11transaction_count\x18\x02 \x01(\x0b\x32\x15.pur.TransactionCount\"q\n\x10TransactionCount\x12/\n\x05\x63ount\x18\x01 \x03(\x0b\x32 .pur.TransactionCount.CountEntry\x1a,\n\nCountEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\x91\x01\n\x13TransactionExtended\x12 \n\x06header\x18\x01 \x01(\x0b\x32\x10.pur.BlockHeader\x12\x1c\n\x02tx\x18\x02 \x01(\x0b\x32\x10.pur.Transaction\x12\x11\n\taddr_from\x18\x03 \x01(\x0c\x12\x0c\n\x04size\x18\x04 \x01(\x04\x12\x19\n\x11timestamp_seconds\x18\x05 \x01(\x04\"\xa6\x01\n\rBlockExtended\x12 \n\x06header\x18\x01 \x01(\x0b\x32\x10.pur.BlockHeader\x12\x37\n\x15\x65xtended_transactions\x18\x02 \x03(\x0b\x32\x18.pur.TransactionExtended\x12,\n\x0fgenesis_balance\x18\x03 \x03(\x0b\x32\x13.pur.GenesisBalance\x12\x0c\n\x04size\x18\x04 \x01(\x04\"\x7f\n\x05\x42lock\x12 \n\x06header\x18\x01 \x01(\x0b\x32\x10.pur.BlockHeader\x12&\n\x0ctransactions\x18\x02 \x03(\x0b\x32\x10.pur.Transaction\x12,\n\x0fgenesis_balance\x18\x03 \x03(\x0b\x32\x13.pur.GenesisBalance\"2\n\x0eGenesisBalance\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\"D\n\x11\x42lockMetaDataList\x12/\n\x13\x62lock_number_hashes\x18\x01 \x03(\x0b\x32\x12.pur.BlockMetaData\"\xaa\x15\n\x0bTransaction\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x0b\n\x03\x66\x65\x65\x18\x02 \x01(\x04\x12\x12\n\npublic_key\x18\x03 \x01(\x0c\x12\x11\n\tsignature\x18\x04 \x01(\x0c\x12\r\n\x05nonce\x18\x05 \x01(\x04\x12\x18\n\x10transaction_hash\x18\x06 \x01(\x0c\x12-\n\x08transfer\x18\x07 \x01(\x0b\x32\x19.pur.Transaction.TransferH\x00\x12-\n\x08\x63oinbase\x18\x08 \x01(\x0b\x32\x19.pur.Transaction.CoinBaseH\x00\x12\x36\n\tlatticePK\x18\t \x01(\x0b\x32!.pur.Transaction.LatticePublicKeyH\x00\x12+\n\x07message\x18\n \x01(\x0b\x32\x18.pur.Transaction.MessageH\x00\x12\'\n\x05token\x18\x0b \x01(\x0b\x32\x16.pur.Transaction.TokenH\x00\x12\x38\n\x0etransfer_token\x18\x0c \x01(\x0b\x32\x1e.pur.Transaction.TransferTokenH\x00\x12\'\n\x05slave\x18\r \x01(\x0b\x32\x16.pur.Transaction.SlaveH\x00\x12;\n\x10multi_sig_create\x18\x0e \x01(\x0b\x32\x1f.pur.Transaction.MultiSigCreateH\x00\x12\x39\n\x0fmulti_sig_spend\x18\x0f \x01(\x0b\x32\x1e.pur.Transaction.MultiSigSpendH\x00\x12\x37\n\x0emulti_sig_vote\x18\x10 \x01(\x0b\x32\x1d.pur.Transaction.MultiSigVoteH\x00\x12:\n\x0fproposal_create\x18\x11 \x01(\x0b\x32\x1f.pur.Transaction.ProposalCreateH\x00\x12\x36\n\rproposal_vote\x18\x12 \x01(\x0b\x32\x1d.pur.Transaction.ProposalVoteH\x00\x1a\x43\n\x08Transfer\x12\x10\n\x08\x61\x64\x64rs_to\x18\x01 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x02 \x03(\x04\x12\x14\n\x0cmessage_data\x18\x03 \x01(\x0c\x1a+\n\x08\x43oinBase\x12\x0f\n\x07\x61\x64\x64r_to\x18\x01 \x01(\x0c\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x04\x1a\x39\n\x10LatticePublicKey\x12\x0b\n\x03pk1\x18\x01 \x01(\x0c\x12\x0b\n\x03pk2\x18\x02 \x01(\x0c\x12\x0b\n\x03pk3\x18\x03 \x01(\x0c\x1a\x30\n\x07Message\x12\x14\n\x0cmessage_hash\x18\x01 \x01(\x0c\x12\x0f\n\x07\x61\x64\x64r_to\x18\x02 \x01(\x0c\x1at\n\x05Token\x12\x0e\n\x06symbol\x18\x01 \x01(\x0c\x12\x0c\n\x04name\x18\x02 \x01(\x0c\x12\r\n\x05owner\x18\x03 \x01(\x0c\x12\x10\n\x08\x64\x65\x63imals\x18\x04 \x01(\x04\x12,\n\x10initial_balances\x18\x05 \x03(\x0b\x32\x12.pur.AddressAmount\x1aH\n\rTransferToken\x12\x14\n\x0ctoken_txhash\x18\x01 \x01(\x0c\x12\x10\n\x08\x61\x64\x64rs_to\x18\x02 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x1a\x30\n\x05Slave\x12\x11\n\tslave_pks\x18\x01 \x03(\x0c\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x02 \x03(\r\x1aI\n\x0eMultiSigCreate\x12\x13\n\x0bsignatories\x18\x01 \x03(\x0c\x12\x0f\n\x07weights\x18\x02 \x03(\r\x12\x11\n\tthreshold\x18\x03 \x01(\r\x1aj\n\rMultiSigSpend\x12\x19\n\x11multi_sig_address\x18\x01 \x01(\x0c\x12\x10\n\x08\x61\x64\x64rs_to\x18\x02 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x12\x1b\n\x13\x65xpiry_block_number\x18\x04 \x01(\x04\x1aH\n\x0cMultiSigVote\x12\x12\n\nshared_key\x18\x01 \x01(\x0c\x12\x0e\n\x06unvote\x18\x02 \x01(\x08\x12\x14\n\x0cprev_tx_hash\x18\x03 \x01(\x0c\x1a\x9b\t\n\x0eProposalCreate\x12\x1b\n\x13\x65xpiry_block_number\x18\x01 \x01(\x04\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x32\n\x03qip\x18\x03 \x01(\x0b\x32#.pur.Transaction.ProposalCreate.QIPH\x00\x12\x38\n\x06\x63onfig\x18\x04 \x01(\x0b\x32&.pur.Transaction.ProposalCreate.ConfigH\x00\x12\x36\n\x05other\x18\x05 \x01(\x0b\x32%.pur.Transaction.ProposalCreate.OtherH\x00\x1a\x17\n\x03QIP\x12\x10\n\x08qip_link\x18\x01 \x01(\t\x1a\xed\x06\n\x06\x43onfig\x12\x18\n\x10\x63hanges_bitfield\x18\x01 \x03(\x0c\x12\x13\n\x0breorg_limit\x18\x02 \x01(\x04\x12\x17\n\x0fmax_coin_supply\x18\x03 \x01(\x04\x12,\n$complete_emission_time_span_in_years\x18\x04 \x01(\x04\x12\x1b\n\x13mining_nonce_offset\x18\x05 \x01(\x04\x12\x1a\n\x12\x65xtra_nonce_offset\x18\x06 \x01(\x04\x12!\n\x19mining_blob_size_in_bytes\x18\x07 \x01(\x04\x12\x1f\n\x17\x62lock_timing_in_seconds\x18\x08 \x01(\x04\x12 \n\x18number_of_blocks_analyze\x18\t \x01(\x04\x12\x1d\n\x15\x62lock_size_multiplier\x18\n \x01(\x04\x12%\n\x1d\x62lock_min_size_limit_in_bytes\x18\x0b \x01(\x04\x12&\n\x1etransaction_multi_output_limit\x18\x0c \x01(\x04\x12\x1a\n\x12message_max_length\x18\r \x01(\x04\x12\x1f\n\x17token_symbol_max_length\x18\x0e \x01(\x04\x12\x1d\n\x15token_name_max_length\x18\x0f \x01(\x04\x12\x1e\n\x16lattice_pk1_max_length\x18\x10 \x01(\x04\x12\x1e\n\x16lattice_pk2_max_length\x18\x11 \x01(\x04\x12\x1e\n\x16lattice_pk3_max_length\x18\x12 \x01(\x04\x12\x39\n1foundation_multi_sig_address_threshold_percentage\x18\x13 \x01(\x04\x12\x1e\n\x16proposal_threshold_per\x18\x14 \x01(\x04\x12 \n\x18proposal_default_options\x18\x15 \x03(\t\x12\x1e\n\x16\x64\x65scription_max_length\x18\x16 \x01(\x04\x12\x1a\n\x12options_max_number\x18\x17 \x01(\x04\x12\x1e\n\x16option_max_text_length\x18\x18 \x01(\x04\x12(\n proposal_config_activation_delay\x18\x19 \x01(\x04\x12\x15\n\rN_measurement\x18\x1a \x01(\x04\x12\n\n\x02kp\x18\x1b \x01(\x04\x1a\x18\n\x05Other\x12\x0f\n\x07options\x18\x01 \x03(\tB\x0e\n\x0cproposalType\x1a\x32\n\x0cProposalVote\x12\x12\n\nshared_key\x18\x01 \x01(\x0c\x12\x0e\n\x06option\x18\x02 \x01(\rB\x11\n\x0ftransactionType\"\xb8\x01\n\tVoteStats\x12\x19\n\x11multi_sig_address\x18\x01 \x01(\x0c\x12\x12\n\nshared_key\x18\x02 \x01(\x0c\x12\x13\n\x0bsignatories\x18\x03 \x03(\x0c\x12\x11\n\ttx_hashes\x18\x04 \x03(\x0c\x12\x0f\n\x07unvotes\x18\x05 \x03(\x08\x12\x1b\n\x13\x65xpiry_block_number\x18\x06 \x01(\x04\x12\x14\n\x0ctotal_weight\x18\x07 \x01(\x04\x12\x10\n\x08\x65xecuted\x18\x08 \x01(\x08\"\xb7\x01\n\x11ProposalVoteStats\x12\x11\n\taddr_from\x18\x01 \x01(\x0c\x12\x12\n\nshared_key\x18\x02 \x01(\x0c\x12\x15\n\rproposal_type\x18\x03 \x01(\t\x12\x18\n\x10weight_by_option\x18\x04 \x03(\x04\x12\x1b\n\x13\x65xpiry_block_number\x18\x05 \x01(\x04\x12\x10\n\x08\x65xecuted\x18\x06 \x01(\x08\x12\x1b\n\x13number_of_tx_hashes\x18\x07 \x01(\x04\"-\n\x0eProposalRecord\x12\x1b\n\x13number_of_tx_hashes\x18\x01 \x01(\x04\"!\n\tTokenList\x12\x14\n\x0ctoken_txhash\x18\x01 \x03(\x0c\"R\n\x0cTokenBalance\x12\x0f\n\x07\x62\x61lance\x18\x01 \x01(\x04\x12\x10\n\x08\x64\x65\x63imals\x18\x02 \x01(\x04\x12\x0f\n\x07tx_hash\x18\x03 \x01(\x0c\x12\x0e\n\x06\x64\x65lete\x18\x04 \x01(\x08\"E\n\rSlaveMetadata\x12\x13\n\x0b\x61\x63\x63\x65ss_type\x18\x01 \x01(\x04\x12\x0f\n\x07tx_hash\x18\x02 \x01(\x0c\x12\x0e\n\x06\x64\x65lete\x18\x03 \x01(\x08\"E\n\x11LatticePKMetadata\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\x12\x0f\n\x07tx_hash\x18\x02 \x01(\x0c\x12\x0e\n\x06\x64\x65lete\x18\x03 \x01(\x08\"G\n\rTokenMetadata\x12\x14\n\x0ctoken_txhash\x18\x01 \x01(\x0c\x12 \n\x18transfer_token_tx_hashes\x18\x02 \x03(\x0c\"\xc4\x01\n\x19\x45ncryptedEphemeralMessage\x12\x0e\n\x06msg_id\x18\x01 \x01(\x0c\x12\x0b\n\x03ttl\x18\x02 \x01(\x04\x12\x0b\n\x03ttr\x18\x03 \x01(\x04\x12\x37\n\x07\x63hannel\x18\x05 \x01(\x0b\x32&.pur.EncryptedEphemeralMessage.Channel\x12\r\n\x05nonce\x18\x06 \x01(\x04\x12\x0f\n\x07payload\x18\x07 \x01(\x0c\x1a$\n\x07\x43hannel\x12\x19\n\x11\x65nc_aes256_symkey\x18\x04 \x01(\x0c\" \n\x0b\x41\x64\x64ressList\x12\x11\n\taddresses\x18\x01 \x03(\x0c\"`\n\x0f\x42lockHeightData\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\x12\x18\n\x10\x62lock_headerhash\x18\x02 \x01(\x0c\x12\x1d\n\x15\x63umulative_difficulty\x18\x03 \x01(\x0c\"\x81\x01\n\rBlockMetaData\x12\x18\n\x10\x62lock_difficulty\x18\x01 \x01(\x0c\x12\x1d\n\x15\x63umulative_difficulty\x18\x02 \x01(\x0c\x12\x1a\n\x12\x63hild_headerhashes\x18\x03 \x03(\x0c\x12\x1b\n\x13last_N_headerhashes\x18\x04 \x03(\x0c\"A\n\x12\x42lockNumberMapping\x12\x12\n\nheaderhash\x18\x01 \x01(\x0c\x12\x17\n\x0fprev_headerhash\x18\x02 \x01(\x0c\"X\n\x08PeerStat\x12\x0f\n\x07peer_ip\x18\x01 \x01(\x0c\x12\x0c\n\x04port\x18\x02 \x01(\r\x12-\n\x10node_chain_state\x18\x03 \x01(\x0b\x32\x13.pur.NodeChainState\"~\n\x0eNodeChainState\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\x12\x13\n\x0bheader_hash\x18\x02 \x01(\x0c\x12\x1d\n\x15\x63umulative_difficulty\x18\x03 \x01(\x0c\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x11\n\ttimestamp\x18\x05 \x01(\x04\"<\n\x0eNodeHeaderHash\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\x12\x14\n\x0cheaderhashes\x18\x02 \x03(\x0c\"-\n\x12P2PAcknowledgement\x12\x17\n\x0f\x62ytes_processed\x18\x01 \x01(\r\"|\n\x08PeerInfo\x12\x0f\n\x07peer_ip\x18\x01 \x01(\x0c\x12\x0c\n\x04port\x18\x02 \x01(\r\x12\x18\n\x10\x62\x61nned_timestamp\x18\x03 \x01(\r\x12\x13\n\x0b\x63redibility\x18\x04 \x01(\r\x12\"\n\x1alast_connections_timestamp\x18\x05 \x03(\r\".\n\x05Peers\x12%\n\x0epeer_info_list\x18\x01 \x03(\x0b\x32\r.pur.PeerInfo\"\xbb\x0c\n\tDevConfig\x12\x16\n\x0eprev_state_key\x18\x01 \x01(\x0c\x12\x19\n\x11\x63urrent_state_key\x18\x02 \x01(\x0c\x12\x1e\n\x16\x61\x63tivation_header_hash\x18\x03 \x01(\x0c\x12\x1f\n\x17\x61\x63tivation_block_number\x18\x04 \x01(\x04\x12#\n\x05\x63hain\x18\x05 \x01(\x0b\x32\x14.pur.DevConfig.Chain\x12#\n\x05\x62lock\x18\x06 \x01(\x0b\x32\x14.pur.DevConfig.Block\x12/\n\x0btransaction\x18\x07 \x01(\x0b\x32\x1a.pur.DevConfig.Transaction\x12\x1f\n\x03pow\x18\x08 \x01(\x0b\x32\x12.pur.DevConfig.POW\x1a\x63\n\x05\x43hain\x12\x13\n\x0breorg_limit\x18\x01 \x01(\x04\x12\x17\n\x0fmax_coin_supply\x18\x02 \x01(\x04\x12,\n$complete_emission_time_span_in_years\x18\x03 \x01(\x04\x1a\xc6\x02\n\x05\x42lock\x12\x1b\n\x13mining_nonce_offset\x18\x01 \x01(\x04\x12\x1a\n\x12\x65xtra_nonce_offset\x18\x02 \x01(\x04\x12!\n\x19mining_blob_size_in_bytes\x18\x03 \x01(\x04\x12\x1f\n\x17\x62lock_timing_in_seconds\x18\x04 \x01(\x04\x12G\n\x15\x62lock_size_controller\x18\x05 \x01(\x0b\x32(.pur.DevConfig.Block.BlockSizeController\x1aw\n\x13\x42lockSizeController\x12 \n\x18number_of_blocks_analyze\x18\x01 \x01(\x04\x12\x17\n\x0fsize_multiplier\x18\x02 \x01(\x04\x12%\n\x1d\x62lock_min_size_limit_in_bytes\x18\x03 \x01(\x04\x1a\xc5\x06\n\x0bTransaction\x12\x1a\n\x12multi_output_limit\x18\x01 \x01(\x04\x12\x33\n\x07message\x18\x02 \x01(\x0b\x32\".pur.DevConfig.Transaction.Message\x12/\n\x05slave\x18\x03 \x01(\x0b\x32 .pur.DevConfig.Transaction.Slave\x12/\n\x05token\x18\x04 \x01(\x0b\x32 .pur.DevConfig.Transaction.Token\x12\x33\n\x07lattice\x18\x05 \x01(\x0b\x32\".pur.DevConfig.Transaction.Lattice\x12K\n\x14\x66oundation_multi_sig\x18\x06 \x01(\x0b\x32-.pur.DevConfig.Transaction.FoundationMultiSig\x12\x35\n\x08proposal\x18\x07 \x01(\x0b\x32#.pur.DevConfig.Transaction.Proposal\x1a\x1d\n\x07Message\x12\x12\n\nmax_length\x18\x01 \x01(\x04\x1a$\n\x05Slave\x12\x1b\n\x13slave_pk_max_length\x18\x02 \x01(\x04\x1a;\n\x05Token\x12\x19\n\x11symbol_max_length\x18\x01 \x01(\x04\x12\x17\n\x0fname_max_length\x18\x02 \x01(\x04\x1aQ\n\x07Lattice\x12\x16\n\x0epk1_max_length\x18\x01 \x01(\x04\x12\x16\n\x0epk2_max_length\x18\x02 \x01(\x04\x12\x16\n\x0epk3_max_length\x18\x03 \x01(\x04\x1a\x32\n\x12\x46oundationMultiSig\x12\x1c\n\x14threshold_percentage\x18\x01 \x01(\x04\x1a\xc0\x01\n\x08Proposal\x12\x15\n\rthreshold_per\x18\x01 \x01(\x04\x12\x17\n\x0f\x64\x65\x66\x61ult_options\x18\x02 \x03(\t\x12\x1e\n\x16\x64\x65scription_max_length\x18\x03 \x01(\x04\x12\x1a\n\x12options_max_number\x18\x04 \x01(\x04\x12\x1e\n\x16option_max_text_length\x18\x05 \x01(\x04\x12(\n proposal_config_activation_delay\x18\x06 \x01(\x04\x1a(\n\x03POW\x12\x15\n\rN_measurement\x18\x01 \x01(\x04\x12\n\n\x02kp\x18\x02 \x01(\x04\x32\xbd\x1d\n\tPublicAPI\x12P\n\x0cGetNodeState\x12\x14.pur.GetNodeStateReq\x1a\x15.pur.GetNodeStateResp\"\x13\x82\xd3\xe4\x93\x02\r\x12\x0b/node-state\x12T\n\rGetKnownPeers\x12\x15.pur.GetKnownPeersReq\x1a\x16.pur.GetKnownPeersResp\"\x14\x82\xd3\xe4\x93\x02\x0e\x12\x0c/known-peers\x12P\n\x0cGetPeersStat\x12\x14.pur.GetPeersStatReq\x1a\x15.pur.GetPeersStatResp\"\x13\x82\xd3\xe4\x93\x02\r\x12\x0b/peers-stat\x12?\n\x08GetStats\x12\x10.pur.GetStatsReq\x1a\x11.pur.GetStatsResp\"\x0e\x82\xd3\xe4\x93\x02\x08\x12\x06/stats\x12\\\n\x0fGetAddressState\x12\x17.pur.GetAddressStateReq\x1a\x18.pur.GetAddressStateResp\"\x16\x82\xd3\xe4\x93\x02\x10\x12\x0e/address-state\x12x\n\x18GetOptimizedAddressState\x12\x17.pur.GetAddressStateReq\x1a!.pur.GetOptimizedAddressStateResp\" \x82\xd3\xe4\x93\x02\x1a\x12\x18/optimized-address-state\x12~\n\x17GetMultiSigAddressState\x12\x1f.pur.GetMultiSigAddressStateReq\x1a .pur.GetMultiSigAddressStateResp\" \x82\xd3\xe4\x93\x02\x1a\x12\x18/multi-sig-address-state\x12?\n\x07IsSlave\x12\x0f.pur.IsSlaveReq\x1a\x10.pur.IsSlaveResp\"\x11\x82\xd3\xe4\x93\x02\x0b\x12\t/is-slave\x12\x43\n\tGetObject\x12\x11.pur.GetObjectReq\x1a\x12.pur.GetObjectResp\"\x0f\x82\xd3\xe4\x93\x02\t\x12\x07/object\x12T\n\rGetLatestData\x12\x15.pur.GetLatestDataReq\x1a\x16.pur.GetLatestDataResp\"\x14\x82\xd3\xe4\x93\x02\x0e\x12\x0c/latest-data\x12_\n\x0fPushTransaction\x12\x17.pur.PushTransactionReq\x1a\x18.pur.PushTransactionResp\"\x19\x82\xd3\xe4\x93\x02\x13\"\x11/push-transaction\x12W\n\rTransferCoins\x12\x15.pur.TransferCoinsReq\x1a\x16.pur.TransferCoinsResp\"\x17\x82\xd3\xe4\x93\x02\x11\"\x0f/transfer-coins\x12S\n\x0cParseAddress\x12\x14.pur.ParseAddressReq\x1a\x15.pur.ParseAddressResp\"\x16\x82\xd3\xe4\x93\x02\x10\x12\x0e/parse-address\x12T\n\rGetChainStats\x12\x15.pur.GetChainStatsReq\x1a\x16.pur.GetChainStatsResp\"\x14\x82\xd3\xe4\x93\x02\x0e\x12\x0c/chain-stats\x12\x61\n\x10GetAddressFromPK\x12\x18.pur.GetAddressFromPKReq\x1a\x19.pur.GetAddressFromPKResp\"\x18\x82\xd3\xe4\x93\x02\x12\x12\x10/address-from-pk\x12h\n\x14GetMultiSigCreateTxn\x12\x19.pur.MultiSigCreateTxnReq\x1a\x16.pur.TransferCoinsResp\"\x1d\x82\xd3\xe4\x93\x02\x17\"\x15/multi-sig-create-txn\x12\x65\n\x13GetMultiSigSpendTxn\x12\x18.pur.MultiSigSpendTxnReq\x1a\x16.pur.TransferCoinsResp\"\x1c\x82\xd3\xe4\x93\x02\x16\"\x14/multi-sig-spend-txn\x12\x62\n\x12GetMultiSigVoteTxn\x12\x17.pur.MultiSigVoteTxnReq\x1a\x16.pur.TransferCoinsResp\"\x1b\x82\xd3\xe4\x93\x02\x15\"\x13/multi-sig-vote-txn\x12Q\n\rGetMessageTxn\x12\x12.pur.MessageTxnReq\x1a\x16.pur.TransferCoinsResp\"\x14\x82\xd3\xe4\x93\x02\x0e\"\x0c/message-txn\x12K\n\x0bGetTokenTxn\x12\x10.pur.TokenTxnReq\x1a\x16.pur.TransferCoinsResp\"\x12\x82\xd3\xe4\x93\x02\x0c\"\n/token-txn\x12\x64\n\x13GetTransferTokenTxn\x12\x18.pur.TransferTokenTxnReq\x1a\x16.pur.TransferCoinsResp\"\x1b\x82\xd3\xe4\x93\x02\x15\"\x13/transfer-token-txn\x12K\n\x0bGetSlaveTxn\x12\x10.pur.SlaveTxnReq\x1a\x16.pur.TransferCoinsResp\"\x12\x82\xd3\xe4\x93\x02\x0c\"\n/slave-txn\x12Q\n\rGetLatticeTxn\x12\x12.pur.LatticeTxnReq\x1a\x16.pur.TransferCoinsResp\"\x14\x82\xd3\xe4\x93\x02\x0e\"\x0c/lattice-txn\x12W\n\x0eGetTransaction\x12\x16.pur.GetTransactionReq\x1a\x17.pur.GetTransactionResp\"\x14\x82\xd3\xe4\x93\x02\x0e\x12\x0c/transaction\x12\x91\x01\n\x1cGetMiniTransactionsByAddress\x12$.pur.GetMiniTransactionsByAddressReq\x1a%.pur.GetMiniTransactionsByAddressResp\"$\x82\xd3\xe4\x93\x02\x1e\x12\x1c/mini-transaction-by-address\x12\x81\x01\n\x18GetTransactionsByAddress\x12 .pur.GetTransactionsByAddressReq\x1a!.pur.GetTransactionsByAddressResp\" \x82\xd3\xe4\x93\x02\x1a\x12\x18/transactions-by-address\x12o\n\x12GetTokensByAddress\x12 .pur.GetTransactionsByAddressReq\x1a\x1b.pur.GetTokensByAddressResp\"\x1a\x82\xd3\xe4\x93\x02\x14\x12\x12/tokens-by-address\x12o\n\x12GetSlavesByAddress\x12 .pur.GetTransactionsByAddressReq\x1a\x1b.pur.GetSlavesByAddressResp\"\x1a\x82\xd3\xe4\x93\x02\x14\x12\x12/slaves-by-address\x12|\n\x16GetLatticePKsByAddress\x12 .pur.GetTransactionsByAddressReq\x1a\x1f.pur.GetLatticePKsByAddressResp\"\x1f\x82\xd3\xe4\x93\x02\x19\x12\x17/lattice-pks-by-address\x12\x92\x01\n\x1dGetMultiSigAddressesByAddress\x12 .pur.GetTransactionsByAddressReq\x1a&.pur.GetMultiSigAddressesByAddressResp\"\'\x82\xd3\xe4\x93\x02!\x12\x1f/multi-sig-addresses-by-address\x12\x94\x01\n\x1cGetMultiSigSpendTxsByAddress\x12$.pur.GetMultiSigSpendTxsByAddressReq\x1a%.pur.GetMultiSigSpendTxsByAddressResp\"\'\x82\xd3\xe4\x93\x02!\x12\x1f/multi-sig-spend-txs-by-address\x12P\n\x0cGetVoteStats\x12\x14.pur.GetVoteStatsReq\x1a\x15.pur.GetVoteStatsResp\"\x13\x82\xd3\xe4\x93\x02\r\x12\x0b/vote-stats\x12\x85\x01\n\x19GetInbopuressagesByAddress\x12 .pur.GetTransactionsByAddressReq\x1a\".pur.GetInbopuressagesByAddressResp\"\"\x82\xd3\xe4\x93\x02\x1c\x12\x1a/inbox-messages-by-address\x12G\n\nGetBalance\x12\x12.pur.GetBalanceReq\x1a\x13.pur.GetBalanceResp\"\x10\x82\xd3\xe4\x93\x02\n\x12\x08/balance\x12\\\n\x0fGetTotalBalance\x12\x17.pur.GetTotalBalanceReq\x1a\x18.pur.GetTotalBalanceResp\"\x16\x82\xd3\xe4\x93\x02\x10\x12\x0e/total-balance\x12\x37\n\x06GetOTS\x12\x0e.pur.GetOTSReq\x1a\x0f.pur.GetOTSResp\"\x0c\x82\xd3\xe4\x93\x02\x06\x12\x04/ots\x12\x43\n\tGetHeight\x12\x11.pur.GetHeightReq\x1a\x12.pur.GetHeightResp\"\x0f\x82\xd3\xe4\x93\x02\t\x12\x07/height\x12?\n\x08GetBlock\x12\x10.pur.GetBlockReq\x1a\x11.pur.GetBlockResp\"\x0e\x82\xd3\xe4\x93\x02\x08\x12\x06/block\x12\x61\n\x10GetBlockByNumber\x12\x18.pur.GetBlockByNumberReq\x1a\x19.pur.GetBlockByNumberResp\"\x18\x82\xd3\xe4\x93\x02\x12\x12\x10/block-by-number2\n\n\x08\x41\x64minAPIb\x06proto3')
+  serialized_pb=_b('\n\tpur.proto\x12\x03pur\x1a\x1cgoogle/api/annotations.proto\"\x07\n\x05\x45mpty\"\x11\n\x0fGetNodeStateReq\"/\n\x10GetNodeStateResp\x12\x1b\n\x04info\x18\x01 \x01(\x0b\x32\r.pur.NodeInfo\"\x12\n\x10GetKnownPeersReq\"U\n\x11GetKnownPeersResp\x12 \n\tnode_info\x18\x01 \x01(\x0b\x32\r.pur.NodeInfo\x12\x1e\n\x0bknown_peers\x18\x02 \x03(\x0b\x32\t.pur.Peer\"\x11\n\x0fGetPeersStatReq\"5\n\x10GetPeersStatResp\x12!\n\npeers_stat\x18\x01 \x03(\x0b\x32\r.pur.PeerStat\"\x12\n\x10GetChainStatsReq\"U\n\x11GetChainStatsResp\x12\x12\n\nstate_size\x18\x01 \x01(\x04\x12\x15\n\rstate_size_mb\x18\x02 \x01(\t\x12\x15\n\rstate_size_gb\x18\x03 \x01(\t\")\n\x0bGetStatsReq\x12\x1a\n\x12include_timeseries\x18\x01 \x01(\x08\"\x84\x02\n\x0cGetStatsResp\x12 \n\tnode_info\x18\x01 \x01(\x0b\x32\r.pur.NodeInfo\x12\r\n\x05\x65poch\x18\x02 \x01(\x04\x12\x16\n\x0euptime_network\x18\x03 \x01(\x04\x12\x19\n\x11\x62lock_last_reward\x18\x04 \x01(\x04\x12\x17\n\x0f\x62lock_time_mean\x18\x05 \x01(\x04\x12\x15\n\rblock_time_sd\x18\x06 \x01(\x04\x12\x1a\n\x12\x63oins_total_supply\x18\x07 \x01(\x04\x12\x15\n\rcoins_emitted\x18\x08 \x01(\x04\x12-\n\x10\x62lock_timeseries\x18\t \x03(\x0b\x32\x13.pur.BlockDataPoint\"!\n\x13GetAddressFromPKReq\x12\n\n\x02pk\x18\x01 \x01(\x0c\"\'\n\x14GetAddressFromPKResp\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\"\xb2\x01\n\x0e\x42lockDataPoint\x12\x0e\n\x06number\x18\x01 \x01(\x04\x12\x12\n\ndifficulty\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\x04\x12\x11\n\ttime_last\x18\x04 \x01(\x04\x12\x13\n\x0btime_movavg\x18\x05 \x01(\x04\x12\x12\n\nhash_power\x18\x06 \x01(\x02\x12\x13\n\x0bheader_hash\x18\x07 \x01(\x0c\x12\x18\n\x10header_hash_prev\x18\x08 \x01(\x0c\"g\n\x12GetAddressStateReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x1c\n\x14\x65xclude_ots_bitfield\x18\x02 \x01(\x08\x12\"\n\x1a\x65xclude_transaction_hashes\x18\x03 \x01(\x08\"7\n\x13GetAddressStateResp\x12 \n\x05state\x18\x01 \x01(\x0b\x32\x11.pur.AddressState\"I\n\x1cGetOptimizedAddressStateResp\x12)\n\x05state\x18\x01 \x01(\x0b\x32\x1a.pur.OptimizedAddressState\"(\n\x13GetAddressStatesReq\x12\x11\n\taddresses\x18\x01 \x03(\x0c\"B\n\x14GetAddressStatesResp\x12*\n\x06states\x18\x01 \x03(\x0b\x32\x1a.pur.OptimizedAddressState\"-\n\x1aGetMultiSigAddressStateReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\"G\n\x1bGetMultiSigAddressStateResp\x12(\n\x05state\x18\x01 \x01(\x0b\x32\x19.pur.MultiSigAddressState\"6\n\nIsSlaveReq\x12\x16\n\x0emaster_address\x18\x01 \x01(\x0c\x12\x10\n\x08slave_pk\x18\x02 \x01(\x0c\"\x1d\n\x0bIsSlaveResp\x12\x0e\n\x06result\x18\x01 \x01(\x08\"\x93\x01\n\x11GetSlavesStateReq\x12\x16\n\x0emaster_address\x18\x01 \x01(\x0c\x12,\n\x06slaves\x18\x02 \x03(\x0b\x32\x1c.pur.GetSlavesStateReq.Slave\x1a\x38\n\x05Slave\x12\x10\n\x08slave_pk\x18\x01 \x01(\x0c\x12\x1d\n\x15unused_ots_index_from\x18\x02 \x01(\x04\"\x84\x01\n\nSlaveState\x12\x10\n\x08slave_pk\x18\x01 \x01(\x0c\x12\x10\n\x08is_slave\x18\x02 \x01(\x08\x12\x13\n\x0b\x61\x63\x63\x65ss_type\x18\x03 \x01(\r\x12\x1d\n\x15next_unused_ots_index\x18\x04 \x01(\x04\x12\x1e\n\x16unused_ots_index_found\x18\x05 \x01(\x08\";\n\x12GetSlavesStateResp\x12%\n\x0cslaves_state\x18\x01 \x03(\x0b\x32\x0f.pur.SlaveState\"\"\n\x0fParseAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\"J\n\x10ParseAddressResp\x12\x10\n\x08is_valid\x18\x01 \x01(\x08\x12$\n\x04\x64\x65sc\x18\x02 \x01(\x0b\x32\x16.pur.AddressDescriptor\"\x1d\n\x0cGetObjectReq\x12\r\n\x05query\x18\x01 \x01(\x0c\"\xbc\x01\n\rGetObjectResp\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\x12\x33\n\raddress_state\x18\x02 \x01(\x0b\x32\x1a.pur.OptimizedAddressStateH\x00\x12/\n\x0btransaction\x18\x03 \x01(\x0b\x32\x18.pur.TransactionExtendedH\x00\x12,\n\x0e\x62lock_extended\x18\x04 \x01(\x0b\x32\x12.pur.BlockExtendedH\x00\x42\x08\n\x06result\"\xb7\x01\n\x10GetLatestDataReq\x12,\n\x06\x66ilter\x18\x01 \x01(\x0e\x32\x1c.pur.GetLatestDataReq.Filter\x12\x0e\n\x06offset\x18\x02 \x01(\r\x12\x10\n\x08quantity\x18\x03 \x01(\r\"S\n\x06\x46ilter\x12\x07\n\x03\x41LL\x10\x00\x12\x10\n\x0c\x42LOCKHEADERS\x10\x01\x12\x10\n\x0cTRANSACTIONS\x10\x02\x12\x1c\n\x18TRANSACTIONS_UNCONFIRMED\x10\x03\"\xaf\x01\n\x11GetLatestDataResp\x12.\n\x0c\x62lockheaders\x18\x01 \x03(\x0b\x32\x18.pur.BlockHeaderExtended\x12.\n\x0ctransactions\x18\x02 \x03(\x0b\x32\x18.pur.TransactionExtended\x12:\n\x18transactions_unconfirmed\x18\x03 \x03(\x0b\x32\x18.pur.TransactionExtended\"\x83\x01\n\x10TransferCoinsReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x02 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x12\x14\n\x0cmessage_data\x18\x04 \x01(\x0c\x12\x0b\n\x03\x66\x65\x65\x18\x05 \x01(\x04\x12\x10\n\x08purss_pk\x18\x06 \x01(\x0c\"T\n\x11TransferCoinsResp\x12?\n\x1d\x65xtended_transaction_unsigned\x18\x01 \x01(\x0b\x32\x18.pur.TransactionExtended\"B\n\x12PushTransactionReq\x12,\n\x12transaction_signed\x18\x01 \x01(\x0b\x32\x10.pur.Transaction\"\xca\x01\n\x13PushTransactionResp\x12\x39\n\nerror_code\x18\x01 \x01(\x0e\x32%.pur.PushTransactionResp.ResponseCode\x12\x19\n\x11\x65rror_description\x18\x02 \x01(\t\x12\x0f\n\x07tx_hash\x18\x03 \x01(\x0c\"L\n\x0cResponseCode\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05\x45RROR\x10\x01\x12\x15\n\x11VALIDATION_FAILED\x10\x02\x12\r\n\tSUBMITTED\x10\x03\"D\n\x13PushTransactionsReq\x12-\n\x13transactions_signed\x18\x01 \x03(\x0b\x32\x10.pur.Transaction\"A\n\x14PushTransactionsResp\x12)\n\x07results\x18\x01 \x03(\x0b\x32\x18.pur.PushTransactionResp\"\x83\x01\n\x14MultiSigCreateTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x13\n\x0bsignatories\x18\x02 \x03(\x0c\x12\x0f\n\x07weights\x18\x03 \x03(\r\x12\x11\n\tthreshold\x18\x04 \x01(\r\x12\x0b\n\x03\x66\x65\x65\x18\x05 \x01(\x04\x12\x10\n\x08purss_pk\x18\x06 \x01(\x0c\"\xa4\x01\n\x13MultiSigSpendTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x19\n\x11multi_sig_address\x18\x02 \x01(\x0c\x12\x10\n\x08\x61\x64\x64rs_to\x18\x03 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x04 \x03(\x04\x12\x1b\n\x13\x65xpiry_block_number\x18\x05 \x01(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x06 \x01(\x04\x12\x10\n\x08purss_pk\x18\x07 \x01(\x0c\"l\n\x12MultiSigVoteTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x12\n\nshared_key\x18\x02 \x01(\x0c\x12\x0e\n\x06unvote\x18\x03 \x01(\x08\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x10\n\x08purss_pk\x18\x05 \x01(\x0c\"e\n\rMessageTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x0f\n\x07message\x18\x02 \x01(\x0c\x12\x0f\n\x07\x61\x64\x64r_to\x18\x03 \x01(\x0c\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x10\n\x08purss_pk\x18\x05 \x01(\x0c\"\xae\x01\n\x0bTokenTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x0e\n\x06symbol\x18\x02 \x01(\x0c\x12\x0c\n\x04name\x18\x03 \x01(\x0c\x12\r\n\x05owner\x18\x04 \x01(\x0c\x12\x10\n\x08\x64\x65\x63imals\x18\x05 \x01(\x04\x12,\n\x10initial_balances\x18\x06 \x03(\x0b\x32\x12.pur.AddressAmount\x12\x0b\n\x03\x66\x65\x65\x18\x07 \x01(\x04\x12\x10\n\x08purss_pk\x18\x08 \x01(\x0c\"\x86\x01\n\x13TransferTokenTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x02 \x03(\x0c\x12\x14\n\x0ctoken_txhash\x18\x03 \x01(\x0c\x12\x0f\n\x07\x61mounts\x18\x04 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x05 \x01(\x04\x12\x10\n\x08purss_pk\x18\x06 \x01(\x0c\"j\n\x0bSlaveTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x11\n\tslave_pks\x18\x02 \x03(\x0c\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x03 \x03(\r\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x10\n\x08purss_pk\x18\x05 \x01(\x0c\"j\n\rLatticeTxnReq\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x0b\n\x03pk1\x18\x02 \x01(\x0c\x12\x0b\n\x03pk2\x18\x03 \x01(\x0c\x12\x0b\n\x03pk3\x18\x04 \x01(\x0c\x12\x0b\n\x03\x66\x65\x65\x18\x05 \x01(\x04\x12\x10\n\x08purss_pk\x18\x06 \x01(\x0c\"H\n\x0fMiniTransaction\x12\x18\n\x10transaction_hash\x18\x01 \x01(\t\x12\x0b\n\x03out\x18\x02 \x01(\x08\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x04\"$\n\x11GetTransactionReq\x12\x0f\n\x07tx_hash\x18\x01 \x01(\x0c\"\xa0\x01\n\x12GetTransactionResp\x12\x1c\n\x02tx\x18\x01 \x01(\x0b\x32\x10.pur.Transaction\x12\x15\n\rconfirmations\x18\x02 \x01(\x04\x12\x14\n\x0c\x62lock_number\x18\x03 \x01(\x04\x12\x19\n\x11\x62lock_header_hash\x18\x04 \x01(\x0c\x12\x11\n\ttimestamp\x18\x05 \x01(\x04\x12\x11\n\taddr_from\x18\x06 \x01(\x0c\"n\n\x1fGetMiniTransactionsByAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x15\n\ritem_per_page\x18\x02 \x01(\x04\x12\x13\n\x0bpage_number\x18\x03 \x01(\x04\x12\x0e\n\x06\x63ursor\x18\x04 \x01(\x0c\"y\n GetMiniTransactionsByAddressResp\x12/\n\x11mini_transactions\x18\x01 \x03(\x0b\x32\x14.pur.MiniTransaction\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\x12\x13\n\x0bnext_cursor\x18\x03 \x01(\x0c\"j\n\x1bGetTransactionsByAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x15\n\ritem_per_page\x18\x02 \x01(\x04\x12\x13\n\x0bpage_number\x18\x03 \x01(\x04\x12\x0e\n\x06\x63ursor\x18\x04 \x01(\x0c\"i\n\x1cGetTransactionsByAddressResp\x12\x34\n\x13transactions_detail\x18\x01 \x03(\x0b\x32\x17.pur.GetTransactionResp\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\x0c\"\xb8\x02\n\x1fGetMultiSigSpendTxsByAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x15\n\ritem_per_page\x18\x02 \x01(\x04\x12\x13\n\x0bpage_number\x18\x03 \x01(\x04\x12\x44\n\x0b\x66ilter_type\x18\x04 \x01(\x0e\x32/.pur.GetMultiSigSpendTxsByAddressReq.FilterType\"\x91\x01\n\nFilterType\x12\x08\n\x04NONE\x10\x00\x12\x11\n\rEXECUTED_ONLY\x10\x01\x12\x10\n\x0cNON_EXECUTED\x10\x02\x12\x0b\n\x07\x45XPIRED\x10\x03\x12\x0f\n\x0bNON_EXPIRED\x10\x04\x12\x18\n\x14NON_EXECUTED_EXPIRED\x10\x05\x12\x1c\n\x18NON_EXECUTED_NON_EXPIRED\x10\x06\"X\n GetMultiSigSpendTxsByAddressResp\x12\x34\n\x13transactions_detail\x18\x01 \x03(\x0b\x32\x17.pur.GetTransactionResp\"2\n\x0fGetVoteStatsReq\x12\x1f\n\x17multi_sig_spend_tx_hash\x18\x01 \x01(\x0c\"6\n\x10GetVoteStatsResp\x12\"\n\nvote_stats\x18\x01 \x01(\x0b\x32\x0e.pur.VoteStats\"V\n\x1eGetInbopuressagesByAddressResp\x12\x34\n\x13transactions_detail\x18\x01 \x03(\x0b\x32\x17.pur.GetTransactionResp\"m\n\rInbopuressage\x12\x11\n\taddr_from\x18\x01 \x01(\x0c\x12\x11\n\ttimestamp\x18\x02 \x01(\x04\x12\x0f\n\x07message\x18\x03 \x01(\x0c\x12\x0f\n\x07tx_hash\x18\x04 \x01(\x0c\x12\x14\n\x0c\x62lock_number\x18\x05 \x01(\x04\"R\n\x0bTokenDetail\x12\x14\n\x0ctoken_txhash\x18\x01 \x01(\x0c\x12\x0c\n\x04name\x18\x02 \x01(\x0c\x12\x0e\n\x06symbol\x18\x03 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x04 \x01(\x04\"A\n\x16GetTokensByAddressResp\x12\'\n\rtokens_detail\x18\x01 \x03(\x0b\x32\x10.pur.TokenDetail\"9\n\x0bSlaveDetail\x12\x15\n\rslave_address\x18\x01 \x01(\x0c\x12\x13\n\x0b\x61\x63\x63\x65ss_type\x18\x02 \x01(\x04\"A\n\x16GetSlavesByAddressResp\x12\'\n\rslaves_detail\x18\x01 \x03(\x0b\x32\x10.pur.SlaveDetail\"J\n\x10LatticePKsDetail\x12\x0b\n\x03pk1\x18\x01 \x01(\x0c\x12\x0b\n\x03pk2\x18\x02 \x01(\x0c\x12\x0b\n\x03pk3\x18\x03 \x01(\x0c\x12\x0f\n\x07tx_hash\x18\x04 \x01(\x0c\"O\n\x1aGetLatticePKsByAddressResp\x12\x31\n\x12lattice_pks_detail\x18\x01 \x03(\x0b\x32\x15.pur.LatticePKsDetail\"2\n\x0eMultiSigDetail\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\"R\n!GetMultiSigAddressesByAddressResp\x12-\n\x10multi_sig_detail\x18\x01 \x03(\x0b\x32\x13.pur.MultiSigDetail\" \n\rGetBalanceReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\"!\n\x0eGetBalanceResp\x12\x0f\n\x07\x62\x61lance\x18\x01 \x01(\x04\"\'\n\x12GetTotalBalanceReq\x12\x11\n\taddresses\x18\x01 \x03(\x0c\"&\n\x13GetTotalBalanceResp\x12\x0f\n\x07\x62\x61lance\x18\x01 \x01(\x04\"b\n\tGetOTSReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x11\n\tpage_from\x18\x02 \x01(\x04\x12\x12\n\npage_count\x18\x03 \x01(\x04\x12\x1d\n\x15unused_ots_index_from\x18\x04 \x01(\x04\">\n\x11OTSBitfieldByPage\x12\x14\n\x0cots_bitfield\x18\x01 \x03(\x0c\x12\x13\n\x0bpage_number\x18\x02 \x01(\x04\"\x81\x01\n\nGetOTSResp\x12\x34\n\x14ots_bitfield_by_page\x18\x01 \x03(\x0b\x32\x16.pur.OTSBitfieldByPage\x12\x1d\n\x15next_unused_ots_index\x18\x02 \x01(\x04\x12\x1e\n\x16unused_ots_index_found\x18\x03 \x01(\x08\"\x0e\n\x0cGetHeightReq\"\x1f\n\rGetHeightResp\x12\x0e\n\x06height\x18\x01 \x01(\x04\"\"\n\x0bGetBlockReq\x12\x13\n\x0bheader_hash\x18\x01 \x01(\x0c\")\n\x0cGetBlockResp\x12\x19\n\x05\x62lock\x18\x01 \x01(\x0b\x32\n.pur.Block\"+\n\x13GetBlockByNumberReq\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\"1\n\x14GetBlockByNumberResp\x12\x19\n\x05\x62lock\x18\x01 \x01(\x0b\x32\n.pur.Block\"\x14\n\x12SubscribeBlocksReq\"\x94\x01\n\x13SubscribeBlocksResp\x12\x36\n\nevent_type\x18\x01 \x01(\x0e\x32\".pur.SubscribeBlocksResp.EventType\x12 \n\x06header\x18\x02 \x01(\x0b\x32\x10.pur.BlockHeader\"#\n\tEventType\x12\t\n\x05\x41\x44\x44\x45\x44\x10\x00\x12\x0b\n\x07REMOVED\x10\x01\"\x15\n\x13SubscribeMempoolReq\"4\n\x14SubscribeMempoolResp\x12\x1c\n\x02tx\x18\x01 \x01(\x0b\x32\x10.pur.Transaction\"*\n\x15SubscribeAddressesReq\x12\x11\n\taddresses\x18\x01 \x03(\x0c\"\xd8\x01\n\x16SubscribeAddressesResp\x12\x39\n\nevent_type\x18\x01 \x01(\x0e\x32%.pur.SubscribeAddressesResp.EventType\x12\x11\n\taddresses\x18\x02 \x03(\x0c\x12\x1c\n\x02tx\x18\x03 \x01(\x0b\x32\x10.pur.Transaction\x12 \n\x06header\x18\x04 \x01(\x0b\x32\x10.pur.BlockHeader\"0\n\tEventType\x12\x0b\n\x07MEMPOOL\x10\x00\x12\t\n\x05\x41\x44\x44\x45\x44\x10\x01\x12\x0b\n\x07REMOVED\x10\x02\"\x16\n\x14GetLocalAddressesReq\"*\n\x15GetLocalAddressesResp\x12\x11\n\taddresses\x18\x01 \x03(\x0c\"\x8d\x02\n\x08NodeInfo\x12\x0f\n\x07version\x18\x01 \x01(\t\x12\"\n\x05state\x18\x02 \x01(\x0e\x32\x13.pur.NodeInfo.State\x12\x17\n\x0fnum_connections\x18\x03 \x01(\r\x12\x17\n\x0fnum_known_peers\x18\x04 \x01(\r\x12\x0e\n\x06uptime\x18\x05 \x01(\x04\x12\x14\n\x0c\x62lock_height\x18\x06 \x01(\x04\x12\x17\n\x0f\x62lock_last_hash\x18\x07 \x01(\x0c\x12\x12\n\nnetwork_id\x18\x08 \x01(\t\"G\n\x05State\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0c\n\x08UNSYNCED\x10\x01\x12\x0b\n\x07SYNCING\x10\x02\x12\n\n\x06SYNCED\x10\x03\x12\n\n\x06\x46ORKED\x10\x04\"\x85\x01\n\x11\x41\x64\x64ressDescriptor\x12\x15\n\rhash_function\x18\x01 \x01(\t\x12\x18\n\x10signature_scheme\x18\x02 \x01(\t\x12\x13\n\x0btree_height\x18\x03 \x01(\r\x12\x12\n\nsignatures\x18\x04 \x01(\r\x12\x16\n\x0e\x61\x64\x64ress_format\x18\x05 \x01(\t\"\'\n\x0bStoredPeers\x12\x18\n\x05peers\x18\x01 \x03(\x0b\x32\t.pur.Peer\"\x12\n\x04Peer\x12\n\n\x02ip\x18\x01 \x01(\t\"\x91\x03\n\x0c\x41\x64\x64ressState\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\x12\r\n\x05nonce\x18\x03 \x01(\x04\x12\x14\n\x0cots_bitfield\x18\x04 \x03(\x0c\x12\x1a\n\x12transaction_hashes\x18\x05 \x03(\x0c\x12-\n\x06tokens\x18\x06 \x03(\x0b\x32\x1d.pur.AddressState.TokensEntry\x12&\n\x0elatticePK_list\x18\x07 \x03(\x0b\x32\x0e.pur.LatticePK\x12H\n\x15slave_pks_access_type\x18\x08 \x03(\x0b\x32).pur.AddressState.SlavePksAccessTypeEntry\x12\x13\n\x0bots_counter\x18\t \x01(\x04\x1a-\n\x0bTokensEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\x1a\x39\n\x17SlavePksAccessTypeEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\xe0\x03\n\x15OptimizedAddressState\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\x12\r\n\x05nonce\x18\x03 \x01(\x04\x12\x1e\n\x16ots_bitfield_used_page\x18\x04 \x01(\x04\x12\x1a\n\x12used_ots_key_count\x18\x05 \x01(\x04\x12\x1e\n\x16transaction_hash_count\x18\x06 \x01(\x04\x12\x14\n\x0ctokens_count\x18\x07 \x01(\x04\x12\x14\n\x0cslaves_count\x18\x08 \x01(\x04\x12\x18\n\x10lattice_pk_count\x18\t \x01(\x04\x12\x1f\n\x17multi_sig_address_count\x18\n \x01(\x04\x12\x1d\n\x15multi_sig_spend_count\x18\x0b \x01(\x04\x12\x1b\n\x13inbox_message_count\x18\x0c \x01(\x04\x12+\n#foundation_multi_sig_spend_txn_hash\x18\r \x03(\x0c\x12*\n\"foundation_multi_sig_vote_txn_hash\x18\x0e \x03(\x0c\x12\x0f\n\x07unvotes\x18\x0f \x03(\x0c\x12-\n\x13proposal_vote_stats\x18\x10 \x03(\x0b\x32\x10.pur.Transaction\"\x93\x03\n\x14MultiSigAddressState\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x18\n\x10\x63reation_tx_hash\x18\x02 \x01(\x0c\x12\r\n\x05nonce\x18\x03 \x01(\x04\x12\x0f\n\x07\x62\x61lance\x18\x04 \x01(\x04\x12\x13\n\x0bsignatories\x18\x05 \x03(\x0c\x12\x0f\n\x07weights\x18\x06 \x03(\r\x12\x11\n\tthreshold\x18\x07 \x01(\r\x12\x1e\n\x16transaction_hash_count\x18\x08 \x01(\x04\x12\x1d\n\x15multi_sig_spend_count\x18\t \x01(\x04\x12\x1f\n\x17multi_sig_address_count\x18\n \x01(\x04\x12+\n#foundation_multi_sig_spend_txn_hash\x18\x0b \x03(\x0c\x12*\n\"foundation_multi_sig_vote_txn_hash\x18\x0c \x03(\x0c\x12\x0f\n\x07unvotes\x18\r \x03(\x0c\x12-\n\x13proposal_vote_stats\x18\x0e \x03(\x0b\x32\x10.pur.Transaction\"\'\n\x15MultiSigAddressesList\x12\x0e\n\x06hashes\x18\x01 \x03(\x0c\"\x1a\n\x08\x44\x61taList\x12\x0e\n\x06values\x18\x01 \x03(\x0c\"\x1d\n\x08\x42itfield\x12\x11\n\tbitfields\x18\x01 \x03(\x0c\"%\n\x13TransactionHashList\x12\x0e\n\x06hashes\x18\x01 \x03(\x0c\"3\n\tLatticePK\x12\x10\n\x08kyber_pk\x18\x01 \x01(\x0c\x12\x14\n\x0c\x64ilithium_pk\x18\x02 \x01(\x0c\"0\n\rAddressAmount\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x04\"\xd7\x01\n\x0b\x42lockHeader\x12\x13\n\x0bhash_header\x18\x01 \x01(\x0c\x12\x14\n\x0c\x62lock_number\x18\x02 \x01(\x04\x12\x19\n\x11timestamp_seconds\x18\x03 \x01(\x04\x12\x18\n\x10hash_header_prev\x18\x04 \x01(\x0c\x12\x14\n\x0creward_block\x18\x05 \x01(\x04\x12\x12\n\nreward_fee\x18\x06 \x01(\x04\x12\x13\n\x0bmerkle_root\x18\x07 \x01(\x0c\x12\x14\n\x0cmining_nonce\x18\x08 \x01(\r\x12\x13\n\x0b\x65xtra_nonce\x18\t \x01(\x04\"i\n\x13\x42lockHeaderExtended\x12 \n\x06header\x18\x01 \x01(\x0b\x32\x10.pur.BlockHeader\x12\x30\n\x11transaction_count\x18\x02 \x01(\x0b\x32\x15.pur.TransactionCount\"q\n\x10TransactionCount\x12/\n\x05\x63ount\x18\x01 \x03(\x0b\x32 .pur.TransactionCount.CountEntry\x1a,\n\nCountEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\x91\x01\n\x13TransactionExtended\x12 \n\x06header\x18\x01 \x01(\x0b\x32\x10.pur.BlockHeader\x12\x1c\n\x02tx\x18\x02 \x01(\x0b\x32\x10.pur.Transaction\x12\x11\n\taddr_from\x18\x03 \x01(\x0c\x12\x0c\n\x04size\x18\x04 \x01(\x04\x12\x19\n\x11timestamp_seconds\x18\x05 \x01(\x04\"\xa6\x01\n\rBlockExtended\x12 \n\x06header\x18\x01 \x01(\x0b\x32\x10.pur.BlockHeader\x12\x37\n\x15\x65xtended_transactions\x18\x02 \x03(\x0b\x32\x18.pur.TransactionExtended\x12,\n\x0fgenesis_balance\x18\x03 \x03(\x0b\x32\x13.pur.GenesisBalance\x12\x0c\n\x04size\x18\x04 \x01(\x04\"\x7f\n\x05\x42lock\x12 \n\x06header\x18\x01 \x01(\x0b\x32\x10.pur.BlockHeader\x12&\n\x0ctransactions\x18\x02 \x03(\x0b\x32\x10.pur.Transaction\x12,\n\x0fgenesis_balance\x18\x03 \x03(\x0b\x32\x13.pur.GenesisBalance\"2\n\x0eGenesisBalance\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\x0c\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\"D\n\x11\x42lockMetaDataList\x12/\n\x13\x62lock_number_hashes\x18\x01 \x03(\x0b\x32\x12.pur.BlockMetaData\"\xaa\x15\n\x0bTransaction\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\x0c\x12\x0b\n\x03\x66\x65\x65\x18\x02 \x01(\x04\x12\x12\n\npublic_key\x18\x03 \x01(\x0c\x12\x11\n\tsignature\x18\x04 \x01(\x0c\x12\r\n\x05nonce\x18\x05 \x01(\x04\x12\x18\n\x10transaction_hash\x18\x06 \x01(\x0c\x12-\n\x08transfer\x18\x07 \x01(\x0b\x32\x19.pur.Transaction.TransferH\x00\x12-\n\x08\x63oinbase\x18\x08 \x01(\x0b\x32\x19.pur.Transaction.CoinBaseH\x00\x12\x36\n\tlatticePK\x18\t \x01(\x0b\x32!.pur.Transaction.LatticePublicKeyH\x00\x12+\n\x07message\x18\n \x01(\x0b\x32\x18.pur.Transaction.MessageH\x00\x12\'\n\x05token\x18\x0b \x01(\x0b\x32\x16.pur.Transaction.TokenH\x00\x12\x38\n\x0etransfer_token\x18\x0c \x01(\x0b\x32\x1e.pur.Transaction.TransferTokenH\x00\x12\'\n\x05slave\x18\r \x01(\x0b\x32\x16.pur.Transaction.SlaveH\x00\x12;\n\x10multi_sig_create\x18\x0e \x01(\x0b\x32\x1f.pur.Transaction.MultiSigCreateH\x00\x12\x39\n\x0fmulti_sig_spend\x18\x0f \x01(\x0b\x32\x1e.pur.Transaction.MultiSigSpendH\x00\x12\x37\n\x0emulti_sig_vote\x18\x10 \x01(\x0b\x32\x1d.pur.Transaction.MultiSigVoteH\x00\x12:\n\x0fproposal_create\x18\x11 \x01(\x0b\x32\x1f.pur.Transaction.ProposalCreateH\x00\x12\x36\n\rproposal_vote\x18\x12 \x01(\x0b\x32\x1d.pur.Transaction.ProposalVoteH\x00\x1a\x43\n\x08Transfer\x12\x10\n\x08\x61\x64\x64rs_to\x18\x01 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x02 \x03(\x04\x12\x14\n\x0cmessage_data\x18\x03 \x01(\x0c\x1a+\n\x08\x43oinBase\x12\x0f\n\x07\x61\x64\x64r_to\x18\x01 \x01(\x0c\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x04\x1a\x39\n\x10LatticePublicKey\x12\x0b\n\x03pk1\x18\x01 \x01(\x0c\x12\x0b\n\x03pk2\x18\x02 \x01(\x0c\x12\x0b\n\x03pk3\x18\x03 \x01(\x0c\x1a\x30\n\x07Message\x12\x14\n\x0cmessage_hash\x18\x01 \x01(\x0c\x12\x0f\n\x07\x61\x64\x64r_to\x18\x02 \x01(\x0c\x1at\n\x05Token\x12\x0e\n\x06symbol\x18\x01 \x01(\x0c\x12\x0c\n\x04name\x18\x02 \x01(\x0c\x12\r\n\x05owner\x18\x03 \x01(\x0c\x12\x10\n\x08\x64\x65\x63imals\x18\x04 \x01(\x04\x12,\n\x10initial_balances\x18\x05 \x03(\x0b\x32\x12.pur.AddressAmount\x1aH\n\rTransferToken\x12\x14\n\x0ctoken_txhash\x18\x01 \x01(\x0c\x12\x10\n\x08\x61\x64\x64rs_to\x18\x02 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x1a\x30\n\x05Slave\x12\x11\n\tslave_pks\x18\x01 \x03(\x0c\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x02 \x03(\r\x1aI\n\x0eMultiSigCreate\x12\x13\n\x0bsignatories\x18\x01 \x03(\x0c\x12\x0f\n\x07weights\x18\x02 \x03(\r\x12\x11\n\tthreshold\x18\x03 \x01(\r\x1aj\n\rMultiSigSpend\x12\x19\n\x11multi_sig_address\x18\x01 \x01(\x0c\x12\x10\n\x08\x61\x64\x64rs_to\x18\x02 \x03(\x0c\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x12\x1b\n\x13\x65xpiry_block_number\x18\x04 \x01(\x04\x1aH\n\x0cMultiSigVote\x12\x12\n\nshared_key\x18\x01 \x01(\x0c\x12\x0e\n\x06unvote\x18\x02 \x01(\x08\x12\x14\n\x0cprev_tx_hash\x18\x03 \x01(\x0c\x1a\x9b\t\n\x0eProposalCreate\x12\x1b\n\x13\x65xpiry_block_number\x18\x01 \x01(\x04\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x32\n\x03qip\x18\x03 \x01(\x0b\x32#.pur.Transaction.ProposalCreate.QIPH\x00\x12\x38\n\x06\x63onfig\x18\x04 \x01(\x0b\x32&.pur.Transaction.ProposalCreate.ConfigH\x00\x12\x36\n\x05other\x18\x05 \x01(\x0b\x32%.pur.Transaction.ProposalCreate.OtherH\x00\x1a\x17\n\x03QIP\x12\x10\n\x08qip_link\x18\x01 \x01(\t\x1a\xed\x06\n\x06\x43onfig\x12\x18\n\x10\x63hanges_bitfield\x18\x01 \x03(\x0c\x12\x13\n\x0breorg_limit\x18\x02 \x01(\x04\x12\x17\n\x0fmax_coin_supply\x18\x03 \x01(\x04\x12,\n$complete_emission_time_span_in_years\x18\x04 \x01(\x04\x12\x1b\n\x13mining_nonce_offset\x18\x05 \x01(\x04\x12\x1a\n\x12\x65xtra_nonce_offset\x18\x06 \x01(\x04\x12!\n\x19mining_blob_size_in_bytes\x18\x07 \x01(\x04\x12\x1f\n\x17\x62lock_timing_in_seconds\x18\x08 \x01(\x04\x12 \n\x18number_of_blocks_analyze\x18\t \x01(\x04\x12\x1d\n\x15\x62lock_size_multiplier\x18\n \x01(\x04\x12%\n\x1d\x62lock_min_size_limit_in_bytes\x18\x0b \x01(\x04\x12&\n\x1etransaction_multi_output_limit\x18\x0c \x01(\x04\x12\x1a\n\x12message_max_length\x18\r \x01(\x04\x12\x1f\n\x17token_symbol_max_length\x18\x0e \x01(\x04\x12\x1d\n\x15token_name_max_length\x18\x0f \x01(\x04\x12\x1e\n\x16lattice_pk1_max_length\x18\x10 \x01(\x04\x12\x1e\n\x16lattice_pk2_max_length\x18\x11 \x01(\x04\x12\x1e\n\x16lattice_pk3_max_length\x18\x12 \x01(\x04\x12\x39\n1foundation_multi_sig_address_threshold_percentage\x18\x13 \x01(\x04\x12\x1e\n\x16proposal_threshold_per\x18\x14 \x01(\x04\x12 \n\x18proposal_default_options\x18\x15 \x03(\t\x12\x1e\n\x16\x64\x65scription_max_length\x18\x16 \x01(\x04\x12\x1a\n\x12options_max_number\x18\x17 \x01(\x04\x12\x1e\n\x16option_max_text_length\x18\x18 \x01(\x04\x12(\n proposal_config_activation_delay\x18\x19 \x01(\x04\x12\x15\n\rN_measurement\x18\x1a \x01(\x04\x12\n\n\x02kp\x18\x1b \x01(\x04\x1a\x18\n\x05Other\x12\x0f\n\x07options\x18\x01 \x03(\tB\x0e\n\x0cproposalType\x1a\x32\n\x0cProposalVote\x12\x12\n\nshared_key\x18\x01 \x01(\x0c\x12\x0e\n\x06option\x18\x02 \x01(\rB\x11\n\x0ftransactionType\"\xb8\x01\n\tVoteStats\x12\x19\n\x11multi_sig_address\x18\x01 \x01(\x0c\x12\x12\n\nshared_key\x18\x02 \x01(\x0c\x12\x13\n\x0bsignatories\x18\x03 \x03(\x0c\x12\x11\n\ttx_hashes\x18\x04 \x03(\x0c\x12\x0f\n\x07unvotes\x18\x05 \x03(\x08\x12\x1b\n\x13\x65xpiry_block_number\x18\x06 \x01(\x04\x12\x14\n\x0ctotal_weight\x18\x07 \x01(\x04\x12\x10\n\x08\x65xecuted\x18\x08 \x01(\x08\"\xb7\x01\n\x11ProposalVoteStats\x12\x11\n\taddr_from\x18\x01 \x01(\x0c\x12\x12\n\nshared_key\x18\x02 \x01(\x0c\x12\x15\n\rproposal_type\x18\x03 \x01(\t\x12\x18\n\x10weight_by_option\x18\x04 \x03(\x04\x12\x1b\n\x13\x65xpiry_block_number\x18\x05 \x01(\x04\x12\x10\n\x08\x65xecuted\x18\x06 \x01(\x08\x12\x1b\n\x13number_of_tx_hashes\x18\x07 \x01(\x04\"-\n\x0eProposalRecord\x12\x1b\n\x13number_of_tx_hashes\x18\x01 \x01(\x04\"!\n\tTokenList\x12\x14\n\x0ctoken_txhash\x18\x01 \x03(\x0c\"R\n\x0cTokenBalance\x12\x0f\n\x07\x62\x61lance\x18\x01 \x01(\x04\x12\x10\n\x08\x64\x65\x63imals\x18\x02 \x01(\x04\x12\x0f\n\x07tx_hash\x18\x03 \x01(\x0c\x12\x0e\n\x06\x64\x65lete\x18\x04 \x01(\x08\"E\n\rSlaveMetadata\x12\x13\n\x0b\x61\x63\x63\x65ss_type\x18\x01 \x01(\x04\x12\x0f\n\x07tx_hash\x18\x02 \x01(\x0c\x12\x0e\n\x06\x64\x65lete\x18\x03 \x01(\x08\"E\n\x11LatticePKMetadata\x12\x0f\n\x07\x65nabled\x18\x01 \x01(\x08\x12\x0f\n\x07tx_hash\x18\x02 \x01(\x0c\x12\x0e\n\x06\x64\x65lete\x18\x03 \x01(\x08\"G\n\rTokenMetadata\x12\x14\n\x0ctoken_txhash\x18\x01 \x01(\x0c\x12 \n\x18transfer_token_tx_hashes\x18\x02 \x03(\x0c\"\xc4\x01\n\x19\x45ncryptedEphemeralMessage\x12\x0e\n\x06msg_id\x18\x01 \x01(\x0c\x12\x0b\n\x03ttl\x18\x02 \x01(\x04\x12\x0b\n\x03ttr\x18\x03 \x01(\x04\x12\x37\n\x07\x63hannel\x18\x05 \x01(\x0b\x32&.pur.EncryptedEphemeralMessage.Channel\x12\r\n\x05nonce\x18\x06 \x01(\x04\x12\x0f\n\x07payload\x18\x07 \x01(\x0c\x1a$\n\x07\x43hannel\x12\x19\n\x11\x65nc_aes256_symkey\x18\x04 \x01(\x0c\" \n\x0b\x41\x64\x64ressList\x12\x11\n\taddresses\x18\x01 \x03(\x0c\"`\n\x0f\x42lockHeightData\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\x12\x18\n\x10\x62lock_headerhash\x18\x02 \x01(\x0c\x12\x1d\n\x15\x63umulative_difficulty\x18\x03 \x01(\x0c\"\xcb\x01\n\rBlockMetaData\x12\x18\n\x10\x62lock_difficulty\x18\x01 \x01(\x0c\x12\x1d\n\x15\x63umulative_difficulty\x18\x02 \x01(\x0c\x12\x1a\n\x12\x63hild_headerhashes\x18\x03 \x03(\x0c\x12\x1b\n\x13last_N_headerhashes\x18\x04 \x03(\x0c\x12\x1a\n\x12last_N_block_sizes\x18\x05 \x03(\x04\x12\x11\n\ttimestamp\x18\x06 \x01(\x04\x12\x19\n\x11last_N_timestamps\x18\x07 \x03(\x04\"A\n\x12\x42lockNumberMapping\x12\x12\n\nheaderhash\x18\x01 \x01(\x0c\x12\x17\n\x0fprev_headerhash\x18\x02 \x01(\x0c\"X\n\x08PeerStat\x12\x0f\n\x07peer_ip\x18\x01 \x01(\x0c\x12\x0c\n\x04port\x18\x02 \x01(\r\x12-\n\x10node_chain_state\x18\x03 \x01(\x0b\x32\x13.pur.NodeChainState\"~\n\x0eNodeChainState\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\x12\x13\n\x0bheader_hash\x18\x02 \x01(\x0c\x12\x1d\n\x15\x63umulative_difficulty\x18\x03 \x01(\x0c\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x11\n\ttimestamp\x18\x05 \x01(\x04\"<\n\x0eNodeHeaderHash\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\x12\x14\n\x0cheaderhashes\x18\x02 \x03(\x0c\"-\n\x12P2PAcknowledgement\x12\x17\n\x0f\x62ytes_processed\x18\x01 \x01(\r\"|\n\x08PeerInfo\x12\x0f\n\x07peer_ip\x18\x01 \x01(\x0c\x12\x0c\n\x04port\x18\x02 \x01(\r\x12\x18\n\x10\x62\x61nned_timestamp\x18\x03 \x01(\r\x12\x13\n\x0b\x63redibility\x18\x04 \x01(\r\x12\"\n\x1alast_connections_timestamp\x18\x05 \x03(\r\".\n\x05Peers\x12%\n\x0epeer_info_list\x18\x01 \x03(\x0b\x32\r.pur.PeerInfo\"\xbb\x0c\n\tDevConfig\x12\x16\n\x0eprev_state_key\x18\x01 \x01(\x0c\x12\x19\n\x11\x63urrent_state_key\x18\x02 \x01(\x0c\x12\x1e\n\x16\x61\x63tivation_header_hash\x18\x03 \x01(\x0c\x12\x1f\n\x17\x61\x63tivation_block_number\x18\x04 \x01(\x04\x12#\n\x05\x63hain\x18\x05 \x01(\x0b\x32\x14.pur.DevConfig.Chain\x12#\n\x05\x62lock\x18\x06 \x01(\x0b\x32\x14.pur.DevConfig.Block\x12/\n\x0btransaction\x18\x07 \x01(\x0b\x32\x1a.pur.DevConfig.Transaction\x12\x1f\n\x03pow\x18\x08 \x01(\x0b\x32\x12.pur.DevConfig.POW\x1a\x63\n\x05\x43hain\x12\x13\n\x0breorg_limit\x18\x01 \x01(\x04\x12\x17\n\x0fmax_coin_supply\x18\x02 \x01(\x04\x12,\n$complete_emission_time_span_in_years\x18\x03 \x01(\x04\x1a\xc6\x02\n\x05\x42lock\x12\x1b\n\x13mining_nonce_offset\x18\x01 \x01(\x04\x12\x1a\n\x12\x65xtra_nonce_offset\x18\x02 \x01(\x04\x12!\n\x19mining_blob_size_in_bytes\x18\x03 \x01(\x04\x12\x1f\n\x17\x62lock_timing_in_seconds\x18\x04 \x01(\x04\x12G\n\x15\x62lock_size_controller\x18\x05 \x01(\x0b\x32(.pur.DevConfig.Block.BlockSizeController\x1aw\n\x13\x42lockSizeController\x12 \n\x18number_of_blocks_analyze\x18\x01 \x01(\x04\x12\x17\n\x0fsize_multiplier\x18\x02 \x01(\x04\x12%\n\x1d\x62lock_min_size_limit_in_bytes\x18\x03 \x01(\x04\x1a\xc5\x06\n\x0bTransaction\x12\x1a\n\x12multi_output_limit\x18\x01 \x01(\x04\x12\x33\n\x07message\x18\x02 \x01(\x0b\x32\".pur.DevConfig.Transaction.Message\x12/\n\x05slave\x18\x03 \x01(\x0b\x32 .pur.DevConfig.Transaction.Slave\x12/\n\x05token\x18\x04 \x01(\x0b\x32 .pur.DevConfig.Transaction.Token\x12\x33\n\x07lattice\x18\x05 \x01(\x0b\x32\".pur.DevConfig.Transaction.Lattice\x12K\n\x14\x66oundation_multi_sig\x18\x06 \x01(\x0b\x32-.pur.DevConfig.Transaction.FoundationMultiSig\x12\x35\n\x08proposal\x18\x07 \x01(\x0b\x32#.pur.DevConfig.Transaction.Proposal\x1a\x1d\n\x07Message\x12\x12\n\nmax_length\x18\x01 \x01(\x04\x1a$\n\x05Slave\x12\x1b\n\x13slave_pk_max_length\x18\x02 \x01(\x04\x1a;\n\x05Token\x12\x19\n\x11symbol_max_length\x18\x01 \x01(\x04\x12\x17\n\x0fname_max_length\x18\x02 \x01(\x04\x1aQ\n\x07Lattice\x12\x16\n\x0epk1_max_length\x18\x01 \x01(\x04\x12\x16\n\x0epk2_max_length\x18\x02 \x01(\x04\x12\x16\n\x0epk3_max_length\x18\x03 \x01(\x04\x1a\x32\n\x12\x46oundationMultiSig\x12\x1c\n\x14threshold_percentage\x18\x01 \x01(\x04\x1a\xc0\x01\n\x08Proposal\x12\x15\n\rthreshold_per\x18\x01 \x01(\x04\x12\x17\n\x0f\x64\x65\x66\x61ult_options\x18\x02 \x03(\t\x12\x1e\n\x16\x64\x65scription_max_length\x18\x03 \x01(\x04\x12\x1a\n\x12options_max_number\x18\x04 \x01(\x04\x12\x1e\n\x16option_max_text_length\x18\x05 \x01(\x04\x12(\n proposal_config_activation_delay\x18\x06 \x01(\x04\x1a(\n\x03POW\x12\x15\n\rN_measurement\x18\x01 \x01(\x04\x12\n\n\x02kp\x18\x02 \x01(\x04\x32\xc4!\n\tPublicAPI\x12P\n\x0cGetNodeState\x12\x14.pur.GetNodeStateReq\x1a\x15.pur.GetNodeStateResp\"\x13\x82\xd3\xe4\x93\x02\r\x12\x0b/node-state\x12T\n\rGetKnownPeers\x12\x15.pur.GetKnownPeersReq\x1a\x16.pur.GetKnownPeersResp\"\x14\x82\xd3\xe4\x93\x02\x0e\x12\x0c/known-peers\x12P\n\x0cGetPeersStat\x12\x14.pur.GetPeersStatReq\x1a\x15.pur.GetPeersStatResp\"\x13\x82\xd3\xe4\x93\x02\r\x12\x0b/peers-stat\x12?\n\x08GetStats\x12\x10.pur.GetStatsReq\x1a\x11.pur.GetStatsResp\"\x0e\x82\xd3\xe4\x93\x02\x08\x12\x06/stats\x12\\\n\x0fGetAddressState\x12\x17.pur.GetAddressStateReq\x1a\x18.pur.GetAddressStateResp\"\x16\x82\xd3\xe4\x93\x02\x10\x12\x0e/address-state\x12x\n\x18GetOptimizedAddressState\x12\x17.pur.GetAddressStateReq\x1a!.pur.GetOptimizedAddressStateResp\" \x82\xd3\xe4\x93\x02\x1a\x12\x18/optimized-address-state\x12`\n\x10GetAddressStates\x12\x18.pur.GetAddressStatesReq\x1a\x19.pur.GetAddressStatesResp\"\x17\x82\xd3\xe4\x93\x02\x11\x12\x0f/address-states\x12~\n\x17GetMultiSigAddressState\x12\x1f.pur.GetMultiSigAddressStateReq\x1a .pur.GetMultiSigAddressStateResp\" \x82\xd3\xe4\x93\x02\x1a\x12\x18/multi-sig-address-state\x12?\n\x07IsSlave\x12\x0f.pur.IsSlaveReq\x1a\x10.pur.IsSlaveResp\"\x11\x82\xd3\xe4\x93\x02\x0b\x12\t/is-slave\x12X\n\x0eGetSlavesState\x12\x16.pur.GetSlavesStateReq\x1a\x17.pur.GetSlavesStateResp\"\x15\x82\xd3\xe4\x93\x02\x0f\x12\r/slaves-state\x12\x43\n\tGetObject\x12\x11.pur.GetObjectReq\x1a\x12.pur.GetObjectResp\"\x0f\x82\xd3\xe4\x93\x02\t\x12\x07/object\x12T\n\rGetLatestData\x12\x15.pur.GetLatestDataReq\x1a\x16.pur.GetLatestDataResp\"\x14\x82\xd3\xe4\x93\x02\x0e\x12\x0c/latest-data\x12_\n\x0fPushTransaction\x12\x17.pur.PushTransactionReq\x1a\x18.pur.PushTransactionResp\"\x19\x82\xd3\xe4\x93\x02\x13\"\x11/push-transaction\x12\x63\n\x10PushTransactions\x12\x18.pur.PushTransactionsReq\x1a\x19.pur.PushTransactionsResp\"\x1a\x82\xd3\xe4\x93\x02\x14\"\x12/push-transactions\x12W\n\rTransferCoins\x12\x15.pur.TransferCoinsReq\x1a\x16.pur.TransferCoinsResp\"\x17\x82\xd3\xe4\x93\x02\x11\"\x0f/transfer-coins\x12S\n\x0cParseAddress\x12\x14.pur.ParseAddressReq\x1a\x15.pur.ParseAddressResp\"\x16\x82\xd3\xe4\x93\x02\x10\x12\x0e/parse-address\x12T\n\rGetChainStats\x12\x15.pur.GetChainStatsReq\x1a\x16.pur.GetChainStatsResp\"\x14\x82\xd3\xe4\x93\x02\x0e\x12\x0c/chain-stats\x12\x61\n\x10GetAddressFromPK\x12\x18.pur.GetAddressFromPKReq\x1a\x19.pur.GetAddressFromPKResp\"\x18\x82\xd3\xe4\x93\x02\x12\x12\x10/address-from-pk\x12h\n\x14GetMultiSigCreateTxn\x12\x19.pur.MultiSigCreateTxnReq\x1a\x16.pur.TransferCoinsResp\"\x1d\x82\xd3\xe4\x93\x02\x17\"\x15/multi-sig-create-txn\x12\x65\n\x13GetMultiSigSpendTxn\x12\x18.pur.MultiSigSpendTxnReq\x1a\x16.pur.TransferCoinsResp\"\x1c\x82\xd3\xe4\x93\x02\x16\"\x14/multi-sig-spend-txn\x12\x62\n\x12GetMultiSigVoteTxn\x12\x17.pur.MultiSigVoteTxnReq\x1a\x16.pur.TransferCoinsResp\"\x1b\x82\xd3\xe4\x93\x02\x15\"\x13/multi-sig-vote-txn\x12Q\n\rGetMessageTxn\x12\x12.pur.MessageTxnReq\x1a\x16.pur.TransferCoinsResp\"\x14\x82\xd3\xe4\x93\x02\x0e\"\x0c/message-txn\x12K\n\x0bGetTokenTxn\x12\x10.pur.TokenTxnReq\x1a\x16.pur.TransferCoinsResp\"\x12\x82\xd3\xe4\x93\x02\x0c\"\n/token-txn\x12\x64\n\x13GetTransferTokenTxn\x12\x18.pur.TransferTokenTxnReq\x1a\x16.pur.TransferCoinsResp\"\x1b\x82\xd3\xe4\x93\x02\x15\"\x13/transfer-token-txn\x12K\n\x0bGetSlaveTxn\x12\x10.pur.SlaveTxnReq\x1a\x16.pur.TransferCoinsResp\"\x12\x82\xd3\xe4\x93\x02\x0c\"\n/slave-txn\x12Q\n\rGetLatticeTxn\x12\x12.pur.LatticeTxnReq\x1a\x16.pur.TransferCoinsResp\"\x14\x82\xd3\xe4\x93\x02\x0e\"\x0c/lattice-txn\x12W\n\x0eGetTransaction\x12\x16.pur.GetTransactionReq\x1a\x17.pur.GetTransactionResp\"\x14\x82\xd3\xe4\x93\x02\x0e\x12\x0c/transaction\x12\x91\x01\n\x1cGetMiniTransactionsByAddress\x12$.pur.GetMiniTransactionsByAddressReq\x1a%.pur.GetMiniTransactionsByAddressResp\"$\x82\xd3\xe4\x93\x02\x1e\x12\x1c/mini-transaction-by-address\x12\x81\x01\n\x18GetTransactionsByAddress\x12 .pur.GetTransactionsByAddressReq\x1a!.pur.GetTransactionsByAddressResp\" \x82\xd3\xe4\x93\x02\x1a\x12\x18/transactions-by-address\x12o\n\x12GetTokensByAddress\x12 .pur.GetTransactionsByAddressReq\x1a\x1b.pur.GetTokensByAddressResp\"\x1a\x82\xd3\xe4\x93\x02\x14\x12\x12/tokens-by-address\x12o\n\x12GetSlavesByAddress\x12 .pur.GetTransactionsByAddressReq\x1a\x1b.pur.GetSlavesByAddressResp\"\x1a\x82\xd3\xe4\x93\x02\x14\x12\x12/slaves-by-address\x12|\n\x16GetLatticePKsByAddress\x12 .pur.GetTransactionsByAddressReq\x1a\x1f.pur.GetLatticePKsByAddressResp\"\x1f\x82\xd3\xe4\x93\x02\x19\x12\x17/lattice-pks-by-address\x12\x92\x01\n\x1dGetMultiSigAddressesByAddress\x12 .pur.GetTransactionsByAddressReq\x1a&.pur.GetMultiSigAddressesByAddressResp\"\'\x82\xd3\xe4\x93\x02!\x12\x1f/multi-sig-addresses-by-address\x12\x94\x01\n\x1cGetMultiSigSpendTxsByAddress\x12$.pur.GetMultiSigSpendTxsByAddressReq\x1a%.pur.GetMultiSigSpendTxsByAddressResp\"\'\x82\xd3\xe4\x93\x02!\x12\x1f/multi-sig-spend-txs-by-address\x12P\n\x0cGetVoteStats\x12\x14.pur.GetVoteStatsReq\x1a\x15.pur.GetVoteStatsResp\"\x13\x82\xd3\xe4\x93\x02\r\x12\x0b/vote-stats\x12\x87\x01\n\x1aGetInbopuressagesByAddress\x12 .pur.GetTransactionsByAddressReq\x1a#.pur.GetInbopuressagesByAddressResp\"\"\x82\xd3\xe4\x93\x02\x1c\x12\x1a/inbox-messages-by-address\x12G\n\nGetBalance\x12\x12.pur.GetBalanceReq\x1a\x13.pur.GetBalanceResp\"\x10\x82\xd3\xe4\x93\x02\n\x12\x08/balance\x12\\\n\x0fGetTotalBalance\x12\x17.pur.GetTotalBalanceReq\x1a\x18.pur.GetTotalBalanceResp\"\x16\x82\xd3\xe4\x93\x02\x10\x12\x0e/total-balance\x12\x37\n\x06GetOTS\x12\x0e.pur.GetOTSReq\x1a\x0f.pur.GetOTSResp\"\x0c\x82\xd3\xe4\x93\x02\x06\x12\x04/ots\x12\x43\n\tGetHeight\x12\x11.pur.GetHeightReq\x1a\x12.pur.GetHeightResp\"\x0f\x82\xd3\xe4\x93\x02\t\x12\x07/height\x12?\n\x08GetBlock\x12\x10.pur.GetBlockReq\x1a\x11.pur.GetBlockResp\"\x0e\x82\xd3\xe4\x93\x02\x08\x12\x06/block\x12\x61\n\x10GetBlockByNumber\x12\x18.pur.GetBlockByNumberReq\x1a\x19.pur.GetBlockByNumberResp\"\x18\x82\xd3\xe4\x93\x02\x12\x12\x10/block-by-number\x12\x46\n\x0fSubscribeBlocks\x12\x17.pur.SubscribeBlocksReq\x1a\x18.pur.SubscribeBlocksResp0\x01\x12I\n\x10SubscribeMempool\x12\x18.pur.SubscribeMempoolReq\x1a\x19.pur.SubscribeMempoolResp0\x01\x12O\n\x12SubscribeAddresses\x12\x1a.pur.SubscribeAddressesReq\x1a\x1b.pur.SubscribeAddressesResp0\x01\x32\n\n\x08\x41\x64minAPIb\x06proto3')
   ,
   dependencies=[google_dot_api_dot_annotations__pb2.DESCRIPTOR,])
 
@@ -51,8 +51,8 @@ _GETLATESTDATAREQ_FILTER = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   options=None,
-  serialized_start=1855,
-  serialized_end=1938,
+  serialized_start=2311,
+  serialized_end=2394,
 )
 _sym_db.RegisterEnumDescriptor(_GETLATESTDATAREQ_FILTER)
 
@@ -81,8 +81,8 @@ _PUSHTRANSACTIONRESP_RESPONSECODE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   options=None,
-  serialized_start=2532,
-  serialized_end=2608,
+  serialized_start=2989,
+  serialized_end=3065,
 )
 _sym_db.RegisterEnumDescriptor(_PUSHTRANSACTIONRESP_RESPONSECODE)
 
@@ -123,11 +123,59 @@ _GETMULTISIGSPENDTXSBYADDRESSREQ_FILTERTYPE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   options=None,
-  serialized_start=4465,
-  serialized_end=4610,
+  serialized_start=5141,
+  serialized_end=5286,
 )
 _sym_db.RegisterEnumDescriptor(_GETMULTISIGSPENDTXSBYADDRESSREQ_FILTERTYPE)
 
+_SUBSCRIBEBLOCKSRESP_EVENTTYPE = _descriptor.EnumDescriptor(
+  name='EventType',
+  full_name='pur.SubscribeBlocksResp.EventType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='ADDED', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='REMOVED', index=1, number=1,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=7061,
+  serialized_end=7096,
+)
+_sym_db.RegisterEnumDescriptor(_SUBSCRIBEBLOCKSRESP_EVENTTYPE)
+
+_SUBSCRIBEADDRESSESRESP_EVENTTYPE = _descriptor.EnumDescriptor(
+  name='EventType',
+  full_name='pur.SubscribeAddressesResp.EventType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='MEMPOOL', index=0, number=0,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ADDED', index=1, number=1,
+      options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='REMOVED', index=2, number=2,
+      options=None,
+      type=None),
+  ],
+  containing_type=None,
+  options=None,
+  serialized_start=7388,
+  serialized_end=7436,
+)
+_sym_db.RegisterEnumDescriptor(_SUBSCRIBEADDRESSESRESP_EVENTTYPE)
+
 _NODEINFO_STATE = _descriptor.EnumDescriptor(
   name='State',
   full_name='pur.NodeInfo.State',
@@ -157,8 +205,8 @@ _NODEINFO_STATE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   options=None,
-  serialized_start=6514,
-  serialized_end=6585,
+  serialized_start=7705,
+  serialized_end=7776,
 )
 _sym_db.RegisterEnumDescriptor(_NODEINFO_STATE)
 
@@ -795,6 +843,68 @@ _GETOPTIMIZEDADDRESSSTATERESP = _descriptor.Descriptor(
 )
 
 
+_GETADDRESSSTATESREQ = _descriptor.Descriptor(
+  name='GetAddressStatesReq',
+  full_name='pur.GetAddressStatesReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='addresses', full_name='pur.GetAddressStatesReq.addresses', index=0,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1213,
+  serialized_end=1253,
+)
+
+
+_GETADDRESSSTATESRESP = _descriptor.Descriptor(
+  name='GetAddressStatesResp',
+  full_name='pur.GetAddressStatesResp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='states', full_name='pur.GetAddressStatesResp.states', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1255,
+  serialized_end=1321,
+)
+
+
 _GETMULTISIGADDRESSSTATEREQ = _descriptor.Descriptor(
   name='GetMultiSigAddressStateReq',
   full_name='pur.GetMultiSigAddressStateReq',
@@ -821,8 +931,8 @@ _GETMULTISIGADDRESSSTATEREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1213,
-  serialized_end=1258,
+  serialized_start=1323,
+  serialized_end=1368,
 )
 
 
@@ -852,8 +962,8 @@ _GETMULTISIGADDRESSSTATERESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1260,
-  serialized_end=1331,
+  serialized_start=1370,
+  serialized_end=1441,
 )
 
 
@@ -890,8 +1000,8 @@ _ISSLAVEREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1333,
-  serialized_end=1387,
+  serialized_start=1443,
+  serialized_end=1497,
 )
 
 
@@ -921,8 +1031,173 @@ _ISSLAVERESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1389,
-  serialized_end=1418,
+  serialized_start=1499,
+  serialized_end=1528,
+)
+
+
+_GETSLAVESSTATEREQ_SLAVE = _descriptor.Descriptor(
+  name='Slave',
+  full_name='pur.GetSlavesStateReq.Slave',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='slave_pk', full_name='pur.GetSlavesStateReq.Slave.slave_pk', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='unused_ots_index_from', full_name='pur.GetSlavesStateReq.Slave.unused_ots_index_from', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1622,
+  serialized_end=1678,
+)
+
+_GETSLAVESSTATEREQ = _descriptor.Descriptor(
+  name='GetSlavesStateReq',
+  full_name='pur.GetSlavesStateReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='master_address', full_name='pur.GetSlavesStateReq.master_address', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='slaves', full_name='pur.GetSlavesStateReq.slaves', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_GETSLAVESSTATEREQ_SLAVE, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1531,
+  serialized_end=1678,
+)
+
+
+_SLAVESTATE = _descriptor.Descriptor(
+  name='SlaveState',
+  full_name='pur.SlaveState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='slave_pk', full_name='pur.SlaveState.slave_pk', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='is_slave', full_name='pur.SlaveState.is_slave', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='access_type', full_name='pur.SlaveState.access_type', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='next_unused_ots_index', full_name='pur.SlaveState.next_unused_ots_index', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='unused_ots_index_found', full_name='pur.SlaveState.unused_ots_index_found', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1681,
+  serialized_end=1813,
+)
+
+
+_GETSLAVESSTATERESP = _descriptor.Descriptor(
+  name='GetSlavesStateResp',
+  full_name='pur.GetSlavesStateResp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='slaves_state', full_name='pur.GetSlavesStateResp.slaves_state', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1815,
+  serialized_end=1874,
 )
 
 
@@ -952,8 +1227,8 @@ _PARSEADDRESSREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1420,
-  serialized_end=1454,
+  serialized_start=1876,
+  serialized_end=1910,
 )
 
 
@@ -990,8 +1265,8 @@ _PARSEADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1456,
-  serialized_end=1530,
+  serialized_start=1912,
+  serialized_end=1986,
 )
 
 
@@ -1021,8 +1296,8 @@ _GETOBJECTREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1532,
-  serialized_end=1561,
+  serialized_start=1988,
+  serialized_end=2017,
 )
 
 
@@ -1076,8 +1351,8 @@ _GETOBJECTRESP = _descriptor.Descriptor(
       name='result', full_name='pur.GetObjectResp.result',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=1564,
-  serialized_end=1752,
+  serialized_start=2020,
+  serialized_end=2208,
 )
 
 
@@ -1122,8 +1397,8 @@ _GETLATESTDATAREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1755,
-  serialized_end=1938,
+  serialized_start=2211,
+  serialized_end=2394,
 )
 
 
@@ -1167,8 +1442,8 @@ _GETLATESTDATARESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1941,
-  serialized_end=2116,
+  serialized_start=2397,
+  serialized_end=2572,
 )
 
 
@@ -1233,8 +1508,8 @@ _TRANSFERCOINSREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2119,
-  serialized_end=2249,
+  serialized_start=2575,
+  serialized_end=2706,
 )
 
 
@@ -1264,8 +1539,8 @@ _TRANSFERCOINSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2251,
-  serialized_end=2335,
+  serialized_start=2708,
+  serialized_end=2792,
 )
 
 
@@ -1295,8 +1570,8 @@ _PUSHTRANSACTIONREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2337,
-  serialized_end=2403,
+  serialized_start=2794,
+  serialized_end=2860,
 )
 
 
@@ -1341,8 +1616,70 @@ _PUSHTRANSACTIONRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2406,
-  serialized_end=2608,
+  serialized_start=2863,
+  serialized_end=3065,
+)
+
+
+_PUSHTRANSACTIONSREQ = _descriptor.Descriptor(
+  name='PushTransactionsReq',
+  full_name='pur.PushTransactionsReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transactions_signed', full_name='pur.PushTransactionsReq.transactions_signed', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3067,
+  serialized_end=3135,
+)
+
+
+_PUSHTRANSACTIONSRESP = _descriptor.Descriptor(
+  name='PushTransactionsResp',
+  full_name='pur.PushTransactionsResp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='results', full_name='pur.PushTransactionsResp.results', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3137,
+  serialized_end=3202,
 )
 
 
@@ -1407,8 +1744,8 @@ _MULTISIpurREATETXNREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2611,
-  serialized_end=2741,
+  serialized_start=3205,
+  serialized_end=3336,
 )
 
 
@@ -1480,8 +1817,8 @@ _MULTISIGSPENDTXNREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2744,
-  serialized_end=2907,
+  serialized_start=3339,
+  serialized_end=3503,
 )
 
 
@@ -1539,8 +1876,8 @@ _MULTISIGVOTETXNREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2909,
-  serialized_end=3016,
+  serialized_start=3505,
+  serialized_end=3613,
 )
 
 
@@ -1598,8 +1935,8 @@ _MESSAGETXNREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3018,
-  serialized_end=3118,
+  serialized_start=3615,
+  serialized_end=3716,
 )
 
 
@@ -1678,8 +2015,8 @@ _TOKENTXNREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3121,
-  serialized_end=3294,
+  serialized_start=3719,
+  serialized_end=3893,
 )
 
 
@@ -1744,8 +2081,8 @@ _TRANSFERTOKENTXNREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3297,
-  serialized_end=3430,
+  serialized_start=3896,
+  serialized_end=4030,
 )
 
 
@@ -1803,8 +2140,8 @@ _SLAVETXNREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3432,
-  serialized_end=3537,
+  serialized_start=4032,
+  serialized_end=4138,
 )
 
 
@@ -1869,8 +2206,8 @@ _LATTICETXNREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3539,
-  serialized_end=3644,
+  serialized_start=4140,
+  serialized_end=4246,
 )
 
 
@@ -1914,8 +2251,8 @@ _MINITRANSACTION = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3646,
-  serialized_end=3718,
+  serialized_start=4248,
+  serialized_end=4320,
 )
 
 
@@ -1945,8 +2282,8 @@ _GETTRANSACTIONREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3720,
-  serialized_end=3756,
+  serialized_start=4322,
+  serialized_end=4358,
 )
 
 
@@ -2011,8 +2348,8 @@ _GETTRANSACTIONRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3759,
-  serialized_end=3919,
+  serialized_start=4361,
+  serialized_end=4521,
 )
 
 
@@ -2044,6 +2381,13 @@ _GETMINITRANSACTIONSBYADDRESSREQ = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cursor', full_name='pur.GetMiniTransactionsByAddressReq.cursor', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -2056,8 +2400,8 @@ _GETMINITRANSACTIONSBYADDRESSREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3921,
-  serialized_end=4015,
+  serialized_start=4523,
+  serialized_end=4633,
 )
 
 
@@ -2082,6 +2426,13 @@ _GETMINITRANSACTIONSBYADDRESSRESP = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='next_cursor', full_name='pur.GetMiniTransactionsByAddressResp.next_cursor', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -2094,8 +2445,8 @@ _GETMINITRANSACTIONSBYADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4017,
-  serialized_end=4117,
+  serialized_start=4635,
+  serialized_end=4756,
 )
 
 
@@ -2127,6 +2478,13 @@ _GETTRANSACTIONSBYADDRESSREQ = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cursor', full_name='pur.GetTransactionsByAddressReq.cursor', index=3,
+      number=4, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -2139,8 +2497,8 @@ _GETTRANSACTIONSBYADDRESSREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4119,
-  serialized_end=4209,
+  serialized_start=4758,
+  serialized_end=4864,
 )
 
 
@@ -2158,6 +2516,13 @@ _GETTRANSACTIONSBYADDRESSRESP = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='next_cursor', full_name='pur.GetTransactionsByAddressResp.next_cursor', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -2170,8 +2535,8 @@ _GETTRANSACTIONSBYADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4211,
-  serialized_end=4295,
+  serialized_start=4866,
+  serialized_end=4971,
 )
 
 
@@ -2223,8 +2588,8 @@ _GETMULTISIGSPENDTXSBYADDRESSREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4298,
-  serialized_end=4610,
+  serialized_start=4974,
+  serialized_end=5286,
 )
 
 
@@ -2254,8 +2619,8 @@ _GETMULTISIGSPENDTXSBYADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4612,
-  serialized_end=4700,
+  serialized_start=5288,
+  serialized_end=5376,
 )
 
 
@@ -2285,8 +2650,8 @@ _GETVOTESTATSREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4702,
-  serialized_end=4752,
+  serialized_start=5378,
+  serialized_end=5428,
 )
 
 
@@ -2316,8 +2681,8 @@ _GETVOTESTATSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4754,
-  serialized_end=4808,
+  serialized_start=5430,
+  serialized_end=5484,
 )
 
 
@@ -2347,8 +2712,8 @@ _GETINBOpurESSAGESBYADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4810,
-  serialized_end=4895,
+  serialized_start=5486,
+  serialized_end=5572,
 )
 
 
@@ -2406,8 +2771,8 @@ _INBOpurESSAGE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4897,
-  serialized_end=5005,
+  serialized_start=5574,
+  serialized_end=5683,
 )
 
 
@@ -2458,8 +2823,8 @@ _TOKENDETAIL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5007,
-  serialized_end=5089,
+  serialized_start=5685,
+  serialized_end=5767,
 )
 
 
@@ -2489,8 +2854,8 @@ _GETTOKENSBYADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5091,
-  serialized_end=5156,
+  serialized_start=5769,
+  serialized_end=5834,
 )
 
 
@@ -2527,8 +2892,8 @@ _SLAVEDETAIL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5158,
-  serialized_end=5215,
+  serialized_start=5836,
+  serialized_end=5893,
 )
 
 
@@ -2558,8 +2923,8 @@ _GETSLAVESBYADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5217,
-  serialized_end=5282,
+  serialized_start=5895,
+  serialized_end=5960,
 )
 
 
@@ -2610,8 +2975,8 @@ _LATTICEPKSDETAIL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5284,
-  serialized_end=5358,
+  serialized_start=5962,
+  serialized_end=6036,
 )
 
 
@@ -2641,8 +3006,8 @@ _GETLATTICEPKSBYADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5360,
-  serialized_end=5439,
+  serialized_start=6038,
+  serialized_end=6117,
 )
 
 
@@ -2679,8 +3044,8 @@ _MULTISIGDETAIL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5441,
-  serialized_end=5491,
+  serialized_start=6119,
+  serialized_end=6169,
 )
 
 
@@ -2710,8 +3075,8 @@ _GETMULTISIGADDRESSESBYADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5493,
-  serialized_end=5575,
+  serialized_start=6171,
+  serialized_end=6253,
 )
 
 
@@ -2741,8 +3106,8 @@ _GETBALANCEREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5577,
-  serialized_end=5609,
+  serialized_start=6255,
+  serialized_end=6287,
 )
 
 
@@ -2772,8 +3137,8 @@ _GETBALANCERESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5611,
-  serialized_end=5644,
+  serialized_start=6289,
+  serialized_end=6322,
 )
 
 
@@ -2803,8 +3168,8 @@ _GETTOTALBALANCEREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5646,
-  serialized_end=5685,
+  serialized_start=6324,
+  serialized_end=6363,
 )
 
 
@@ -2834,8 +3199,8 @@ _GETTOTALBALANCERESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5687,
-  serialized_end=5725,
+  serialized_start=6365,
+  serialized_end=6403,
 )
 
 
@@ -2886,8 +3251,8 @@ _GETOTSREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5727,
-  serialized_end=5825,
+  serialized_start=6405,
+  serialized_end=6503,
 )
 
 
@@ -2899,15 +3264,208 @@ _OTSBITFIELDBYPAGE = _descriptor.Descriptor(
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='ots_bitfield', full_name='pur.OTSBitfieldByPage.ots_bitfield', index=0,
-      number=1, type=12, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='page_number', full_name='pur.OTSBitfieldByPage.page_number', index=1,
-      number=2, type=4, cpp_type=4, label=1,
+      name='ots_bitfield', full_name='pur.OTSBitfieldByPage.ots_bitfield', index=0,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='page_number', full_name='pur.OTSBitfieldByPage.page_number', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6505,
+  serialized_end=6567,
+)
+
+
+_GETOTSRESP = _descriptor.Descriptor(
+  name='GetOTSResp',
+  full_name='pur.GetOTSResp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ots_bitfield_by_page', full_name='pur.GetOTSResp.ots_bitfield_by_page', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='next_unused_ots_index', full_name='pur.GetOTSResp.next_unused_ots_index', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='unused_ots_index_found', full_name='pur.GetOTSResp.unused_ots_index_found', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6570,
+  serialized_end=6699,
+)
+
+
+_GETHEIGHTREQ = _descriptor.Descriptor(
+  name='GetHeightReq',
+  full_name='pur.GetHeightReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6701,
+  serialized_end=6715,
+)
+
+
+_GETHEIGHTRESP = _descriptor.Descriptor(
+  name='GetHeightResp',
+  full_name='pur.GetHeightResp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='height', full_name='pur.GetHeightResp.height', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6717,
+  serialized_end=6748,
+)
+
+
+_GETBLOCKREQ = _descriptor.Descriptor(
+  name='GetBlockReq',
+  full_name='pur.GetBlockReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='header_hash', full_name='pur.GetBlockReq.header_hash', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6750,
+  serialized_end=6784,
+)
+
+
+_GETBLOCKRESP = _descriptor.Descriptor(
+  name='GetBlockResp',
+  full_name='pur.GetBlockResp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='block', full_name='pur.GetBlockResp.block', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6786,
+  serialized_end=6827,
+)
+
+
+_GETBLOCKBYNUMBERREQ = _descriptor.Descriptor(
+  name='GetBlockByNumberReq',
+  full_name='pur.GetBlockByNumberReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='block_number', full_name='pur.GetBlockByNumberReq.block_number', index=0,
+      number=1, type=4, cpp_type=4, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -2924,36 +3482,22 @@ _OTSBITFIELDBYPAGE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5827,
-  serialized_end=5889,
+  serialized_start=6829,
+  serialized_end=6872,
 )
 
 
-_GETOTSRESP = _descriptor.Descriptor(
-  name='GetOTSResp',
-  full_name='pur.GetOTSResp',
+_GETBLOCKBYNUMBERRESP = _descriptor.Descriptor(
+  name='GetBlockByNumberResp',
+  full_name='pur.GetBlockByNumberResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='ots_bitfield_by_page', full_name='pur.GetOTSResp.ots_bitfield_by_page', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='next_unused_ots_index', full_name='pur.GetOTSResp.next_unused_ots_index', index=1,
-      number=2, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='unused_ots_index_found', full_name='pur.GetOTSResp.unused_ots_index_found', index=2,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
+      name='block', full_name='pur.GetBlockByNumberResp.block', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
@@ -2969,14 +3513,14 @@ _GETOTSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5892,
-  serialized_end=6021,
+  serialized_start=6874,
+  serialized_end=6923,
 )
 
 
-_GETHEIGHTREQ = _descriptor.Descriptor(
-  name='GetHeightReq',
-  full_name='pur.GetHeightReq',
+_SUBSCRIBEBLOCKSREQ = _descriptor.Descriptor(
+  name='SubscribeBlocksReq',
+  full_name='pur.SubscribeBlocksReq',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
@@ -2993,30 +3537,38 @@ _GETHEIGHTREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6023,
-  serialized_end=6037,
+  serialized_start=6925,
+  serialized_end=6945,
 )
 
 
-_GETHEIGHTRESP = _descriptor.Descriptor(
-  name='GetHeightResp',
-  full_name='pur.GetHeightResp',
+_SUBSCRIBEBLOCKSRESP = _descriptor.Descriptor(
+  name='SubscribeBlocksResp',
+  full_name='pur.SubscribeBlocksResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='height', full_name='pur.GetHeightResp.height', index=0,
-      number=1, type=4, cpp_type=4, label=1,
+      name='event_type', full_name='pur.SubscribeBlocksResp.event_type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='header', full_name='pur.SubscribeBlocksResp.header', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
+    _SUBSCRIBEBLOCKSRESP_EVENTTYPE,
   ],
   options=None,
   is_extendable=False,
@@ -3024,25 +3576,18 @@ _GETHEIGHTRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6039,
-  serialized_end=6070,
+  serialized_start=6948,
+  serialized_end=7096,
 )
 
 
-_GETBLOCKREQ = _descriptor.Descriptor(
-  name='GetBlockReq',
-  full_name='pur.GetBlockReq',
+_SUBSCRIBEMEMPOOLREQ = _descriptor.Descriptor(
+  name='SubscribeMempoolReq',
+  full_name='pur.SubscribeMempoolReq',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
-    _descriptor.FieldDescriptor(
-      name='header_hash', full_name='pur.GetBlockReq.header_hash', index=0,
-      number=1, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -3055,20 +3600,20 @@ _GETBLOCKREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6072,
-  serialized_end=6106,
+  serialized_start=7098,
+  serialized_end=7119,
 )
 
 
-_GETBLOCKRESP = _descriptor.Descriptor(
-  name='GetBlockResp',
-  full_name='pur.GetBlockResp',
+_SUBSCRIBEMEMPOOLRESP = _descriptor.Descriptor(
+  name='SubscribeMempoolResp',
+  full_name='pur.SubscribeMempoolResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='block', full_name='pur.GetBlockResp.block', index=0,
+      name='tx', full_name='pur.SubscribeMempoolResp.tx', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
@@ -3086,22 +3631,22 @@ _GETBLOCKRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6108,
-  serialized_end=6149,
+  serialized_start=7121,
+  serialized_end=7173,
 )
 
 
-_GETBLOCKBYNUMBERREQ = _descriptor.Descriptor(
-  name='GetBlockByNumberReq',
-  full_name='pur.GetBlockByNumberReq',
+_SUBSCRIBEADDRESSESREQ = _descriptor.Descriptor(
+  name='SubscribeAddressesReq',
+  full_name='pur.SubscribeAddressesReq',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='block_number', full_name='pur.GetBlockByNumberReq.block_number', index=0,
-      number=1, type=4, cpp_type=4, label=1,
-      has_default_value=False, default_value=0,
+      name='addresses', full_name='pur.SubscribeAddressesReq.addresses', index=0,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
@@ -3117,21 +3662,42 @@ _GETBLOCKBYNUMBERREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6151,
-  serialized_end=6194,
+  serialized_start=7175,
+  serialized_end=7217,
 )
 
 
-_GETBLOCKBYNUMBERRESP = _descriptor.Descriptor(
-  name='GetBlockByNumberResp',
-  full_name='pur.GetBlockByNumberResp',
+_SUBSCRIBEADDRESSESRESP = _descriptor.Descriptor(
+  name='SubscribeAddressesResp',
+  full_name='pur.SubscribeAddressesResp',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='block', full_name='pur.GetBlockByNumberResp.block', index=0,
-      number=1, type=11, cpp_type=10, label=1,
+      name='event_type', full_name='pur.SubscribeAddressesResp.event_type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='addresses', full_name='pur.SubscribeAddressesResp.addresses', index=1,
+      number=2, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='tx', full_name='pur.SubscribeAddressesResp.tx', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='header', full_name='pur.SubscribeAddressesResp.header', index=3,
+      number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
@@ -3141,6 +3707,7 @@ _GETBLOCKBYNUMBERRESP = _descriptor.Descriptor(
   ],
   nested_types=[],
   enum_types=[
+    _SUBSCRIBEADDRESSESRESP_EVENTTYPE,
   ],
   options=None,
   is_extendable=False,
@@ -3148,8 +3715,8 @@ _GETBLOCKBYNUMBERRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6196,
-  serialized_end=6245,
+  serialized_start=7220,
+  serialized_end=7436,
 )
 
 
@@ -3172,8 +3739,8 @@ _GETLOCALADDRESSESREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6247,
-  serialized_end=6269,
+  serialized_start=7438,
+  serialized_end=7460,
 )
 
 
@@ -3203,8 +3770,8 @@ _GETLOCALADDRESSESRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6271,
-  serialized_end=6313,
+  serialized_start=7462,
+  serialized_end=7504,
 )
 
 
@@ -3284,8 +3851,8 @@ _NODEINFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6316,
-  serialized_end=6585,
+  serialized_start=7507,
+  serialized_end=7776,
 )
 
 
@@ -3343,8 +3910,8 @@ _ADDRESSDESCRIPTOR = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6588,
-  serialized_end=6721,
+  serialized_start=7779,
+  serialized_end=7912,
 )
 
 
@@ -3374,8 +3941,8 @@ _STOREDPEERS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6723,
-  serialized_end=6762,
+  serialized_start=7914,
+  serialized_end=7953,
 )
 
 
@@ -3405,8 +3972,8 @@ _PEER = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6764,
-  serialized_end=6782,
+  serialized_start=7955,
+  serialized_end=7973,
 )
 
 
@@ -3443,8 +4010,8 @@ _ADDRESSSTATE_TOKENSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=7082,
-  serialized_end=7127,
+  serialized_start=8273,
+  serialized_end=8318,
 )
 
 _ADDRESSSTATE_SLAVEPKSACCESSTYPEENTRY = _descriptor.Descriptor(
@@ -3480,8 +4047,8 @@ _ADDRESSSTATE_SLAVEPKSACCESSTYPEENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=7129,
-  serialized_end=7186,
+  serialized_start=8320,
+  serialized_end=8377,
 )
 
 _ADDRESSSTATE = _descriptor.Descriptor(
@@ -3566,8 +4133,8 @@ _ADDRESSSTATE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=6785,
-  serialized_end=7186,
+  serialized_start=7976,
+  serialized_end=8377,
 )
 
 
@@ -3702,8 +4269,8 @@ _OPTIMIZEDADDRESSSTATE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=7189,
-  serialized_end=7669,
+  serialized_start=8380,
+  serialized_end=8860,
 )
 
 
@@ -3824,8 +4391,8 @@ _MULTISIGADDRESSSTATE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=7672,
-  serialized_end=8075,
+  serialized_start=8863,
+  serialized_end=9266,
 )
 
 
@@ -3855,8 +4422,8 @@ _MULTISIGADDRESSESLIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8077,
-  serialized_end=8116,
+  serialized_start=9268,
+  serialized_end=9307,
 )
 
 
@@ -3886,8 +4453,8 @@ _DATALIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8118,
-  serialized_end=8144,
+  serialized_start=9309,
+  serialized_end=9335,
 )
 
 
@@ -3917,8 +4484,8 @@ _BITFIELD = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8146,
-  serialized_end=8175,
+  serialized_start=9337,
+  serialized_end=9366,
 )
 
 
@@ -3948,8 +4515,8 @@ _TRANSACTIONHASHLIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8177,
-  serialized_end=8214,
+  serialized_start=9368,
+  serialized_end=9405,
 )
 
 
@@ -3986,8 +4553,8 @@ _LATTICEPK = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8216,
-  serialized_end=8267,
+  serialized_start=9407,
+  serialized_end=9458,
 )
 
 
@@ -4024,8 +4591,8 @@ _ADDRESSAMOUNT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8269,
-  serialized_end=8317,
+  serialized_start=9460,
+  serialized_end=9508,
 )
 
 
@@ -4111,8 +4678,8 @@ _BLOCKHEADER = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8320,
-  serialized_end=8535,
+  serialized_start=9511,
+  serialized_end=9726,
 )
 
 
@@ -4149,8 +4716,8 @@ _BLOCKHEADEREXTENDED = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8537,
-  serialized_end=8642,
+  serialized_start=9728,
+  serialized_end=9833,
 )
 
 
@@ -4187,8 +4754,8 @@ _TRANSACTIONCOUNT_COUNTENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8713,
-  serialized_end=8757,
+  serialized_start=9904,
+  serialized_end=9948,
 )
 
 _TRANSACTIONCOUNT = _descriptor.Descriptor(
@@ -4217,8 +4784,8 @@ _TRANSACTIONCOUNT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8644,
-  serialized_end=8757,
+  serialized_start=9835,
+  serialized_end=9948,
 )
 
 
@@ -4276,8 +4843,8 @@ _TRANSACTIONEXTENDED = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8760,
-  serialized_end=8905,
+  serialized_start=9951,
+  serialized_end=10096,
 )
 
 
@@ -4328,8 +4895,8 @@ _BLOCKEXTENDED = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=8908,
-  serialized_end=9074,
+  serialized_start=10099,
+  serialized_end=10265,
 )
 
 
@@ -4373,8 +4940,8 @@ _BLOCK = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=9076,
-  serialized_end=9203,
+  serialized_start=10267,
+  serialized_end=10394,
 )
 
 
@@ -4411,8 +4978,8 @@ _GENESISBALANCE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=9205,
-  serialized_end=9255,
+  serialized_start=10396,
+  serialized_end=10446,
 )
 
 
@@ -4442,8 +5009,8 @@ _BLOCKMETADATALIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=9257,
-  serialized_end=9325,
+  serialized_start=10448,
+  serialized_end=10516,
 )
 
 
@@ -4487,8 +5054,8 @@ _TRANSACTION_TRANSFER = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10085,
-  serialized_end=10152,
+  serialized_start=11276,
+  serialized_end=11343,
 )
 
 _TRANSACTION_COINBASE = _descriptor.Descriptor(
@@ -4524,8 +5091,8 @@ _TRANSACTION_COINBASE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10154,
-  serialized_end=10197,
+  serialized_start=11345,
+  serialized_end=11388,
 )
 
 _TRANSACTION_LATTICEPUBLICKEY = _descriptor.Descriptor(
@@ -4568,8 +5135,8 @@ _TRANSACTION_LATTICEPUBLICKEY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10199,
-  serialized_end=10256,
+  serialized_start=11390,
+  serialized_end=11447,
 )
 
 _TRANSACTION_MESSAGE = _descriptor.Descriptor(
@@ -4605,8 +5172,8 @@ _TRANSACTION_MESSAGE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10258,
-  serialized_end=10306,
+  serialized_start=11449,
+  serialized_end=11497,
 )
 
 _TRANSACTION_TOKEN = _descriptor.Descriptor(
@@ -4663,8 +5230,8 @@ _TRANSACTION_TOKEN = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10308,
-  serialized_end=10424,
+  serialized_start=11499,
+  serialized_end=11615,
 )
 
 _TRANSACTION_TRANSFERTOKEN = _descriptor.Descriptor(
@@ -4707,8 +5274,8 @@ _TRANSACTION_TRANSFERTOKEN = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10426,
-  serialized_end=10498,
+  serialized_start=11617,
+  serialized_end=11689,
 )
 
 _TRANSACTION_SLAVE = _descriptor.Descriptor(
@@ -4744,8 +5311,8 @@ _TRANSACTION_SLAVE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10500,
-  serialized_end=10548,
+  serialized_start=11691,
+  serialized_end=11739,
 )
 
 _TRANSACTION_MULTISIpurREATE = _descriptor.Descriptor(
@@ -4788,8 +5355,8 @@ _TRANSACTION_MULTISIpurREATE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10550,
-  serialized_end=10623,
+  serialized_start=11741,
+  serialized_end=11814,
 )
 
 _TRANSACTION_MULTISIGSPEND = _descriptor.Descriptor(
@@ -4839,8 +5406,8 @@ _TRANSACTION_MULTISIGSPEND = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10625,
-  serialized_end=10731,
+  serialized_start=11816,
+  serialized_end=11922,
 )
 
 _TRANSACTION_MULTISIGVOTE = _descriptor.Descriptor(
@@ -4883,8 +5450,8 @@ _TRANSACTION_MULTISIGVOTE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=10733,
-  serialized_end=10805,
+  serialized_start=11924,
+  serialized_end=11996,
 )
 
 _TRANSACTION_PROPOSALCREATE_QIP = _descriptor.Descriptor(
@@ -4913,8 +5480,8 @@ _TRANSACTION_PROPOSALCREATE_QIP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=11042,
-  serialized_end=11065,
+  serialized_start=12233,
+  serialized_end=12256,
 )
 
 _TRANSACTION_PROPOSALCREATE_CONFIG = _descriptor.Descriptor(
@@ -5125,8 +5692,8 @@ _TRANSACTION_PROPOSALCREATE_CONFIG = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=11068,
-  serialized_end=11945,
+  serialized_start=12259,
+  serialized_end=13136,
 )
 
 _TRANSACTION_PROPOSALCREATE_OTHER = _descriptor.Descriptor(
@@ -5155,8 +5722,8 @@ _TRANSACTION_PROPOSALCREATE_OTHER = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=11947,
-  serialized_end=11971,
+  serialized_start=13138,
+  serialized_end=13162,
 )
 
 _TRANSACTION_PROPOSALCREATE = _descriptor.Descriptor(
@@ -5216,8 +5783,8 @@ _TRANSACTION_PROPOSALCREATE = _descriptor.Descriptor(
       name='proposalType', full_name='pur.Transaction.ProposalCreate.proposalType',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=10808,
-  serialized_end=11987,
+  serialized_start=11999,
+  serialized_end=13178,
 )
 
 _TRANSACTION_PROPOSALVOTE = _descriptor.Descriptor(
@@ -5253,8 +5820,8 @@ _TRANSACTION_PROPOSALVOTE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=11989,
-  serialized_end=12039,
+  serialized_start=13180,
+  serialized_end=13230,
 )
 
 _TRANSACTION = _descriptor.Descriptor(
@@ -5405,8 +5972,8 @@ _TRANSACTION = _descriptor.Descriptor(
       name='transactionType', full_name='pur.Transaction.transactionType',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=9328,
-  serialized_end=12058,
+  serialized_start=10519,
+  serialized_end=13249,
 )
 
 
@@ -5485,8 +6052,8 @@ _VOTESTATS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12061,
-  serialized_end=12245,
+  serialized_start=13252,
+  serialized_end=13436,
 )
 
 
@@ -5558,8 +6125,8 @@ _PROPOSALVOTESTATS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12248,
-  serialized_end=12431,
+  serialized_start=13439,
+  serialized_end=13622,
 )
 
 
@@ -5589,8 +6156,8 @@ _PROPOSALRECORD = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12433,
-  serialized_end=12478,
+  serialized_start=13624,
+  serialized_end=13669,
 )
 
 
@@ -5620,8 +6187,8 @@ _TOKENLIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12480,
-  serialized_end=12513,
+  serialized_start=13671,
+  serialized_end=13704,
 )
 
 
@@ -5672,8 +6239,8 @@ _TOKENBALANCE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12515,
-  serialized_end=12597,
+  serialized_start=13706,
+  serialized_end=13788,
 )
 
 
@@ -5717,8 +6284,8 @@ _SLAVEMETADATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12599,
-  serialized_end=12668,
+  serialized_start=13790,
+  serialized_end=13859,
 )
 
 
@@ -5762,8 +6329,8 @@ _LATTICEPKMETADATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12670,
-  serialized_end=12739,
+  serialized_start=13861,
+  serialized_end=13930,
 )
 
 
@@ -5800,8 +6367,8 @@ _TOKENMETADATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12741,
-  serialized_end=12812,
+  serialized_start=13932,
+  serialized_end=14003,
 )
 
 
@@ -5831,8 +6398,8 @@ _ENCRYPTEDEPHEMERALMESSAGE_CHANNEL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12975,
-  serialized_end=13011,
+  serialized_start=14166,
+  serialized_end=14202,
 )
 
 _ENCRYPTEDEPHEMERALMESSAGE = _descriptor.Descriptor(
@@ -5896,8 +6463,8 @@ _ENCRYPTEDEPHEMERALMESSAGE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=12815,
-  serialized_end=13011,
+  serialized_start=14006,
+  serialized_end=14202,
 )
 
 
@@ -5927,8 +6494,8 @@ _ADDRESSLIST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13013,
-  serialized_end=13045,
+  serialized_start=14204,
+  serialized_end=14236,
 )
 
 
@@ -5972,8 +6539,8 @@ _BLOCKHEIGHTDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13047,
-  serialized_end=13143,
+  serialized_start=14238,
+  serialized_end=14334,
 )
 
 
@@ -6012,6 +6579,27 @@ _BLOCKMETADATA = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='last_N_block_sizes', full_name='pur.BlockMetaData.last_N_block_sizes', index=4,
+      number=5, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='pur.BlockMetaData.timestamp', index=5,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='last_N_timestamps', full_name='pur.BlockMetaData.last_N_timestamps', index=6,
+      number=7, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -6024,8 +6612,8 @@ _BLOCKMETADATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13146,
-  serialized_end=13275,
+  serialized_start=14337,
+  serialized_end=14540,
 )
 
 
@@ -6062,8 +6650,8 @@ _BLOCKNUMBERMAPPING = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13277,
-  serialized_end=13342,
+  serialized_start=14542,
+  serialized_end=14607,
 )
 
 
@@ -6107,8 +6695,8 @@ _PEERSTAT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13344,
-  serialized_end=13432,
+  serialized_start=14609,
+  serialized_end=14697,
 )
 
 
@@ -6166,8 +6754,8 @@ _NODECHAINSTATE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13434,
-  serialized_end=13560,
+  serialized_start=14699,
+  serialized_end=14825,
 )
 
 
@@ -6204,8 +6792,8 @@ _NODEHEADERHASH = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13562,
-  serialized_end=13622,
+  serialized_start=14827,
+  serialized_end=14887,
 )
 
 
@@ -6235,8 +6823,8 @@ _P2PACKNOWLEDGEMENT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13624,
-  serialized_end=13669,
+  serialized_start=14889,
+  serialized_end=14934,
 )
 
 
@@ -6294,8 +6882,8 @@ _PEERINFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13671,
-  serialized_end=13795,
+  serialized_start=14936,
+  serialized_end=15060,
 )
 
 
@@ -6325,8 +6913,8 @@ _PEERS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13797,
-  serialized_end=13843,
+  serialized_start=15062,
+  serialized_end=15108,
 )
 
 
@@ -6370,8 +6958,8 @@ _DEVCONFIG_CHAIN = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=14131,
-  serialized_end=14230,
+  serialized_start=15396,
+  serialized_end=15495,
 )
 
 _DEVCONFIG_BLOCK_BLOCKSIZECONTROLLER = _descriptor.Descriptor(
@@ -6414,8 +7002,8 @@ _DEVCONFIG_BLOCK_BLOCKSIZECONTROLLER = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=14440,
-  serialized_end=14559,
+  serialized_start=15705,
+  serialized_end=15824,
 )
 
 _DEVCONFIG_BLOCK = _descriptor.Descriptor(
@@ -6472,8 +7060,8 @@ _DEVCONFIG_BLOCK = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=14233,
-  serialized_end=14559,
+  serialized_start=15498,
+  serialized_end=15824,
 )
 
 _DEVCONFIG_TRANSACTION_MESSAGE = _descriptor.Descriptor(
@@ -6502,8 +7090,8 @@ _DEVCONFIG_TRANSACTION_MESSAGE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=14941,
-  serialized_end=14970,
+  serialized_start=16206,
+  serialized_end=16235,
 )
 
 _DEVCONFIG_TRANSACTION_SLAVE = _descriptor.Descriptor(
@@ -6532,8 +7120,8 @@ _DEVCONFIG_TRANSACTION_SLAVE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=14972,
-  serialized_end=15008,
+  serialized_start=16237,
+  serialized_end=16273,
 )
 
 _DEVCONFIG_TRANSACTION_TOKEN = _descriptor.Descriptor(
@@ -6569,8 +7157,8 @@ _DEVCONFIG_TRANSACTION_TOKEN = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=15010,
-  serialized_end=15069,
+  serialized_start=16275,
+  serialized_end=16334,
 )
 
 _DEVCONFIG_TRANSACTION_LATTICE = _descriptor.Descriptor(
@@ -6613,8 +7201,8 @@ _DEVCONFIG_TRANSACTION_LATTICE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=15071,
-  serialized_end=15152,
+  serialized_start=16336,
+  serialized_end=16417,
 )
 
 _DEVCONFIG_TRANSACTION_FOUNDATIONMULTISIG = _descriptor.Descriptor(
@@ -6643,8 +7231,8 @@ _DEVCONFIG_TRANSACTION_FOUNDATIONMULTISIG = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=15154,
-  serialized_end=15204,
+  serialized_start=16419,
+  serialized_end=16469,
 )
 
 _DEVCONFIG_TRANSACTION_PROPOSAL = _descriptor.Descriptor(
@@ -6708,8 +7296,8 @@ _DEVCONFIG_TRANSACTION_PROPOSAL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=15207,
-  serialized_end=15399,
+  serialized_start=16472,
+  serialized_end=16664,
 )
 
 _DEVCONFIG_TRANSACTION = _descriptor.Descriptor(
@@ -6780,8 +7368,8 @@ _DEVCONFIG_TRANSACTION = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=14562,
-  serialized_end=15399,
+  serialized_start=15827,
+  serialized_end=16664,
 )
 
 _DEVCONFIG_POW = _descriptor.Descriptor(
@@ -6817,8 +7405,8 @@ _DEVCONFIG_POW = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=15401,
-  serialized_end=15441,
+  serialized_start=16666,
+  serialized_end=16706,
 )
 
 _DEVCONFIG = _descriptor.Descriptor(
@@ -6896,8 +7484,8 @@ _DEVCONFIG = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=13846,
-  serialized_end=15441,
+  serialized_start=15111,
+  serialized_end=16706,
 )
 
 _GETNODESTATERESP.fields_by_name['info'].message_type = _NODEINFO
@@ -6908,7 +7496,11 @@ _GETSTATSRESP.fields_by_name['node_info'].message_type = _NODEINFO
 _GETSTATSRESP.fields_by_name['block_timeseries'].message_type = _BLOCKDATAPOINT
 _GETADDRESSSTATERESP.fields_by_name['state'].message_type = _ADDRESSSTATE
 _GETOPTIMIZEDADDRESSSTATERESP.fields_by_name['state'].message_type = _OPTIMIZEDADDRESSSTATE
+_GETADDRESSSTATESRESP.fields_by_name['states'].message_type = _OPTIMIZEDADDRESSSTATE
 _GETMULTISIGADDRESSSTATERESP.fields_by_name['state'].message_type = _MULTISIGADDRESSSTATE
+_GETSLAVESSTATEREQ_SLAVE.containing_type = _GETSLAVESSTATEREQ
+_GETSLAVESSTATEREQ.fields_by_name['slaves'].message_type = _GETSLAVESSTATEREQ_SLAVE
+_GETSLAVESSTATERESP.fields_by_name['slaves_state'].message_type = _SLAVESTATE
 _PARSEADDRESSRESP.fields_by_name['desc'].message_type = _ADDRESSDESCRIPTOR
 _GETOBJECTRESP.fields_by_name['address_state'].message_type = _OPTIMIZEDADDRESSSTATE
 _GETOBJECTRESP.fields_by_name['transaction'].message_type = _TRANSACTIONEXTENDED
@@ -6931,6 +7523,8 @@ _TRANSFERCOINSRESP.fields_by_name['extended_transaction_unsigned'].message_type
 _PUSHTRANSACTIONREQ.fields_by_name['transaction_signed'].message_type = _TRANSACTION
 _PUSHTRANSACTIONRESP.fields_by_name['error_code'].enum_type = _PUSHTRANSACTIONRESP_RESPONSECODE
 _PUSHTRANSACTIONRESP_RESPONSECODE.containing_type = _PUSHTRANSACTIONRESP
+_PUSHTRANSACTIONSREQ.fields_by_name['transactions_signed'].message_type = _TRANSACTION
+_PUSHTRANSACTIONSRESP.fields_by_name['results'].message_type = _PUSHTRANSACTIONRESP
 _TOKENTXNREQ.fields_by_name['initial_balances'].message_type = _ADDRESSAMOUNT
 _GETTRANSACTIONRESP.fields_by_name['tx'].message_type = _TRANSACTION
 _GETMINITRANSACTIONSBYADDRESSRESP.fields_by_name['mini_transactions'].message_type = _MINITRANSACTION
@@ -6947,6 +7541,14 @@ _GETMULTISIGADDRESSESBYADDRESSRESP.fields_by_name['multi_sig_detail'].message_ty
 _GETOTSRESP.fields_by_name['ots_bitfield_by_page'].message_type = _OTSBITFIELDBYPAGE
 _GETBLOCKRESP.fields_by_name['block'].message_type = _BLOCK
 _GETBLOCKBYNUMBERRESP.fields_by_name['block'].message_type = _BLOCK
+_SUBSCRIBEBLOCKSRESP.fields_by_name['event_type'].enum_type = _SUBSCRIBEBLOCKSRESP_EVENTTYPE
+_SUBSCRIBEBLOCKSRESP.fields_by_name['header'].message_type = _BLOCKHEADER
+_SUBSCRIBEBLOCKSRESP_EVENTTYPE.containing_type = _SUBSCRIBEBLOCKSRESP
+_SUBSCRIBEMEMPOOLRESP.fields_by_name['tx'].message_type = _TRANSACTION
+_SUBSCRIBEADDRESSESRESP.fields_by_name['event_type'].enum_type = _SUBSCRIBEADDRESSESRESP_EVENTTYPE
+_SUBSCRIBEADDRESSESRESP.fields_by_name['tx'].message_type = _TRANSACTION
+_SUBSCRIBEADDRESSESRESP.fields_by_name['header'].message_type = _BLOCKHEADER
+_SUBSCRIBEADDRESSESRESP_EVENTTYPE.containing_type = _SUBSCRIBEADDRESSESRESP
 _NODEINFO.fields_by_name['state'].enum_type = _NODEINFO_STATE
 _NODEINFO_STATE.containing_type = _NODEINFO
 _STOREDPEERS.fields_by_name['peers'].message_type = _PEER
@@ -7089,10 +7691,15 @@ DESCRIPTOR.message_types_by_name['BlockDataPoint'] = _BLOCKDATAPOINT
 DESCRIPTOR.message_types_by_name['GetAddressStateReq'] = _GETADDRESSSTATEREQ
 DESCRIPTOR.message_types_by_name['GetAddressStateResp'] = _GETADDRESSSTATERESP
 DESCRIPTOR.message_types_by_name['GetOptimizedAddressStateResp'] = _GETOPTIMIZEDADDRESSSTATERESP
+DESCRIPTOR.message_types_by_name['GetAddressStatesReq'] = _GETADDRESSSTATESREQ
+DESCRIPTOR.message_types_by_name['GetAddressStatesResp'] = _GETADDRESSSTATESRESP
 DESCRIPTOR.message_types_by_name['GetMultiSigAddressStateReq'] = _GETMULTISIGADDRESSSTATEREQ
 DESCRIPTOR.message_types_by_name['GetMultiSigAddressStateResp'] = _GETMULTISIGADDRESSSTATERESP
 DESCRIPTOR.message_types_by_name['IsSlaveReq'] = _ISSLAVEREQ
 DESCRIPTOR.message_types_by_name['IsSlaveResp'] = _ISSLAVERESP
+DESCRIPTOR.message_types_by_name['GetSlavesStateReq'] = _GETSLAVESSTATEREQ
+DESCRIPTOR.message_types_by_name['SlaveState'] = _SLAVESTATE
+DESCRIPTOR.message_types_by_name['GetSlavesStateResp'] = _GETSLAVESSTATERESP
 DESCRIPTOR.message_types_by_name['ParseAddressReq'] = _PARSEADDRESSREQ
 DESCRIPTOR.message_types_by_name['ParseAddressResp'] = _PARSEADDRESSRESP
 DESCRIPTOR.message_types_by_name['GetObjectReq'] = _GETOBJECTREQ
@@ -7103,6 +7710,8 @@ DESCRIPTOR.message_types_by_name['TransferCoinsReq'] = _TRANSFERCOINSREQ
 DESCRIPTOR.message_types_by_name['TransferCoinsResp'] = _TRANSFERCOINSRESP
 DESCRIPTOR.message_types_by_name['PushTransactionReq'] = _PUSHTRANSACTIONREQ
 DESCRIPTOR.message_types_by_name['PushTransactionResp'] = _PUSHTRANSACTIONRESP
+DESCRIPTOR.message_types_by_name['PushTransactionsReq'] = _PUSHTRANSACTIONSREQ
+DESCRIPTOR.message_types_by_name['PushTransactionsResp'] = _PUSHTRANSACTIONSRESP
 DESCRIPTOR.message_types_by_name['MultiSigCreateTxnReq'] = _MULTISIpurREATETXNREQ
 DESCRIPTOR.message_types_by_name['MultiSigSpendTxnReq'] = _MULTISIGSPENDTXNREQ
 DESCRIPTOR.message_types_by_name['MultiSigVoteTxnReq'] = _MULTISIGVOTETXNREQ
@@ -7145,6 +7754,12 @@ DESCRIPTOR.message_types_by_name['GetBlockReq'] = _GETBLOCKREQ
 DESCRIPTOR.message_types_by_name['GetBlockResp'] = _GETBLOCKRESP
 DESCRIPTOR.message_types_by_name['GetBlockByNumberReq'] = _GETBLOCKBYNUMBERREQ
 DESCRIPTOR.message_types_by_name['GetBlockByNumberResp'] = _GETBLOCKBYNUMBERRESP
+DESCRIPTOR.message_types_by_name['SubscribeBlocksReq'] = _SUBSCRIBEBLOCKSREQ
+DESCRIPTOR.message_types_by_name['SubscribeBlocksResp'] = _SUBSCRIBEBLOCKSRESP
+DESCRIPTOR.message_types_by_name['SubscribeMempoolReq'] = _SUBSCRIBEMEMPOOLREQ
+DESCRIPTOR.message_types_by_name['SubscribeMempoolResp'] = _SUBSCRIBEMEMPOOLRESP
+DESCRIPTOR.message_types_by_name['SubscribeAddressesReq'] = _SUBSCRIBEADDRESSESREQ
+DESCRIPTOR.message_types_by_name['SubscribeAddressesResp'] = _SUBSCRIBEADDRESSESRESP
 DESCRIPTOR.message_types_by_name['GetLocalAddressesReq'] = _GETLOCALADDRESSESREQ
 DESCRIPTOR.message_types_by_name['GetLocalAddressesResp'] = _GETLOCALADDRESSESRESP
 DESCRIPTOR.message_types_by_name['NodeInfo'] = _NODEINFO
@@ -7310,6 +7925,20 @@ GetOptimizedAddressStateResp = _reflection.GeneratedProtocolMessageType('GetOpti
   ))
 _sym_db.RegisterMessage(GetOptimizedAddressStateResp)
 
+GetAddressStatesReq = _reflection.GeneratedProtocolMessageType('GetAddressStatesReq', (_message.Message,), dict(
+  DESCRIPTOR = _GETADDRESSSTATESREQ,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.GetAddressStatesReq)
+  ))
+_sym_db.RegisterMessage(GetAddressStatesReq)
+
+GetAddressStatesResp = _reflection.GeneratedProtocolMessageType('GetAddressStatesResp', (_message.Message,), dict(
+  DESCRIPTOR = _GETADDRESSSTATESRESP,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.GetAddressStatesResp)
+  ))
+_sym_db.RegisterMessage(GetAddressStatesResp)
+
 GetMultiSigAddressStateReq = _reflection.GeneratedProtocolMessageType('GetMultiSigAddressStateReq', (_message.Message,), dict(
   DESCRIPTOR = _GETMULTISIGADDRESSSTATEREQ,
   __module__ = 'pur_pb2'
@@ -7338,6 +7967,35 @@ IsSlaveResp = _reflection.GeneratedProtocolMessageType('IsSlaveResp', (_message.
   ))
 _sym_db.RegisterMessage(IsSlaveResp)
 
+GetSlavesStateReq = _reflection.GeneratedProtocolMessageType('GetSlavesStateReq', (_message.Message,), dict(
+
+  Slave = _reflection.GeneratedProtocolMessageType('Slave', (_message.Message,), dict(
+    DESCRIPTOR = _GETSLAVESSTATEREQ_SLAVE,
+    __module__ = 'pur_pb2'
+    # @@protoc_insertion_point(class_scope:pur.GetSlavesStateReq.Slave)
+    ))
+  ,
+  DESCRIPTOR = _GETSLAVESSTATEREQ,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.GetSlavesStateReq)
+  ))
+_sym_db.RegisterMessage(GetSlavesStateReq)
+_sym_db.RegisterMessage(GetSlavesStateReq.Slave)
+
+SlaveState = _reflection.GeneratedProtocolMessageType('SlaveState', (_message.Message,), dict(
+  DESCRIPTOR = _SLAVESTATE,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.SlaveState)
+  ))
+_sym_db.RegisterMessage(SlaveState)
+
+GetSlavesStateResp = _reflection.GeneratedProtocolMessageType('GetSlavesStateResp', (_message.Message,), dict(
+  DESCRIPTOR = _GETSLAVESSTATERESP,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.GetSlavesStateResp)
+  ))
+_sym_db.RegisterMessage(GetSlavesStateResp)
+
 ParseAddressReq = _reflection.GeneratedProtocolMessageType('ParseAddressReq', (_message.Message,), dict(
   DESCRIPTOR = _PARSEADDRESSREQ,
   __module__ = 'pur_pb2'
@@ -7408,6 +8066,20 @@ PushTransactionResp = _reflection.GeneratedProtocolMessageType('PushTransactionR
   ))
 _sym_db.RegisterMessage(PushTransactionResp)
 
+PushTransactionsReq = _reflection.GeneratedProtocolMessageType('PushTransactionsReq', (_message.Message,), dict(
+  DESCRIPTOR = _PUSHTRANSACTIONSREQ,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.PushTransactionsReq)
+  ))
+_sym_db.RegisterMessage(PushTransactionsReq)
+
+PushTransactionsResp = _reflection.GeneratedProtocolMessageType('PushTransactionsResp', (_message.Message,), dict(
+  DESCRIPTOR = _PUSHTRANSACTIONSRESP,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.PushTransactionsResp)
+  ))
+_sym_db.RegisterMessage(PushTransactionsResp)
+
 MultiSigCreateTxnReq = _reflection.GeneratedProtocolMessageType('MultiSigCreateTxnReq', (_message.Message,), dict(
   DESCRIPTOR = _MULTISIpurREATETXNREQ,
   __module__ = 'pur_pb2'
@@ -7702,6 +8374,48 @@ GetBlockByNumberResp = _reflection.GeneratedProtocolMessageType('GetBlockByNumbe
   ))
 _sym_db.RegisterMessage(GetBlockByNumberResp)
 
+SubscribeBlocksReq = _reflection.GeneratedProtocolMessageType('SubscribeBlocksReq', (_message.Message,), dict(
+  DESCRIPTOR = _SUBSCRIBEBLOCKSREQ,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.SubscribeBlocksReq)
+  ))
+_sym_db.RegisterMessage(SubscribeBlocksReq)
+
+SubscribeBlocksResp = _reflection.GeneratedProtocolMessageType('SubscribeBlocksResp', (_message.Message,), dict(
+  DESCRIPTOR = _SUBSCRIBEBLOCKSRESP,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.SubscribeBlocksResp)
+  ))
+_sym_db.RegisterMessage(SubscribeBlocksResp)
+
+SubscribeMempoolReq = _reflection.GeneratedProtocolMessageType('SubscribeMempoolReq', (_message.Message,), dict(
+  DESCRIPTOR = _SUBSCRIBEMEMPOOLREQ,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.SubscribeMempoolReq)
+  ))
+_sym_db.RegisterMessage(SubscribeMempoolReq)
+
+SubscribeMempoolResp = _reflection.GeneratedProtocolMessageType('SubscribeMempoolResp', (_message.Message,), dict(
+  DESCRIPTOR = _SUBSCRIBEMEMPOOLRESP,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.SubscribeMempoolResp)
+  ))
+_sym_db.RegisterMessage(SubscribeMempoolResp)
+
+SubscribeAddressesReq = _reflection.GeneratedProtocolMessageType('SubscribeAddressesReq', (_message.Message,), dict(
+  DESCRIPTOR = _SUBSCRIBEADDRESSESREQ,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.SubscribeAddressesReq)
+  ))
+_sym_db.RegisterMessage(SubscribeAddressesReq)
+
+SubscribeAddressesResp = _reflection.GeneratedProtocolMessageType('SubscribeAddressesResp', (_message.Message,), dict(
+  DESCRIPTOR = _SUBSCRIBEADDRESSESRESP,
+  __module__ = 'pur_pb2'
+  # @@protoc_insertion_point(class_scope:pur.SubscribeAddressesResp)
+  ))
+_sym_db.RegisterMessage(SubscribeAddressesResp)
+
 GetLocalAddressesReq = _reflection.GeneratedProtocolMessageType('GetLocalAddressesReq', (_message.Message,), dict(
   DESCRIPTOR = _GETLOCALADDRESSESREQ,
   __module__ = 'pur_pb2'
@@ -8264,8 +8978,8 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   options=None,
-  serialized_start=15444,
-  serialized_end=19217,
+  serialized_start=16709,
+  serialized_end=21001,
   methods=[
   _descriptor.MethodDescriptor(
     name='GetNodeState',
@@ -8321,10 +9035,19 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
     output_type=_GETOPTIMIZEDADDRESSSTATERESP,
     options=_descriptor._ParseOptions(descriptor_pb2.MethodOptions(), _b('\202\323\344\223\002\032\022\030/optimized-address-state')),
   ),
+  _descriptor.MethodDescriptor(
+    name='GetAddressStates',
+    full_name='pur.PublicAPI.GetAddressStates',
+    index=6,
+    containing_service=None,
+    input_type=_GETADDRESSSTATESREQ,
+    output_type=_GETADDRESSSTATESRESP,
+    options=_descriptor._ParseOptions(descriptor_pb2.MethodOptions(), _b('\202\323\344\223\002\021\022\017/address-states')),
+  ),
   _descriptor.MethodDescriptor(
     name='GetMultiSigAddressState',
     full_name='pur.PublicAPI.GetMultiSigAddressState',
-    index=6,
+    index=7,
     containing_service=None,
     input_type=_GETMULTISIGADDRESSSTATEREQ,
     output_type=_GETMULTISIGADDRESSSTATERESP,
@@ -8333,16 +9056,25 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='IsSlave',
     full_name='pur.PublicAPI.IsSlave',
-    index=7,
+    index=8,
     containing_service=None,
     input_type=_ISSLAVEREQ,
     output_type=_ISSLAVERESP,
     options=_descriptor._ParseOptions(descriptor_pb2.MethodOptions(), _b('\202\323\344\223\002\013\022\t/is-slave')),
   ),
+  _descriptor.MethodDescriptor(
+    name='GetSlavesState',
+    full_name='pur.PublicAPI.GetSlavesState',
+    index=9,
+    containing_service=None,
+    input_type=_GETSLAVESSTATEREQ,
+    output_type=_GETSLAVESSTATERESP,
+    options=_descriptor._ParseOptions(descriptor_pb2.MethodOptions(), _b('\202\323\344\223\002\017\022\r/slaves-state')),
+  ),
   _descriptor.MethodDescriptor(
     name='GetObject',
     full_name='pur.PublicAPI.GetObject',
-    index=8,
+    index=10,
     containing_service=None,
     input_type=_GETOBJECTREQ,
     output_type=_GETOBJECTRESP,
@@ -8351,7 +9083,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetLatestData',
     full_name='pur.PublicAPI.GetLatestData',
-    index=9,
+    index=11,
     containing_service=None,
     input_type=_GETLATESTDATAREQ,
     output_type=_GETLATESTDATARESP,
@@ -8360,16 +9092,25 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='PushTransaction',
     full_name='pur.PublicAPI.PushTransaction',
-    index=10,
+    index=12,
     containing_service=None,
     input_type=_PUSHTRANSACTIONREQ,
     output_type=_PUSHTRANSACTIONRESP,
     options=_descriptor._ParseOptions(descriptor_pb2.MethodOptions(), _b('\202\323\344\223\002\023\"\021/push-transaction')),
   ),
+  _descriptor.MethodDescriptor(
+    name='PushTransactions',
+    full_name='pur.PublicAPI.PushTransactions',
+    index=13,
+    containing_service=None,
+    input_type=_PUSHTRANSACTIONSREQ,
+    output_type=_PUSHTRANSACTIONSRESP,
+    options=_descriptor._ParseOptions(descriptor_pb2.MethodOptions(), _b('\202\323\344\223\002\024\"\022/push-transactions')),
+  ),
   _descriptor.MethodDescriptor(
     name='TransferCoins',
     full_name='pur.PublicAPI.TransferCoins',
-    index=11,
+    index=14,
     containing_service=None,
     input_type=_TRANSFERCOINSREQ,
     output_type=_TRANSFERCOINSRESP,
@@ -8378,7 +9119,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='ParseAddress',
     full_name='pur.PublicAPI.ParseAddress',
-    index=12,
+    index=15,
     containing_service=None,
     input_type=_PARSEADDRESSREQ,
     output_type=_PARSEADDRESSRESP,
@@ -8387,7 +9128,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetChainStats',
     full_name='pur.PublicAPI.GetChainStats',
-    index=13,
+    index=16,
     containing_service=None,
     input_type=_GETCHAINSTATSREQ,
     output_type=_GETCHAINSTATSRESP,
@@ -8396,7 +9137,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetAddressFromPK',
     full_name='pur.PublicAPI.GetAddressFromPK',
-    index=14,
+    index=17,
     containing_service=None,
     input_type=_GETADDRESSFROMPKREQ,
     output_type=_GETADDRESSFROMPKRESP,
@@ -8405,7 +9146,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetMultiSigCreateTxn',
     full_name='pur.PublicAPI.GetMultiSigCreateTxn',
-    index=15,
+    index=18,
     containing_service=None,
     input_type=_MULTISIpurREATETXNREQ,
     output_type=_TRANSFERCOINSRESP,
@@ -8414,7 +9155,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetMultiSigSpendTxn',
     full_name='pur.PublicAPI.GetMultiSigSpendTxn',
-    index=16,
+    index=19,
     containing_service=None,
     input_type=_MULTISIGSPENDTXNREQ,
     output_type=_TRANSFERCOINSRESP,
@@ -8423,7 +9164,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetMultiSigVoteTxn',
     full_name='pur.PublicAPI.GetMultiSigVoteTxn',
-    index=17,
+    index=20,
     containing_service=None,
     input_type=_MULTISIGVOTETXNREQ,
     output_type=_TRANSFERCOINSRESP,
@@ -8432,7 +9173,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetMessageTxn',
     full_name='pur.PublicAPI.GetMessageTxn',
-    index=18,
+    index=21,
     containing_service=None,
     input_type=_MESSAGETXNREQ,
     output_type=_TRANSFERCOINSRESP,
@@ -8441,7 +9182,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTokenTxn',
     full_name='pur.PublicAPI.GetTokenTxn',
-    index=19,
+    index=22,
     containing_service=None,
     input_type=_TOKENTXNREQ,
     output_type=_TRANSFERCOINSRESP,
@@ -8450,7 +9191,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTransferTokenTxn',
     full_name='pur.PublicAPI.GetTransferTokenTxn',
-    index=20,
+    index=23,
     containing_service=None,
     input_type=_TRANSFERTOKENTXNREQ,
     output_type=_TRANSFERCOINSRESP,
@@ -8459,7 +9200,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetSlaveTxn',
     full_name='pur.PublicAPI.GetSlaveTxn',
-    index=21,
+    index=24,
     containing_service=None,
     input_type=_SLAVETXNREQ,
     output_type=_TRANSFERCOINSRESP,
@@ -8468,7 +9209,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetLatticeTxn',
     full_name='pur.PublicAPI.GetLatticeTxn',
-    index=22,
+    index=25,
     containing_service=None,
     input_type=_LATTICETXNREQ,
     output_type=_TRANSFERCOINSRESP,
@@ -8477,7 +9218,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTransaction',
     full_name='pur.PublicAPI.GetTransaction',
-    index=23,
+    index=26,
     containing_service=None,
     input_type=_GETTRANSACTIONREQ,
     output_type=_GETTRANSACTIONRESP,
@@ -8486,7 +9227,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetMiniTransactionsByAddress',
     full_name='pur.PublicAPI.GetMiniTransactionsByAddress',
-    index=24,
+    index=27,
     containing_service=None,
     input_type=_GETMINITRANSACTIONSBYADDRESSREQ,
     output_type=_GETMINITRANSACTIONSBYADDRESSRESP,
@@ -8495,7 +9236,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTransactionsByAddress',
     full_name='pur.PublicAPI.GetTransactionsByAddress',
-    index=25,
+    index=28,
     containing_service=None,
     input_type=_GETTRANSACTIONSBYADDRESSREQ,
     output_type=_GETTRANSACTIONSBYADDRESSRESP,
@@ -8504,7 +9245,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTokensByAddress',
     full_name='pur.PublicAPI.GetTokensByAddress',
-    index=26,
+    index=29,
     containing_service=None,
     input_type=_GETTRANSACTIONSBYADDRESSREQ,
     output_type=_GETTOKENSBYADDRESSRESP,
@@ -8513,7 +9254,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetSlavesByAddress',
     full_name='pur.PublicAPI.GetSlavesByAddress',
-    index=27,
+    index=30,
     containing_service=None,
     input_type=_GETTRANSACTIONSBYADDRESSREQ,
     output_type=_GETSLAVESBYADDRESSRESP,
@@ -8522,7 +9263,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetLatticePKsByAddress',
     full_name='pur.PublicAPI.GetLatticePKsByAddress',
-    index=28,
+    index=31,
     containing_service=None,
     input_type=_GETTRANSACTIONSBYADDRESSREQ,
     output_type=_GETLATTICEPKSBYADDRESSRESP,
@@ -8531,7 +9272,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetMultiSigAddressesByAddress',
     full_name='pur.PublicAPI.GetMultiSigAddressesByAddress',
-    index=29,
+    index=32,
     containing_service=None,
     input_type=_GETTRANSACTIONSBYADDRESSREQ,
     output_type=_GETMULTISIGADDRESSESBYADDRESSRESP,
@@ -8540,7 +9281,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetMultiSigSpendTxsByAddress',
     full_name='pur.PublicAPI.GetMultiSigSpendTxsByAddress',
-    index=30,
+    index=33,
     containing_service=None,
     input_type=_GETMULTISIGSPENDTXSBYADDRESSREQ,
     output_type=_GETMULTISIGSPENDTXSBYADDRESSRESP,
@@ -8549,7 +9290,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetVoteStats',
     full_name='pur.PublicAPI.GetVoteStats',
-    index=31,
+    index=34,
     containing_service=None,
     input_type=_GETVOTESTATSREQ,
     output_type=_GETVOTESTATSRESP,
@@ -8558,7 +9299,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetInbopuressagesByAddress',
     full_name='pur.PublicAPI.GetInbopuressagesByAddress',
-    index=32,
+    index=35,
     containing_service=None,
     input_type=_GETTRANSACTIONSBYADDRESSREQ,
     output_type=_GETINBOpurESSAGESBYADDRESSRESP,
@@ -8567,7 +9308,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetBalance',
     full_name='pur.PublicAPI.GetBalance',
-    index=33,
+    index=36,
     containing_service=None,
     input_type=_GETBALANCEREQ,
     output_type=_GETBALANCERESP,
@@ -8576,7 +9317,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTotalBalance',
     full_name='pur.PublicAPI.GetTotalBalance',
-    index=34,
+    index=37,
     containing_service=None,
     input_type=_GETTOTALBALANCEREQ,
     output_type=_GETTOTALBALANCERESP,
@@ -8585,7 +9326,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetOTS',
     full_name='pur.PublicAPI.GetOTS',
-    index=35,
+    index=38,
     containing_service=None,
     input_type=_GETOTSREQ,
     output_type=_GETOTSRESP,
@@ -8594,7 +9335,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetHeight',
     full_name='pur.PublicAPI.GetHeight',
-    index=36,
+    index=39,
     containing_service=None,
     input_type=_GETHEIGHTREQ,
     output_type=_GETHEIGHTRESP,
@@ -8603,7 +9344,7 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetBlock',
     full_name='pur.PublicAPI.GetBlock',
-    index=37,
+    index=40,
     containing_service=None,
     input_type=_GETBLOCKREQ,
     output_type=_GETBLOCKRESP,
@@ -8612,12 +9353,39 @@ _PUBLICAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetBlockByNumber',
     full_name='pur.PublicAPI.GetBlockByNumber',
-    index=38,
+    index=41,
     containing_service=None,
     input_type=_GETBLOCKBYNUMBERREQ,
     output_type=_GETBLOCKBYNUMBERRESP,
     options=_descriptor._ParseOptions(descriptor_pb2.MethodOptions(), _b('\202\323\344\223\002\022\022\020/block-by-number')),
   ),
+  _descriptor.MethodDescriptor(
+    name='SubscribeBlocks',
+    full_name='pur.PublicAPI.SubscribeBlocks',
+    index=42,
+    containing_service=None,
+    input_type=_SUBSCRIBEBLOCKSREQ,
+    output_type=_SUBSCRIBEBLOCKSRESP,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='SubscribeMempool',
+    full_name='pur.PublicAPI.SubscribeMempool',
+    index=43,
+    containing_service=None,
+    input_type=_SUBSCRIBEMEMPOOLREQ,
+    output_type=_SUBSCRIBEMEMPOOLRESP,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='SubscribeAddresses',
+    full_name='pur.PublicAPI.SubscribeAddresses',
+    index=44,
+    containing_service=None,
+    input_type=_SUBSCRIBEADDRESSESREQ,
+    output_type=_SUBSCRIBEADDRESSESRESP,
+    options=None,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_PUBLICAPI)
 
@@ -8630,8 +9398,8 @@ _ADMINAPI = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=1,
   options=None,
-  serialized_start=19219,
-  serialized_end=19229,
+  serialized_start=21003,
+  serialized_end=21013,
   methods=[
 ])
 _sym_db.RegisterServiceDescriptor(_ADMINAPI)
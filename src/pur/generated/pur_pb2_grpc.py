@@ -52,6 +52,11 @@ class PublicAPIStub(object):
         request_serializer=pur__pb2.GetAddressStateReq.SerializeToString,
         response_deserializer=pur__pb2.GetOptimizedAddressStateResp.FromString,
         )
+    self.GetAddressStates = channel.unary_unary(
+        '/pur.PublicAPI/GetAddressStates',
+        request_serializer=pur__pb2.GetAddressStatesReq.SerializeToString,
+        response_deserializer=pur__pb2.GetAddressStatesResp.FromString,
+        )
     self.GetMultiSigAddressState = channel.unary_unary(
         '/pur.PublicAPI/GetMultiSigAddressState',
         request_serializer=pur__pb2.GetMultiSigAddressStateReq.SerializeToString,
@@ -62,6 +67,11 @@ class PublicAPIStub(object):
         request_serializer=pur__pb2.IsSlaveReq.SerializeToString,
         response_deserializer=pur__pb2.IsSlaveResp.FromString,
         )
+    self.GetSlavesState = channel.unary_unary(
+        '/pur.PublicAPI/GetSlavesState',
+        request_serializer=pur__pb2.GetSlavesStateReq.SerializeToString,
+        response_deserializer=pur__pb2.GetSlavesStateResp.FromString,
+        )
     self.GetObject = channel.unary_unary(
         '/pur.PublicAPI/GetObject',
         request_serializer=pur__pb2.GetObjectReq.SerializeToString,
@@ -77,6 +87,11 @@ class PublicAPIStub(object):
         request_serializer=pur__pb2.PushTransactionReq.SerializeToString,
         response_deserializer=pur__pb2.PushTransactionResp.FromString,
         )
+    self.PushTransactions = channel.unary_unary(
+        '/pur.PublicAPI/PushTransactions',
+        request_serializer=pur__pb2.PushTransactionsReq.SerializeToString,
+        response_deserializer=pur__pb2.PushTransactionsResp.FromString,
+        )
     self.TransferCoins = channel.unary_unary(
         '/pur.PublicAPI/TransferCoins',
         request_serializer=pur__pb2.TransferCoinsReq.SerializeToString,
@@ -217,6 +232,21 @@ class PublicAPIStub(object):
         request_serializer=pur__pb2.GetBlockByNumberReq.SerializeToString,
         response_deserializer=pur__pb2.GetBlockByNumberResp.FromString,
         )
+    self.SubscribeBlocks = channel.unary_stream(
+        '/pur.PublicAPI/SubscribeBlocks',
+        request_serializer=pur__pb2.SubscribeBlocksReq.SerializeToString,
+        response_deserializer=pur__pb2.SubscribeBlocksResp.FromString,
+        )
+    self.SubscribeMempool = channel.unary_stream(
+        '/pur.PublicAPI/SubscribeMempool',
+        request_serializer=pur__pb2.SubscribeMempoolReq.SerializeToString,
+        response_deserializer=pur__pb2.SubscribeMempoolResp.FromString,
+        )
+    self.SubscribeAddresses = channel.unary_stream(
+        '/pur.PublicAPI/SubscribeAddresses',
+        request_serializer=pur__pb2.SubscribeAddressesReq.SerializeToString,
+        response_deserializer=pur__pb2.SubscribeAddressesResp.FromString,
+        )
 
 
 class PublicAPIServicer(object):
@@ -267,6 +297,12 @@ class PublicAPIServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def GetAddressStates(self, request, context):
+    # missing associated documentation comment in .proto file
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def GetMultiSigAddressState(self, request, context):
     # missing associated documentation comment in .proto file
     context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -279,6 +315,12 @@ class PublicAPIServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def GetSlavesState(self, request, context):
+    # missing associated documentation comment in .proto file
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def GetObject(self, request, context):
     # missing associated documentation comment in .proto file
     context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -297,6 +339,12 @@ class PublicAPIServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def PushTransactions(self, request, context):
+    # missing associated documentation comment in .proto file
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def TransferCoins(self, request, context):
     # missing associated documentation comment in .proto file
     context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -465,6 +513,25 @@ class PublicAPIServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def SubscribeBlocks(self, request, context):
+    """Server streams, until the client cancels or does not keep up with the events
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def SubscribeMempool(self, request, context):
+    # missing associated documentation comment in .proto file
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def SubscribeAddresses(self, request, context):
+    # missing associated documentation comment in .proto file
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
 
 def add_PublicAPIServicer_to_server(servicer, server):
   rpc_method_handlers = {
@@ -498,6 +565,11 @@ def add_PublicAPIServicer_to_server(servicer, server):
           request_deserializer=pur__pb2.GetAddressStateReq.FromString,
           response_serializer=pur__pb2.GetOptimizedAddressStateResp.SerializeToString,
       ),
+      'GetAddressStates': grpc.unary_unary_rpc_method_handler(
+          servicer.GetAddressStates,
+          request_deserializer=pur__pb2.GetAddressStatesReq.FromString,
+          response_serializer=pur__pb2.GetAddressStatesResp.SerializeToString,
+      ),
       'GetMultiSigAddressState': grpc.unary_unary_rpc_method_handler(
           servicer.GetMultiSigAddressState,
           request_deserializer=pur__pb2.GetMultiSigAddressStateReq.FromString,
@@ -508,6 +580,11 @@ def add_PublicAPIServicer_to_server(servicer, server):
           request_deserializer=pur__pb2.IsSlaveReq.FromString,
           response_serializer=pur__pb2.IsSlaveResp.SerializeToString,
       ),
+      'GetSlavesState': grpc.unary_unary_rpc_method_handler(
+          servicer.GetSlavesState,
+          request_deserializer=pur__pb2.GetSlavesStateReq.FromString,
+          response_serializer=pur__pb2.GetSlavesStateResp.SerializeToString,
+      ),
       'GetObject': grpc.unary_unary_rpc_method_handler(
           servicer.GetObject,
           request_deserializer=pur__pb2.GetObjectReq.FromString,
@@ -523,6 +600,11 @@ def add_PublicAPIServicer_to_server(servicer, server):
           request_deserializer=pur__pb2.PushTransactionReq.FromString,
           response_serializer=pur__pb2.PushTransactionResp.SerializeToString,
       ),
+      'PushTransactions': grpc.unary_unary_rpc_method_handler(
+          servicer.PushTransactions,
+          request_deserializer=pur__pb2.PushTransactionsReq.FromString,
+          response_serializer=pur__pb2.PushTransactionsResp.SerializeToString,
+      ),
       'TransferCoins': grpc.unary_unary_rpc_method_handler(
           servicer.TransferCoins,
           request_deserializer=pur__pb2.TransferCoinsReq.FromString,
@@ -663,6 +745,21 @@ def add_PublicAPIServicer_to_server(servicer, server):
           request_deserializer=pur__pb2.GetBlockByNumberReq.FromString,
           response_serializer=pur__pb2.GetBlockByNumberResp.SerializeToString,
       ),
+      'SubscribeBlocks': grpc.unary_stream_rpc_method_handler(
+          servicer.SubscribeBlocks,
+          request_deserializer=pur__pb2.SubscribeBlocksReq.FromString,
+          response_serializer=pur__pb2.SubscribeBlocksResp.SerializeToString,
+      ),
+      'SubscribeMempool': grpc.unary_stream_rpc_method_handler(
+          servicer.SubscribeMempool,
+          request_deserializer=pur__pb2.SubscribeMempoolReq.FromString,
+          response_serializer=pur__pb2.SubscribeMempoolResp.SerializeToString,
+      ),
+      'SubscribeAddresses': grpc.unary_stream_rpc_method_handler(
+          servicer.SubscribeAddresses,
+          request_deserializer=pur__pb2.SubscribeAddressesReq.FromString,
+          response_serializer=pur__pb2.SubscribeAddressesResp.SerializeToString,
+      ),
   }
   generic_handler = grpc.method_handlers_generic_handler(
       'pur.PublicAPI', rpc_method_handlers)
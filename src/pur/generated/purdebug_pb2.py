@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='purdebug.proto',
   package='pur',
   syntax='proto3',
-  serialized_pb=_b('\n\x0epurdebug.proto\x12\x03pur\x1a\tpur.proto\"\x11\n\x0fGetFullStateReq\"i\n\x10GetFullStateResp\x12)\n\x0e\x63oinbase_state\x18\x01 \x01(\x0b\x32\x11.pur.AddressState\x12*\n\x0f\x61\x64\x64resses_state\x18\x02 \x03(\x0b\x32\x11.pur.AddressState2G\n\x08\x44\x65\x62ugAPI\x12;\n\x0cGetFullState\x12\x14.pur.GetFullStateReq\x1a\x15.pur.GetFullStateRespb\x06proto3')
+  serialized_pb=_b('\n\x0epurdebug.proto\x12\x03pur\x1a\tpur.proto\"\x11\n\x0fGetFullStateReq\"i\n\x10GetFullStateResp\x12)\n\x0e\x63oinbase_state\x18\x01 \x01(\x0b\x32\x11.pur.AddressState\x12*\n\x0f\x61\x64\x64resses_state\x18\x02 \x03(\x0b\x32\x11.pur.AddressState\"/\n\x15GetFullStateStreamReq\x12\x16\n\x0emax_chunk_size\x18\x01 \x01(\x04\"M\n\x16GetFullStateStreamResp\x12\x33\n\x0f\x61\x64\x64resses_state\x18\x01 \x03(\x0b\x32\x1a.pur.OptimizedAddressState2\x98\x01\n\x08\x44\x65\x62ugAPI\x12;\n\x0cGetFullState\x12\x14.pur.GetFullStateReq\x1a\x15.pur.GetFullStateResp\x12O\n\x12GetFullStateStream\x12\x1a.pur.GetFullStateStreamReq\x1a\x1b.pur.GetFullStateStreamResp0\x01\x62\x06proto3')
   ,
   dependencies=[pur__pb2.DESCRIPTOR,])
 
@@ -88,10 +88,75 @@ _GETFULLSTATERESP = _descriptor.Descriptor(
   serialized_end=158,
 )
 
+
+_GETFULLSTATESTREAMREQ = _descriptor.Descriptor(
+  name='GetFullStateStreamReq',
+  full_name='pur.GetFullStateStreamReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='max_chunk_size', full_name='pur.GetFullStateStreamReq.max_chunk_size', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=160,
+  serialized_end=207,
+)
+
+
+_GETFULLSTATESTREAMRESP = _descriptor.Descriptor(
+  name='GetFullStateStreamResp',
+  full_name='pur.GetFullStateStreamResp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='addresses_state', full_name='pur.GetFullStateStreamResp.addresses_state', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=209,
+  serialized_end=286,
+)
+
 _GETFULLSTATERESP.fields_by_name['coinbase_state'].message_type = pur__pb2._ADDRESSSTATE
 _GETFULLSTATERESP.fields_by_name['addresses_state'].message_type = pur__pb2._ADDRESSSTATE
+_GETFULLSTATESTREAMRESP.fields_by_name['addresses_state'].message_type = pur__pb2._OPTIMIZEDADDRESSSTATE
 DESCRIPTOR.message_types_by_name['GetFullStateReq'] = _GETFULLSTATEREQ
 DESCRIPTOR.message_types_by_name['GetFullStateResp'] = _GETFULLSTATERESP
+DESCRIPTOR.message_types_by_name['GetFullStateStreamReq'] = _GETFULLSTATESTREAMREQ
+DESCRIPTOR.message_types_by_name['GetFullStateStreamResp'] = _GETFULLSTATESTREAMRESP
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 GetFullStateReq = _reflection.GeneratedProtocolMessageType('GetFullStateReq', (_message.Message,), dict(
@@ -108,6 +173,20 @@ GetFullStateResp = _reflection.GeneratedProtocolMessageType('GetFullStateResp',
   ))
 _sym_db.RegisterMessage(GetFullStateResp)
 
+GetFullStateStreamReq = _reflection.GeneratedProtocolMessageType('GetFullStateStreamReq', (_message.Message,), dict(
+  DESCRIPTOR = _GETFULLSTATESTREAMREQ,
+  __module__ = 'purdebug_pb2'
+  # @@protoc_insertion_point(class_scope:pur.GetFullStateStreamReq)
+  ))
+_sym_db.RegisterMessage(GetFullStateStreamReq)
+
+GetFullStateStreamResp = _reflection.GeneratedProtocolMessageType('GetFullStateStreamResp', (_message.Message,), dict(
+  DESCRIPTOR = _GETFULLSTATESTREAMRESP,
+  __module__ = 'purdebug_pb2'
+  # @@protoc_insertion_point(class_scope:pur.GetFullStateStreamResp)
+  ))
+_sym_db.RegisterMessage(GetFullStateStreamResp)
+
 
 
 _DEBUGAPI = _descriptor.ServiceDescriptor(
@@ -116,8 +195,8 @@ _DEBUGAPI = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   options=None,
-  serialized_start=160,
-  serialized_end=231,
+  serialized_start=289,
+  serialized_end=441,
   methods=[
   _descriptor.MethodDescriptor(
     name='GetFullState',
@@ -128,6 +207,15 @@ _DEBUGAPI = _descriptor.ServiceDescriptor(
     output_type=_GETFULLSTATERESP,
     options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='GetFullStateStream',
+    full_name='pur.DebugAPI.GetFullStateStream',
+    index=1,
+    containing_service=None,
+    input_type=_GETFULLSTATESTREAMREQ,
+    output_type=_GETFULLSTATESTREAMRESP,
+    options=None,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_DEBUGAPI)
 
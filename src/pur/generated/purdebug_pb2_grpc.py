@@ -27,6 +27,11 @@ class DebugAPIStub(object):
         request_serializer=purdebug__pb2.GetFullStateReq.SerializeToString,
         response_deserializer=purdebug__pb2.GetFullStateResp.FromString,
         )
+    self.GetFullStateStream = channel.unary_stream(
+        '/pur.DebugAPI/GetFullStateStream',
+        request_serializer=purdebug__pb2.GetFullStateStreamReq.SerializeToString,
+        response_deserializer=purdebug__pb2.GetFullStateStreamResp.FromString,
+        )
 
 
 class DebugAPIServicer(object):
@@ -47,6 +52,13 @@ class DebugAPIServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def GetFullStateStream(self, request, context):
+    """Streams the address states in chunks, read from a snapshot of the state
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
 
 def add_DebugAPIServicer_to_server(servicer, server):
   rpc_method_handlers = {
@@ -55,6 +67,11 @@ def add_DebugAPIServicer_to_server(servicer, server):
           request_deserializer=purdebug__pb2.GetFullStateReq.FromString,
           response_serializer=purdebug__pb2.GetFullStateResp.SerializeToString,
       ),
+      'GetFullStateStream': grpc.unary_stream_rpc_method_handler(
+          servicer.GetFullStateStream,
+          request_deserializer=purdebug__pb2.GetFullStateStreamReq.FromString,
+          response_serializer=purdebug__pb2.GetFullStateStreamResp.SerializeToString,
+      ),
   }
   generic_handler = grpc.method_handlers_generic_handler(
       'pur.DebugAPI', rpc_method_handlers)
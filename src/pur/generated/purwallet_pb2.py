@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='purwallet.proto',
   package='pur',
   syntax='proto3',
-  serialized_pb=_b('\n\x0fpurwallet.proto\x12\x03pur\x1a\tpur.proto\"9\n\x10\x41\x64\x64NewAddressReq\x12\x0e\n\x06height\x18\x01 \x01(\x04\x12\x15\n\rhash_function\x18\x02 \x01(\t\"A\n\x11\x41\x64\x64NewAddressResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\"]\n\x1a\x41\x64\x64NewAddressWithSlavesReq\x12\x0e\n\x06height\x18\x01 \x01(\x04\x12\x18\n\x10number_of_slaves\x18\x02 \x01(\x04\x12\x15\n\rhash_function\x18\x03 \x01(\t\"%\n\x15\x41\x64\x64\x41\x64\x64ressFromSeedReq\x12\x0c\n\x04seed\x18\x01 \x01(\t\"F\n\x16\x41\x64\x64\x41\x64\x64ressFromSeedResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\"\x12\n\x10ListAddressesReq\"C\n\x11ListAddressesResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x11\n\taddresses\x18\x03 \x03(\t\"#\n\x10RemoveAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"0\n\x11RemoveAddressResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"\"\n\x0fValidAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\">\n\x10ValidAddressResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\r\n\x05valid\x18\x03 \x01(\t\"&\n\x10\x45ncryptWalletReq\x12\x12\n\npassphrase\x18\x01 \x01(\t\"0\n\x11\x45ncryptWalletResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"%\n\x0fUnlockWalletReq\x12\x12\n\npassphrase\x18\x01 \x01(\t\"/\n\x10UnlockWalletResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"\x0f\n\rLockWalletReq\"-\n\x0eLockWalletResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"&\n\x13GetRecoverySeedsReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"V\n\x14GetRecoverySeedsResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07hexseed\x18\x03 \x01(\t\x12\x10\n\x08mnemonic\x18\x04 \x01(\t\"\x12\n\x10GetWalletInfoReq\"n\n\x11GetWalletInfoResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\r\x12\x15\n\raddress_count\x18\x04 \x01(\x04\x12\x14\n\x0cis_encrypted\x18\x05 \x01(\x08\"\x8c\x01\n\x13RelayTransferTxnReq\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x01 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x02 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x04\x12\x16\n\x0emaster_address\x18\x04 \x01(\t\x12\x16\n\x0esigner_address\x18\x05 \x01(\t\x12\x11\n\tots_index\x18\x06 \x01(\x04\"h\n\x1aRelayTransferTxnBySlaveReq\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x01 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x02 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x04\x12\x16\n\x0emaster_address\x18\x04 \x01(\t\"u\n\x12RelayMessageTxnReq\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\x02 \x01(\x04\x12\x16\n\x0emaster_address\x18\x03 \x01(\t\x12\x16\n\x0esigner_address\x18\x04 \x01(\t\x12\x11\n\tots_index\x18\x05 \x01(\x04\"Q\n\x19RelayMessageTxnBySlaveReq\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\x02 \x01(\x04\x12\x16\n\x0emaster_address\x18\x03 \x01(\t\"\xc5\x01\n\x10RelayTokenTxnReq\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05owner\x18\x03 \x01(\t\x12\x10\n\x08\x64\x65\x63imals\x18\x04 \x01(\x04\x12\x11\n\taddresses\x18\x05 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x06 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x07 \x01(\x04\x12\x16\n\x0emaster_address\x18\x08 \x01(\t\x12\x16\n\x0esigner_address\x18\t \x01(\t\x12\x11\n\tots_index\x18\n \x01(\x04\"\xa1\x01\n\x17RelayTokenTxnBySlaveReq\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05owner\x18\x03 \x01(\t\x12\x10\n\x08\x64\x65\x63imals\x18\x04 \x01(\x04\x12\x11\n\taddresses\x18\x05 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x06 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x07 \x01(\x04\x12\x16\n\x0emaster_address\x18\x08 \x01(\t\"\xa7\x01\n\x18RelayTransferTokenTxnReq\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x01 \x03(\t\x12\x14\n\x0ctoken_txhash\x18\x02 \x01(\t\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x16\n\x0emaster_address\x18\x05 \x01(\t\x12\x16\n\x0esigner_address\x18\x06 \x01(\t\x12\x11\n\tots_index\x18\x07 \x01(\x04\"\x83\x01\n\x1fRelayTransferTokenTxnBySlaveReq\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x01 \x03(\t\x12\x14\n\x0ctoken_txhash\x18\x02 \x01(\t\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x16\n\x0emaster_address\x18\x05 \x01(\t\"\x8b\x01\n\x10RelaySlaveTxnReq\x12\x11\n\tslave_pks\x18\x01 \x03(\x0c\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x02 \x03(\r\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x04\x12\x16\n\x0emaster_address\x18\x04 \x01(\t\x12\x16\n\x0esigner_address\x18\x05 \x01(\t\x12\x11\n\tots_index\x18\x06 \x01(\x04\"g\n\x17RelaySlaveTxnBySlaveReq\x12\x11\n\tslave_pks\x18\x01 \x03(\x0c\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x02 \x03(\r\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x04\x12\x16\n\x0emaster_address\x18\x04 \x01(\t\"N\n\x0cRelayTxnResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12!\n\x02tx\x18\x03 \x01(\x0b\x32\x15.pur.PlainTransaction\"C\n\x13\x43hangePassphraseReq\x12\x15\n\roldPassphrase\x18\x01 \x01(\t\x12\x15\n\rnewPassphrase\x18\x02 \x01(\t\"3\n\x14\x43hangePassphraseResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"+\n\x18TransactionsByAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"z\n\x19TransactionsByAddressResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12/\n\x11mini_transactions\x18\x03 \x03(\x0b\x32\x14.pur.MiniTransaction\x12\x0f\n\x07\x62\x61lance\x18\x04 \x01(\x04\"!\n\x0eTransactionReq\x12\x0f\n\x07tx_hash\x18\x01 \x01(\t\"\x99\x01\n\x0fTransactionResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12!\n\x02tx\x18\x03 \x01(\x0b\x32\x15.pur.PlainTransaction\x12\x15\n\rconfirmations\x18\x04 \x01(\t\x12\x14\n\x0c\x62lock_number\x18\x05 \x01(\x04\x12\x19\n\x11\x62lock_header_hash\x18\x06 \x01(\t\"\x1d\n\nBalanceReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\";\n\x0b\x42\x61lanceResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x62\x61lance\x18\x03 \x01(\t\"\x11\n\x0fTotalBalanceReq\"@\n\x10TotalBalanceResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x62\x61lance\x18\x03 \x01(\t\"\x19\n\x06OTSReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"\x9b\x01\n\x07OTSResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x34\n\x14ots_bitfield_by_page\x18\x03 \x03(\x0b\x32\x16.pur.OTSBitfieldByPage\x12\x1d\n\x15next_unused_ots_index\x18\x04 \x01(\x04\x12\x1e\n\x16unused_ots_index_found\x18\x05 \x01(\x08\"\x0b\n\tHeightReq\"9\n\nHeightResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0e\n\x06height\x18\x03 \x01(\x04\"\x1f\n\x08\x42lockReq\x12\x13\n\x0bheader_hash\x18\x01 \x01(\t\"H\n\tBlockResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x1e\n\x05\x62lock\x18\x03 \x01(\x0b\x32\x0f.pur.PlainBlock\"(\n\x10\x42lockByNumberReq\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\"\x1e\n\x10\x41\x64\x64ressFromPKReq\x12\n\n\x02pk\x18\x01 \x01(\t\"A\n\x11\x41\x64\x64ressFromPKResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\"\r\n\x0bNodeInfoReq\"\xc1\x01\n\x0cNodeInfoResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\t\x12\x17\n\x0fnum_connections\x18\x04 \x01(\t\x12\x17\n\x0fnum_known_peers\x18\x05 \x01(\t\x12\x0e\n\x06uptime\x18\x06 \x01(\x04\x12\x14\n\x0c\x62lock_height\x18\x07 \x01(\x04\x12\x17\n\x0f\x62lock_last_hash\x18\x08 \x01(\t\x12\x12\n\nnetwork_id\x18\t \x01(\t\"7\n\x13PlainGenesisBalance\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\"5\n\x12PlainAddressAmount\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x04\"\xce\x07\n\x10PlainTransaction\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\x02 \x01(\x04\x12\x12\n\npublic_key\x18\x03 \x01(\t\x12\x11\n\tsignature\x18\x04 \x01(\t\x12\r\n\x05nonce\x18\x05 \x01(\x04\x12\x18\n\x10transaction_hash\x18\x06 \x01(\t\x12\x13\n\x0bsigner_addr\x18\x07 \x01(\t\x12\x32\n\x08transfer\x18\x08 \x01(\x0b\x32\x1e.pur.PlainTransaction.TransferH\x00\x12\x32\n\x08\x63oinbase\x18\t \x01(\x0b\x32\x1e.pur.PlainTransaction.CoinBaseH\x00\x12;\n\tlatticePK\x18\n \x01(\x0b\x32&.pur.PlainTransaction.LatticePublicKeyH\x00\x12\x30\n\x07message\x18\x0b \x01(\x0b\x32\x1d.pur.PlainTransaction.MessageH\x00\x12,\n\x05token\x18\x0c \x01(\x0b\x32\x1b.pur.PlainTransaction.TokenH\x00\x12=\n\x0etransfer_token\x18\r \x01(\x0b\x32#.pur.PlainTransaction.TransferTokenH\x00\x12,\n\x05slave\x18\x0e \x01(\x0b\x32\x1b.pur.PlainTransaction.SlaveH\x00\x1a-\n\x08Transfer\x12\x10\n\x08\x61\x64\x64rs_to\x18\x01 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x02 \x03(\x04\x1a+\n\x08\x43oinBase\x12\x0f\n\x07\x61\x64\x64r_to\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x04\x1a:\n\x10LatticePublicKey\x12\x10\n\x08kyber_pk\x18\x01 \x01(\t\x12\x14\n\x0c\x64ilithium_pk\x18\x02 \x01(\t\x1a\x1f\n\x07Message\x12\x14\n\x0cmessage_hash\x18\x01 \x01(\t\x1ay\n\x05Token\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05owner\x18\x03 \x01(\t\x12\x10\n\x08\x64\x65\x63imals\x18\x04 \x01(\x04\x12\x31\n\x10initial_balances\x18\x05 \x03(\x0b\x32\x17.pur.PlainAddressAmount\x1aH\n\rTransferToken\x12\x14\n\x0ctoken_txhash\x18\x01 \x01(\t\x12\x10\n\x08\x61\x64\x64rs_to\x18\x02 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x1a\x30\n\x05Slave\x12\x11\n\tslave_pks\x18\x01 \x03(\t\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x02 \x03(\rB\x11\n\x0ftransactionType\"\xdc\x01\n\x10PlainBlockHeader\x12\x13\n\x0bhash_header\x18\x01 \x01(\t\x12\x14\n\x0c\x62lock_number\x18\x02 \x01(\x04\x12\x19\n\x11timestamp_seconds\x18\x03 \x01(\x04\x12\x18\n\x10hash_header_prev\x18\x04 \x01(\t\x12\x14\n\x0creward_block\x18\x05 \x01(\x04\x12\x12\n\nreward_fee\x18\x06 \x01(\x04\x12\x13\n\x0bmerkle_root\x18\x07 \x01(\t\x12\x14\n\x0cmining_nonce\x18\x08 \x01(\r\x12\x13\n\x0b\x65xtra_nonce\x18\t \x01(\x04\"\x93\x01\n\nPlainBlock\x12%\n\x06header\x18\x01 \x01(\x0b\x32\x15.pur.PlainBlockHeader\x12+\n\x0ctransactions\x18\x02 \x03(\x0b\x32\x15.pur.PlainTransaction\x12\x31\n\x0fgenesis_balance\x18\x03 \x03(\x0b\x32\x18.pur.PlainGenesisBalance2\xe5\x0f\n\tWalletAPI\x12>\n\rAddNewAddress\x12\x15.pur.AddNewAddressReq\x1a\x16.pur.AddNewAddressResp\x12R\n\x17\x41\x64\x64NewAddressWithSlaves\x12\x1f.pur.AddNewAddressWithSlavesReq\x1a\x16.pur.AddNewAddressResp\x12>\n\rListAddresses\x12\x15.pur.ListAddressesReq\x1a\x16.pur.ListAddressesResp\x12>\n\rRemoveAddress\x12\x15.pur.RemoveAddressReq\x1a\x16.pur.RemoveAddressResp\x12=\n\x0eIsValidAddress\x12\x14.pur.ValidAddressReq\x1a\x15.pur.ValidAddressResp\x12>\n\rEncryptWallet\x12\x15.pur.EncryptWalletReq\x1a\x16.pur.EncryptWalletResp\x12\x35\n\nLockWallet\x12\x12.pur.LockWalletReq\x1a\x13.pur.LockWalletResp\x12;\n\x0cUnlockWallet\x12\x14.pur.UnlockWalletReq\x1a\x15.pur.UnlockWalletResp\x12G\n\x10GetRecoverySeeds\x12\x18.pur.GetRecoverySeedsReq\x1a\x19.pur.GetRecoverySeedsResp\x12>\n\rGetWalletInfo\x12\x15.pur.GetWalletInfoReq\x1a\x16.pur.GetWalletInfoResp\x12?\n\x10RelayTransferTxn\x12\x18.pur.RelayTransferTxnReq\x1a\x11.pur.RelayTxnResp\x12M\n\x17RelayTransferTxnBySlave\x12\x1f.pur.RelayTransferTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12=\n\x0fRelayMessageTxn\x12\x17.pur.RelayMessageTxnReq\x1a\x11.pur.RelayTxnResp\x12K\n\x16RelayMessageTxnBySlave\x12\x1e.pur.RelayMessageTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12\x39\n\rRelayTokenTxn\x12\x15.pur.RelayTokenTxnReq\x1a\x11.pur.RelayTxnResp\x12G\n\x14RelayTokenTxnBySlave\x12\x1c.pur.RelayTokenTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12I\n\x15RelayTransferTokenTxn\x12\x1d.pur.RelayTransferTokenTxnReq\x1a\x11.pur.RelayTxnResp\x12W\n\x1cRelayTransferTokenTxnBySlave\x12$.pur.RelayTransferTokenTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12\x39\n\rRelaySlaveTxn\x12\x15.pur.RelaySlaveTxnReq\x1a\x11.pur.RelayTxnResp\x12G\n\x14RelaySlaveTxnBySlave\x12\x1c.pur.RelaySlaveTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12G\n\x10\x43hangePassphrase\x12\x18.pur.ChangePassphraseReq\x1a\x19.pur.ChangePassphraseResp\x12Y\n\x18GetTransactionsByAddress\x12\x1d.pur.TransactionsByAddressReq\x1a\x1e.pur.TransactionsByAddressResp\x12;\n\x0eGetTransaction\x12\x13.pur.TransactionReq\x1a\x14.pur.TransactionResp\x12/\n\nGetBalance\x12\x0f.pur.BalanceReq\x1a\x10.pur.BalanceResp\x12>\n\x0fGetTotalBalance\x12\x14.pur.TotalBalanceReq\x1a\x15.pur.TotalBalanceResp\x12#\n\x06GetOTS\x12\x0b.pur.OTSReq\x1a\x0c.pur.OTSResp\x12,\n\tGetHeight\x12\x0e.pur.HeightReq\x1a\x0f.pur.HeightResp\x12)\n\x08GetBlock\x12\r.pur.BlockReq\x1a\x0e.pur.BlockResp\x12\x39\n\x10GetBlockByNumber\x12\x15.pur.BlockByNumberReq\x1a\x0e.pur.BlockResp\x12\x41\n\x10GetAddressFromPK\x12\x15.pur.AddressFromPKReq\x1a\x16.pur.AddressFromPKResp\x12\x32\n\x0bGetNodeInfo\x12\x10.pur.NodeInfoReq\x1a\x11.pur.NodeInfoRespb\x06proto3')
+  serialized_pb=_b('\n\x0fpurwallet.proto\x12\x03pur\x1a\tpur.proto\"9\n\x10\x41\x64\x64NewAddressReq\x12\x0e\n\x06height\x18\x01 \x01(\x04\x12\x15\n\rhash_function\x18\x02 \x01(\t\"A\n\x11\x41\x64\x64NewAddressResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\"]\n\x1a\x41\x64\x64NewAddressWithSlavesReq\x12\x0e\n\x06height\x18\x01 \x01(\x04\x12\x18\n\x10number_of_slaves\x18\x02 \x01(\x04\x12\x15\n\rhash_function\x18\x03 \x01(\t\"%\n\x15\x41\x64\x64\x41\x64\x64ressFromSeedReq\x12\x0c\n\x04seed\x18\x01 \x01(\t\"F\n\x16\x41\x64\x64\x41\x64\x64ressFromSeedResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\"\x12\n\x10ListAddressesReq\"C\n\x11ListAddressesResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x11\n\taddresses\x18\x03 \x03(\t\"#\n\x10RemoveAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"0\n\x11RemoveAddressResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"\"\n\x0fValidAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\">\n\x10ValidAddressResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\r\n\x05valid\x18\x03 \x01(\t\"&\n\x10\x45ncryptWalletReq\x12\x12\n\npassphrase\x18\x01 \x01(\t\"0\n\x11\x45ncryptWalletResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"%\n\x0fUnlockWalletReq\x12\x12\n\npassphrase\x18\x01 \x01(\t\"/\n\x10UnlockWalletResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"\x0f\n\rLockWalletReq\"-\n\x0eLockWalletResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"&\n\x13GetRecoverySeedsReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"V\n\x14GetRecoverySeedsResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07hexseed\x18\x03 \x01(\t\x12\x10\n\x08mnemonic\x18\x04 \x01(\t\"\x12\n\x10GetWalletInfoReq\"n\n\x11GetWalletInfoResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\r\x12\x15\n\raddress_count\x18\x04 \x01(\x04\x12\x14\n\x0cis_encrypted\x18\x05 \x01(\x08\"\x8c\x01\n\x13RelayTransferTxnReq\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x01 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x02 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x04\x12\x16\n\x0emaster_address\x18\x04 \x01(\t\x12\x16\n\x0esigner_address\x18\x05 \x01(\t\x12\x11\n\tots_index\x18\x06 \x01(\x04\"h\n\x1aRelayTransferTxnBySlaveReq\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x01 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x02 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x04\x12\x16\n\x0emaster_address\x18\x04 \x01(\t\"u\n\x12RelayMessageTxnReq\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\x02 \x01(\x04\x12\x16\n\x0emaster_address\x18\x03 \x01(\t\x12\x16\n\x0esigner_address\x18\x04 \x01(\t\x12\x11\n\tots_index\x18\x05 \x01(\x04\"Q\n\x19RelayMessageTxnBySlaveReq\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\x02 \x01(\x04\x12\x16\n\x0emaster_address\x18\x03 \x01(\t\"\xc5\x01\n\x10RelayTokenTxnReq\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05owner\x18\x03 \x01(\t\x12\x10\n\x08\x64\x65\x63imals\x18\x04 \x01(\x04\x12\x11\n\taddresses\x18\x05 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x06 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x07 \x01(\x04\x12\x16\n\x0emaster_address\x18\x08 \x01(\t\x12\x16\n\x0esigner_address\x18\t \x01(\t\x12\x11\n\tots_index\x18\n \x01(\x04\"\xa1\x01\n\x17RelayTokenTxnBySlaveReq\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05owner\x18\x03 \x01(\t\x12\x10\n\x08\x64\x65\x63imals\x18\x04 \x01(\x04\x12\x11\n\taddresses\x18\x05 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x06 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x07 \x01(\x04\x12\x16\n\x0emaster_address\x18\x08 \x01(\t\"\xa7\x01\n\x18RelayTransferTokenTxnReq\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x01 \x03(\t\x12\x14\n\x0ctoken_txhash\x18\x02 \x01(\t\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x16\n\x0emaster_address\x18\x05 \x01(\t\x12\x16\n\x0esigner_address\x18\x06 \x01(\t\x12\x11\n\tots_index\x18\x07 \x01(\x04\"\x83\x01\n\x1fRelayTransferTokenTxnBySlaveReq\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x01 \x03(\t\x12\x14\n\x0ctoken_txhash\x18\x02 \x01(\t\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x04 \x01(\x04\x12\x16\n\x0emaster_address\x18\x05 \x01(\t\"\x8b\x01\n\x10RelaySlaveTxnReq\x12\x11\n\tslave_pks\x18\x01 \x03(\x0c\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x02 \x03(\r\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x04\x12\x16\n\x0emaster_address\x18\x04 \x01(\t\x12\x16\n\x0esigner_address\x18\x05 \x01(\t\x12\x11\n\tots_index\x18\x06 \x01(\x04\"g\n\x17RelaySlaveTxnBySlaveReq\x12\x11\n\tslave_pks\x18\x01 \x03(\x0c\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x02 \x03(\r\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x04\x12\x16\n\x0emaster_address\x18\x04 \x01(\t\"N\n\x0cRelayTxnResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12!\n\x02tx\x18\x03 \x01(\x0b\x32\x15.pur.PlainTransaction\"\x97\x01\n\rRelayBatchReq\x12\x16\n\x0emaster_address\x18\x01 \x01(\t\x12.\n\ttransfers\x18\x02 \x03(\x0b\x32\x1b.pur.RelayBatchReq.Transfer\x1a>\n\x08Transfer\x12\x14\n\x0c\x61\x64\x64resses_to\x18\x01 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x02 \x03(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x03 \x01(\x04\"Q\n\x0eRelayBatchResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\"\n\x07results\x18\x03 \x03(\x0b\x32\x11.pur.RelayTxnResp\"C\n\x13\x43hangePassphraseReq\x12\x15\n\roldPassphrase\x18\x01 \x01(\t\x12\x15\n\rnewPassphrase\x18\x02 \x01(\t\"3\n\x14\x43hangePassphraseResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"+\n\x18TransactionsByAddressReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"z\n\x19TransactionsByAddressResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12/\n\x11mini_transactions\x18\x03 \x03(\x0b\x32\x14.pur.MiniTransaction\x12\x0f\n\x07\x62\x61lance\x18\x04 \x01(\x04\"!\n\x0eTransactionReq\x12\x0f\n\x07tx_hash\x18\x01 \x01(\t\"\x99\x01\n\x0fTransactionResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12!\n\x02tx\x18\x03 \x01(\x0b\x32\x15.pur.PlainTransaction\x12\x15\n\rconfirmations\x18\x04 \x01(\t\x12\x14\n\x0c\x62lock_number\x18\x05 \x01(\x04\x12\x19\n\x11\x62lock_header_hash\x18\x06 \x01(\t\"\x1d\n\nBalanceReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\";\n\x0b\x42\x61lanceResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x62\x61lance\x18\x03 \x01(\t\"\x11\n\x0fTotalBalanceReq\"@\n\x10TotalBalanceResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x62\x61lance\x18\x03 \x01(\t\"\x19\n\x06OTSReq\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"\x9b\x01\n\x07OTSResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x34\n\x14ots_bitfield_by_page\x18\x03 \x03(\x0b\x32\x16.pur.OTSBitfieldByPage\x12\x1d\n\x15next_unused_ots_index\x18\x04 \x01(\x04\x12\x1e\n\x16unused_ots_index_found\x18\x05 \x01(\x08\"\x0b\n\tHeightReq\"9\n\nHeightResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0e\n\x06height\x18\x03 \x01(\x04\"\x1f\n\x08\x42lockReq\x12\x13\n\x0bheader_hash\x18\x01 \x01(\t\"H\n\tBlockResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x1e\n\x05\x62lock\x18\x03 \x01(\x0b\x32\x0f.pur.PlainBlock\"(\n\x10\x42lockByNumberReq\x12\x14\n\x0c\x62lock_number\x18\x01 \x01(\x04\"\x1e\n\x10\x41\x64\x64ressFromPKReq\x12\n\n\x02pk\x18\x01 \x01(\t\"A\n\x11\x41\x64\x64ressFromPKResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\"\r\n\x0bNodeInfoReq\"\xc1\x01\n\x0cNodeInfoResp\x12\x0c\n\x04\x63ode\x18\x01 \x01(\r\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\t\x12\x17\n\x0fnum_connections\x18\x04 \x01(\t\x12\x17\n\x0fnum_known_peers\x18\x05 \x01(\t\x12\x0e\n\x06uptime\x18\x06 \x01(\x04\x12\x14\n\x0c\x62lock_height\x18\x07 \x01(\x04\x12\x17\n\x0f\x62lock_last_hash\x18\x08 \x01(\t\x12\x12\n\nnetwork_id\x18\t \x01(\t\"7\n\x13PlainGenesisBalance\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0f\n\x07\x62\x61lance\x18\x02 \x01(\x04\"5\n\x12PlainAddressAmount\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x04\"\xce\x07\n\x10PlainTransaction\x12\x13\n\x0bmaster_addr\x18\x01 \x01(\t\x12\x0b\n\x03\x66\x65\x65\x18\x02 \x01(\x04\x12\x12\n\npublic_key\x18\x03 \x01(\t\x12\x11\n\tsignature\x18\x04 \x01(\t\x12\r\n\x05nonce\x18\x05 \x01(\x04\x12\x18\n\x10transaction_hash\x18\x06 \x01(\t\x12\x13\n\x0bsigner_addr\x18\x07 \x01(\t\x12\x32\n\x08transfer\x18\x08 \x01(\x0b\x32\x1e.pur.PlainTransaction.TransferH\x00\x12\x32\n\x08\x63oinbase\x18\t \x01(\x0b\x32\x1e.pur.PlainTransaction.CoinBaseH\x00\x12;\n\tlatticePK\x18\n \x01(\x0b\x32&.pur.PlainTransaction.LatticePublicKeyH\x00\x12\x30\n\x07message\x18\x0b \x01(\x0b\x32\x1d.pur.PlainTransaction.MessageH\x00\x12,\n\x05token\x18\x0c \x01(\x0b\x32\x1b.pur.PlainTransaction.TokenH\x00\x12=\n\x0etransfer_token\x18\r \x01(\x0b\x32#.pur.PlainTransaction.TransferTokenH\x00\x12,\n\x05slave\x18\x0e \x01(\x0b\x32\x1b.pur.PlainTransaction.SlaveH\x00\x1a-\n\x08Transfer\x12\x10\n\x08\x61\x64\x64rs_to\x18\x01 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x02 \x03(\x04\x1a+\n\x08\x43oinBase\x12\x0f\n\x07\x61\x64\x64r_to\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x04\x1a:\n\x10LatticePublicKey\x12\x10\n\x08kyber_pk\x18\x01 \x01(\t\x12\x14\n\x0c\x64ilithium_pk\x18\x02 \x01(\t\x1a\x1f\n\x07Message\x12\x14\n\x0cmessage_hash\x18\x01 \x01(\t\x1ay\n\x05Token\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05owner\x18\x03 \x01(\t\x12\x10\n\x08\x64\x65\x63imals\x18\x04 \x01(\x04\x12\x31\n\x10initial_balances\x18\x05 \x03(\x0b\x32\x17.pur.PlainAddressAmount\x1aH\n\rTransferToken\x12\x14\n\x0ctoken_txhash\x18\x01 \x01(\t\x12\x10\n\x08\x61\x64\x64rs_to\x18\x02 \x03(\t\x12\x0f\n\x07\x61mounts\x18\x03 \x03(\x04\x1a\x30\n\x05Slave\x12\x11\n\tslave_pks\x18\x01 \x03(\t\x12\x14\n\x0c\x61\x63\x63\x65ss_types\x18\x02 \x03(\rB\x11\n\x0ftransactionType\"\xdc\x01\n\x10PlainBlockHeader\x12\x13\n\x0bhash_header\x18\x01 \x01(\t\x12\x14\n\x0c\x62lock_number\x18\x02 \x01(\x04\x12\x19\n\x11timestamp_seconds\x18\x03 \x01(\x04\x12\x18\n\x10hash_header_prev\x18\x04 \x01(\t\x12\x14\n\x0creward_block\x18\x05 \x01(\x04\x12\x12\n\nreward_fee\x18\x06 \x01(\x04\x12\x13\n\x0bmerkle_root\x18\x07 \x01(\t\x12\x14\n\x0cmining_nonce\x18\x08 \x01(\r\x12\x13\n\x0b\x65xtra_nonce\x18\t \x01(\x04\"\x93\x01\n\nPlainBlock\x12%\n\x06header\x18\x01 \x01(\x0b\x32\x15.pur.PlainBlockHeader\x12+\n\x0ctransactions\x18\x02 \x03(\x0b\x32\x15.pur.PlainTransaction\x12\x31\n\x0fgenesis_balance\x18\x03 \x03(\x0b\x32\x18.pur.PlainGenesisBalance2\x9c\x10\n\tWalletAPI\x12>\n\rAddNewAddress\x12\x15.pur.AddNewAddressReq\x1a\x16.pur.AddNewAddressResp\x12R\n\x17\x41\x64\x64NewAddressWithSlaves\x12\x1f.pur.AddNewAddressWithSlavesReq\x1a\x16.pur.AddNewAddressResp\x12>\n\rListAddresses\x12\x15.pur.ListAddressesReq\x1a\x16.pur.ListAddressesResp\x12>\n\rRemoveAddress\x12\x15.pur.RemoveAddressReq\x1a\x16.pur.RemoveAddressResp\x12=\n\x0eIsValidAddress\x12\x14.pur.ValidAddressReq\x1a\x15.pur.ValidAddressResp\x12>\n\rEncryptWallet\x12\x15.pur.EncryptWalletReq\x1a\x16.pur.EncryptWalletResp\x12\x35\n\nLockWallet\x12\x12.pur.LockWalletReq\x1a\x13.pur.LockWalletResp\x12;\n\x0cUnlockWallet\x12\x14.pur.UnlockWalletReq\x1a\x15.pur.UnlockWalletResp\x12G\n\x10GetRecoverySeeds\x12\x18.pur.GetRecoverySeedsReq\x1a\x19.pur.GetRecoverySeedsResp\x12>\n\rGetWalletInfo\x12\x15.pur.GetWalletInfoReq\x1a\x16.pur.GetWalletInfoResp\x12?\n\x10RelayTransferTxn\x12\x18.pur.RelayTransferTxnReq\x1a\x11.pur.RelayTxnResp\x12M\n\x17RelayTransferTxnBySlave\x12\x1f.pur.RelayTransferTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12=\n\x0fRelayMessageTxn\x12\x17.pur.RelayMessageTxnReq\x1a\x11.pur.RelayTxnResp\x12K\n\x16RelayMessageTxnBySlave\x12\x1e.pur.RelayMessageTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12\x39\n\rRelayTokenTxn\x12\x15.pur.RelayTokenTxnReq\x1a\x11.pur.RelayTxnResp\x12G\n\x14RelayTokenTxnBySlave\x12\x1c.pur.RelayTokenTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12I\n\x15RelayTransferTokenTxn\x12\x1d.pur.RelayTransferTokenTxnReq\x1a\x11.pur.RelayTxnResp\x12W\n\x1cRelayTransferTokenTxnBySlave\x12$.pur.RelayTransferTokenTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12\x39\n\rRelaySlaveTxn\x12\x15.pur.RelaySlaveTxnReq\x1a\x11.pur.RelayTxnResp\x12G\n\x14RelaySlaveTxnBySlave\x12\x1c.pur.RelaySlaveTxnBySlaveReq\x1a\x11.pur.RelayTxnResp\x12\x35\n\nRelayBatch\x12\x12.pur.RelayBatchReq\x1a\x13.pur.RelayBatchResp\x12G\n\x10\x43hangePassphrase\x12\x18.pur.ChangePassphraseReq\x1a\x19.pur.ChangePassphraseResp\x12Y\n\x18GetTransactionsByAddress\x12\x1d.pur.TransactionsByAddressReq\x1a\x1e.pur.TransactionsByAddressResp\x12;\n\x0eGetTransaction\x12\x13.pur.TransactionReq\x1a\x14.pur.TransactionResp\x12/\n\nGetBalance\x12\x0f.pur.BalanceReq\x1a\x10.pur.BalanceResp\x12>\n\x0fGetTotalBalance\x12\x14.pur.TotalBalanceReq\x1a\x15.pur.TotalBalanceResp\x12#\n\x06GetOTS\x12\x0b.pur.OTSReq\x1a\x0c.pur.OTSResp\x12,\n\tGetHeight\x12\x0e.pur.HeightReq\x1a\x0f.pur.HeightResp\x12)\n\x08GetBlock\x12\r.pur.BlockReq\x1a\x0e.pur.BlockResp\x12\x39\n\x10GetBlockByNumber\x12\x15.pur.BlockByNumberReq\x1a\x0e.pur.BlockResp\x12\x41\n\x10GetAddressFromPK\x12\x15.pur.AddressFromPKReq\x1a\x16.pur.AddressFromPKResp\x12\x32\n\x0bGetNodeInfo\x12\x10.pur.NodeInfoReq\x1a\x11.pur.NodeInfoRespb\x06proto3')
   ,
   dependencies=[pur__pb2.DESCRIPTOR,])
 
@@ -1502,6 +1502,133 @@ _RELAYTXNRESP = _descriptor.Descriptor(
 )
 
 
+_RELAYBATCHREQ_TRANSFER = _descriptor.Descriptor(
+  name='Transfer',
+  full_name='pur.RelayBatchReq.Transfer',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='addresses_to', full_name='pur.RelayBatchReq.Transfer.addresses_to', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='amounts', full_name='pur.RelayBatchReq.Transfer.amounts', index=1,
+      number=2, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fee', full_name='pur.RelayBatchReq.Transfer.fee', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2681,
+  serialized_end=2743,
+)
+
+_RELAYBATCHREQ = _descriptor.Descriptor(
+  name='RelayBatchReq',
+  full_name='pur.RelayBatchReq',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='master_address', full_name='pur.RelayBatchReq.master_address', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='transfers', full_name='pur.RelayBatchReq.transfers', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_RELAYBATCHREQ_TRANSFER, ],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2592,
+  serialized_end=2743,
+)
+
+
+_RELAYBATCHRESP = _descriptor.Descriptor(
+  name='RelayBatchResp',
+  full_name='pur.RelayBatchResp',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='code', full_name='pur.RelayBatchResp.code', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='pur.RelayBatchResp.error', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='results', full_name='pur.RelayBatchResp.results', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2745,
+  serialized_end=2826,
+)
+
+
 _CHANGEPASSPHRASEREQ = _descriptor.Descriptor(
   name='ChangePassphraseReq',
   full_name='pur.ChangePassphraseReq',
@@ -1535,8 +1662,8 @@ _CHANGEPASSPHRASEREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2591,
-  serialized_end=2658,
+  serialized_start=2828,
+  serialized_end=2895,
 )
 
 
@@ -1573,8 +1700,8 @@ _CHANGEPASSPHRASERESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2660,
-  serialized_end=2711,
+  serialized_start=2897,
+  serialized_end=2948,
 )
 
 
@@ -1604,8 +1731,8 @@ _TRANSACTIONSBYADDRESSREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2713,
-  serialized_end=2756,
+  serialized_start=2950,
+  serialized_end=2993,
 )
 
 
@@ -1656,8 +1783,8 @@ _TRANSACTIONSBYADDRESSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2758,
-  serialized_end=2880,
+  serialized_start=2995,
+  serialized_end=3117,
 )
 
 
@@ -1687,8 +1814,8 @@ _TRANSACTIONREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2882,
-  serialized_end=2915,
+  serialized_start=3119,
+  serialized_end=3152,
 )
 
 
@@ -1753,8 +1880,8 @@ _TRANSACTIONRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2918,
-  serialized_end=3071,
+  serialized_start=3155,
+  serialized_end=3308,
 )
 
 
@@ -1784,8 +1911,8 @@ _BALANCEREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3073,
-  serialized_end=3102,
+  serialized_start=3310,
+  serialized_end=3339,
 )
 
 
@@ -1829,8 +1956,8 @@ _BALANCERESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3104,
-  serialized_end=3163,
+  serialized_start=3341,
+  serialized_end=3400,
 )
 
 
@@ -1853,8 +1980,8 @@ _TOTALBALANCEREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3165,
-  serialized_end=3182,
+  serialized_start=3402,
+  serialized_end=3419,
 )
 
 
@@ -1898,8 +2025,8 @@ _TOTALBALANCERESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3184,
-  serialized_end=3248,
+  serialized_start=3421,
+  serialized_end=3485,
 )
 
 
@@ -1929,8 +2056,8 @@ _OTSREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3250,
-  serialized_end=3275,
+  serialized_start=3487,
+  serialized_end=3512,
 )
 
 
@@ -1988,8 +2115,8 @@ _OTSRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3278,
-  serialized_end=3433,
+  serialized_start=3515,
+  serialized_end=3670,
 )
 
 
@@ -2012,8 +2139,8 @@ _HEIGHTREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3435,
-  serialized_end=3446,
+  serialized_start=3672,
+  serialized_end=3683,
 )
 
 
@@ -2057,8 +2184,8 @@ _HEIGHTRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3448,
-  serialized_end=3505,
+  serialized_start=3685,
+  serialized_end=3742,
 )
 
 
@@ -2088,8 +2215,8 @@ _BLOCKREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3507,
-  serialized_end=3538,
+  serialized_start=3744,
+  serialized_end=3775,
 )
 
 
@@ -2133,8 +2260,8 @@ _BLOCKRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3540,
-  serialized_end=3612,
+  serialized_start=3777,
+  serialized_end=3849,
 )
 
 
@@ -2164,8 +2291,8 @@ _BLOCKBYNUMBERREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3614,
-  serialized_end=3654,
+  serialized_start=3851,
+  serialized_end=3891,
 )
 
 
@@ -2195,8 +2322,8 @@ _ADDRESSFROMPKREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3656,
-  serialized_end=3686,
+  serialized_start=3893,
+  serialized_end=3923,
 )
 
 
@@ -2240,8 +2367,8 @@ _ADDRESSFROMPKRESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3688,
-  serialized_end=3753,
+  serialized_start=3925,
+  serialized_end=3990,
 )
 
 
@@ -2264,8 +2391,8 @@ _NODEINFOREQ = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3755,
-  serialized_end=3768,
+  serialized_start=3992,
+  serialized_end=4005,
 )
 
 
@@ -2351,8 +2478,8 @@ _NODEINFORESP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3771,
-  serialized_end=3964,
+  serialized_start=4008,
+  serialized_end=4201,
 )
 
 
@@ -2389,8 +2516,8 @@ _PLAINGENESISBALANCE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3966,
-  serialized_end=4021,
+  serialized_start=4203,
+  serialized_end=4258,
 )
 
 
@@ -2427,8 +2554,8 @@ _PLAINADDRESSAMOUNT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4023,
-  serialized_end=4076,
+  serialized_start=4260,
+  serialized_end=4313,
 )
 
 
@@ -2465,8 +2592,8 @@ _PLAINTRANSACTION_TRANSFER = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4604,
-  serialized_end=4649,
+  serialized_start=4841,
+  serialized_end=4886,
 )
 
 _PLAINTRANSACTION_COINBASE = _descriptor.Descriptor(
@@ -2502,8 +2629,8 @@ _PLAINTRANSACTION_COINBASE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4651,
-  serialized_end=4694,
+  serialized_start=4888,
+  serialized_end=4931,
 )
 
 _PLAINTRANSACTION_LATTICEPUBLICKEY = _descriptor.Descriptor(
@@ -2539,8 +2666,8 @@ _PLAINTRANSACTION_LATTICEPUBLICKEY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4696,
-  serialized_end=4754,
+  serialized_start=4933,
+  serialized_end=4991,
 )
 
 _PLAINTRANSACTION_MESSAGE = _descriptor.Descriptor(
@@ -2569,8 +2696,8 @@ _PLAINTRANSACTION_MESSAGE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4756,
-  serialized_end=4787,
+  serialized_start=4993,
+  serialized_end=5024,
 )
 
 _PLAINTRANSACTION_TOKEN = _descriptor.Descriptor(
@@ -2627,8 +2754,8 @@ _PLAINTRANSACTION_TOKEN = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4789,
-  serialized_end=4910,
+  serialized_start=5026,
+  serialized_end=5147,
 )
 
 _PLAINTRANSACTION_TRANSFERTOKEN = _descriptor.Descriptor(
@@ -2671,8 +2798,8 @@ _PLAINTRANSACTION_TRANSFERTOKEN = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4912,
-  serialized_end=4984,
+  serialized_start=5149,
+  serialized_end=5221,
 )
 
 _PLAINTRANSACTION_SLAVE = _descriptor.Descriptor(
@@ -2708,8 +2835,8 @@ _PLAINTRANSACTION_SLAVE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4986,
-  serialized_end=5034,
+  serialized_start=5223,
+  serialized_end=5271,
 )
 
 _PLAINTRANSACTION = _descriptor.Descriptor(
@@ -2832,8 +2959,8 @@ _PLAINTRANSACTION = _descriptor.Descriptor(
       name='transactionType', full_name='pur.PlainTransaction.transactionType',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=4079,
-  serialized_end=5053,
+  serialized_start=4316,
+  serialized_end=5290,
 )
 
 
@@ -2919,8 +3046,8 @@ _PLAINBLOCKHEADER = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5056,
-  serialized_end=5276,
+  serialized_start=5293,
+  serialized_end=5513,
 )
 
 
@@ -2964,11 +3091,14 @@ _PLAINBLOCK = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=5279,
-  serialized_end=5426,
+  serialized_start=5516,
+  serialized_end=5663,
 )
 
 _RELAYTXNRESP.fields_by_name['tx'].message_type = _PLAINTRANSACTION
+_RELAYBATCHREQ_TRANSFER.containing_type = _RELAYBATCHREQ
+_RELAYBATCHREQ.fields_by_name['transfers'].message_type = _RELAYBATCHREQ_TRANSFER
+_RELAYBATCHRESP.fields_by_name['results'].message_type = _RELAYTXNRESP
 _TRANSACTIONSBYADDRESSRESP.fields_by_name['mini_transactions'].message_type = pur__pb2._MINITRANSACTION
 _TRANSACTIONRESP.fields_by_name['tx'].message_type = _PLAINTRANSACTION
 _OTSRESP.fields_by_name['ots_bitfield_by_page'].message_type = pur__pb2._OTSBITFIELDBYPAGE
@@ -3044,6 +3174,8 @@ DESCRIPTOR.message_types_by_name['RelayTransferTokenTxnBySlaveReq'] = _RELAYTRAN
 DESCRIPTOR.message_types_by_name['RelaySlaveTxnReq'] = _RELAYSLAVETXNREQ
 DESCRIPTOR.message_types_by_name['RelaySlaveTxnBySlaveReq'] = _RELAYSLAVETXNBYSLAVEREQ
 DESCRIPTOR.message_types_by_name['RelayTxnResp'] = _RELAYTXNRESP
+DESCRIPTOR.message_types_by_name['RelayBatchReq'] = _RELAYBATCHREQ
+DESCRIPTOR.message_types_by_name['RelayBatchResp'] = _RELAYBATCHRESP
 DESCRIPTOR.message_types_by_name['ChangePassphraseReq'] = _CHANGEPASSPHRASEREQ
 DESCRIPTOR.message_types_by_name['ChangePassphraseResp'] = _CHANGEPASSPHRASERESP
 DESCRIPTOR.message_types_by_name['TransactionsByAddressReq'] = _TRANSACTIONSBYADDRESSREQ
@@ -3296,6 +3428,28 @@ RelayTxnResp = _reflection.GeneratedProtocolMessageType('RelayTxnResp', (_messag
   ))
 _sym_db.RegisterMessage(RelayTxnResp)
 
+RelayBatchReq = _reflection.GeneratedProtocolMessageType('RelayBatchReq', (_message.Message,), dict(
+
+  Transfer = _reflection.GeneratedProtocolMessageType('Transfer', (_message.Message,), dict(
+    DESCRIPTOR = _RELAYBATCHREQ_TRANSFER,
+    __module__ = 'purwallet_pb2'
+    # @@protoc_insertion_point(class_scope:pur.RelayBatchReq.Transfer)
+    ))
+  ,
+  DESCRIPTOR = _RELAYBATCHREQ,
+  __module__ = 'purwallet_pb2'
+  # @@protoc_insertion_point(class_scope:pur.RelayBatchReq)
+  ))
+_sym_db.RegisterMessage(RelayBatchReq)
+_sym_db.RegisterMessage(RelayBatchReq.Transfer)
+
+RelayBatchResp = _reflection.GeneratedProtocolMessageType('RelayBatchResp', (_message.Message,), dict(
+  DESCRIPTOR = _RELAYBATCHRESP,
+  __module__ = 'purwallet_pb2'
+  # @@protoc_insertion_point(class_scope:pur.RelayBatchResp)
+  ))
+_sym_db.RegisterMessage(RelayBatchResp)
+
 ChangePassphraseReq = _reflection.GeneratedProtocolMessageType('ChangePassphraseReq', (_message.Message,), dict(
   DESCRIPTOR = _CHANGEPASSPHRASEREQ,
   __module__ = 'purwallet_pb2'
@@ -3542,8 +3696,8 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   options=None,
-  serialized_start=5429,
-  serialized_end=7450,
+  serialized_start=5666,
+  serialized_end=7742,
   methods=[
   _descriptor.MethodDescriptor(
     name='AddNewAddress',
@@ -3725,10 +3879,19 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
     output_type=_RELAYTXNRESP,
     options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='RelayBatch',
+    full_name='pur.WalletAPI.RelayBatch',
+    index=20,
+    containing_service=None,
+    input_type=_RELAYBATCHREQ,
+    output_type=_RELAYBATCHRESP,
+    options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='ChangePassphrase',
     full_name='pur.WalletAPI.ChangePassphrase',
-    index=20,
+    index=21,
     containing_service=None,
     input_type=_CHANGEPASSPHRASEREQ,
     output_type=_CHANGEPASSPHRASERESP,
@@ -3737,7 +3900,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTransactionsByAddress',
     full_name='pur.WalletAPI.GetTransactionsByAddress',
-    index=21,
+    index=22,
     containing_service=None,
     input_type=_TRANSACTIONSBYADDRESSREQ,
     output_type=_TRANSACTIONSBYADDRESSRESP,
@@ -3746,7 +3909,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTransaction',
     full_name='pur.WalletAPI.GetTransaction',
-    index=22,
+    index=23,
     containing_service=None,
     input_type=_TRANSACTIONREQ,
     output_type=_TRANSACTIONRESP,
@@ -3755,7 +3918,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetBalance',
     full_name='pur.WalletAPI.GetBalance',
-    index=23,
+    index=24,
     containing_service=None,
     input_type=_BALANCEREQ,
     output_type=_BALANCERESP,
@@ -3764,7 +3927,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetTotalBalance',
     full_name='pur.WalletAPI.GetTotalBalance',
-    index=24,
+    index=25,
     containing_service=None,
     input_type=_TOTALBALANCEREQ,
     output_type=_TOTALBALANCERESP,
@@ -3773,7 +3936,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetOTS',
     full_name='pur.WalletAPI.GetOTS',
-    index=25,
+    index=26,
     containing_service=None,
     input_type=_OTSREQ,
     output_type=_OTSRESP,
@@ -3782,7 +3945,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetHeight',
     full_name='pur.WalletAPI.GetHeight',
-    index=26,
+    index=27,
     containing_service=None,
     input_type=_HEIGHTREQ,
     output_type=_HEIGHTRESP,
@@ -3791,7 +3954,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetBlock',
     full_name='pur.WalletAPI.GetBlock',
-    index=27,
+    index=28,
     containing_service=None,
     input_type=_BLOCKREQ,
     output_type=_BLOCKRESP,
@@ -3800,7 +3963,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetBlockByNumber',
     full_name='pur.WalletAPI.GetBlockByNumber',
-    index=28,
+    index=29,
     containing_service=None,
     input_type=_BLOCKBYNUMBERREQ,
     output_type=_BLOCKRESP,
@@ -3809,7 +3972,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetAddressFromPK',
     full_name='pur.WalletAPI.GetAddressFromPK',
-    index=29,
+    index=30,
     containing_service=None,
     input_type=_ADDRESSFROMPKREQ,
     output_type=_ADDRESSFROMPKRESP,
@@ -3818,7 +3981,7 @@ _WALLETAPI = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='GetNodeInfo',
     full_name='pur.WalletAPI.GetNodeInfo',
-    index=30,
+    index=31,
     containing_service=None,
     input_type=_NODEINFOREQ,
     output_type=_NODEINFORESP,
@@ -122,6 +122,11 @@ class WalletAPIStub(object):
         request_serializer=purwallet__pb2.RelaySlaveTxnBySlaveReq.SerializeToString,
         response_deserializer=purwallet__pb2.RelayTxnResp.FromString,
         )
+    self.RelayBatch = channel.unary_unary(
+        '/pur.WalletAPI/RelayBatch',
+        request_serializer=purwallet__pb2.RelayBatchReq.SerializeToString,
+        response_deserializer=purwallet__pb2.RelayBatchResp.FromString,
+        )
     self.ChangePassphrase = channel.unary_unary(
         '/pur.WalletAPI/ChangePassphrase',
         request_serializer=purwallet__pb2.ChangePassphraseReq.SerializeToString,
@@ -313,6 +318,12 @@ class WalletAPIServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def RelayBatch(self, request, context):
+    # missing associated documentation comment in .proto file
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def ChangePassphrase(self, request, context):
     # missing associated documentation comment in .proto file
     context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -482,6 +493,11 @@ def add_WalletAPIServicer_to_server(servicer, server):
           request_deserializer=purwallet__pb2.RelaySlaveTxnBySlaveReq.FromString,
           response_serializer=purwallet__pb2.RelayTxnResp.SerializeToString,
       ),
+      'RelayBatch': grpc.unary_unary_rpc_method_handler(
+          servicer.RelayBatch,
+          request_deserializer=purwallet__pb2.RelayBatchReq.FromString,
+          response_serializer=purwallet__pb2.RelayBatchResp.SerializeToString,
+      ),
       'ChangePassphrase': grpc.unary_unary_rpc_method_handler(
           servicer.ChangePassphrase,
           request_deserializer=purwallet__pb2.ChangePassphraseReq.FromString,
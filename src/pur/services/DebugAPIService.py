@@ -10,6 +10,7 @@ from pur.services.grpcHelper import GrpcExceptionWrapper
 
 class DebugAPIService(DebugAPIServicer):
     MAX_REQUEST_QUANTITY = 100
+    MAX_STREAM_CHUNK_SIZE = 1024 * 1024
 
     def __init__(self, purnode: purNode):
         self.purnode = purnode
@@ -20,3 +21,13 @@ class DebugAPIService(DebugAPIServicer):
             coinbase_state=self.purnode.get_address_state(config.dev.coinbase_address).pbdata,
             addresses_state=self.purnode.get_all_address_state()
         )
+
+    def GetFullStateStream(self, request: purdebug_pb2.GetFullStateStreamReq, context):
+        max_chunk_size = self.MAX_STREAM_CHUNK_SIZE
+        if request.max_chunk_size:
+            max_chunk_size = min(request.max_chunk_size, self.MAX_STREAM_CHUNK_SIZE)
+
+        for addresses_state in self.purnode.get_optimized_addresses_state_chunks(max_chunk_size):
+            yield purdebug_pb2.GetFullStateStreamResp(
+                addresses_state=[address_state.pbdata for address_state in addresses_state]
+            )
@@ -5,11 +5,13 @@ import traceback
 import os
 from statistics import variance, mean
 
+from grpc import StatusCode
 from pypurlib.pypurlib import hstr2bin, purHelper, purDescriptor
 
 from pur.core import config
 from pur.core.AddressState import AddressState
 from pur.core.misc import logger
+from pur.core.notification.Subscriptions import SubscriptionManager
 from pur.core.purnode import purNode
 from pur.core.txs.Transaction import Transaction, CODEMAP
 from pur.generated import pur_pb2
@@ -19,6 +21,12 @@ from pur.services.grpcHelper import GrpcExceptionWrapper
 
 class PublicAPIService(PublicAPIServicer):
     MAX_REQUEST_QUANTITY = 100
+    MAX_ADDRESSES_QUANTITY = 10000
+    # Around 100 bytes per OptimizedAddressState, clients asking for the maximum
+    # must raise their grpc.max_receive_message_length above the default 4 MB
+    MAX_ADDRESS_STATES_QUANTITY = 50000
+    MAX_TRANSACTIONS_QUANTITY = 1000
+    SUBSCRIPTION_POLL_TIMEOUT = 1
 
     # TODO: Separate the Service from the node model
     def __init__(self, purnode: purNode):
@@ -42,6 +50,15 @@ class PublicAPIService(PublicAPIServicer):
     def IsSlave(self, request: pur_pb2.IsSlaveReq, context) -> pur_pb2.IsSlaveResp:
         return pur_pb2.IsSlaveResp(result=self.purnode.is_slave(request.master_address, request.slave_pk))
 
+    @GrpcExceptionWrapper(pur_pb2.GetSlavesStateResp)
+    def GetSlavesState(self, request: pur_pb2.GetSlavesStateReq, context) -> pur_pb2.GetSlavesStateResp:
+        if len(request.slaves) > self.MAX_ADDRESSES_QUANTITY:
+            raise ValueError("Too many slaves, limit is {}".format(self.MAX_ADDRESSES_QUANTITY))
+        slaves_state = self.purnode.get_slaves_state(request.master_address,
+                                                     [(slave.slave_pk, slave.unused_ots_index_from)
+                                                      for slave in request.slaves])
+        return pur_pb2.GetSlavesStateResp(slaves_state=slaves_state)
+
     @GrpcExceptionWrapper(pur_pb2.GetNodeStateResp)
     def GetNodeState(self, request: pur_pb2.GetNodeStateReq, context) -> pur_pb2.GetNodeStateResp:
         return pur_pb2.GetNodeStateResp(info=self.purnode.get_node_info())
@@ -116,6 +133,15 @@ class PublicAPIService(PublicAPIServicer):
         address_state = self.purnode.get_optimized_address_state(request.address)
         return pur_pb2.GetOptimizedAddressStateResp(state=address_state.pbdata)
 
+    @GrpcExceptionWrapper(pur_pb2.GetAddressStatesResp)
+    def GetAddressStates(self,
+                         request: pur_pb2.GetAddressStatesReq,
+                         context) -> pur_pb2.GetAddressStatesResp:
+        if len(request.addresses) > self.MAX_ADDRESS_STATES_QUANTITY:
+            raise ValueError("Too many addresses, limit is {}".format(self.MAX_ADDRESS_STATES_QUANTITY))
+        addresses_state = self.purnode.get_optimized_addresses_state(list(request.addresses))
+        return pur_pb2.GetAddressStatesResp(states=[address_state.pbdata for address_state in addresses_state])
+
     @GrpcExceptionWrapper(pur_pb2.GetMultiSigAddressStateResp)
     def GetMultiSigAddressState(self,
                                 request: pur_pb2.GetMultiSigAddressStateReq,
@@ -143,10 +169,21 @@ class PublicAPIService(PublicAPIServicer):
     @GrpcExceptionWrapper(pur_pb2.PushTransactionResp)
     def PushTransaction(self, request: pur_pb2.PushTransactionReq, context) -> pur_pb2.PushTransactionResp:
         logger.debug("[PublicAPI] PushTransaction")
+        return self._push_transaction(request.transaction_signed)
+
+    @GrpcExceptionWrapper(pur_pb2.PushTransactionsResp)
+    def PushTransactions(self, request: pur_pb2.PushTransactionsReq, context) -> pur_pb2.PushTransactionsResp:
+        logger.debug("[PublicAPI] PushTransactions")
+        if len(request.transactions_signed) > self.MAX_TRANSACTIONS_QUANTITY:
+            raise ValueError("Too many transactions, limit is {}".format(self.MAX_TRANSACTIONS_QUANTITY))
+        return pur_pb2.PushTransactionsResp(results=[self._push_transaction(transaction_signed)
+                                                     for transaction_signed in request.transactions_signed])
+
+    def _push_transaction(self, transaction_signed: pur_pb2.Transaction) -> pur_pb2.PushTransactionResp:
         answer = pur_pb2.PushTransactionResp()
 
         try:
-            tx = Transaction.from_pbdata(request.transaction_signed)
+            tx = Transaction.from_pbdata(transaction_signed)
             tx.update_txhash()
 
             # FIpurE: Full validation takes too much time. At least verify there is a signature
@@ -428,7 +465,8 @@ class PublicAPIService(PublicAPIServicer):
         logger.debug("[PublicAPI] GetTransactionsByAddress")
         return self.purnode.get_mini_transactions_by_address(request.address,
                                                              request.item_per_page,
-                                                             request.page_number)
+                                                             request.page_number,
+                                                             request.cursor)
 
     @GrpcExceptionWrapper(pur_pb2.GetTransactionsByAddressResp)
     def GetTransactionsByAddress(self,
@@ -437,7 +475,8 @@ class PublicAPIService(PublicAPIServicer):
         logger.debug("[PublicAPI] GetTransactionsByAddress")
         return self.purnode.get_transactions_by_address(request.address,
                                                         request.item_per_page,
-                                                        request.page_number)
+                                                        request.page_number,
+                                                        request.cursor)
 
     @GrpcExceptionWrapper(pur_pb2.GetTokensByAddressResp)
     def GetTokensByAddress(self,
@@ -531,9 +570,12 @@ class PublicAPIService(PublicAPIServicer):
         logger.debug("[PublicAPI] GetTotalBalance")
         response = pur_pb2.GetBalanceResp(balance=0)
 
-        for address in request.addresses:
-            address_state = self.purnode.get_optimized_address_state(address)
-            response.balance += address_state.balance
+        # Looked up in chunks, so that the number of addresses is not limited
+        addresses = list(request.addresses)
+        for i in range(0, len(addresses), self.MAX_ADDRESS_STATES_QUANTITY):
+            chunk = addresses[i:i + self.MAX_ADDRESS_STATES_QUANTITY]
+            for address_state in self.purnode.get_optimized_addresses_state(chunk):
+                response.balance += address_state.balance
 
         return response
 
@@ -570,3 +612,45 @@ class PublicAPIService(PublicAPIServicer):
         if block:
             return pur_pb2.GetBlockByNumberResp(block=block.pbdata)
         return pur_pb2.GetBlockByNumberResp()
+
+    def _subscribe(self, context, topic: str, addresses: list = None):
+        try:
+            subscriber = self.purnode.subscribe(topic, addresses)
+        except ValueError as e:
+            context.set_code(StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return
+
+        if subscriber is None:
+            context.set_code(StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details("Too many subscribers")
+            return
+
+        context.add_callback(subscriber.close)
+        try:
+            while context.is_active() and not subscriber.closed:
+                event = subscriber.get(self.SUBSCRIPTION_POLL_TIMEOUT)
+                if event is not None:
+                    yield event
+        finally:
+            self.purnode.unsubscribe(subscriber)
+
+        if subscriber.dropped:
+            context.set_code(StatusCode.RESOURCE_EXHAUSTED)
+            context.set_details("Subscriber dropped, the events were not consumed fast enough")
+
+    def SubscribeBlocks(self, request: pur_pb2.SubscribeBlocksReq, context):
+        logger.debug("[PublicAPI] SubscribeBlocks")
+        return self._subscribe(context, SubscriptionManager.TOPIC_BLOCKS)
+
+    def SubscribeMempool(self, request: pur_pb2.SubscribeMempoolReq, context):
+        logger.debug("[PublicAPI] SubscribeMempool")
+        return self._subscribe(context, SubscriptionManager.TOPIC_MEMPOOL)
+
+    def SubscribeAddresses(self, request: pur_pb2.SubscribeAddressesReq, context):
+        logger.debug("[PublicAPI] SubscribeAddresses")
+        if len(request.addresses) > self.MAX_ADDRESSES_QUANTITY:
+            context.set_code(StatusCode.INVALID_ARGUMENT)
+            context.set_details("Too many addresses")
+            return iter([])
+        return self._subscribe(context, SubscriptionManager.TOPIC_ADDRESSES, list(request.addresses))
@@ -277,6 +277,23 @@ class WalletAPIService(WalletAPIServicer):
 
         return resp
 
+    @GrpcExceptionWrapper(purwallet_pb2.RelayBatchResp)
+    def RelayBatch(self, request: purwallet_pb2.RelayBatchReq, context) -> purwallet_pb2.RelayBatchResp:
+        resp = purwallet_pb2.RelayBatchResp()
+        try:
+            transfers = [(transfer.addresses_to, transfer.amounts, transfer.fee) for transfer in request.transfers]
+            for tx, error in self._walletd.relay_batch(transfers, request.master_address):
+                result = purwallet_pb2.RelayTxnResp(tx=tx)
+                if error is not None:
+                    result.code = 1
+                    result.error = error
+                resp.results.extend([result])
+        except Exception as e:
+            resp.code = 1
+            resp.error = str(e)
+
+        return resp
+
     @GrpcExceptionWrapper(purwallet_pb2.EncryptWalletResp)
     def EncryptWallet(self, request: purwallet_pb2.EncryptWalletReq, context) -> purwallet_pb2.EncryptWalletResp:
         resp = purwallet_pb2.EncryptWalletResp()
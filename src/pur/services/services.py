@@ -20,7 +20,9 @@ from pur.services.DebugAPIService import DebugAPIService
 
 
 def start_services(node: purNode):
-    public_server = grpc.server(ThreadPoolExecutor(max_workers=config.user.public_api_threads),
+    # Each subscription stream holds a thread for its whole duration
+    public_api_threads = config.user.public_api_threads + config.user.public_api_max_subscribers
+    public_server = grpc.server(ThreadPoolExecutor(max_workers=public_api_threads),
                                 maximum_concurrent_rpcs=config.user.public_api_max_concurrent_rpc)
     add_BaseServicer_to_server(BaseService(node), public_server)
     add_PublicAPIServicer_to_server(PublicAPIService(node), public_server)
@@ -0,0 +1,53 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+import argparse
+import os
+import sys
+
+from google.protobuf.json_format import MessageToJson
+
+from pur.core import config
+from pur.core.OptimizedAddressState import OptimizedAddressState
+from pur.core.State import State
+from pur.core.misc.db import SnapshotDB
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Exports the address states of a stopped node, '
+                                                 'one json object per line')
+    parser.add_argument('--purdir', '-d', dest='pur_dir', default=config.user.pur_dir,
+                        help="Use a different directory for node data/configuration")
+    parser.add_argument('--output', '-o', default='-', help="Output file, '-' for stdout")
+    parser.add_argument('--chunk_size', default=1024 * 1024, type=int,
+                        help='Maximum size in bytes of the address states held in memory')
+    return parser.parse_args()
+
+
+def export_state(state: State, output, chunk_size: int) -> int:
+    count = 0
+    for addresses_state in OptimizedAddressState.get_optimized_addresses_state_chunks(state, chunk_size):
+        for address_state in addresses_state:
+            output.write(MessageToJson(address_state.pbdata, sort_keys=True, indent=None))
+            output.write('\n')
+        count += len(addresses_state)
+    return count
+
+
+def main():
+    args = parse_arguments()
+    config.user.pur_dir = os.path.expanduser(os.path.normpath(args.pur_dir))
+
+    with State() as state:
+        snapshot_state = State(SnapshotDB(state._db))
+        if args.output == '-':
+            count = export_state(snapshot_state, sys.stdout, args.chunk_size)
+        else:
+            with open(args.output, 'w') as output:
+                count = export_state(snapshot_state, output, args.chunk_size)
+
+    print('Exported {} address states'.format(count), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from pypurlib.pypurlib import purssFast
+
+from pur.core import config
+from pur.core.Block import Block
+from pur.core.ChainManager import ChainManager
+from pur.core.GenesisBlock import GenesisBlock
+from pur.core.State import State
+from pur.crypto.purss import purSS
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Measures the throughput of ChainManager.add_block '
+                                                 'on a synthetic chain')
+    parser.add_argument('--blocks', default=100000, type=int, help='Number of blocks in the synthetic chain')
+    parser.add_argument('--report_every', default=10000, type=int, help='Number of blocks between progress reports')
+    parser.add_argument('--baseline', default=None, type=str,
+                        help='Git revision to compare with, e.g. the parent commit. The same benchmark is run '
+                             'against the pur package of that revision, checked out in a temporary worktree')
+    return parser.parse_args()
+
+
+def create_chain(block_count):
+    miner_address = purSS(purssFast(bytes(48), 4)).address
+    blocks = []
+    prev_block = GenesisBlock()
+    for block_number in range(1, block_count + 1):
+        block = Block.create(dev_config=config.dev,
+                             block_number=block_number,
+                             prev_headerhash=prev_block.headerhash,
+                             prev_timestamp=prev_block.timestamp,
+                             transactions=[],
+                             miner_address=miner_address,
+                             seed_height=None,
+                             seed_hash=None)
+        blocks.append(block)
+        prev_block = block
+    return blocks
+
+
+def benchmark_add_block(chain_manager, blocks, report_every) -> float:
+    start = time.time()
+    report_start = start
+    for block in blocks:
+        if not chain_manager.add_block(block, check_stale=False):
+            raise Exception('Failed to add block #{}'.format(block.block_number))
+
+        if block.block_number % report_every == 0:
+            now = time.time()
+            print('#{} {:.0f} blocks/s'.format(block.block_number, report_every / (now - report_start)))
+            report_start = now
+    return time.time() - start
+
+
+def run(args) -> float:
+    data_dir = tempfile.mkdtemp()
+    prev_pur_dir = config.user.pur_dir
+    config.user.pur_dir = data_dir
+    try:
+        print('Creating {} blocks'.format(args.blocks))
+        blocks = create_chain(args.blocks)
+
+        with State() as state:
+            chain_manager = ChainManager(state)
+            chain_manager.load(GenesisBlock())
+            return benchmark_add_block(chain_manager, blocks, args.report_every)
+    finally:
+        config.user.pur_dir = prev_pur_dir
+        shutil.rmtree(data_dir)
+
+
+def run_baseline(args) -> float:
+    """
+    Runs this script against the pur package of the baseline revision, and returns its duration.
+    """
+    repo_dir = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'],
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    worktree_dir = tempfile.mkdtemp()
+    subprocess.check_call(['git', 'worktree', 'add', '--detach', worktree_dir, args.baseline], cwd=repo_dir)
+    try:
+        env = dict(os.environ, PYTHONPATH=os.path.join(worktree_dir, 'src'))
+        output = subprocess.check_output([sys.executable,
+                                          os.path.abspath(__file__),
+                                          '--blocks', str(args.blocks),
+                                          '--report_every', str(args.report_every)],
+                                         cwd=worktree_dir,
+                                         env=env).decode()
+        print(output, end='')
+        return float(output.splitlines()[-1].split()[-1])
+    finally:
+        subprocess.check_call(['git', 'worktree', 'remove', '--force', worktree_dir], cwd=repo_dir)
+
+
+def main():
+    args = parse_arguments()
+
+    duration = run(args)
+    print('add_block: {} blocks in {:.2f}s, {:.0f} blocks/s'.format(args.blocks, duration, args.blocks / duration))
+
+    if args.baseline:
+        print('Baseline {}'.format(args.baseline))
+        baseline_duration = run_baseline(args)
+        print('Baseline add_block: {:.2f}s, {:.0f} blocks/s, speedup {:.2f}x'.format(baseline_duration,
+                                                                                   args.blocks / baseline_duration,
+                                                                                   baseline_duration / duration))
+
+    # Parsed by run_baseline
+    print('Duration {:.3f}'.format(duration))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import struct
+import time
+
+from pur.core import config
+from pur.core.Block import Block
+from pur.core.p2p.p2pprotocol import P2PProtocol
+from pur.generated import purlegacy_pb2
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Measures the parse throughput of the P2PProtocol receive buffer')
+    parser.add_argument('--mr_messages', default=100000, type=int, help='Number of MR messages')
+    parser.add_argument('--pb_messages', default=20, type=int, help='Number of PB messages')
+    parser.add_argument('--pb_size', default=8 * 1024 * 1024, type=int, help='Approximate size in bytes of a PB message')
+    parser.add_argument('--tcp_chunk_size', default=64 * 1024, type=int, help='Size of the chunks passed to the parser')
+    parser.add_argument('--legacy', action='store_true',
+                        help='Parses with the previous bytes concatenation and slicing, for comparison')
+    return parser.parse_args()
+
+
+def create_mr_message(index) -> bytes:
+    mr_data = purlegacy_pb2.MRData(hash=index.to_bytes(32, byteorder='big'), type=purlegacy_pb2.LegacyMessage.TX)
+    msg = purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.MR, mrData=mr_data)
+    return P2PProtocol._wrap_message(msg)
+
+
+def create_pb_message(size) -> bytes:
+    block = Block.create(dev_config=config.dev,
+                         block_number=1,
+                         prev_headerhash=b'',
+                         prev_timestamp=0,
+                         transactions=[],
+                         miner_address=config.dev.coinbase_address,
+                         seed_height=None,
+                         seed_hash=None)
+    # Pads the block up to the requested size with a single large field
+    block.pbdata.transactions[0].master_addr = bytes(size)
+    msg = purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.PB,
+                                      pbData=purlegacy_pb2.PBData(block=block.pbdata))
+    return P2PProtocol._wrap_message(msg)
+
+
+def legacy_parse(buffer: bytes):
+    messages = []
+    while len(buffer) >= 5:
+        chunk_size = struct.unpack('>L', buffer[:4])[0]
+        if len(buffer) - 4 < chunk_size:
+            break
+        message = purlegacy_pb2.LegacyMessage()
+        message.ParseFromString(buffer[4:4 + chunk_size])
+        messages.append(message)
+        buffer = buffer[4 + chunk_size:]
+    return buffer, messages
+
+
+def benchmark(data: bytes, tcp_chunk_size: int, legacy: bool) -> (int, float):
+    count = 0
+    start = time.time()
+    if legacy:
+        buffer = bytes()
+        for offset in range(0, len(data), tcp_chunk_size):
+            buffer += data[offset:offset + tcp_chunk_size]
+            buffer, messages = legacy_parse(buffer)
+            count += len(messages)
+    else:
+        channel = P2PProtocol()
+        for offset in range(0, len(data), tcp_chunk_size):
+            channel._buffer.write(data[offset:offset + tcp_chunk_size])
+            count += sum(1 for _ in channel._parse_buffer([0]))
+    return count, time.time() - start
+
+
+def main():
+    args = parse_arguments()
+    # Allows messages larger than the limit of the p2p network
+    config.dev.message_buffer_size = max(config.dev.message_buffer_size, 2 * args.pb_size)
+
+    mr_data = b''.join(create_mr_message(i) for i in range(args.mr_messages))
+    pb_data = create_pb_message(args.pb_size) * args.pb_messages
+
+    for name, data in [('MR', mr_data), ('PB', pb_data)]:
+        count, duration = benchmark(data, args.tcp_chunk_size, args.legacy)
+        print('{}: {} messages, {:.2f} MB in {:.2f}s, {:.0f} messages/s, {:.1f} MB/s{}'.format(
+            name,
+            count,
+            len(data) / 1024 / 1024,
+            duration,
+            count / duration,
+            len(data) / 1024 / 1024 / duration,
+            ' (legacy)' if args.legacy else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import shutil
+import tempfile
+import time
+
+from pur.core import config
+from pur.core.OptimizedAddressState import OptimizedAddressState
+from pur.core.PaginatedData import PaginatedData
+from pur.core.State import State
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Measures the throughput of PaginatedData '
+                                                 'for the transaction hashes of a single address')
+    parser.add_argument('--txs', default=1000000, type=int, help='Number of transaction hashes of the address')
+    parser.add_argument('--txs_per_block', default=100, type=int,
+                        help='Number of transaction hashes written per batch')
+    return parser.parse_args()
+
+
+def generate_tx_hash(index) -> bytes:
+    return index.to_bytes(32, byteorder='big', signed=False)
+
+
+def benchmark_insert(state, address_state, tx_count, txs_per_block) -> float:
+    p = PaginatedData(b'p_tx_hash', True, state._db)
+    start = time.time()
+    for index in range(tx_count):
+        p.insert(address_state, generate_tx_hash(index))
+        if (index + 1) % txs_per_block == 0:
+            batch = state.batch
+            p.put_paginated_data(batch)
+            state.write_batch(batch)
+    batch = state.batch
+    p.put_paginated_data(batch)
+    state.write_batch(batch)
+    return time.time() - start
+
+
+def benchmark_read(state, address_state) -> float:
+    p = PaginatedData(b'p_tx_hash', False, state._db)
+    start = time.time()
+    count = address_state.get_counter_by_name(b'p_tx_hash')
+    for index in range(0, count, config.dev.data_per_page):
+        p.get_paginated_data(address_state.address, index)
+    return time.time() - start
+
+
+def benchmark_remove(state, address_state, tx_count, txs_per_block) -> float:
+    p = PaginatedData(b'p_tx_hash', True, state._db)
+    start = time.time()
+    for index in range(tx_count - 1, tx_count - 1 - txs_per_block, -1):
+        p.remove(address_state, generate_tx_hash(index))
+    batch = state.batch
+    p.put_paginated_data(batch)
+    state.write_batch(batch)
+    return time.time() - start
+
+
+def main():
+    args = parse_arguments()
+
+    data_dir = tempfile.mkdtemp()
+    prev_pur_dir = config.user.pur_dir
+    config.user.pur_dir = data_dir
+    try:
+        with State() as state:
+            address_state = OptimizedAddressState.get_default(config.dev.coinbase_address)
+
+            duration = benchmark_insert(state, address_state, args.txs, args.txs_per_block)
+            print('Insert: {} tx hashes in {:.2f}s, {:.0f} tx hashes/s'.format(args.txs,
+                                                                             duration,
+                                                                             args.txs / duration))
+
+            duration = benchmark_read(state, address_state)
+            print('Read: {} pages in {:.2f}s'.format(args.txs // config.dev.data_per_page + 1, duration))
+
+            duration = benchmark_remove(state, address_state, args.txs, args.txs_per_block)
+            print('Remove: {} tx hashes in {:.4f}s'.format(args.txs_per_block, duration))
+    finally:
+        config.user.pur_dir = prev_pur_dir
+        shutil.rmtree(data_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from pur.core import config
+from pur.core.Block import Block
+from pur.core.ChainManager import ChainManager
+from pur.core.GenesisBlock import GenesisBlock
+from pur.core.purnode import purNode
+from pur.core.State import State
+from pur.generated import pur_pb2
+from pur.services.PublicAPIService import PublicAPIService
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Measures the latency of GetBalance and GetObject '
+                                                 'while blocks are being applied')
+    parser.add_argument('--blocks', default=2000, type=int, help='Number of blocks applied during the benchmark')
+    parser.add_argument('--threads', default=os.cpu_count() or 1, type=int, help='Number of API threads')
+    parser.add_argument('--locked', action='store_true',
+                        help='Serves the API through ChainManager and its lock, instead of the snapshots')
+    return parser.parse_args()
+
+
+def create_chain(block_count):
+    blocks = []
+    prev_block = GenesisBlock()
+    for block_number in range(1, block_count + 1):
+        block = Block.create(dev_config=config.dev,
+                             block_number=block_number,
+                             prev_headerhash=prev_block.headerhash,
+                             prev_timestamp=prev_block.timestamp,
+                             transactions=[],
+                             miner_address=config.dev.coinbase_address,
+                             seed_height=None,
+                             seed_hash=None)
+        blocks.append(block)
+        prev_block = block
+    return blocks
+
+
+def apply_blocks(chain_manager, blocks, locked):
+    for block in blocks:
+        with chain_manager.lock:
+            batch = chain_manager._state.batch
+            Block.put_block(chain_manager._state, block, batch)
+            chain_manager._add_block_metadata(block, config.dev, batch)
+            chain_manager._apply_state_changes(block, batch, verify_signature=False)
+            chain_manager._update_block_number_mapping(block, batch)
+            chain_manager._write_batch(batch)
+            if not locked:
+                chain_manager._update_snapshot()
+
+
+def query_api(service, done, latencies):
+    balance_request = pur_pb2.GetBalanceReq(address=config.dev.coinbase_address)
+    object_request = pur_pb2.GetObjectReq(query=GenesisBlock().headerhash)
+    while not done.is_set():
+        start = time.time()
+        service.GetBalance(balance_request, None)
+        service.GetObject(object_request, None)
+        latencies.append(time.time() - start)
+
+
+def main():
+    args = parse_arguments()
+
+    data_dir = tempfile.mkdtemp()
+    prev_pur_dir = config.user.pur_dir
+    config.user.pur_dir = data_dir
+    try:
+        print('Creating {} blocks'.format(args.blocks))
+        blocks = create_chain(args.blocks)
+
+        with State() as state:
+            chain_manager = ChainManager(state)
+            chain_manager.load(GenesisBlock())
+            if args.locked:
+                chain_manager._snapshot = None
+
+            purnode = purNode(mining_address=b'')
+            purnode.set_chain_manager(chain_manager)
+            service = PublicAPIService(purnode)
+
+            done = threading.Event()
+            latencies = [[] for _ in range(args.threads)]
+            threads = [threading.Thread(target=query_api, args=(service, done, latencies[i]))
+                       for i in range(args.threads)]
+            for thread in threads:
+                thread.start()
+
+            start = time.time()
+            apply_blocks(chain_manager, blocks, args.locked)
+            duration = time.time() - start
+
+            done.set()
+            for thread in threads:
+                thread.join()
+
+        latencies = sorted(latency for thread_latencies in latencies for latency in thread_latencies)
+        print('Applied {} blocks in {:.2f}s{}'.format(args.blocks, duration, ' (locked)' if args.locked else ''))
+        print('{} queries, {:.0f} queries/s, p50 {:.2f}ms, p99 {:.2f}ms, max {:.2f}ms'.format(
+            len(latencies),
+            len(latencies) / duration,
+            latencies[len(latencies) // 2] * 1000,
+            latencies[len(latencies) * 99 // 100] * 1000,
+            latencies[-1] * 1000))
+    finally:
+        config.user.pur_dir = prev_pur_dir
+        shutil.rmtree(data_dir)
+
+
+if __name__ == '__main__':
+    main()
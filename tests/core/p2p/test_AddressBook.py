@@ -0,0 +1,81 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from pur.core.p2p.AddressBook import AddressBook, PeerStats
+from pur.core.p2p.IPMetadata import IPMetadata
+from tests.misc.helper import replacement_getTime
+
+
+def make_channel(ip):
+    return Mock(name=ip, peer=IPMetadata(ip, 19000))
+
+
+@patch('pur.core.misc.ntp.getTime', new=replacement_getTime)
+class TestAddressBook(TestCase):
+    def setUp(self):
+        self.address_book = AddressBook(max_size=3)
+        self.channel_1 = make_channel('1.1.1.1')
+        self.channel_2 = make_channel('2.2.2.2')
+
+    def test_unknown_peers_have_the_same_score(self):
+        self.assertEqual(self.address_book.score(self.channel_1), self.address_book.score(self.channel_2))
+        self.assertEqual(self.address_book.connection_score('1.1.1.1:19000'),
+                         self.address_book.connection_score('2.2.2.2:19000'))
+        # Scoring does not add the peers
+        self.assertEqual(0, len(self.address_book))
+
+    def test_latency(self):
+        self.address_book.add_latency(self.channel_1, 0.1)
+        self.address_book.add_latency(self.channel_2, 2)
+        self.assertGreater(self.address_book.score(self.channel_1), self.address_book.score(self.channel_2))
+
+        self.address_book.add_latency(self.channel_1, 1.1)
+        self.assertAlmostEqual(0.3, self.address_book.get('1.1.1.1').latency)
+
+    @patch('pur.core.p2p.AddressBook.time')
+    def test_requests(self, m_time):
+        m_time.monotonic.return_value = 10
+        self.address_book.request_sent(self.channel_1, 1)
+        self.address_book.request_sent(self.channel_2, 2)
+
+        m_time.monotonic.return_value = 12
+        self.address_book.request_served(self.channel_1, 1, 1000)
+        self.address_book.request_failed(self.channel_2, 2)
+
+        stats_1 = self.address_book.get('1.1.1.1')
+        self.assertEqual(1, stats_1.served_requests)
+        self.assertEqual(500, stats_1.download_rate)
+        self.assertEqual(1, self.address_book.get('2.2.2.2').failed_requests)
+        self.assertEqual(dict(), self.address_book._pending_requests)
+
+        # With the same download rate, the peer which failed its request is scored lower
+        self.address_book.get('1.1.1.1').download_rate = PeerStats.REFERENCE_RATE
+        self.assertGreater(self.address_book.score(self.channel_1), self.address_book.score(self.channel_2))
+
+    def test_connections(self):
+        self.address_book.connection_attempted('1.1.1.1')
+        self.address_book.connection_attempted('2.2.2.2')
+        self.address_book.connected(self.channel_1)
+
+        self.assertTrue(self.address_book.get('1.1.1.1').connected_since)
+        self.assertGreater(self.address_book.connection_score('1.1.1.1:19000'),
+                           self.address_book.connection_score('2.2.2.2:19000'))
+
+        self.address_book.request_sent(self.channel_1, 1)
+        self.address_book.disconnected(self.channel_1)
+        self.assertIsNone(self.address_book.get('1.1.1.1').connected_since)
+        self.assertEqual(dict(), self.address_book._pending_requests)
+
+    def test_max_size(self):
+        self.address_book.connected(self.channel_1)
+        for ip in ['2.2.2.2', '3.3.3.3', '4.4.4.4']:
+            self.address_book.connection_attempted(ip)
+
+        # The least recently used peer not connected is forgotten
+        self.assertEqual(3, len(self.address_book))
+        self.assertIn('1.1.1.1', self.address_book._stats)
+        self.assertNotIn('2.2.2.2', self.address_book._stats)
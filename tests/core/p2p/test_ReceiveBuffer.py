@@ -0,0 +1,47 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from unittest import TestCase
+
+from pur.core.p2p.ReceiveBuffer import ReceiveBuffer
+
+
+class TestReceiveBuffer(TestCase):
+    def test_write_consume(self):
+        buffer = ReceiveBuffer(capacity=8)
+        buffer.write(b'\x00\x00\x00\x03abc')
+        self.assertEqual(7, len(buffer))
+        self.assertEqual(3, buffer.unpack_uint32())
+
+        with buffer.view(4, 3) as view:
+            self.assertEqual(b'abc', bytes(view))
+
+        buffer.consume(4)
+        self.assertEqual(b'abc', bytes(buffer))
+
+        buffer.consume(3)
+        self.assertEqual(0, len(buffer))
+        self.assertFalse(buffer)
+
+    def test_compaction(self):
+        buffer = ReceiveBuffer(capacity=16)
+        buffer.write(b'abcdefghijkl')
+        buffer.consume(11)
+
+        # The unread byte is moved to the start instead of growing the bytearray
+        buffer.write(b'mnopqr')
+        self.assertEqual(16, buffer.capacity)
+        self.assertEqual(b'lmnopqr', bytes(buffer))
+
+    def test_grow_and_shrink(self):
+        buffer = ReceiveBuffer(capacity=8)
+        for _ in range(10):
+            buffer.write(b'0123456789')
+        self.assertEqual(b'0123456789' * 10, bytes(buffer))
+        self.assertGreaterEqual(buffer.capacity, 100)
+
+        with buffer.view(95, 10) as view:
+            self.assertEqual(b'56789', bytes(view))
+
+        buffer.consume(100)
+        self.assertEqual(8, buffer.capacity)
@@ -126,7 +126,7 @@ class TestP2PChainManager(TestCase):
                            )
         self.manager.handle_block(self.channel, msg)
         self.channel.factory.master_mr.register.assert_not_called()
-        self.channel.factory.pow.pre_block_logic.assert_not_called()
+        self.channel.factory.pow.block_received.assert_not_called()
 
     def test_handle_block_height_incoming_request(self, m_logger):
         """
@@ -3,6 +3,7 @@
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 import os
 import time
+import json
 from unittest import TestCase
 
 from mock import Mock, patch, mock
@@ -11,6 +12,7 @@ from pyqryptonight.pyqryptonight import StringToUInt256
 
 from pur.core import config
 from pur.core.misc import logger
+from pur.core.misc.expiring_set import ExpiringSet
 from pur.core.p2p.IPMetadata import IPMetadata
 from pur.core.p2p.p2pPeerManager import P2PPeerManager
 from pur.core.p2p.p2pfactory import P2PFactory
@@ -44,6 +46,11 @@ class TestP2PPeerManager(TestCase):
         super().__init__(*args, **kwargs)
 
     def setUp(self):
+        # Peers are saved by calling flush(), as the reactor does once peers_flush_interval has elapsed
+        reactor_patcher = patch('pur.core.p2p.p2pPeerManager.reactor')
+        self.m_reactor = reactor_patcher.start()
+        self.addCleanup(reactor_patcher.stop)
+
         self.peer_manager = P2PPeerManager()
 
     def tearDown(self):
@@ -179,6 +186,51 @@ class TestP2PPeerManager(TestCase):
         self.assertEqual(len(self.peer_manager._channels), 1)
         self.assertEqual(len(self.peer_manager._peer_node_status), 1)
 
+    def test_remove_channel_saves_known_peers_on_flush(self):
+        """
+        remove_channel() moves the peer to the start of the disconnected peers in memory.
+        known_peers.json is only written once the changes are flushed, from the reactor thread pool.
+        """
+        channel = make_channel()
+        channel.ip_public_port = '2.2.2.2:9000'
+        self.peer_manager._peer_order = ['1.1.1.1:9000', '3.3.3.3:9000', '2.2.2.2:9000']
+        self.peer_manager._banned_peer_ips = ExpiringSet(expiration_time=60)
+
+        with set_pur_dir('no_data') as tmp_dir:
+            self.peer_manager.peers_path = os.path.join(tmp_dir, config.dev.peers_filename)
+
+            self.peer_manager.remove_channel(channel)
+            self.peer_manager.remove_channel(channel)
+
+            self.assertEqual(['2.2.2.2:9000', '1.1.1.1:9000', '3.3.3.3:9000'], self.peer_manager._peer_order)
+            self.assertFalse(os.path.exists(self.peer_manager.peers_path))
+            self.m_reactor.callLater.assert_called_once_with(config.user.peers_flush_interval, self.peer_manager.flush)
+
+            self.peer_manager.flush()
+            self.m_reactor.callInThread.assert_called_once_with(P2PPeerManager._write,
+                                                                self.peer_manager.save_known_peers,
+                                                                ['2.2.2.2:9000', '1.1.1.1:9000', '3.3.3.3:9000'])
+
+            self.peer_manager.remove_channel(channel)
+            self.peer_manager.flush(threaded=False)
+            with open(self.peer_manager.peers_path) as f:
+                self.assertEqual(['2.2.2.2:9000', '1.1.1.1:9000', '3.3.3.3:9000'], json.load(f))
+
+    def test_ban_channel(self):
+        channel = make_channel()
+
+        with set_pur_dir('no_data') as tmp_dir:
+            self.peer_manager._banned_peer_ips._filename = os.path.join(tmp_dir, config.dev.banned_peers_filename)
+
+            self.peer_manager.ban_channel(channel)
+            self.assertTrue(self.peer_manager.is_banned(channel.peer))
+            channel.loseConnection.assert_called_once_with()
+            self.assertFalse(os.path.exists(self.peer_manager._banned_peer_ips._filename))
+
+            self.peer_manager.flush(threaded=False)
+            with open(self.peer_manager._banned_peer_ips._filename) as f:
+                self.assertIn(channel.peer.ip, json.load(f))
+
     def test_new_channel(self):
         """
         new_channel() makes sure that for each channel P2PPeerManager has in _channels, there is a corresponding
@@ -203,10 +255,12 @@ class TestP2PPeerManager(TestCase):
         message = purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.VE,
                                               veData=purlegacy_pb2.VEData(version=config.dev.version,
                                                                           genesis_prev_hash=config.user.genesis_prev_headerhash,
-                                                                          rate_limit=config.user.peer_rate_limit))
+                                                                          rate_limit=config.user.peer_rate_limit,
+                                                                          features=purlegacy_pb2.VEData.MR_BATCH))
         self.peer_manager.handle_version(channel, message)
         channel.peer_manager.ban_channel.assert_not_called()
         channel.loseConnection.assert_not_called()
+        self.assertEqual(purlegacy_pb2.VEData.MR_BATCH, channel.peer_features)
 
     def test_handle_version_empty_version_message(self):
         """
@@ -221,6 +275,7 @@ class TestP2PPeerManager(TestCase):
                                                                           rate_limit=config.user.peer_rate_limit))
         self.peer_manager.handle_version(channel, message)
         self.assertEqual(channel.send.call_args[0][0].veData.version, config.dev.version)
+        self.assertEqual(channel.send.call_args[0][0].veData.features, purlegacy_pb2.VEData.MR_BATCH)
 
     def test_handle_version_wrong_genesis_prev_headerhash(self):
         """
@@ -442,9 +497,11 @@ class TestP2PPeerManager(TestCase):
                                           p2pAckData=pur_pb2.P2PAcknowledgement(bytes_processed=15))
         channel = make_channel()
         channel.bytes_sent = 20
+        channel.pop_round_trip_time.return_value = 0.5
         self.peer_manager.handle_p2p_acknowledgement(channel, ack)
 
         channel.send_next.assert_called_once_with()
+        channel.factory.address_book.add_latency.assert_called_once_with(channel, 0.5)
 
     def test_handle_p2p_acknowledgement_negative_bytes_processed(self):
         """
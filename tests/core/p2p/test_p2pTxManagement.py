@@ -39,13 +39,13 @@ class TestP2PTpuranagement(TestCase):
         self.tx_manager.new_channel(channel)
         channel.register.assert_called()
 
-        self.assertEquals(11, channel.register.call_count)
+        self.assertEquals(13, channel.register.call_count)
 
     def test_observable(self):
         channel = Observable(None)
         self.tx_manager = P2PTpuranagement()
         self.tx_manager.new_channel(channel)
-        self.assertEquals(11, channel.observers_count)
+        self.assertEquals(13, channel.observers_count)
 
     def test_notification_no_observer(self):
         source = Mock()
@@ -256,6 +256,57 @@ class TestP2PTpuranagementHandlers(TestCase):
         P2PTpuranagement.handle_full_message_request(self.channel, msg)
         self.channel.send.assert_not_called()
 
+    def test_handle_message_receipt_batch(self):
+        """
+        Each MessageReceipt of a MRB is handled as a MR, the missing full messages are requested all at once.
+        """
+        self.channel.factory.master_mr.is_callLater_active.return_value = False
+        # We already have the second Message.
+        self.channel.factory.master_mr.contains.side_effect = lambda msg_hash, msg_type: msg_hash == b'2'
+
+        mr_batch_data = purlegacy_pb2.MRBatchData(mr_data=[purlegacy_pb2.MRData(hash=b'1', type=purlegacy_pb2.LegacyMessage.SL),
+                                                           purlegacy_pb2.MRData(hash=b'2', type=purlegacy_pb2.LegacyMessage.SL),
+                                                           purlegacy_pb2.MRData(hash=b'3', type=999),
+                                                           purlegacy_pb2.MRData(hash=b'4', type=purlegacy_pb2.LegacyMessage.SL)])
+        msg = make_message(func_name=purlegacy_pb2.LegacyMessage.MRB, mrBatchData=mr_batch_data)
+
+        P2PTpuranagement.handle_message_receipt_batch(self.channel, msg)
+
+        self.channel.factory.request_full_message.assert_not_called()
+        self.channel.factory.request_full_messages.assert_called_once_with([mr_batch_data.mr_data[0],
+                                                                            mr_batch_data.mr_data[3]])
+
+    def test_handle_full_message_request_batch(self):
+        self.channel.factory.master_mr.get.side_effect = lambda msg_type, msg_hash: msg_hash if msg_hash != b'2' else None
+
+        mr_batch_data = purlegacy_pb2.MRBatchData(mr_data=[purlegacy_pb2.MRData(hash=b'1', type=purlegacy_pb2.LegacyMessage.SL),
+                                                           purlegacy_pb2.MRData(hash=b'2', type=purlegacy_pb2.LegacyMessage.SL),
+                                                           purlegacy_pb2.MRData(hash=b'3', type=purlegacy_pb2.LegacyMessage.SL)])
+        msg = make_message(func_name=purlegacy_pb2.LegacyMessage.SFMB, mrBatchData=mr_batch_data)
+
+        P2PTpuranagement.handle_full_message_request_batch(self.channel, msg)
+
+        self.assertEqual([b'1', b'3'], [call[0][0] for call in self.channel.send.call_args_list])
+
+    def test_handle_batch_rate_limit(self):
+        """
+        Each item of a MRB or SFMB counts against the peer rate limit, once the limit is hit the batch is dropped.
+        """
+        self.channel.count_in_messages.return_value = False
+        mr_batch_data = purlegacy_pb2.MRBatchData(mr_data=[purlegacy_pb2.MRData(hash=b'1', type=purlegacy_pb2.LegacyMessage.SL),
+                                                           purlegacy_pb2.MRData(hash=b'2', type=purlegacy_pb2.LegacyMessage.SL),
+                                                           purlegacy_pb2.MRData(hash=b'3', type=purlegacy_pb2.LegacyMessage.SL)])
+
+        msg = make_message(func_name=purlegacy_pb2.LegacyMessage.MRB, mrBatchData=mr_batch_data)
+        P2PTpuranagement.handle_message_receipt_batch(self.channel, msg)
+        self.channel.count_in_messages.assert_called_once_with(2)
+        self.channel.factory.request_full_messages.assert_not_called()
+
+        msg = make_message(func_name=purlegacy_pb2.LegacyMessage.SFMB, mrBatchData=mr_batch_data)
+        P2PTpuranagement.handle_full_message_request_batch(self.channel, msg)
+        self.channel.factory.master_mr.get.assert_not_called()
+        self.channel.send.assert_not_called()
+
     @patch('pur.core.p2p.p2pTpuranagement.Transaction')
     def test_handle_message_transaction(self, m_Transaction):
         """
@@ -7,7 +7,7 @@ from unittest import TestCase
 from mock import Mock, patch
 from pypurlib.pypurlib import hstr2bin
 from pyqryptonight.pyqryptonight import StringToUInt256
-from twisted.internet import reactor
+from twisted.internet import reactor, defer
 
 from pur.core import config
 from pur.core.Block import Block
@@ -21,6 +21,7 @@ from pur.core.p2p.IPMetadata import IPMetadata
 from pur.core.p2p.p2pPeerManager import P2PPeerManager
 from pur.core.p2p.p2pfactory import P2PFactory
 from pur.core.p2p.p2pprotocol import P2PProtocol
+from pur.core.processors.VerificationPool import VerificationPool
 from pur.core.purnode import purNode
 from pur.core.txs.MessageTransaction import MessageTransaction
 from pur.core.txs.SlaveTransaction import SlaveTransaction
@@ -60,13 +61,16 @@ class TestP2PFactory(TestCase):
 
         self.channel_1 = Mock(autospec=P2PProtocol,
                               name='mock Channel 1',
-                              peer=IPMetadata('1.1.1.1', config.user.p2p_public_port))
+                              peer=IPMetadata('1.1.1.1', config.user.p2p_public_port),
+                              known_inventory=set())
         self.channel_2 = Mock(autospec=P2PProtocol,
                               name='mock Channel 2',
-                              peer=IPMetadata('2.2.2.2', config.user.p2p_public_port))
+                              peer=IPMetadata('2.2.2.2', config.user.p2p_public_port),
+                              known_inventory=set())
         self.channel_3 = Mock(autospec=P2PProtocol,
                               name='mock Channel 3',
-                              peer=IPMetadata('3.3.3.3', config.user.p2p_public_port))
+                              peer=IPMetadata('3.3.3.3', config.user.p2p_public_port),
+                              known_inventory=set())
 
         self.factory = P2PFactory(chain_manager=ChainManager(state=Mock(autospec=State)), sync_state=None, pur_node=self.m_purnode)
         self.factory.pow = Mock(autospec=POW)
@@ -210,6 +214,23 @@ class TestP2PFactory(TestCase):
             self.factory.monitor_connections()
             self.factory.connect_peer.assert_called_once_with([make_address('4.4.4.4')])
 
+    def test_monitor_connections_prefers_better_scored_candidates(self, m_reactor, m_logger):
+        """
+        The candidates which could not be connected to are tried after the others.
+        """
+        self.factory.connect_peer = Mock(autospec=P2PFactory.connect_peer)
+        self.factory._peer_q = [make_address('5.5.5.5'), make_address('6.6.6.6'), make_address('7.7.7.7')]
+        self.factory.address_book.connection_attempted('5.5.5.5')
+        with patch('pur.core.p2p.p2pfactory.config', autospec=True) as m_config:
+            m_config.user.peer_list = []
+            m_config.user.max_peers_limit = 100
+            self.factory.monitor_connections()
+
+        self.factory.connect_peer.assert_called_once_with([make_address('6.6.6.6'),
+                                                           make_address('7.7.7.7'),
+                                                           make_address('5.5.5.5')])
+        self.assertEqual([], self.factory._peer_q)
+
     def test_monitor_connections_no_peers_connected(self, m_reactor, m_logger):
         self.factory.remove_connection(self.channel_1)
         self.factory.remove_connection(self.channel_2)
@@ -254,6 +275,50 @@ class TestP2PFactory(TestCase):
         # because of already_requested_peers and use the next one in peers_list.
         m_reactor.callLater.assert_called_once()
 
+    def test_request_full_messages(self, m_reactor, m_logger):
+        """
+        The requests of many Messages made to the same peer are sent together.
+        """
+        mr_data_list = [purlegacy_pb2.MRData(type=purlegacy_pb2.LegacyMessage.SL, hash=b'1'),
+                        purlegacy_pb2.MRData(type=purlegacy_pb2.LegacyMessage.SL, hash=b'2'),
+                        purlegacy_pb2.MRData(type=purlegacy_pb2.LegacyMessage.SL, hash=b'3')]
+
+        for mr_data, peer in zip(mr_data_list, [self.channel_1, self.channel_2, self.channel_1]):
+            message_request = MessageRequest()
+            message_request.peers_connection_list.append(peer)
+            self.factory.master_mr.requested_hash[mr_data.hash] = message_request
+
+        self.factory.request_full_messages(mr_data_list)
+
+        self.channel_1.send_full_message_requests.assert_called_once_with([mr_data_list[0], mr_data_list[2]])
+        self.channel_2.send_full_message_requests.assert_called_once_with([mr_data_list[1]])
+        self.channel_3.send_full_message_requests.assert_not_called()
+
+        # A request to the next peer is scheduled for each Message
+        self.assertEqual(3, m_reactor.callLater.call_count)
+
+    def test_request_full_message_prefers_better_scored_peer(self, m_reactor, m_logger):
+        """
+        The Message is requested from the best scored peer first. When the request times out,
+        the peer is scored down and the next peer is requested.
+        """
+        mrData = purlegacy_pb2.MRData(type=purlegacy_pb2.LegacyMessage.SL, hash=b'1234')
+        message_request = MessageRequest()
+        message_request.peers_connection_list = [self.channel_1, self.channel_2]
+        self.factory.master_mr.requested_hash[b'1234'] = message_request
+        self.factory.address_book.add_latency(self.channel_1, 2)
+
+        self.factory.request_full_message(mrData)
+
+        self.channel_1.send.assert_not_called()
+        self.channel_2.send.assert_called_once()
+
+        # The request to channel_2 timed out
+        self.factory.request_full_message(mrData)
+
+        self.channel_1.send.assert_called_once()
+        self.assertEqual(1, self.factory.address_book.get(self.channel_2.peer.ip).failed_requests)
+
     def test_request_full_message_already_requested_this_message_from_another_peer(self, m_reactor, m_logger):
         """
         If we have already requested this Message (from another peer), this function should still go ahead
@@ -352,6 +417,16 @@ class TestP2PFactory(TestCase):
     def test_broadcast(self, m_reactor, m_logger):
         # broadcast msg_type is purlegacy_pb2.LegacyMessage
         self.factory.broadcast(purlegacy_pb2.LegacyMessage.TX, b'1234')
+        self.channel_1.send_message_receipt.assert_called_once()
+        self.channel_2.send_message_receipt.assert_called_once()
+        self.channel_3.send_message_receipt.assert_called_once()
+
+        # The MR is encoded once for all the peers
+        wrapped_message = self.channel_1.send_message_receipt.call_args[0][1]
+        self.assertIs(wrapped_message, self.channel_2.send_message_receipt.call_args[0][1])
+
+        # Blocks are not batched
+        self.factory.broadcast(purlegacy_pb2.LegacyMessage.BK, b'5678')
         self.channel_1.send.assert_called_once()
         self.channel_2.send.assert_called_once()
         self.channel_3.send.assert_called_once()
@@ -361,9 +436,27 @@ class TestP2PFactory(TestCase):
         message_request.peers_connection_list = [self.channel_2, self.channel_3]
         self.factory.master_mr.requested_hash[b'1234'] = message_request
         self.factory.broadcast(purlegacy_pb2.LegacyMessage.SL, b'1234')
-        self.channel_1.send.assert_called_once()
+        self.channel_1.send_message_receipt.assert_called_once()
+        self.channel_2.send_message_receipt.assert_not_called()
+        self.channel_3.send_message_receipt.assert_not_called()
+
+    def test_broadcast_does_not_broadcast_to_peers_knowing_the_hash(self, m_reactor, m_logger):
+        self.channel_2.known_inventory.add(b'1234')
+        self.factory.register_and_broadcast(purlegacy_pb2.LegacyMessage.TX, b'1234', pur_pb2.Transaction())
+        self.channel_1.send_message_receipt.assert_called_once()
+        self.channel_2.send_message_receipt.assert_not_called()
+        self.channel_3.send_message_receipt.assert_called_once()
+
+        # The node does not request again a message it has already relayed, even once forgotten by master_mr
+        self.assertIn(b'1234', self.factory.known_inventory)
+        self.factory.master_mr._hash_msg.clear()
+        message_request = MessageRequest()
+        message_request.peers_connection_list.append(self.channel_2)
+        self.factory.master_mr.requested_hash[b'1234'] = message_request
+
+        self.factory.request_full_message(purlegacy_pb2.MRData(type=purlegacy_pb2.LegacyMessage.TX, hash=b'1234'))
         self.channel_2.send.assert_not_called()
-        self.channel_3.send.assert_not_called()
+        self.assertNotIn(b'1234', self.factory.master_mr.requested_hash)
 
     def test_broadcast_tx(self, m_reactor, m_logger):
         # broadcast_tx() should handle all Transaction Types
@@ -572,32 +665,38 @@ class TestP2PFactoryPeerFetchBlock(TestCase):
             block_number=1,
             headerhashes=[bhstr2bin('123456'), bhstr2bin('deadbeef'), bhstr2bin('abcdef')]
         )
-        self.factory._last_requested_block_number = 1
+        self.factory._sync_peers = {self.channel_1: self.factory._target_node_header_hash}
+        self.factory._next_block_number = 1
+        self.factory._syncing_enabled = True
 
     def test_peer_fetch_block_we_dont_already_have_the_block(self, m_reactor, m_logger):
         """
         Given a peer's NodeHeaderHash (inventory), peer_fetch_block() tries to find a corresponding block in the node's
-        chain. If it can't find it then it sends a fetch_block Message (P2PProtocol.send_fetch_block())
+        chain. If it can't find it then it sends a fetch_block Message (P2PProtocol.send_fetch_block()) for every block
+        within the download window.
         """
         self.factory._chain_manager._state.get_block.return_value = None
 
         self.factory.peer_fetch_block()
 
-        self.channel_1.send_fetch_block.assert_called_once_with(1)
+        self.assertEqual(self.channel_1.send_fetch_block.call_count, 3)
+        self.channel_1.send_fetch_block.assert_any_call(1)
+        self.channel_1.send_fetch_block.assert_any_call(2)
+        self.channel_1.send_fetch_block.assert_any_call(3)
+        self.assertEqual(set(self.factory._requested_blocks.keys()), {1, 2, 3})
 
     def test_peer_fetch_block_we_already_have_the_block(self, m_reactor, m_logger):
         """
         If peer_fetch_block() finds a corresponding block in the node's chain, then it keeps asking the node's local
-        chain for newer blocks until
-        1. the node doesn't have any newer blocks OR
-        2. we've reached the end of the peer's NodeHeaderHash.
-        Then it will ask the peer for the next block after that.
+        chain for newer blocks until the node doesn't have any newer blocks.
+        Then it will ask the peer for the blocks after that.
         """
-        with patch.object(Block, 'get_block', return_value=Block()):
+        with patch.object(Block, 'get_block', side_effect=[Block(), Block(), None]):
             self.factory.peer_fetch_block()
 
             self.assertEqual(Block.get_block.call_count, 3)
             self.channel_1.send_fetch_block.assert_called_once_with(3)
+            self.assertEqual(self.factory._next_block_number, 3)
 
     def test_peer_fetch_block_we_are_synced(self, m_reactor, m_logger):
         """
@@ -610,17 +709,97 @@ class TestP2PFactoryPeerFetchBlock(TestCase):
 
             self.channel_1.send_fetch_block.assert_not_called()
 
-    def test_peer_fetch_block_block_not_found_and_retry(self, m_reactor, m_logger):
+    def test_peer_fetch_block_spread_across_peers(self, m_reactor, m_logger):
         """
-        If we can't find the blocks that the Peer's NodeHeaderHash indicated, and retry >= 5, ban the peer.
-        Assume we are synced.
+        The blocks are requested from all the peers agreeing with the target NodeHeaderHash, the least busy first.
         """
         self.factory._chain_manager._state.get_block.return_value = None
+        self.factory._sync_peers[self.channel_2] = self.factory._target_node_header_hash
+
+        self.factory.peer_fetch_block()
 
-        self.factory.peer_fetch_block(retry=5)
+        self.assertEqual(self.channel_1.send_fetch_block.call_count, 2)
+        self.channel_2.send_fetch_block.assert_called_once_with(2)
+
+    def test_peer_fetch_block_prefers_better_scored_peers(self, m_reactor, m_logger):
+        """
+        The blocks are spread across the peers relative to their score, a peer whose requests failed gets fewer blocks.
+        """
+        self.factory._chain_manager._state.get_block.return_value = None
+        self.factory._sync_peers[self.channel_2] = self.factory._target_node_header_hash
+        self.factory.address_book.get(self.channel_1.peer.ip).failed_requests = 3
+
+        self.factory.peer_fetch_block()
+
+        self.channel_1.send_fetch_block.assert_called_once_with(3)
+        self.assertEqual(self.channel_2.send_fetch_block.call_count, 2)
+
+    def test_peer_fetch_block_skips_disagreeing_peer(self, m_reactor, m_logger):
+        """
+        A peer is not asked for a block, if its headerhash for that block_number disagrees with the target.
+        """
+        self.factory._chain_manager._state.get_block.return_value = None
+        self.factory._sync_peers[self.channel_2] = pur_pb2.NodeHeaderHash(
+            block_number=2,
+            headerhashes=[bhstr2bin('000000')]
+        )
+
+        self.factory.peer_fetch_block()
+
+        self.assertEqual(self.channel_1.send_fetch_block.call_count, 3)
+        self.channel_2.send_fetch_block.assert_not_called()
+
+    @patch('pur.core.p2p.p2pfactory.config', autospec=True)
+    def test_peer_fetch_block_download_window(self, m_config, m_reactor, m_logger):
+        """
+        No more than block_download_window blocks are requested at the same time.
+        """
+        m_config.user.block_download_window = 2
+        self.factory._chain_manager._state.get_block.return_value = None
+
+        self.factory.peer_fetch_block()
+
+        self.assertEqual(self.channel_1.send_fetch_block.call_count, 2)
+        self.assertEqual(set(self.factory._requested_blocks.keys()), {1, 2})
+
+    def test_peer_fetch_block_timeout_reassigns_blocks(self, m_reactor, m_logger):
+        """
+        If a peer doesn't provide the requested block in time, it is banned and its blocks are requested from
+        the other agreeing peers.
+        """
+        self.factory._chain_manager._state.get_block.return_value = None
+        self.factory._sync_peers[self.channel_2] = self.factory._target_node_header_hash
+
+        self.factory.peer_fetch_block()
+        self.factory.block_download_timeout(self.channel_1, 1)
 
         self.m_purnode.peer_manager.ban_channel.assert_called_once_with(self.channel_1)
-        self.factory.is_syncing_finished.assert_called_once_with(force_finish=True)
+        self.assertNotIn(self.channel_1, self.factory._sync_peers)
+        for block_number in [1, 2, 3]:
+            self.assertEqual(self.factory._requested_blocks[block_number][0], self.channel_2)
+
+    def test_peer_fetch_block_skips_pow_pending_block(self, m_reactor, m_logger):
+        """
+        The block whose PoW is being verified is not in the chain yet, but it must not be requested again.
+        """
+        self.factory._chain_manager._state.get_block.return_value = None
+        self.factory._pow_pending_block = Mock(autospec=Block, block_number=1)
+
+        self.factory.peer_fetch_block()
+
+        self.assertEqual(self.channel_1.send_fetch_block.call_count, 2)
+        self.assertEqual(set(self.factory._requested_blocks.keys()), {2, 3})
+
+    def test_peer_fetch_block_no_peer_available(self, m_reactor, m_logger):
+        """
+        If no peer agrees with the target NodeHeaderHash, syncing is stopped.
+        """
+        self.factory._chain_manager._state.get_block.return_value = None
+        self.factory._sync_peers = dict()
+
+        self.factory.peer_fetch_block()
+
+        self.factory.is_syncing_finished.assert_called_with(force_finish=True)
 
 
 @patch('pur.core.misc.ntp.getTime', new=replacement_getTime)
@@ -650,11 +829,20 @@ class TestP2PFactoryBlockReceived(TestCase):
         )
 
         # This mocking ensures that the Block gets added to the Chain, and that the next block is requested.
-        self.factory._target_peer = self.channel_1
-        self.factory._last_requested_block_number = 1
+        self.factory._target_channel = self.channel_1
+        self.factory._sync_peers = {self.channel_1: self.factory._target_node_header_hash}
+        self.factory._requested_blocks = {1: [self.channel_1, Mock()],
+                                          2: [self.channel_1, Mock()]}
+        self.factory._next_block_number = 1
+        self.factory._syncing_enabled = True
         self.factory._chain_manager.add_block.return_value = True
         self.factory.peer_fetch_block = Mock(autospec=P2PFactory.peer_fetch_block)
 
+        # Signatures verified on the VerificationPool are reported as valid, without leaving the reactor thread.
+        self.factory.verification_pool = Mock(autospec=VerificationPool)
+        self.factory.verification_pool.verify_block.side_effect = lambda *args, **kwargs: defer.succeed(True)
+        self.factory.verification_pool.verify_pow.side_effect = lambda *args, **kwargs: defer.succeed(True)
+
     def tearDown(self):
         self.factory.remove_connection(self.channel_1)
         self.factory.remove_connection(self.channel_2)
@@ -665,40 +853,59 @@ class TestP2PFactoryBlockReceived(TestCase):
         P2PChainManager.handle_push_block() simply creates the Block from the incoming Protobuf data, and throws an
         error if it can't.
         But this function is the one that actually:
-        1. checks that the block came from the peer we were talking to
+        1. checks that the block came from the peer it was requested from
         2. checks that the block is the one we requested
         3. validates the block
-        4. requests the next block (since we are in a syncing scenario)
+        4. requests the next blocks (since we are in a syncing scenario)
         """
-        m_reactor.download_monitor = Mock()
         # The peer has sent the whole block that corresponds to block_number 1.
         block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
         block.validate.return_value = True
 
-        self.factory._target_channel = self.channel_1
         self.factory.block_received(self.channel_1, block)
 
         self.factory._chain_manager.add_block.assert_called_once()
-        # After all this, the node should ask for the next block.
+        # After all this, the node should ask for the next blocks.
         self.factory.peer_fetch_block.assert_called_once()
 
         # After the peer sends the last block, we should not ask for any more blocks.
         self.factory._chain_manager.add_block.reset_mock()
         self.factory.peer_fetch_block.reset_mock()
         block_2 = Mock(autospec=Block, block_number=2, headerhash=bhstr2bin('deadbeef'))
-        block.validate.return_value = True
+        block_2.validate.return_value = True
 
         self.factory.block_received(self.channel_1, block_2)
 
         self.factory._chain_manager.add_block.assert_called_once()
         self.assertIsNone(self.factory._target_channel)
+        self.assertFalse(self.factory.is_syncing())
         self.factory.peer_fetch_block.assert_not_called()
 
+    def test_block_received_out_of_order(self, m_reactor, m_logger):
+        """
+        A block received ahead of the chain height is buffered, and added once all the blocks before it are added.
+        """
+        block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
+        block.validate.return_value = True
+        block_2 = Mock(autospec=Block, block_number=2, headerhash=bhstr2bin('deadbeef'))
+        block_2.validate.return_value = True
+
+        self.factory.block_received(self.channel_1, block_2)
+
+        self.factory._chain_manager.add_block.assert_not_called()
+        self.assertIn(2, self.factory._received_blocks)
+
+        self.factory.block_received(self.channel_1, block)
+
+        self.assertEqual(self.factory._chain_manager.add_block.call_count, 2)
+        self.assertEqual(self.factory._chain_manager.add_block.call_args_list[0][0][0], block)
+        self.assertEqual(self.factory._chain_manager.add_block.call_args_list[1][0][0], block_2)
+        self.assertFalse(self.factory.is_syncing())
+
     def test_block_received_suspend_mining_when_we_just_updated_chain(self, m_reactor, m_logger):
         """
         If we've just updated the chain with a new block, start mining a bit later, not now.
         """
-        m_reactor.download_monitor = Mock()
         self.factory._chain_manager.last_block.headerhash = bhstr2bin('123456')
         block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
         self.factory.block_received(self.channel_1, block)
@@ -706,13 +913,12 @@ class TestP2PFactoryBlockReceived(TestCase):
 
     def test_block_received_wrong_peer(self, m_reactor, m_logger):
         """
-        If the incoming Block didn't come from the peer we were talking to, don't process (ignore) it.
+        If the incoming Block didn't come from the peer it was requested from, don't process (ignore) it.
         """
-        m_reactor.download_monitor = Mock()
         block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
         block.validate.return_value = True
 
-        self.factory._target_channel = self.channel_2
+        self.factory._requested_blocks[1] = [self.channel_2, Mock()]
 
         self.factory.block_received(self.channel_1, block)
 
@@ -721,10 +927,9 @@ class TestP2PFactoryBlockReceived(TestCase):
 
     def test_block_received_wrong_block_idx(self, m_reactor, m_logger):
         """
-        If the incoming block_number is not the one we requested, don't process it.
+        If the incoming block_number is not one we requested, don't process it.
         """
-        m_reactor.download_monitor = Mock()
-        block = Mock(autospec=Block, block_number=2, headerhash=bhstr2bin('123456'))
+        block = Mock(autospec=Block, block_number=3, headerhash=bhstr2bin('123456'))
         block.validate.return_value = True
 
         self.factory.block_received(self.channel_1, block)
@@ -735,35 +940,123 @@ class TestP2PFactoryBlockReceived(TestCase):
     def test_block_received_wrong_block_headerhash(self, m_reactor, m_logger):
         """
         The node should already know which block_number should have which headerhash.
+        The peer is banned and the blocks requested from it are requested again from other peers.
         """
-        m_reactor.download_monitor = Mock()
         block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('deadbeef'))
         block.validate.return_value = True
 
         self.factory.block_received(self.channel_1, block)
 
         self.factory._chain_manager.add_block.assert_not_called()
-        self.factory.peer_fetch_block.assert_not_called()
+        self.m_purnode.peer_manager.ban_channel.assert_called_once_with(self.channel_1)
+        self.assertEqual(self.factory._requested_blocks, dict())
+        self.factory.peer_fetch_block.assert_called_once()
 
     def test_block_received_block_fails_validation(self, m_reactor, m_logger):
         """
         Somehow the block fails to validate. Then it shouldn't be added to the chain.
         """
-        m_reactor.download_monitor = Mock()
         block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
         block.validate.return_value = False
 
         self.factory.block_received(self.channel_1, block)
 
         self.factory._chain_manager.add_block.assert_not_called()
-        self.factory.peer_fetch_block.assert_not_called()
+        self.m_purnode.peer_manager.ban_channel.assert_called_once_with(self.channel_1)
+
+    def test_block_received_signature_verification_fails(self, m_reactor, m_logger):
+        """
+        If the VerificationPool finds an invalid signature in the block, the peer is banned.
+        """
+        self.factory.verification_pool.verify_block.side_effect = lambda *args, **kwargs: defer.succeed(False)
+        block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
+        block.validate.return_value = True
+
+        self.factory.block_received(self.channel_1, block)
+
+        self.factory.verification_pool.verify_block.assert_called_once_with(block,
+                                                                            self.factory._chain_manager,
+                                                                            check_pow=False)
+        self.factory._chain_manager.add_block.assert_not_called()
+        self.m_purnode.peer_manager.ban_channel.assert_called_once_with(self.channel_1)
+        self.assertNotIn(1, self.factory._received_blocks)
+
+    def test_block_received_waits_for_signature_verification(self, m_reactor, m_logger):
+        """
+        A block is not added to the chain until the VerificationPool has verified its signatures.
+        """
+        d = defer.Deferred()
+        self.factory.verification_pool.verify_block.side_effect = None
+        self.factory.verification_pool.verify_block.return_value = d
+        block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
+        block.validate.return_value = True
+
+        self.factory.block_received(self.channel_1, block)
+        self.factory._chain_manager.add_block.assert_not_called()
+
+        d.callback(True)
+        self.factory._chain_manager.add_block.assert_called_once_with(block, check_stale=False, verify_signature=False)
+
+    def test_block_received_pow_verification_fails(self, m_reactor, m_logger):
+        """
+        If the VerificationPool finds an invalid PoW, the block is not added and the peer is banned.
+        """
+        self.factory.verification_pool.verify_pow.side_effect = lambda *args, **kwargs: defer.succeed(False)
+        block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
+        block.validate.return_value = True
+
+        self.factory.block_received(self.channel_1, block)
+
+        self.factory.verification_pool.verify_pow.assert_called_once_with(block, self.factory._chain_manager)
+        self.factory._chain_manager.add_block.assert_not_called()
+        self.m_purnode.peer_manager.ban_channel.assert_called_once_with(self.channel_1)
+        self.assertIsNone(self.factory._pow_pending_block)
+
+    def test_block_received_waits_for_pow_verification(self, m_reactor, m_logger):
+        """
+        The PoW of the next block is verified only once its parent has been added to the chain,
+        so the following block waits until the PoW of the previous one has been verified.
+        """
+        d = defer.Deferred()
+        self.factory.verification_pool.verify_pow.side_effect = [d, defer.succeed(True)]
+        block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
+        block.validate.return_value = True
+        block_2 = Mock(autospec=Block, block_number=2, headerhash=bhstr2bin('deadbeef'))
+        block_2.validate.return_value = True
+
+        self.factory.block_received(self.channel_1, block)
+        self.factory.block_received(self.channel_1, block_2)
+
+        self.factory.verification_pool.verify_pow.assert_called_once_with(block, self.factory._chain_manager)
+        self.factory._chain_manager.add_block.assert_not_called()
+        self.assertIn(2, self.factory._received_blocks)
+
+        d.callback(True)
+
+        self.assertEqual(self.factory.verification_pool.verify_pow.call_count, 2)
+        self.assertEqual(self.factory._chain_manager.add_block.call_args_list[0][0][0], block)
+        self.assertEqual(self.factory._chain_manager.add_block.call_args_list[1][0][0], block_2)
+        self.assertFalse(self.factory.is_syncing())
+
+    def test_block_received_drops_stale_received_blocks(self, m_reactor, m_logger):
+        """
+        A block below the next block number, which is already in the chain, is dropped from the received blocks
+        instead of staying there until syncing is finished.
+        """
+        block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
+        block.validate.return_value = True
+        self.factory._received_blocks[0] = [self.channel_1, Mock(autospec=Block, block_number=0), True]
+
+        self.factory.block_received(self.channel_1, block)
+
+        self.assertEqual(self.factory._next_block_number, 2)
+        self.assertNotIn(0, self.factory._received_blocks)
 
     def test_block_received_adding_block_fails(self, m_reactor, m_logger):
         """
-        If the block couldn't be added to the chain for any reason, don't ask for the next block.
+        If the block couldn't be added to the chain for any reason, ban the peer and request the block again.
         In fact, don't even run is_syncing_finished(), for it might mess up our current state.
         """
-        m_reactor.download_monitor = Mock()
         block = Mock(autospec=Block, block_number=1, headerhash=bhstr2bin('123456'))
         block.validate.return_value = True
         self.factory._chain_manager.add_block.return_value = False
@@ -771,5 +1064,6 @@ class TestP2PFactoryBlockReceived(TestCase):
 
         self.factory.block_received(self.channel_1, block)
 
-        self.factory.peer_fetch_block.assert_not_called()
+        self.m_purnode.peer_manager.ban_channel.assert_called_once_with(self.channel_1)
+        self.assertEqual(self.factory._next_block_number, 1)
         self.factory.is_syncing_finished.assert_not_called()
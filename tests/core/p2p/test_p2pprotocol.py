@@ -7,12 +7,13 @@ from unittest import TestCase
 from mock import Mock, patch, MagicMock
 from pypurlib.pypurlib import hstr2bin, bin2hstr
 
+from pur.core import config
 from pur.core.misc import logger
 from pur.core.p2p import p2pPeerManager
 from pur.core.p2p.p2pfactory import P2PFactory, p2p_msg_priority
 from pur.core.p2p.p2pprotocol import P2PProtocol
 from pur.core.purnode import purNode
-from pur.generated import purlegacy_pb2
+from pur.generated import purlegacy_pb2, pur_pb2
 from tests.misc.helper import replacement_getTime
 
 logger.initialize_default()
@@ -43,6 +44,11 @@ class TestP2PProtocol(TestCase):
         attrs = {'getPeer.return_value': sample_peer_1, 'getHost.return_value': sample_host}
         self.channel.transport = Mock(**attrs)
 
+        # Queued messages are flushed by calling _flush(), as the reactor does at its next iteration
+        reactor_patcher = patch('pur.core.p2p.p2pprotocol.reactor')
+        self.m_reactor = reactor_patcher.start()
+        self.addCleanup(reactor_patcher.stop)
+
     def tearDown(self):
         del self.channel
 
@@ -76,7 +82,7 @@ class TestP2PProtocol(TestCase):
         self.channel.tx_manager.new_channel.assert_called_once_with(self.channel)
 
         # send_peer_list and send_version_request messages should be in the outgoing queue.
-        self.assertEqual(self.channel.outgoing_queue.unfinished_tasks, 2)
+        self.assertEqual(len(self.channel.outgoing_queue), 2)
 
     def test_connectionLost_behavior(self):
         """
@@ -93,10 +99,11 @@ class TestP2PProtocol(TestCase):
         getTime.return_value = 1525078652.9991353
         data = b'\x00\x00\x00\x80\x08\x01"|\n\x0e66.175.217.203\n\x0e138.195.214.85\n\r35.177.72.178\n\x0e173.249.22.240\n\x0c2.238.131.20\n\r77.64.144.198\n\r34.208.138.15\n\x0f144.202.107.148\x00\x00\x00\x00'  # noqa
         self.channel.dataReceived(data)
+        self.channel._flush()
 
         # Twisted transport should have received acknowledgement message to send out
         acknowledgement_bytes = b'\x00\x00\x00\x08\x08\x13\xaa\x01\x03\x08\x84\x01'
-        self.channel.transport.write.assert_called_once_with(acknowledgement_bytes)
+        self.channel.transport.writeSequence.assert_called_once_with([acknowledgement_bytes])
 
     @patch('pur.core.misc.ntp.getTime')
     @patch('pur.core.p2p.p2pprotocol.logger', autospec=True)
@@ -109,7 +116,7 @@ class TestP2PProtocol(TestCase):
         config_dev.trust_min_mspurount = 10
         getTime.return_value = 1525078652.9991353
         acknowledgement_bytes = b'\x00\x00\x00\x08\x08\x13\xaa\x01\x03\x08\x88\x01'
-        self.channel._buffer = 10 * acknowledgement_bytes
+        self.channel._buffer.write(10 * acknowledgement_bytes)
         self.channel.dataReceived(acknowledgement_bytes)
         self.channel.transport.loseConnection.assert_called()
 
@@ -118,7 +125,7 @@ class TestP2PProtocol(TestCase):
         getTime.return_value = 1525078652.9991353
         self.channel.rate_limit = 2
         acknowledgement_bytes = b'\x00\x00\x00\x08\x08\x13\xaa\x01\x03\x08\x88\x01'
-        self.channel._buffer = 10 * acknowledgement_bytes
+        self.channel._buffer.write(10 * acknowledgement_bytes)
         self.channel.dataReceived(acknowledgement_bytes)
         self.channel.peer_manager.ban_channel.assert_called_with(self.channel)
 
@@ -127,43 +134,138 @@ class TestP2PProtocol(TestCase):
         getTime.return_value = 1525078652.9991353
         version_request = b'\x00\x00\x00\x02\x1a\x00'
         self.channel.send_version_request()
-        self.channel.transport.write.assert_called_with(version_request)
+        self.channel._flush()
+        self.channel.transport.writeSequence.assert_called_with([version_request])
 
     @patch('pur.core.misc.ntp.getTime')
     def test_send_sync(self, getTime):
         getTime.return_value = 1525078652.9991353
         self.channel.send_sync(synced=True)
         synced = b'\x00\x00\x00\r\x08\x10\x92\x01\x08\n\x06Synced'
-        self.channel.transport.write.assert_called_with(synced)
+        self.channel._flush()
+        self.channel.transport.writeSequence.assert_called_with([synced])
 
         self.channel.send_sync(synced=False)
         unsynced = b'\x00\x00\x00\x05\x08\x10\x92\x01\x00'
-        self.channel.transport.write.assert_called_with(unsynced)
+        self.channel._flush()
+        self.channel.transport.writeSequence.assert_called_with([unsynced])
 
     @patch('pur.core.misc.ntp.getTime')
     def test_send_fetch_block(self, getTime):
         getTime.return_value = 1525078652.9991353
         block_request = b'\x00\x00\x00\x06\x08\x06B\x02\x08\x01'
         self.channel.send_fetch_block(1)
-        self.channel.transport.write.assert_called_with(block_request)
+        self.channel._flush()
+        self.channel.transport.writeSequence.assert_called_with([block_request])
 
     @patch('pur.core.misc.ntp.getTime')
     def test_get_headerhash_list(self, getTime):
         getTime.return_value = 1525078652.9991353
         get_headerhash_request = b'\x00\x00\x00\x05\x08\x12\xa2\x01\x00'
         self.channel.send_get_headerhash_list(1)
-        self.channel.transport.write.assert_called_with(get_headerhash_request)
+        self.channel._flush()
+        self.channel.transport.writeSequence.assert_called_with([get_headerhash_request])
+
+    @patch('pur.core.misc.ntp.getTime')
+    def test_send_coalesced(self, getTime):
+        getTime.return_value = 1525078652.9991353
+        self.channel.send_get_headerhash_list(1)
+        self.channel.send_version_request()
+        self.channel.send_fetch_block(1)
+
+        # A single write is scheduled for the reactor iteration
+        self.m_reactor.callLater.assert_called_once_with(0, self.channel._flush)
+        self.channel.transport.writeSequence.assert_not_called()
+
+        self.channel._flush()
+
+        # Ordered by priority, then by the order they were sent
+        version_request = b'\x00\x00\x00\x02\x1a\x00'
+        block_request = b'\x00\x00\x00\x06\x08\x06B\x02\x08\x01'
+        get_headerhash_request = b'\x00\x00\x00\x05\x08\x12\xa2\x01\x00'
+        self.channel.transport.writeSequence.assert_called_once_with([version_request,
+                                                                      block_request,
+                                                                      get_headerhash_request])
+        self.assertEqual(len(version_request + block_request + get_headerhash_request), self.channel.bytes_sent)
+
+    @patch('pur.core.p2p.p2pprotocol.time')
+    @patch('pur.core.misc.ntp.getTime')
+    def test_pop_round_trip_time(self, getTime, m_time):
+        getTime.return_value = 1525078652.9991353
+        monotonic = m_time.monotonic
+        monotonic.return_value = 10
+
+        # The peer does not acknowledge a P2P_ACK alone
+        self.channel.send(purlegacy_pb2.LegacyMessage(func_name=purlegacy_pb2.LegacyMessage.P2P_ACK,
+                                                      p2pAckData=pur_pb2.P2PAcknowledgement(bytes_processed=1)))
+        self.channel._flush()
+        self.assertIsNone(self.channel.pop_round_trip_time())
+
+        self.channel.send_version_request()
+        self.channel._flush()
+        monotonic.return_value = 11
+        self.channel.send_fetch_block(1)
+        self.channel._flush()
+
+        # Measured from the first message written since the previous P2P_ACK
+        monotonic.return_value = 10.25 + 2
+        self.assertEqual(2.25, self.channel.pop_round_trip_time())
+        self.assertIsNone(self.channel.pop_round_trip_time())
+
+    @patch('pur.core.misc.ntp.getTime')
+    def test_send_message_receipt(self, getTime):
+        getTime.return_value = 1525078652.9991353
+        mr_data_1 = purlegacy_pb2.MRData(hash=b'1', type=purlegacy_pb2.LegacyMessage.TX)
+        mr_data_2 = purlegacy_pb2.MRData(hash=b'2', type=purlegacy_pb2.LegacyMessage.TX)
+
+        # Peers not supporting MR_BATCH get a MR per message
+        self.channel.send_message_receipt(mr_data_1)
+        self.channel.send_message_receipt(mr_data_2)
+        self.assertEqual(2, len(self.channel.outgoing_queue))
+        self.channel._flush()
+
+        # Otherwise the message receipts are sent together once the window elapsed
+        self.channel.peer_features = purlegacy_pb2.VEData.MR_BATCH
+        self.m_reactor.callLater.reset_mock()
+        self.channel.send_message_receipt(mr_data_1)
+        self.channel.send_message_receipt(mr_data_2)
+        self.m_reactor.callLater.assert_called_once_with(config.user.mr_batch_window, self.channel.flush_message_receipts)
+        self.assertEqual(0, len(self.channel.outgoing_queue))
+
+        self.channel.flush_message_receipts()
+        self.assertEqual(1, len(self.channel.outgoing_queue))
+        msg = self.channel.outgoing_queue.get().message
+        self.assertEqual(purlegacy_pb2.LegacyMessage.MRB, msg.func_name)
+        self.assertEqual([mr_data_1, mr_data_2], list(msg.mrBatchData.mr_data))
+
+    @patch('pur.core.misc.ntp.getTime')
+    def test_send_full_message_requests(self, getTime):
+        getTime.return_value = 1525078652.9991353
+        mr_data_list = [purlegacy_pb2.MRData(hash=b'1', type=purlegacy_pb2.LegacyMessage.TX, block_number=5),
+                        purlegacy_pb2.MRData(hash=b'2', type=purlegacy_pb2.LegacyMessage.TX)]
+
+        self.channel.send_full_message_requests(mr_data_list)
+        self.assertEqual([purlegacy_pb2.LegacyMessage.SFM, purlegacy_pb2.LegacyMessage.SFM],
+                         [self.channel.outgoing_queue.get().message.func_name for _ in range(2)])
+
+        self.channel.peer_features = purlegacy_pb2.VEData.MR_BATCH
+        self.channel.send_full_message_requests(mr_data_list)
+        self.assertEqual(1, len(self.channel.outgoing_queue))
+        msg = self.channel.outgoing_queue.get().message
+        self.assertEqual(purlegacy_pb2.LegacyMessage.SFMB, msg.func_name)
+        self.assertEqual([b'1', b'2'], [mr_data.hash for mr_data in msg.mrBatchData.mr_data])
+        self.assertEqual(0, msg.mrBatchData.mr_data[0].block_number)
 
     def test_parse_buffer_works(self):
-        self.channel._buffer = bytes(hstr2bin('000000191a170a0776657273696f6e120c67656e657369735f68617368' +
-                                              '000000191a170a0776657273696f6e120c67656e657369735f68617368'))
+        self.channel._buffer.write(bytes(hstr2bin('000000191a170a0776657273696f6e120c67656e657369735f68617368' +
+                                                  '000000191a170a0776657273696f6e120c67656e657369735f68617368')))
         messages = self.channel._parse_buffer([0])
         self.assertEqual(2, len(list(messages)))
 
     @patch('pur.core.p2p.p2pprotocol.logger', autospec=True)
     def test_parse_buffer_invalid_data(self, logger):
-        self.channel._buffer = bytes(hstr2bin('0000000000000000000000000000000000000000000000000000000000' +
-                                              '1111111111111111111111111111111111111111111111111111111111'))
+        self.channel._buffer.write(bytes(hstr2bin('0000000000000000000000000000000000000000000000000000000000' +
+                                                  '1111111111111111111111111111111111111111111111111111111111')))
 
         messages = self.channel._parse_buffer([0])
         messages_list = list(messages)
@@ -3,6 +3,7 @@
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 from unittest import TestCase
 from mock import Mock, patch
+from twisted.internet import defer
 
 from pur.core.misc import logger
 from pur.core.processors.TxnProcessor import TxnProcessor
@@ -11,6 +12,7 @@ from pur.core.State import State
 from pur.core.OptimizedAddressState import OptimizedAddressState
 from pur.core.txs.TransferTransaction import TransferTransaction
 from pur.core.TransactionPool import TransactionPool
+from pur.core.processors.VerificationPool import VerificationPool
 from tests.misc.helper import replacement_getTime
 from pur.core.p2p.p2pfactory import P2PFactory
 
@@ -131,3 +133,30 @@ class TestTxnProcessor(TestCase):
         self.assertEqual([], tx_results)
         self.m_txpool.add_tx_to_pool.assert_not_called()
         self.m_broadcast_tx.assert_not_called()
+
+    def test_txnprocessor_verification_pool(self, m_get_slave, m_logger):
+        """
+        With a VerificationPool, signatures of a batch of transactions are verified in parallel, then the stateful
+        validation is done for each transaction without verifying the signature again.
+        """
+        m_get_slave.return_value = None
+        self.chain_manager.validate_all.return_value = True
+        m_verification_pool = Mock(autospec=VerificationPool, thread_count=2)
+        m_verification_pool.verify_transactions.side_effect = [defer.succeed([True, False]),
+                                                               defer.succeed([True, True])]
+        self.txnprocessor = TxnProcessor(chain_manager=self.chain_manager,
+                                         transaction_pool_obj=self.m_txpool,
+                                         broadcast_tx=self.m_broadcast_tx,
+                                         verification_pool=m_verification_pool)
+
+        tx_results = []
+        for d in self.txnprocessor:
+            d.addCallback(tx_results.extend)
+
+        m_verification_pool.verify_transactions.assert_any_call([self.tx1, self.tx2])
+        m_verification_pool.verify_transactions.assert_any_call([self.tx3, self.tx4])
+        self.assertEqual([True, False, True, True], tx_results)
+        self.assertEqual(3, self.chain_manager.validate_all.call_count)
+        self.chain_manager.validate_all.assert_called_with(self.tx4, check_nonce=False, verify_signature=False)
+        self.assertEqual(3, self.m_txpool.add_tx_to_pool.call_count)
+        self.assertEqual(3, self.m_broadcast_tx.call_count)
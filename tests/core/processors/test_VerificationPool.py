@@ -0,0 +1,89 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from unittest import TestCase
+
+from mock import Mock, patch
+from twisted.internet import defer
+
+from pur.core.Block import Block
+from pur.core.ChainManager import ChainManager
+from pur.core.misc import logger
+from pur.core.processors.VerificationPool import VerificationPool
+from pur.core.txs.TransferTransaction import TransferTransaction
+
+logger.initialize_default()
+
+
+def replacement_deferToThreadPool(reactor, threadpool, f, *args, **kwargs):
+    return defer.maybeDeferred(f, *args, **kwargs)
+
+
+@patch('pur.core.processors.VerificationPool.deferToThreadPool', new=replacement_deferToThreadPool)
+class TestVerificationPool(TestCase):
+    def setUp(self):
+        self.verification_pool = VerificationPool(thread_count=4)
+
+    def test_thread_count(self):
+        self.assertEqual(4, self.verification_pool.thread_count)
+
+    def test_verify_transactions(self):
+        tx1 = Mock(autospec=TransferTransaction)
+        tx1.validate.return_value = True
+        tx2 = Mock(autospec=TransferTransaction)
+        tx2.validate.return_value = False
+        tx3 = Mock(autospec=TransferTransaction)
+        tx3.validate.side_effect = Exception('Native code failure')
+
+        results = []
+        self.verification_pool.verify_transactions([tx1, tx2, tx3]).addCallback(results.extend)
+
+        self.assertEqual([True, False, False], results)
+        tx1.validate.assert_called_once_with(True)
+
+    @patch('pur.core.processors.VerificationPool.Transaction.from_pbdata')
+    def test_verify_block(self, m_from_pbdata):
+        tx = Mock(autospec=TransferTransaction)
+        tx.validate.return_value = True
+        m_from_pbdata.return_value = tx
+
+        block = Mock(autospec=Block, block_number=5, transactions=[Mock(), Mock(), Mock()])
+        chain_manager = Mock(autospec=ChainManager)
+        chain_manager.validate_mining_nonce.return_value = True
+
+        results = []
+        self.verification_pool.verify_block(block, chain_manager).addCallback(results.append)
+
+        self.assertEqual([True], results)
+        chain_manager.validate_mining_nonce.assert_called_once()
+        # Coinbase transaction is not verified
+        self.assertEqual(2, tx.validate.call_count)
+
+    @patch('pur.core.processors.VerificationPool.Transaction.from_pbdata')
+    def test_verify_block_invalid_signature(self, m_from_pbdata):
+        tx = Mock(autospec=TransferTransaction)
+        tx.validate.side_effect = [True, False]
+        m_from_pbdata.return_value = tx
+
+        block = Mock(autospec=Block, block_number=5, transactions=[Mock(), Mock(), Mock()])
+        chain_manager = Mock(autospec=ChainManager)
+
+        results = []
+        self.verification_pool.verify_block(block, chain_manager, check_pow=False).addCallback(results.append)
+
+        self.assertEqual([False], results)
+        chain_manager.validate_mining_nonce.assert_not_called()
+
+    def test_verify_pow(self):
+        block = Mock(autospec=Block, block_number=5)
+        chain_manager = Mock(autospec=ChainManager)
+        chain_manager.validate_mining_nonce.return_value = True
+
+        results = []
+        self.verification_pool.verify_pow(block, chain_manager).addCallback(results.append)
+        self.assertEqual([True], results)
+
+        chain_manager.validate_mining_nonce.side_effect = Exception('Parent block metadata not found')
+        results = []
+        self.verification_pool.verify_pow(block, chain_manager).addCallback(results.append)
+        self.assertEqual([False], results)
@@ -47,3 +47,17 @@ class TestTokenMetadata(TestCase):
                         b'"cumulativeDifficulty": "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="\n}'
 
         self.assertEqual(tmp_json, expected_json)
+
+    def test_update_last_timestamps(self):
+        block_metadata = BlockMetadata.create()
+        self.assertFalse(block_metadata.has_last_N_timestamps)
+
+        block_metadata.set_timestamp(30)
+        self.assertTrue(block_metadata.has_last_N_timestamps)
+
+        block_metadata.update_last_headerhashes([b'test1', b'test2'], b'test3')
+        self.assertFalse(block_metadata.has_last_N_timestamps)
+
+        block_metadata.update_last_timestamps([10, 20], 25)
+        self.assertTrue(block_metadata.has_last_N_timestamps)
+        self.assertEqual([10, 20, 25], list(block_metadata.last_N_timestamps))
@@ -3,12 +3,13 @@
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 from unittest import TestCase
 from os import urandom
+from statistics import median
 
 from mock import Mock, patch, PropertyMock, MagicMock
 from pypurlib.pypurlib import hstr2bin
 from pyqryptonight.pyqryptonight import StringToUInt256
 
-from pur.generated import purstateinfo_pb2
+from pur.generated import pur_pb2, purstateinfo_pb2
 from pur.core import config
 from pur.crypto.purss import purSS
 from pur.crypto.QRandomX import QRandomX
@@ -17,6 +18,7 @@ from pur.core.MultiSigAddressState import MultiSigAddressState
 from pur.core.Block import Block
 from pur.core.BlockMetadata import BlockMetadata
 from pur.core.ChainManager import ChainManager
+from pur.core.ChainSnapshot import ChainSnapshot
 from pur.core.DifficultyTracker import DifficultyTracker
 from pur.core.GenesisBlock import GenesisBlock
 from pur.core.PaginatedBitfield import PaginatedBitfield
@@ -111,6 +113,63 @@ class TestChainManagerReal(TestCase):
         self.chain_manager.load(self.genesis_block)
         self.chain_manager._fork_recovery.assert_called_with(self.genesis_block, m_fork_state)
 
+    def test_snapshot(self):
+        self.assertIsNone(self.chain_manager.snapshot)
+        self.chain_manager.load(self.genesis_block)
+
+        snapshot = self.chain_manager.snapshot
+        self.assertIsInstance(snapshot, ChainSnapshot)
+        self.assertEqual(0, snapshot.height)
+        self.assertEqual(self.genesis_block.headerhash, snapshot.get_block_by_number(0).headerhash)
+
+        # Writes made after the snapshot are only visible from the next snapshot
+        alice_address = get_alice_purss().address
+        address_state = OptimizedAddressState.get_default(alice_address)
+        address_state.pbdata.balance = 10
+        OptimizedAddressState.put_optimized_addresses_state(self.state, {alice_address: address_state})
+        self.assertEqual(0, snapshot.get_address_balance(alice_address))
+        self.assertEqual(10, self.chain_manager.get_address_balance(alice_address))
+
+        self.chain_manager._update_snapshot()
+        self.assertEqual(10, self.chain_manager.snapshot.get_address_balance(alice_address))
+
+        with self.assertRaises(NotImplementedError):
+            snapshot._state._db.put_raw(b'key', b'value')
+
+    def test_block_cache(self):
+        self.chain_manager.load(self.genesis_block)
+        headerhash = self.genesis_block.headerhash
+
+        self.assertEqual(headerhash, self.chain_manager.get_block(headerhash).headerhash)
+        hits = self.chain_manager.get_block_cache_stats()['hits']
+        with patch('pur.core.Block.Block.get_block') as m_get_block:
+            self.assertEqual(headerhash, self.chain_manager.get_block(headerhash).headerhash)
+            m_get_block.assert_not_called()
+        self.assertEqual(hits + 1, self.chain_manager.get_block_cache_stats()['hits'])
+
+        # Metadata is returned as a copy, updating it must not update the cache
+        block_metadata = self.chain_manager.get_block_metadata(headerhash)
+        block_metadata.add_child_headerhash(b'child')
+        self.assertEqual(0, len(self.chain_manager.get_block_metadata(headerhash).child_headerhashes))
+
+    def test_block_cache_invalidation(self):
+        self.chain_manager.load(self.genesis_block)
+        headerhash = self.genesis_block.headerhash
+        self.assertEqual(headerhash, self.chain_manager.get_block_header_hash_by_number(0))
+
+        # Number mapping updated in a batch is read from the db until the batch is written
+        batch = self.state.batch
+        block_number_mapping = pur_pb2.BlockNumberMapping(headerhash=b'new headerhash')
+        self.chain_manager._put_block_number_mapping(0, block_number_mapping, batch)
+        self.assertEqual(headerhash, self.chain_manager.get_block_header_hash_by_number(0))
+        self.chain_manager._write_batch(batch)
+        self.assertEqual(b'new headerhash', self.chain_manager.get_block_header_hash_by_number(0))
+
+        batch = self.state.batch
+        self.chain_manager._remove_block_number_mapping(0, batch)
+        self.chain_manager._write_batch(batch)
+        self.assertIsNone(self.chain_manager.get_block_header_hash_by_number(0))
+
     @patch('pur.core.misc.ntp.getTime')
     def test_simple_add_block(self, time_mock):
         # Simply test that adding a block on top of the genesis block works.
@@ -3955,6 +4014,65 @@ class TestChainManagerReal(TestCase):
         self.assertEqual(node_header_hash.headerhashes,
                          [self.genesis_block.headerhash, block_1.headerhash, block_2.headerhash])
 
+    @patch('pur.core.misc.ntp.getTime', new=replacement_getTime)
+    def test_block_metadata_timestamps(self):
+        block_1 = create_block(1, self.genesis_block, alice.address)
+        block_2 = create_block(2, block_1, alice.address)
+
+        self.chain_manager.load(self.genesis_block)
+        self.chain_manager.add_block(block_1)
+        self.chain_manager.add_block(block_2)
+
+        block_metadata = self.chain_manager.get_block_metadata(block_2.headerhash)
+        self.assertEqual(block_2.timestamp, block_metadata.timestamp)
+        self.assertEqual([self.genesis_block.timestamp, block_1.timestamp], list(block_metadata.last_N_timestamps))
+
+        # Measurement is computed from the timestamps kept in the metadata, without loading any block
+        with patch('pur.core.Block.Block.get_block') as m_get_block:
+            measurement = self.chain_manager.get_measurement(config.dev,
+                                                             block_2.timestamp + 60,
+                                                             block_2.headerhash,
+                                                             block_metadata)
+            m_get_block.assert_not_called()
+        expected_measurement = (block_2.timestamp + 60 - block_1.timestamp + config.dev.block_timing_in_seconds) // 2
+        self.assertEqual(expected_measurement, measurement)
+
+    def test_difficulty_int_conversion(self):
+        difficulty = StringToUInt256('123456789012345678901234567890')
+        self.assertEqual(123456789012345678901234567890, DifficultyTracker.to_int(difficulty))
+        self.assertEqual(difficulty, DifficultyTracker.from_int(123456789012345678901234567890))
+
+    @patch('pur.core.misc.ntp.getTime', new=replacement_getTime)
+    def test_get_block_size_limit(self):
+        block_1 = create_block(1, self.genesis_block, alice.address)
+        block_2 = create_block(2, block_1, alice.address)
+
+        self.chain_manager.load(self.genesis_block)
+        self.chain_manager.add_block(block_1)
+        self.chain_manager.add_block(block_2)
+
+        block_metadata = self.chain_manager.get_block_metadata(block_2.headerhash)
+        self.assertEqual([self.genesis_block.size, block_1.size, block_2.size],
+                         list(block_metadata.last_N_block_sizes))
+
+        block_3 = create_block(3, block_2, alice.address)
+        with patch('pur.core.Block.Block.get_block') as m_get_block:
+            block_size_limit = self.chain_manager.get_block_size_limit(block_3, config.dev)
+            m_get_block.assert_not_called()
+        self.assertEqual(max(config.dev.block_min_size_limit_in_bytes,
+                             config.dev.size_multiplier * median([self.genesis_block.size, block_1.size, block_2.size])),
+                         block_size_limit)
+
+    def test_get_block_size_limit_without_block_sizes(self):
+        # The block metadata written by gen_blocks has no block sizes, so the last blocks are loaded
+        blocks = gen_blocks(20, self.state, alice.address)
+        self.assertEqual(self.chain_manager.get_block_size_limit(blocks[-1], config.dev), 1048576)
+
+        # get_block_size_limit() should return None if it couldn't get any blocks from db
+        chain_manager = ChainManager(self.state)
+        with patch('pur.core.Block.Block.get_block', return_value=None):
+            self.assertIsNone(chain_manager.get_block_size_limit(blocks[-1], config.dev))
+
     @patch('pur.core.misc.ntp.getTime', new=replacement_getTime)
     def test_fork_recovery(self):
         # When the node finds that it has been on the slower chain all this time, it runs _fork_recovery() to _rollback
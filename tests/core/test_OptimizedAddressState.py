@@ -47,6 +47,21 @@ class TestOptimizedAddressState(TestCase):
         address_state = OptimizedAddressState.get_optimized_address_state(self.state, alice_address)
         self.assertTrue(isinstance(address_state.address, bytes))
 
+    def test_get_optimized_addresses_state_chunks(self):
+        addresses = [alice.address, slave.address, config.dev.coinbase_address]
+        addresses_state = {address: OptimizedAddressState.get_default(address) for address in addresses}
+        OptimizedAddressState.put_optimized_addresses_state(self.state, addresses_state)
+        # Keys of the same keyspace, which are not address states
+        for address in addresses:
+            self.state._db.put_raw(address[:1] + b'\xff' * 31, b'not an address state')
+
+        self.assertEqual(sorted(addresses), sorted(OptimizedAddressState.get_addresses(self.state)))
+
+        size = addresses_state[alice.address].pbdata.ByteSize()
+        chunks = list(OptimizedAddressState.get_optimized_addresses_state_chunks(self.state, 2 * size))
+        self.assertEqual([2, 1], [len(chunk) for chunk in chunks])
+        self.assertEqual(sorted(addresses), sorted(address_state.address for chunk in chunks for address_state in chunk))
+
     def test_get_optimized_address_state2(self):
         alice_purss = get_alice_purss()
 
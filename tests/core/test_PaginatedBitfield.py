@@ -11,7 +11,8 @@ from pur.core.misc import logger
 from pur.core.State import State
 from pur.core.OptimizedAddressState import OptimizedAddressState
 from pur.core.PaginatedBitfield import PaginatedBitfield
-from tests.misc.helper import get_alice_purss, get_slave_purss, set_pur_dir
+from pur.generated import pur_pb2
+from tests.misc.helper import get_alice_purss, get_bob_purss, get_slave_purss, set_pur_dir
 
 logger.initialize_default()
 
@@ -307,3 +308,109 @@ class TestPaginatedBitfield(TestCase):
             for i in range(total_ots - 2, -1, -1):
                 paginated_bitfield.unset_ots_key(addresses_state, address, i)
                 self.assertEqual(address_state.ots_bitfield_used_page, i // config.dev.ots_tracking_per_page)
+
+    def test_count_used_ots_keys(self):
+        self.assertEqual(0, PaginatedBitfield.count_used_ots_keys(bytearray(16)))
+        self.assertEqual(128, PaginatedBitfield.count_used_ots_keys(bytearray(b'\xff' * 16)))
+        self.assertEqual(5, PaginatedBitfield.count_used_ots_keys(bytearray(b'\x01\x00\x0f')))
+
+    def test_find_unused_ots_key(self):
+        ots_bitfield = bytearray(b'\xff\xff\x0f\x00')
+        self.assertEqual(20, PaginatedBitfield.find_unused_ots_key(ots_bitfield))
+        self.assertEqual(20, PaginatedBitfield.find_unused_ots_key(ots_bitfield, 3))
+        self.assertEqual(22, PaginatedBitfield.find_unused_ots_key(ots_bitfield, 22))
+        self.assertEqual(31, PaginatedBitfield.find_unused_ots_key(ots_bitfield, 31))
+        self.assertIsNone(PaginatedBitfield.find_unused_ots_key(ots_bitfield, 32))
+        self.assertIsNone(PaginatedBitfield.find_unused_ots_key(bytearray(b'\xff' * 4)))
+
+        ots_bitfield = bytearray(b'\xff\xfe\xff\xff')
+        self.assertEqual(8, PaginatedBitfield.find_unused_ots_key(ots_bitfield))
+        self.assertIsNone(PaginatedBitfield.find_unused_ots_key(ots_bitfield, 9))
+
+    def test_get_paginated_data_from_data_list(self):
+        """
+        Pages written as DataList by older nodes must be loaded as a bytearray and
+        rewritten as raw bytes by migrate_bitfields.
+        """
+        with set_pur_dir('no_data'):
+            state = State()
+            paginated_bitfield = PaginatedBitfield(True, state._db)
+            address = alice.address
+            key = paginated_bitfield.generate_bitfield_key(address, 1)
+
+            values = [b'\x00'] * config.dev.ots_bitfield_size
+            values[0] = b'\x05'
+            state._db.put_raw(key, pur_pb2.DataList(values=values).SerializeToString())
+
+            ots_bitfield = paginated_bitfield.get_paginated_data(address, 1)
+            self.assertEqual(config.dev.ots_bitfield_size, len(ots_bitfield))
+            self.assertTrue(paginated_bitfield.ots_key_reuse(ots_bitfield, 0))
+            self.assertFalse(paginated_bitfield.ots_key_reuse(ots_bitfield, 1))
+            self.assertTrue(paginated_bitfield.ots_key_reuse(ots_bitfield, 2))
+
+            self.assertEqual(1, paginated_bitfield.migrate_bitfields())
+            self.assertEqual(bytes(ots_bitfield), bytes(state._db.get_raw(key)))
+            self.assertEqual(0, paginated_bitfield.migrate_bitfields())
+            self.assertEqual(ots_bitfield, paginated_bitfield.get_paginated_data(address, 1))
+
+    def test_migrate_bitfields_summaries(self):
+        """
+        The summary of each address is written while migrating, also when the writes are split across batches.
+        """
+        with set_pur_dir('no_data'):
+            state = State()
+            paginated_bitfield = PaginatedBitfield(True, state._db)
+            full_page = bytearray(config.dev.ots_bitfield_size)
+            full_page[0:8] = b'\xff' * 8
+            pages = [(alice.address, full_page, True),
+                     (get_bob_purss().address, bytearray(config.dev.ots_bitfield_size), True),
+                     (get_slave_purss().address, full_page, False)]
+            for address, ots_bitfield, as_data_list in pages:
+                data = bytes(ots_bitfield)
+                if as_data_list:
+                    values = [bytes([byte]) for byte in ots_bitfield]
+                    data = pur_pb2.DataList(values=values).SerializeToString()
+                state._db.put_raw(paginated_bitfield.generate_bitfield_key(address, 1), data)
+
+            self.assertEqual(2, paginated_bitfield.migrate_bitfields(writes_per_batch=1))
+
+            for address, ots_bitfield, _ in pages:
+                self.assertEqual(ots_bitfield, paginated_bitfield.get_paginated_data(address, 1))
+                expected_summary = b'\x01' if ots_bitfield == full_page else b'\x00'
+                self.assertEqual(expected_summary, bytes(paginated_bitfield.get_summary(address, 6)))
+
+    @patch('pur.core.config.DevConfig.ots_tracking_per_page', new_callable=PropertyMock, return_value=1024)
+    @patch('pur.core.config.DevConfig.ots_bitfield_size', new_callable=PropertyMock)
+    def test_get_unused_ots_index(self, mock_ots_bitfield_size, mock_ots_tracking_per_page):
+        with set_pur_dir('no_data'):
+            state = State()
+            mock_ots_bitfield_size.return_value = ceil(config.dev.ots_tracking_per_page / 8)
+
+            alice_purss = get_alice_purss(12)
+            address = alice_purss.address
+            address_state = OptimizedAddressState.get_default(address)
+            addresses_state = {address: address_state}
+            paginated_bitfield = PaginatedBitfield(True, state._db)
+
+            for i in list(range(0, 1024)) + list(range(2048, 3072)) + [3072, 3074]:
+                paginated_bitfield.set_ots_key(addresses_state, address, i)
+            self.assertEqual(address_state.ots_bitfield_used_page, 1)
+            self.assertEqual(paginated_bitfield.load_summary(address, alice_purss.height), bytearray(b'\x05'))
+
+            paginated_bitfield.put_addresses_bitfield(None)
+            paginated_bitfield = PaginatedBitfield(False, state._db)
+
+            self.assertEqual(1024, paginated_bitfield.get_unused_ots_index(address, alice_purss.height, 0))
+            self.assertEqual(2047, paginated_bitfield.get_unused_ots_index(address, alice_purss.height, 2047))
+            self.assertEqual(3073, paginated_bitfield.get_unused_ots_index(address, alice_purss.height, 2048))
+            self.assertEqual(3075, paginated_bitfield.get_unused_ots_index(address, alice_purss.height, 3074))
+            self.assertIsNone(paginated_bitfield.get_unused_ots_index(address, alice_purss.height, 4096))
+
+            # Full pages are not loaded
+            self.assertNotIn(paginated_bitfield.generate_bitfield_key(address, 3), paginated_bitfield.key_value)
+
+            addresses_state = {address: address_state}
+            paginated_bitfield = PaginatedBitfield(True, state._db)
+            paginated_bitfield.unset_ots_key(addresses_state, address, 2500)
+            self.assertEqual(paginated_bitfield.load_summary(address, alice_purss.height), bytearray(b'\x01'))
+            self.assertEqual(2500, paginated_bitfield.get_unused_ots_index(address, alice_purss.height, 2048))
@@ -10,6 +10,7 @@ from pur.core.misc import logger
 from pur.core.PaginatedData import PaginatedData
 from pur.core.OptimizedAddressState import OptimizedAddressState
 from pur.core.State import State
+from pur.generated import pur_pb2
 
 from tests.misc.helper import set_pur_dir, get_alice_purss
 
@@ -47,7 +48,7 @@ class TestPaginatedData(TestCase):
             p = PaginatedData(b'p_tx_hash', True, state._db)
 
             p.insert(OptimizedAddressState.get_default(b'a'), b'10')
-            self.assertEqual(p.get_value(b'a', 0), [b'10'])
+            self.assertEqual(p.get_value(b'a', 0), b'10')
 
     @patch('pur.core.config.DevConfig.data_per_page', new_callable=PropertyMock, return_value=10)
     def test_put_paginated_data(self, mock_dev_config):
@@ -127,6 +128,11 @@ class TestPaginatedData(TestCase):
             self.assertEqual(len(p.get_paginated_data(alice_address_state.address, 0)),
                              10)
 
+            # only the removed values are deleted from the db
+            self.assertIsNone(p.get_stored_value(p.generate_key(alice_address_state.address, 19)))
+            self.assertEqual(p.get_stored_value(p.generate_key(alice_address_state.address, 18)),
+                             full_hash[18])
+
     @patch('pur.core.config.DevConfig.data_per_page', new_callable=PropertyMock, return_value=10)
     def test_revert_paginated_data2(self, mock_dev_config):
         with set_pur_dir('no_data'):
@@ -193,11 +199,11 @@ class TestPaginatedData(TestCase):
             state = State()
             p = PaginatedData(b'p_tx_hash', True, state._db)
             key = b'test_key'
-            value = [b'hello world']
+            value = b'hello world'
             storage_key = p.generate_key(key, 11)
             p.put(storage_key, value, None)
             found_value = p.get_paginated_data(key, 11)
-            self.assertEqual(value, found_value)
+            self.assertEqual([value], found_value)
 
     @patch('pur.core.config.DevConfig.data_per_page', new_callable=PropertyMock, return_value=10)
     def test_remove(self, mock_dev_config):
@@ -205,12 +211,29 @@ class TestPaginatedData(TestCase):
             state = State()
             p = PaginatedData(b'p_tx_hash', True, state._db)
             key = b'test_key'
-            value = [b'hello world']
+            value = b'hello world'
             storage_key = p.generate_key(key, 11)
             p.put(storage_key, value, None)
             found_value = p.get_paginated_data(key, 11)
-            self.assertEqual(value, found_value)
+            self.assertEqual([value], found_value)
 
             p.delete(storage_key, None)
             found_value = p.get_paginated_data(key, 11)
             self.assertEqual([], found_value)
+
+    @patch('pur.core.config.DevConfig.data_per_page', new_callable=PropertyMock, return_value=10)
+    def test_migrate_page(self, mock_dev_config):
+        with set_pur_dir('no_data'):
+            state = State()
+            p = PaginatedData(b'p_tx_hash', True, state._db)
+            tx_hashes = [b'p_tx_hash_' + i.to_bytes(8, byteorder='big', signed=False) for i in range(0, 15)]
+
+            storage_key = b'p_tx_hash_' + self.alice.address + b'_1'
+            state._db.put_raw(storage_key, pur_pb2.DataList(values=tx_hashes[10:]).SerializeToString())
+
+            self.assertTrue(p.migrate_page(storage_key, state._db.get_raw(storage_key), None))
+            self.assertFalse(p.migrate_page(p.generate_key(self.alice.address, 10), tx_hashes[10], None))
+
+            self.assertEqual(tx_hashes[10:], p.get_paginated_data(self.alice.address, 10))
+            with self.assertRaises(KeyError):
+                state._db.get_raw(storage_key)
@@ -3,7 +3,7 @@
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 from unittest import TestCase
 import mock
-from mock import MagicMock, patch
+from mock import MagicMock
 
 from pur.core import config
 from pur.core.misc import logger, db
@@ -11,7 +11,7 @@ from pur.core.State import State
 from pur.core.Block import Block
 from pur.generated import purstateinfo_pb2
 
-from tests.misc.helper import set_pur_dir, get_alice_purss, replacement_getTime, gen_blocks
+from tests.misc.helper import set_pur_dir, get_alice_purss, replacement_getTime
 
 logger.initialize_default()
 
@@ -58,6 +58,39 @@ class TestState(TestCase):
         block2 = Block.get_block(self.state, block.headerhash)
         self.assertEqual(block.headerhash, block2.headerhash)
 
+    def test_multi_get(self):
+        self.state._db.put_raw(b'key1', b'value1')
+        self.state._db.put_raw(b'key2', b'value2')
+        snapshot = self.state._db.get_snapshot()
+        self.state._db.put_raw(b'key2', b'value3')
+
+        self.assertEqual({b'key1': b'value1', b'key2': b'value2'},
+                         self.state._db.multi_get([b'key1', b'key2', b'key4'], snapshot))
+        self.assertEqual({b'key2': b'value3'}, self.state._db.multi_get([b'key2']))
+
+    def test_prefetch(self):
+        self.state._db.put_raw(b'key1', b'value1')
+        self.state._db.prefetch([b'key1', b'key2'])
+
+        # Prefetched values are served without reading the db
+        plyvel_db = self.state._db.db
+        self.state._db.db = MagicMock(name='mock plyvel DB')
+        self.assertEqual(b'value1', self.state._db.get_raw(b'key1'))
+        with self.assertRaises(KeyError):
+            self.state._db.get_raw(b'key2')
+        self.state._db.db.get.assert_not_called()
+        self.state._db.db = plyvel_db
+
+        # Values are read from the db again once written
+        self.state._db.put_raw(b'key1', b'value2')
+        self.assertEqual(b'value2', self.state._db.get_raw(b'key1'))
+
+        self.state._db.prefetch([b'key1', b'key2'])
+        batch = self.state.batch
+        self.state._db.put_raw(b'key2', b'value2', batch)
+        self.state.write_batch(batch)
+        self.assertEqual(b'value2', self.state._db.get_raw(b'key2'))
+
     def test_update_total_coin_supply(self):
         self.assertEqual(self.state.total_coin_supply, 0)
         self.state._update_total_coin_supply(100, None)
@@ -74,15 +107,6 @@ class TestState(TestCase):
         self.state._delete(block.headerhash, None)
         self.assertIsNone(Block.get_block(self.state, block.headerhash))
 
-    def test_get_block_size_limit(self):
-        alice_purss = get_alice_purss()
-        blocks = gen_blocks(20, self.state, alice_purss.address)
-        self.assertEqual(Block.get_block_size_limit(self.state, blocks[-1], config.dev), 1048576)
-
-        # get_block_size_limit() should return None if it couldn't get any blocks from db
-        with patch('pur.core.Block.Block.get_block', return_value=None):
-            self.assertIsNone(Block.get_block_size_limit(self.state, blocks[-1], config.dev))
-
     def test_update_mainchain_height(self):
         self.state.update_mainchain_height(5, None)
         self.assertEqual(self.state.get_mainchain_height(), 5)
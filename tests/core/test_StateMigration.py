@@ -0,0 +1,58 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from unittest import TestCase
+
+from google.protobuf.json_format import MessageToJson
+
+from pur.core.Block import Block
+from pur.core.State import State
+from pur.core.StateMigration import StateMigration
+from pur.core.misc import logger
+from pur.generated import pur_pb2
+from tests.misc.helper import set_pur_dir
+
+logger.initialize_default()
+
+
+class TestStateMigration(TestCase):
+    def setUp(self):
+        with set_pur_dir('no_data'):
+            self.state = State()
+        self.state_migration = StateMigration()
+
+    def put_legacy_block_number_mappings(self, count) -> list:
+        headerhashes = [i.to_bytes(2, byteorder="big") * 16 for i in range(0, count)]
+        for block_number, headerhash in enumerate(headerhashes):
+            bm = pur_pb2.BlockNumberMapping(headerhash=headerhash)
+            self.state._db.put_raw(str(block_number).encode(), MessageToJson(bm, sort_keys=True).encode())
+        self.state.put_state_version(2)
+        return headerhashes
+
+    def assert_block_number_mappings_migrated(self, headerhashes):
+        self.assertEqual(3, self.state.get_state_version())
+        for block_number, headerhash in enumerate(headerhashes):
+            self.assertEqual(headerhash, Block.get_block_number_mapping(self.state, block_number).headerhash)
+            self.assertIsNone(Block.get_legacy_block_number_mapping(self.state, block_number))
+
+    def test_state_migration_step_4(self):
+        headerhashes = self.put_legacy_block_number_mappings(30)
+
+        self.state_migration.state_migration_step_4(self.state)
+
+        self.assert_block_number_mappings_migrated(headerhashes)
+
+    def test_state_migration_step_4_interrupted(self):
+        """
+        The node stopped while the legacy keys were being deleted, the migration is run again on the next start.
+        """
+        headerhashes = self.put_legacy_block_number_mappings(30)
+        for block_number, headerhash in enumerate(headerhashes):
+            bm = pur_pb2.BlockNumberMapping(headerhash=headerhash)
+            Block.put_block_number_mapping(self.state, block_number, bm, None)
+        for block_number in range(0, 10):
+            self.state._db.delete(str(block_number).encode(), None)
+
+        self.state_migration.state_migration_step_4(self.state)
+
+        self.assert_block_number_mappings_migrated(headerhashes)
@@ -6,6 +6,7 @@ from unittest import TestCase
 from mock import Mock, mock, patch
 
 from pur.core import config
+from pur.core.BlockMetadata import BlockMetadata
 from pur.core.State import State
 from pur.core.ChainManager import ChainManager
 from pur.core.misc import logger
@@ -102,8 +103,7 @@ class TestStateMeasurement(TestCase):
                 self.assertIsNotNone(state)  # to avoid warning (unused variable)
                 chain_manager = ChainManager(state)
                 mock_get_block.side_effect = TestStateMeasurement.get_block_example1
-                parent_metadata = Mock()
-                parent_metadata.last_N_headerhashes = []
+                parent_metadata = BlockMetadata.create()
 
                 measurement = chain_manager.get_measurement(config.dev, 100,
                                                             parent_headerhash=b'0', parent_metadata=parent_metadata)
@@ -124,8 +124,8 @@ class TestStateMeasurement(TestCase):
                 self.assertIsNotNone(state)  # to avoid warning (unused variable)
                 chain_manager = ChainManager(state)
                 mock_get_block.side_effect = TestStateMeasurement.get_block_example1
-                parent_metadata = Mock()
-                parent_metadata.last_N_headerhashes = [b'0']
+                parent_metadata = BlockMetadata.create()
+                parent_metadata.update_last_headerhashes([], b'0')
 
                 measurement = chain_manager.get_measurement(config.dev, 210, b'1', parent_metadata)
                 self.assertEqual(55, measurement)
@@ -144,8 +144,8 @@ class TestStateMeasurement(TestCase):
                     self.assertIsNotNone(state)  # to avoid warning (unused variable)
                     chain_manager = ChainManager(state)
                     mock_get_block.side_effect = TestStateMeasurement.get_block_example1
-                    parent_metadata = Mock()
-                    parent_metadata.last_N_headerhashes = [b'1', b'2']
+                    parent_metadata = BlockMetadata.create()
+                    parent_metadata.update_last_headerhashes([b'1'], b'2')
 
                     measurement = chain_manager.get_measurement(config.dev, 350, b'3', parent_metadata)
                     self.assertEqual(60, measurement)
@@ -164,8 +164,8 @@ class TestStateMeasurement(TestCase):
                     self.assertIsNotNone(state)  # to avoid warning (unused variable)
                     chain_manager = ChainManager(state)
                     mock_get_block.side_effect = TestStateMeasurement.get_block_example1
-                    parent_metadata = Mock()
-                    parent_metadata.last_N_headerhashes = [b'0', b'1', b'2']
+                    parent_metadata = BlockMetadata.create()
+                    parent_metadata.update_last_headerhashes([b'0', b'1'], b'2')
 
                     measurement = chain_manager.get_measurement(config.dev, 350, b'3', parent_metadata)
                     self.assertEqual(63, measurement)
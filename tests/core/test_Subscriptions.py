@@ -0,0 +1,61 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from unittest import TestCase
+
+from pur.core.misc import logger
+from pur.core.notification.Subscriptions import SubscriptionManager
+
+logger.initialize_default()
+
+
+class TestSubscriptions(TestCase):
+    def setUp(self):
+        self.subscriptions = SubscriptionManager(max_subscribers=3, queue_size=2)
+
+    def test_publish(self):
+        subscriber = self.subscriptions.subscribe(SubscriptionManager.TOPIC_BLOCKS)
+        self.assertTrue(self.subscriptions.has_subscribers(SubscriptionManager.TOPIC_BLOCKS))
+        self.assertFalse(self.subscriptions.has_subscribers(SubscriptionManager.TOPIC_MEMPOOL))
+
+        self.subscriptions.publish(SubscriptionManager.TOPIC_BLOCKS, b'block1')
+        self.subscriptions.publish(SubscriptionManager.TOPIC_MEMPOOL, b'tx1')
+
+        self.assertEqual(b'block1', subscriber.get(0))
+        self.assertIsNone(subscriber.get(0))
+
+    def test_publish_addresses(self):
+        subscriber = self.subscriptions.subscribe(SubscriptionManager.TOPIC_ADDRESSES, {b'alice'})
+
+        self.subscriptions.publish(SubscriptionManager.TOPIC_ADDRESSES, b'tx1', {b'bob'})
+        self.subscriptions.publish(SubscriptionManager.TOPIC_ADDRESSES, b'tx2', {b'alice', b'bob'})
+
+        self.assertEqual(b'tx2', subscriber.get(0))
+        self.assertIsNone(subscriber.get(0))
+
+    def test_slow_subscriber_dropped(self):
+        slow_subscriber = self.subscriptions.subscribe(SubscriptionManager.TOPIC_BLOCKS)
+        subscriber = self.subscriptions.subscribe(SubscriptionManager.TOPIC_BLOCKS)
+
+        for event in [b'block1', b'block2']:
+            self.subscriptions.publish(SubscriptionManager.TOPIC_BLOCKS, event)
+            self.assertEqual(event, subscriber.get(0))
+
+        self.subscriptions.publish(SubscriptionManager.TOPIC_BLOCKS, b'block3')
+
+        self.assertTrue(slow_subscriber.dropped)
+        self.assertTrue(slow_subscriber.closed)
+        self.assertIsNone(slow_subscriber.get(0))
+        self.assertEqual(1, self.subscriptions.subscribers_count)
+
+        # The other subscribers are not affected
+        self.assertFalse(subscriber.dropped)
+        self.assertEqual(b'block3', subscriber.get(0))
+
+    def test_max_subscribers(self):
+        subscribers = [self.subscriptions.subscribe(SubscriptionManager.TOPIC_BLOCKS) for _ in range(3)]
+        self.assertIsNone(self.subscriptions.subscribe(SubscriptionManager.TOPIC_MEMPOOL))
+
+        self.subscriptions.unsubscribe(subscribers[0])
+        self.assertTrue(subscribers[0].closed)
+        self.assertIsNotNone(self.subscriptions.subscribe(SubscriptionManager.TOPIC_MEMPOOL))
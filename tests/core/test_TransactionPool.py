@@ -56,8 +56,8 @@ class TestTransactionPool(TestCase):
         result = self.txpool.is_full_transaction_pool()
         self.assertFalse(result)
 
-        tx1 = make_tx(fee=1)
-        tx2 = make_tx(fee=2)
+        tx1 = make_tx(txhash=b'red', fee=1)
+        tx2 = make_tx(txhash=b'blue', fee=2)
 
         self.txpool.add_tx_to_pool(tx1, 1, replacement_getTime())
         self.txpool.add_tx_to_pool(tx2, 1, replacement_getTime())
@@ -65,7 +65,13 @@ class TestTransactionPool(TestCase):
         result = self.txpool.is_full_transaction_pool()
         self.assertTrue(result)
 
-    def test_get_tx_index_from_pool(self):
+    def test_add_tx_to_pool_duplicate(self):
+        tx = make_tx()
+        self.assertTrue(self.txpool.add_tx_to_pool(tx, 1, replacement_getTime()))
+        self.assertFalse(self.txpool.add_tx_to_pool(tx, 1, replacement_getTime()))
+        self.assertEqual(len(self.txpool.transaction_pool), 1)
+
+    def test_get_tx_info_from_pool(self):
         tx1 = make_tx(txhash=b'red')
         tx2 = make_tx(txhash=b'blue')
         tx3 = make_tx(txhash=b'purpink')
@@ -74,14 +80,56 @@ class TestTransactionPool(TestCase):
         self.txpool.add_tx_to_pool(tx2, 1, replacement_getTime())
         self.txpool.add_tx_to_pool(tx3, 1, replacement_getTime())
 
-        idx = self.txpool.get_tx_index_from_pool(b'purpink')
-        self.assertEqual(idx, 2)
+        tx_info = self.txpool.get_tx_info_from_pool(b'purpink')
+        self.assertEqual(tx_info.transaction, tx3)
 
-        idx = self.txpool.get_tx_index_from_pool(b'red')
-        self.assertEqual(idx, 0)
+        tx_info = self.txpool.get_tx_info_from_pool(b'red')
+        self.assertEqual(tx_info.transaction, tx1)
 
-        idx = self.txpool.get_tx_index_from_pool(b'ultraviolet')
-        self.assertEqual(idx, -1)
+        tx_info = self.txpool.get_tx_info_from_pool(b'ultraviolet')
+        self.assertIsNone(tx_info)
+
+    def test_get_tx_pool_by_pk(self):
+        tx1 = make_tx(txhash=b'red', PK=b'alice')
+        tx2 = make_tx(txhash=b'blue', PK=b'bob')
+        tx3 = make_tx(txhash=b'purpink', PK=b'alice')
+
+        self.txpool.add_tx_to_pool(tx1, 1, replacement_getTime())
+        self.txpool.add_tx_to_pool(tx2, 1, replacement_getTime())
+        self.txpool.add_tx_to_pool(tx3, 1, replacement_getTime())
+
+        txs = [tx_set[1].transaction for tx_set in self.txpool.get_tx_pool_by_pk(b'alice')]
+        self.assertEqual([tx1, tx3], txs)
+
+        self.txpool.remove_tx_from_pool(tx1)
+        self.txpool.remove_tx_from_pool(tx2)
+        txs = [tx_set[1].transaction for tx_set in self.txpool.get_tx_pool_by_pk(b'alice')]
+        self.assertEqual([tx3], txs)
+        self.assertEqual([], self.txpool.get_tx_pool_by_pk(b'bob'))
+
+    def test_transactions_sorted_by_fee(self):
+        txs = [make_tx(txhash=bytes([i]), fee=fee) for i, fee in enumerate([3, 7, 1, 7, 5, 2, 9, 4])]
+        for tx in txs:
+            self.txpool.add_tx_to_pool(tx, 1, replacement_getTime())
+
+        fees = [tx_set[0] for tx_set in self.txpool.transactions]
+        self.assertEqual([9, 7, 7, 5, 4, 3, 2, 1], fees)
+        # Same fee, the txn added first comes first
+        self.assertEqual(txs[1], self.txpool.transactions[1][1].transaction)
+        self.assertEqual(txs[3], self.txpool.transactions[2][1].transaction)
+
+        # Removed txns are skipped, even while some of their heap entries are still around
+        self.txpool.remove_tx_from_pool(txs[6])
+        self.txpool.remove_tx_from_pool(txs[4])
+        fees = [tx_set[0] for tx_set in self.txpool.transactions]
+        self.assertEqual([7, 7, 4, 3, 2, 1], fees)
+
+        # Heap is compacted once stale entries outnumber the txns in the pool
+        for tx in txs[:3]:
+            self.txpool.remove_tx_from_pool(tx)
+        self.assertEqual(len(self.txpool.transaction_pool), len(self.txpool._fee_heap))
+        fees = [tx_set[0] for tx_set in self.txpool.iterate_transactions()]
+        self.assertEqual([7, 4, 2], fees)
 
     def test_remove_tx_from_pool(self):
         tx1 = make_tx(txhash=b'red')
@@ -216,8 +264,8 @@ class TestTransactionPool(TestCase):
     @patch('pur.core.txs.Transaction.Transaction.from_pbdata', new=replacement_from_pbdata)
     def test_remove_tx_in_block_from_pool(self):
         m_block = Mock(autospec=Block)
-        tx1 = make_tx(name='Mock TX 1', ots_key=1, PK=b'pk')
-        tx2 = make_tx(name='Mock TX 2', ots_key=2, PK=b'pk')
+        tx1 = make_tx(name='Mock TX 1', txhash=b'h1', ots_key=1, PK=b'pk')
+        tx2 = make_tx(name='Mock TX 2', txhash=b'h2', ots_key=2, PK=b'pk')
         m_block.transactions = [CoinBase(), tx1, tx2]
 
         # To remove the tx from the pool we have to add it first!
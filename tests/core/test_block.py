@@ -3,6 +3,7 @@
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 from unittest import TestCase
 from mock import patch, Mock, PropertyMock
+from google.protobuf.json_format import MessageToJson
 from pypurlib.pypurlib import sha2_256
 from collections import OrderedDict
 
@@ -109,7 +110,6 @@ class TestBlock(TestCase):
         m_chain_manager = Mock(name='Mock ChainManager')
         attrs_all_pass = {
             'get_block_is_duplicate.return_value': False,
-            'validate_mining_nonce.return_value': True,
             'get_config_by_block_number.return_value': config.dev,
             'new_state_container.return_value': StateContainer(None, None, None, None, None, None, 5,
                                                                None, config.dev, False, None, None)
@@ -127,12 +127,6 @@ class TestBlock(TestCase):
         self.assertFalse(result)
         m_chain_manager.get_block_is_duplicate.return_value = False
 
-        # The mining nonce is invalid
-        m_chain_manager.validate_mining_nonce.return_value = False
-        result = self.block.validate(m_chain_manager, OrderedDict())
-        self.assertFalse(result)
-        m_chain_manager.validate_mining_nonce.return_value = True
-
         # No parent block found, and it's not in future_blocks either
         m_chain_manager.get_block.return_value = None
         result = self.block.validate(m_chain_manager, OrderedDict())
@@ -373,6 +367,31 @@ class TestBlockApplyStateChanges(TestCase):
         Block.put_block_number_mapping(self.state, 0, bm, None)
         self.assertIsNone(Block.get_block_by_number(self.state, 4))
 
+    def test_get_headerhashes(self,
+                              m_TransferTransaction_validate,
+                              m_TransferTransaction_validate_extended,
+                              m_TransferTransaction_apply_state_changes,
+                              m_CoinBase_apply_state_changes):
+        headerhashes = [i.to_bytes(2, byteorder="big") * 16 for i in range(0, 300)]
+        for block_number, headerhash in enumerate(headerhashes):
+            bm = pur_pb2.BlockNumberMapping(headerhash=headerhash)
+            Block.put_block_number_mapping(self.state, block_number, bm, None)
+
+        self.assertEqual(headerhashes[250:258], Block.get_headerhashes(self.state, 250, 257))
+        self.assertEqual(headerhashes[298:], Block.get_headerhashes(self.state, 298, 310))
+        self.assertEqual([], Block.get_headerhashes(self.state, 5, 4))
+
+    def test_get_legacy_block_number_mapping(self,
+                                             m_TransferTransaction_validate,
+                                             m_TransferTransaction_validate_extended,
+                                             m_TransferTransaction_apply_state_changes,
+                                             m_CoinBase_apply_state_changes):
+        bm = pur_pb2.BlockNumberMapping(headerhash=b'1' * 32, prev_headerhash=b'0' * 32)
+        self.state._db.put_raw(b'1', MessageToJson(bm, sort_keys=True).encode())
+
+        self.assertEqual(bm, Block.get_legacy_block_number_mapping(self.state, 1))
+        self.assertIsNone(Block.get_block_number_mapping(self.state, 1))
+
     def test_last_block(self,
                         m_TransferTransaction_validate,
                         m_TransferTransaction_validate_extended,
@@ -0,0 +1,59 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+import os
+import tempfile
+from unittest import TestCase
+
+import simplejson as json
+from mock import patch
+
+from pur.core.misc.expiring_set import ExpiringSet
+
+
+@patch('pur.core.misc.ntp.getTime')
+class TestExpiringSet(TestCase):
+    def test_expiration(self, time_mock):
+        time_mock.return_value = 1000
+        expiring_set = ExpiringSet(expiration_time=10)
+        expiring_set.add('a')
+        time_mock.return_value = 1005
+        expiring_set.add('b')
+
+        time_mock.return_value = 1010
+        self.assertNotIn('a', expiring_set)
+        self.assertIn('b', expiring_set)
+        self.assertEqual(1, len(expiring_set))
+
+    def test_add_again_extends_expiration(self, time_mock):
+        time_mock.return_value = 1000
+        expiring_set = ExpiringSet(expiration_time=10)
+        expiring_set.add('a')
+        time_mock.return_value = 1005
+        expiring_set.add('a')
+
+        # The first expiration time of 'a' is outdated
+        time_mock.return_value = 1010
+        self.assertIn('a', expiring_set)
+        time_mock.return_value = 1015
+        self.assertNotIn('a', expiring_set)
+
+    def test_flush_and_load(self, time_mock):
+        time_mock.return_value = 1000
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, 'banned_peers.pur')
+            expiring_set = ExpiringSet(expiration_time=10, filename=filename)
+            expiring_set.add('a')
+
+            # Changes are only written by flush()
+            self.assertTrue(expiring_set.dirty)
+            self.assertFalse(os.path.exists(filename))
+            expiring_set.flush()
+            self.assertFalse(expiring_set.dirty)
+            with open(filename) as f:
+                self.assertEqual({'a': 1010}, json.load(f))
+
+            time_mock.return_value = 1005
+            self.assertIn('a', ExpiringSet(expiration_time=10, filename=filename))
+            time_mock.return_value = 1010
+            self.assertNotIn('a', ExpiringSet(expiration_time=10, filename=filename))
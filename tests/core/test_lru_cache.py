@@ -0,0 +1,72 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from unittest import TestCase
+
+from pur.core.misc.lru_cache import LRUCache
+
+
+class TestLRUCache(TestCase):
+    def setUp(self):
+        self.cache = LRUCache(max_size=10)
+
+    def test_get_put(self):
+        self.assertIsNone(self.cache.get(b'a'))
+        self.cache.put(b'a', 'value a', 4)
+
+        self.assertEqual('value a', self.cache.get(b'a'))
+        self.assertIn(b'a', self.cache)
+        self.assertEqual(4, self.cache.size)
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_put_replaces_value(self):
+        self.cache.put(b'a', 'value a', 4)
+        self.cache.put(b'a', 'value a2', 6)
+
+        self.assertEqual(1, len(self.cache))
+        self.assertEqual(6, self.cache.size)
+        self.assertEqual('value a2', self.cache.get(b'a'))
+
+    def test_eviction_by_size(self):
+        self.cache.put(b'a', 'value a', 4)
+        self.cache.put(b'b', 'value b', 4)
+        self.cache.get(b'a')  # b is now the least recently used
+        self.cache.put(b'c', 'value c', 4)
+
+        self.assertIn(b'a', self.cache)
+        self.assertNotIn(b'b', self.cache)
+        self.assertIn(b'c', self.cache)
+        self.assertEqual(8, self.cache.size)
+
+    def test_put_larger_than_max_size(self):
+        self.cache.put(b'a', 'value a', 4)
+        self.cache.put(b'b', 'value b', 11)
+
+        self.assertIn(b'a', self.cache)
+        self.assertNotIn(b'b', self.cache)
+        self.assertEqual(4, self.cache.size)
+
+    def test_remove(self):
+        self.cache.put(b'a', 'value a', 4)
+        self.cache.remove(b'a')
+        self.cache.remove(b'b')
+
+        self.assertNotIn(b'a', self.cache)
+        self.assertEqual(0, self.cache.size)
+
+    def test_clear(self):
+        self.cache.put(b'a', 'value a', 4)
+        self.cache.put(b'b', 'value b', 4)
+        self.cache.clear()
+
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(0, self.cache.size)
+
+    def test_get_stats(self):
+        self.cache.put(b'a', 'value a', 4)
+        self.cache.get(b'a')
+        self.cache.get(b'b')
+
+        self.assertEqual({'entries': 1, 'size': 4, 'max_size': 10, 'hits': 1, 'misses': 1},
+                         self.cache.get_stats())
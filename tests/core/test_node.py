@@ -4,6 +4,7 @@
 import contextlib
 from unittest import TestCase
 from mock import Mock, MagicMock, patch
+from twisted.internet import defer
 
 from pyqryptonight.pyqryptonight import StringToUInt256
 
@@ -135,3 +136,68 @@ class TestNode(TestCase):
         self.assertIsNotNone(node)
         node.update_node_state(ESyncState.forked)
         # FIpurE: Add more asserts
+
+    def _create_node(self, chain_manager, p2p_factory):
+        return POW(chain_manager=chain_manager,
+                   p2p_factory=p2p_factory,
+                   sync_state=Mock(),
+                   time_provider=Mock(),
+                   mining_address=get_random_purss().address,
+                   mining_thread_count=0)
+
+    def test_block_received(self):
+        chain_manager = Mock()
+        p2p_factory = Mock()
+        p2p_factory.verification_pool.verify_block.return_value = defer.succeed(True)
+        node = self._create_node(chain_manager, p2p_factory)
+        node.pre_block_logic = Mock()
+        block = Mock()
+
+        node.block_received(block)
+
+        p2p_factory.verification_pool.verify_block.assert_called_once_with(block, chain_manager)
+        node.pre_block_logic.assert_called_once_with(block, verified=True)
+
+    def test_block_received_invalid(self):
+        chain_manager = Mock()
+        p2p_factory = Mock()
+        p2p_factory.verification_pool.verify_block.return_value = defer.succeed(False)
+        node = self._create_node(chain_manager, p2p_factory)
+        node.pre_block_logic = Mock()
+
+        node.block_received(Mock())
+
+        node.pre_block_logic.assert_not_called()
+
+    def test_block_received_parent_not_in_state(self):
+        """
+        The PoW cannot be verified on the VerificationPool without the parent block in the state,
+        the block is left to pre_block_logic.
+        """
+        chain_manager = Mock()
+        chain_manager.get_block.return_value = None
+        p2p_factory = Mock()
+        node = self._create_node(chain_manager, p2p_factory)
+        node.pre_block_logic = Mock()
+        block = Mock()
+
+        node.block_received(block)
+
+        p2p_factory.verification_pool.verify_block.assert_not_called()
+        node.pre_block_logic.assert_called_once_with(block)
+
+    def test_pre_block_logic_future_block_invalid_pow(self):
+        """
+        A future block is only cached once its PoW has been verified.
+        """
+        chain_manager = Mock()
+        chain_manager.validate_mining_nonce.return_value = False
+        node = self._create_node(chain_manager, Mock())
+        block = Mock()
+        block.validate.return_value = True
+        block.is_future_block.return_value = True
+
+        self.assertFalse(node.pre_block_logic(block))
+
+        self.assertEqual(0, len(node.future_blocks))
+        chain_manager.add_block.assert_not_called()
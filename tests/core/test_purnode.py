@@ -10,8 +10,11 @@ from pur.core.ESyncState import ESyncState
 from pur.core.purnode import purNode
 from pur.core.State import State
 from pur.core.ChainManager import ChainManager
+from pur.core.PaginatedData import PaginatedData
+from pur.core.TransactionMetadata import TransactionMetadata
 from pur.core.TransactionPool import TransactionPool
 from pur.core.txs.CoinBase import CoinBase
+from pur.core.txs.Transaction import Transaction
 from pur.core.txs.TransferTransaction import TransferTransaction
 from pur.core.p2p.p2pprotocol import P2PProtocol
 from pur.core.p2p.p2pPeerManager import P2PPeerManager
@@ -62,6 +65,39 @@ class TestpurNodeReal(TestCase):
         self.assertTrue(latest_blocks[1] == blocks[8])
         self.assertTrue(latest_blocks[2] == blocks[9])
 
+    @patch('pur.core.ChainManager.ChainManager.height', new_callable=PropertyMock, return_value=5)
+    def test_get_transactions_by_address_cursor(self, m_height):
+        blocks = gen_blocks(6, self.db_state, alice.address)
+
+        address_state = OptimizedAddressState.get_default(alice.address)
+        p = PaginatedData(b'p_tx_hash', True, self.db_state._db)
+        for block in blocks[1:]:
+            tx = Transaction.from_pbdata(block.transactions[0])
+            TransactionMetadata.put_tx_metadata(self.db_state, tx, block.block_number, block.timestamp, None)
+            p.insert(address_state, tx.txhash)
+        p.put_paginated_data(None)
+        OptimizedAddressState.put_optimized_addresses_state(self.db_state, {alice.address: address_state})
+
+        # Newest transactions first, across the pages
+        found_blocks = []
+        response = self.purnode.get_transactions_by_address(alice.address, 2, 1)
+        while True:
+            found_blocks.extend(response.transactions_detail)
+            if not response.next_cursor:
+                break
+            response = self.purnode.get_transactions_by_address(alice.address, 2, 0, response.next_cursor)
+
+        self.assertEqual([5, 4, 3, 2, 1], [detail.block_number for detail in found_blocks])
+        for detail in found_blocks:
+            block = blocks[detail.block_number]
+            self.assertEqual(block.headerhash, detail.block_header_hash)
+            self.assertEqual(block.timestamp, detail.timestamp)
+            self.assertEqual(block.transactions[0], detail.tx)
+            self.assertEqual(6 - detail.block_number, detail.confirmations)
+
+        with self.assertRaises(ValueError):
+            self.purnode.get_transactions_by_address(alice.address, 2, 0, b'invalid')
+
 
 @patch('pur.core.misc.ntp.getTime', new=replacement_getTime)
 class TestpurNode(TestCase):
@@ -166,13 +202,13 @@ class TestpurNode(TestCase):
         with self.assertRaises(ValueError):
             self.purnode.get_address_is_used(b'fdsa')
 
-    @patch('pur.core.PaginatedData.PaginatedData.get_paginated_data')
+    @patch('pur.core.PaginatedData.PaginatedData.get_paginated_data_reversed')
     @patch('pur.core.OptimizedAddressState.OptimizedAddressState.get_optimized_address_state')
-    @patch('pur.core.TransactionMetadata.TransactionMetadata.get_tx_metadata')
+    @patch('pur.core.TransactionMetadata.TransactionMetadata.get_tx_metadata_list')
     def test_get_mini_transactions_by_address(self,
-                                              mock_get_tx_metadata,
+                                              mock_get_tx_metadata_list,
                                               mock_get_optimized_address_state,
-                                              mock_get_paginated_data):
+                                              mock_get_paginated_data_reversed):
         """
         purNode.get_transactions_by_address() returns all the changes in balance caused by a transaction.
         """
@@ -204,11 +240,13 @@ class TestpurNode(TestCase):
         tx3.sign(purss)
         get_tx_metadata.register_tx_metadata(tx3, 2)
 
-        mock_get_paginated_data.return_value = [tx1.txhash, tx2.txhash, tx3.txhash]
-        mock_get_tx_metadata.side_effect = get_tx_metadata.get_tx_metadata
+        mock_get_paginated_data_reversed.return_value = [tx3.txhash, tx2.txhash, tx1.txhash]
+        mock_get_tx_metadata_list.side_effect = get_tx_metadata.get_tx_metadata_list
         response = self.purnode.get_mini_transactions_by_address(alice.address, 3, 1)
         result, balance = response.mini_transactions, response.balance
         self.assertEqual(len(result), 3)
+        self.assertEqual(response.next_cursor, b'')
+        mock_get_paginated_data_reversed.assert_called_once_with(alice.address, 3, 3)
 
         self.assertEqual(result[0].amount, 100)
         self.assertEqual(result[0].out, False)
@@ -0,0 +1,39 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from unittest import TestCase
+
+from pur.core.misc.rolling_bloom_filter import RollingBloomFilter
+
+
+def make_hash(index: int) -> bytes:
+    return index.to_bytes(32, byteorder='big')
+
+
+class TestRollingBloomFilter(TestCase):
+    def test_add(self):
+        known_inventory = RollingBloomFilter(capacity=100, fp_rate=0.0001)
+        self.assertNotIn(make_hash(1), known_inventory)
+
+        known_inventory.add(make_hash(1))
+        self.assertIn(make_hash(1), known_inventory)
+        self.assertNotIn(make_hash(2), known_inventory)
+
+    def test_rolling(self):
+        known_inventory = RollingBloomFilter(capacity=100, fp_rate=0.0001)
+        for index in range(300):
+            known_inventory.add(make_hash(index))
+
+        # The last capacity items are remembered, the oldest ones are forgotten
+        for index in range(200, 300):
+            self.assertIn(make_hash(index), known_inventory)
+        false_positives = sum(1 for index in range(100) if make_hash(index) in known_inventory)
+        self.assertLess(false_positives, 5)
+
+    def test_false_positive_rate(self):
+        known_inventory = RollingBloomFilter(capacity=10000, fp_rate=0.001)
+        for index in range(10000):
+            known_inventory.add(make_hash(index))
+
+        false_positives = sum(1 for index in range(10000, 30000) if make_hash(index) in known_inventory)
+        self.assertLess(false_positives, 20000 * 0.001 * 4)
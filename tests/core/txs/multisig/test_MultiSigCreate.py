@@ -195,11 +195,11 @@ class TestMultiSigCreate(TestCase):
 
         self.assertEqual(200 - tx.fee, addresses_state[self.random_signer.address].balance)
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.random_signer.address, 1)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(self.random_signer.address, 0)
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
         for signatory_address in self.signatories:
-            storage_key = state_container.paginated_tx_hash.generate_key(signatory_address, 1)
-            self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+            storage_key = state_container.paginated_tx_hash.generate_key(signatory_address, 0)
+            self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertTrue(state_container.paginated_bitfield.load_bitfield_and_ots_key_reuse(self.random_signer.address,
                                                                                            tx.ots_key))
@@ -246,11 +246,11 @@ class TestMultiSigCreate(TestCase):
 
         self.assertEqual(200 - tx.fee, addresses_state[self.random_signer.address].balance)
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.random_signer.address, 1)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(self.random_signer.address, 0)
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
         for signatory_address in self.signatories:
-            storage_key = state_container.paginated_tx_hash.generate_key(signatory_address, 1)
-            self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+            storage_key = state_container.paginated_tx_hash.generate_key(signatory_address, 0)
+            self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertTrue(state_container.paginated_bitfield.load_bitfield_and_ots_key_reuse(self.random_signer.address,
                                                                                            tx.ots_key))
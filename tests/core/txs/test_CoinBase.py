@@ -144,12 +144,12 @@ class TestCoinBase(TestCase):
 
         self.assertEqual(1000000 - tx.amount, addresses_state[config.dev.coinbase_address].balance)
 
-        storage_key = state_container.paginated_tx_hash.generate_key(config.dev.coinbase_address, 1)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(config.dev.coinbase_address, 0)
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
         self.assertEqual(tx.amount, addresses_state[self.alice.address].balance)
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
     def test_revert_coinbase_txn(self, m_logger):
         """
@@ -179,12 +179,12 @@ class TestCoinBase(TestCase):
 
         self.assertEqual(1000000, addresses_state[config.dev.coinbase_address].balance)
 
-        storage_key = state_container.paginated_tx_hash.generate_key(config.dev.coinbase_address, 1)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(config.dev.coinbase_address, 0)
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
         self.assertEqual(0, addresses_state[self.alice.address].balance)
 
-        storage_key = state_container.paginated_tx_hash.generate_key(config.dev.coinbase_address, 1)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(config.dev.coinbase_address, 0)
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
     def test_affected_address(self, m_logger):
         # This transaction can only involve 2 addresses.
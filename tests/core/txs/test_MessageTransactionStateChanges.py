@@ -54,9 +54,9 @@ class TestMessageTransactionStateChanges(TestCase):
         tx.apply(self.state, state_container)
 
         self.assertEqual(addresses_state[self.alice.address].balance, 99)
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
     def test_revert_message_txn(self):
         tx = MessageTransaction.create(**self.params)
@@ -79,9 +79,9 @@ class TestMessageTransactionStateChanges(TestCase):
         tx.revert(self.state, state_container)
 
         self.assertEqual(addresses_state[self.alice.address].balance, 100)
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
     def test_validate_tx(self):
         tx = MessageTransaction.create(**self.params)
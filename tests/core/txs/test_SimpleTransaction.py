@@ -383,8 +383,8 @@ class TestSimpleTransaction(TestCase):
         self.assertTrue(state_container.paginated_bitfield.load_bitfield_and_ots_key_reuse(self.alice.address, ots_key))
 
         self.assertEqual(199, addresses_state[self.alice.address].balance)
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
-        self.assertIn(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
     def test_apply_transfer_txn_multi_send(self, m_logger):
         """
@@ -539,11 +539,11 @@ class TestSimpleTransaction(TestCase):
         self.assertEqual(200, addresses_state[self.alice.address].balance)
         self.assertEqual(0, addresses_state[self.bob.address].balance)
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 1)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 0)
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
     def test_revert_transfer_txn_multi_send(self, m_logger):
         """
@@ -591,14 +591,14 @@ class TestSimpleTransaction(TestCase):
         self.assertEqual(0, addresses_state[self.bob.address].balance)
         self.assertEqual(0, addresses_state[self.slave.address].balance)
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 1)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 0)
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.slave.address, 1)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        storage_key = state_container.paginated_tx_hash.generate_key(self.slave.address, 0)
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
     def test_revert_transfer_txn_tx_sends_to_self(self, m_logger):
         """
@@ -58,9 +58,9 @@ class TestSlaveTransactionStateChanges(TestCase):
 
         self.assertEqual(addresses_state[self.alice.address].balance, 99)
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertIn((tx.addr_from, tx.slave_pks[0]), state_container.slaves.data)
         data = state_container.slaves.data[(tx.addr_from, tx.slave_pks[0])]
@@ -89,9 +89,9 @@ class TestSlaveTransactionStateChanges(TestCase):
         tx.revert(self.state, state_container)
 
         self.assertEqual(addresses_state[self.alice.address].balance, 100)
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertIn((tx.addr_from, tx.slave_pks[0]), state_container.slaves.data)
         data = state_container.slaves.data[(tx.addr_from, tx.slave_pks[0])]
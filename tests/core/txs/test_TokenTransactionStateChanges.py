@@ -79,13 +79,13 @@ class TestTokenTransactionStateChanges(TestCase):
 
         self.assertEqual(2, len(state_container.paginated_tx_hash.key_value))
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertEqual(2, len(state_container.tokens.data))
         self.assertIn((self.alice.address, tx.txhash), state_container.tokens.data)
@@ -124,13 +124,13 @@ class TestTokenTransactionStateChanges(TestCase):
 
         self.assertEqual(2, len(state_container.paginated_tx_hash.key_value))
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertEqual(1, len(state_container.tokens.data))
         self.assertIn((self.bob.address, tx.txhash), state_container.tokens.data)
@@ -171,17 +171,17 @@ class TestTokenTransactionStateChanges(TestCase):
         self.assertEqual(addresses_state[self.alice.address].balance, 99)
         self.assertEqual(3, len(state_container.paginated_tx_hash.key_value))
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(slave.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(slave.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([tx.txhash], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertEqual(tx.txhash, state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertEqual(2, len(state_container.tokens.data))
         self.assertIn((self.bob.address, tx.txhash), state_container.tokens.data)
@@ -230,13 +230,13 @@ class TestTokenTransactionStateChanges(TestCase):
 
         self.assertEqual(2, len(state_container.paginated_tx_hash.key_value))
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertEqual(2, len(state_container.tokens.data))
         self.assertIn((self.alice.address, tx.txhash), state_container.tokens.data)
@@ -283,13 +283,13 @@ class TestTokenTransactionStateChanges(TestCase):
 
         self.assertEqual(2, len(state_container.paginated_tx_hash.key_value))
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertEqual(1, len(state_container.tokens.data))
         self.assertIn((self.bob.address, tx.txhash), state_container.tokens.data)
@@ -341,17 +341,17 @@ class TestTokenTransactionStateChanges(TestCase):
         self.assertEqual(addresses_state[self.alice.address].balance, 100)
         self.assertEqual(3, len(state_container.paginated_tx_hash.key_value))
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.alice.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(self.bob.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
-        storage_key = state_container.paginated_tx_hash.generate_key(slave.address, 1)
+        storage_key = state_container.paginated_tx_hash.generate_key(slave.address, 0)
         self.assertIn(storage_key, state_container.paginated_tx_hash.key_value)
-        self.assertEqual([], state_container.paginated_tx_hash.key_value[storage_key])
+        self.assertIsNone(state_container.paginated_tx_hash.key_value[storage_key])
 
         self.assertEqual(2, len(state_container.tokens.data))
         self.assertIn((self.alice.address, tx.txhash), state_container.tokens.data)
@@ -0,0 +1,54 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from unittest import TestCase
+
+from pur.daemon.helper.purSSCache import purSSCache
+from tests.misc.helper import get_alice_purss, get_bob_purss, get_slave_purss
+
+
+class TestpurSSCache(TestCase):
+    def setUp(self):
+        self.cache = purSSCache(max_size=2)
+
+    def test_take_moves_the_tree_forward(self):
+        alice_purss = get_alice_purss(4)
+        self.cache.put(alice_purss)
+
+        purss = self.cache.take(alice_purss.qaddress, 3)
+        self.assertIs(alice_purss, purss)
+        self.assertEqual(3, purss.ots_index)
+
+        # The tree is not shared while it is used
+        self.assertIsNone(self.cache.take(alice_purss.qaddress, 3))
+
+    def test_take_lower_ots_index(self):
+        alice_purss = get_alice_purss(4)
+        alice_purss.set_ots_index(5)
+        self.cache.put(alice_purss)
+
+        self.assertIsNone(self.cache.take(alice_purss.qaddress, 4))
+        self.assertEqual(0, len(self.cache))
+
+    def test_exhausted_tree_not_cached(self):
+        alice_purss = get_alice_purss(4)
+        alice_purss.set_ots_index(2 ** 4 - 1)
+        alice_purss.sign(b'message')
+        self.cache.put(alice_purss)
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_eviction(self):
+        alice_purss = get_alice_purss(4)
+        bob_purss = get_bob_purss(4)
+        slave_purss = get_slave_purss()
+        self.cache.put(alice_purss)
+        self.cache.put(bob_purss)
+        self.cache.put(slave_purss)
+
+        self.assertEqual(2, len(self.cache))
+        self.assertIsNone(self.cache.take(alice_purss.qaddress, 0))
+        self.assertIs(bob_purss, self.cache.take(bob_purss.qaddress, 0))
+
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
@@ -3,7 +3,7 @@
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
 from unittest import TestCase
 
-from mock import Mock
+from mock import Mock, patch
 from pypurlib.pypurlib import bin2hstr, hstr2bin
 
 from pur.daemon.walletd import WalletD
@@ -12,9 +12,10 @@ from pur.core.AddressState import AddressState
 from pur.core.txs.TransferTransaction import TransferTransaction
 from pur.core.txs.MessageTransaction import MessageTransaction
 from pur.daemon.helper.DaemonHelper import WalletDecryptionError
+from pur.crypto.purss import purSS
 from pur.core.misc import logger
 from tests.misc.helper import set_pur_dir, get_alice_purss, get_bob_purss
-from tests.misc.MockHelper.mock_function import MockFunction
+from tests.misc.MockHelper.mock_slaves_state import MockSlavesState
 
 
 logger.initialize_default()
@@ -96,8 +97,7 @@ class TestWalletD(TestCase):
     def test_get_slave(self):
         with set_pur_dir("wallet_ver1"):
             walletd = WalletD()
-            m = MockFunction()
-            walletd.get_address_state = m.get
+            states = MockSlavesState(walletd._public_stub)
 
             walletd._public_stub.PushTransaction = Mock(
                 return_value=pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED))
@@ -107,7 +107,7 @@ class TestWalletD(TestCase):
             walletd.unlock_wallet(self.passphrase)
 
             master_addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            m.put(qaddress, master_addr_state)
+            states.put(master_addr_state)
 
             slaves = walletd.get_slave_list(qaddress)
 
@@ -125,19 +125,19 @@ class TestWalletD(TestCase):
             for i in range(0, 1024):
                 slave00_addr_state.set_ots_key(i)
             walletd._wallet.set_slave_ots_index(0, 0, 0, 1020)
-            m.put(slaves[0][0].qaddress, slave00_addr_state)
+            states.put(slave00_addr_state)
 
             self.assertEqual(slaves[0][1].index, 0)
             for i in range(0, 1024):
                 slave01_addr_state.set_ots_key(i)
             walletd._wallet.set_slave_ots_index(0, 0, 1, 1020)
-            m.put(slaves[0][1].qaddress, slave01_addr_state)
+            states.put(slave01_addr_state)
 
             self.assertEqual(slaves[0][2].index, 5)
             for i in range(5, 1000):
                 slave02_addr_state.set_ots_key(i)
             walletd._wallet.set_slave_ots_index(0, 0, 2, 1018)
-            m.put(slaves[0][2].qaddress, slave02_addr_state)
+            states.put(slave02_addr_state)
 
             walletd.get_slave(qaddress)
             slaves = walletd.get_slave_list(qaddress)
@@ -155,19 +155,19 @@ class TestWalletD(TestCase):
             for i in range(0, 1024):
                 slave10_addr_state.set_ots_key(i)
             walletd._wallet.set_slave_ots_index(0, 1, 0, 1020)
-            m.put(slaves[1][0].qaddress, slave10_addr_state)
+            states.put(slave10_addr_state)
 
             self.assertEqual(slaves[1][1].index, 0)
             for i in range(0, 1024):
                 slave11_addr_state.set_ots_key(i)
             walletd._wallet.set_slave_ots_index(0, 1, 1, 1020)
-            m.put(slaves[1][1].qaddress, slave11_addr_state)
+            states.put(slave11_addr_state)
 
             self.assertEqual(slaves[1][2].index, 5)
             for i in range(5, 1000):
                 slave12_addr_state.set_ots_key(i)
             walletd._wallet.set_slave_ots_index(0, 1, 2, 1018)
-            m.put(slaves[1][2].qaddress, slave12_addr_state)
+            states.put(slave12_addr_state)
 
             walletd.get_slave(qaddress)
             slaves = walletd.get_slave_list(qaddress)
@@ -185,19 +185,19 @@ class TestWalletD(TestCase):
             for i in range(0, 1024):
                 slave20_addr_state.set_ots_key(i)
             walletd._wallet.set_slave_ots_index(0, 2, 0, 1020)
-            m.put(slaves[2][0].qaddress, slave20_addr_state)
+            states.put(slave20_addr_state)
 
             self.assertEqual(slaves[2][1].index, 0)
             for i in range(0, 1024):
                 slave21_addr_state.set_ots_key(i)
             walletd._wallet.set_slave_ots_index(0, 2, 1, 1020)
-            m.put(slaves[2][1].qaddress, slave21_addr_state)
+            states.put(slave21_addr_state)
 
             self.assertEqual(slaves[2][2].index, 5)
             for i in range(5, 1000):
                 slave22_addr_state.set_ots_key(i)
             walletd._wallet.set_slave_ots_index(0, 2, 2, 1018)
-            m.put(slaves[2][2].qaddress, slave22_addr_state)
+            states.put(slave22_addr_state)
 
             walletd.get_slave(qaddress)
             slaves = walletd.get_slave_list(qaddress)
@@ -395,6 +395,28 @@ class TestWalletD(TestCase):
             with self.assertRaises(Exception):
                 walletd.sign_and_push_transaction(tx, alice_purss, 0, enable_save=False)
 
+    def test_sign_and_push_transaction_release(self):
+        with set_pur_dir("wallet_ver1"):
+            walletd = WalletD()
+            walletd._public_stub.PushTransaction = Mock(
+                return_value=pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED))
+            walletd._wallet.release_purss = Mock()
+
+            alice_purss = get_alice_purss()
+            bob_purss = get_bob_purss()
+            tx = TransferTransaction.create(addrs_to=[bob_purss.address],
+                                            amounts=[1],
+                                            message_data=None,
+                                            fee=1,
+                                            purss_pk=alice_purss.pk)
+
+            # The caller keeps using the tree, it is not returned to the cache
+            walletd.sign_and_push_transaction(tx, alice_purss, 0, enable_save=False, release=False)
+            walletd._wallet.release_purss.assert_not_called()
+
+            walletd.sign_and_push_transaction(tx, alice_purss, 0, enable_save=False)
+            walletd._wallet.release_purss.assert_called_once_with(alice_purss)
+
     def test_relay_transfer_txn(self):
         with set_pur_dir("wallet_ver1"):
             walletd = WalletD()
@@ -406,9 +428,6 @@ class TestWalletD(TestCase):
                 return_value=pur_pb2.GetOTSResp(next_unused_ots_index=0,
                                                 unused_ots_index_found=True))
             qaddress = walletd.add_new_address(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
 
             alice_purss = get_alice_purss(4)
             bob_purss = get_bob_purss(4)
@@ -423,6 +442,32 @@ class TestWalletD(TestCase):
                                             ots_index=0)
             self.assertIsNotNone(tx)
 
+    def test_relay_transfer_txn_reuses_purss_tree(self):
+        with set_pur_dir("wallet_ver1"):
+            walletd = WalletD()
+            walletd._public_stub.PushTransaction = Mock(
+                return_value=pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED))
+            qaddress = walletd.add_new_address(height=8)
+
+            alice_purss = get_alice_purss(4)
+            with patch.object(purSS, 'from_extended_seed', wraps=purSS.from_extended_seed) as m_from_extended_seed:
+                for ots_index in [0, 1]:
+                    walletd._public_stub.GetOTS = Mock(
+                        return_value=pur_pb2.GetOTSResp(next_unused_ots_index=ots_index,
+                                                        unused_ots_index_found=True))
+                    tx = walletd.relay_transfer_txn(qaddresses_to=[alice_purss.qaddress],
+                                                    amounts=[1000000000],
+                                                    fee=100000000,
+                                                    master_qaddress=None,
+                                                    signer_address=qaddress,
+                                                    ots_index=0)
+                    self.assertIsNotNone(tx)
+
+                # The tree is only generated for the first transaction, then taken from the cache
+                m_from_extended_seed.assert_called_once()
+            self.assertEqual(2, walletd._wallet.address_items[0].index)
+            self.assertEqual(1, len(walletd._wallet._purss_cache))
+
     def test_relay_transfer_txn2(self):
         with set_pur_dir("wallet_ver1"):
             walletd = WalletD()
@@ -435,9 +480,6 @@ class TestWalletD(TestCase):
                                                 unused_ots_index_found=True))
 
             qaddress = walletd.add_new_address(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -469,10 +511,7 @@ class TestWalletD(TestCase):
             walletd._public_stub.PushTransaction = Mock(
                 return_value=pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED))
 
-            qaddress = walletd.add_new_address(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            walletd.add_new_address(height=8)
 
             alice_purss = get_alice_purss(4)
             bob_purss = get_bob_purss(4)
@@ -499,8 +538,8 @@ class TestWalletD(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             alice_purss = get_alice_purss(4)
             bob_purss = get_bob_purss(4)
@@ -524,8 +563,8 @@ class TestWalletD(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -547,6 +586,83 @@ class TestWalletD(TestCase):
                                                     fee=100000000,
                                                     master_qaddress=qaddress)
 
+    def test_relay_batch(self):
+        with set_pur_dir("wallet_ver1"):
+            walletd = WalletD()
+            walletd._public_stub.PushTransaction = Mock(
+                return_value=pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED))
+            walletd._public_stub.PushTransactions = Mock(
+                side_effect=lambda request, timeout: pur_pb2.PushTransactionsResp(
+                    results=[pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED)
+                             for _ in request.transactions_signed]))
+
+            qaddress = walletd.add_new_address_with_slaves(height=8)
+            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
+            slaves = walletd.get_slave_list(qaddress)
+            for slave in slaves[0]:
+                addr_state.add_slave_pks_access_type(bytes(hstr2bin(slave.pk)), 0)
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
+
+            walletd.encrypt_wallet(self.passphrase)
+            walletd.unlock_wallet(self.passphrase)
+
+            alice_purss = get_alice_purss(4)
+            transfers = [([alice_purss.qaddress], [1000000000 + i], 100000000) for i in range(5)]
+
+            with patch('pur.daemon.walletd.config.user.walletd_push_batch_size', 3):
+                results = walletd.relay_batch(transfers, qaddress)
+
+            self.assertEqual(5, len(results))
+            for (tx, error), amount in zip(results, [1000000000 + i for i in range(5)]):
+                self.assertIsNone(error)
+                self.assertEqual([amount], list(tx.transfer.amounts))
+
+            # The transfers are spread over the slaves, each one signing with its next OTS indexes
+            signers = [tx.signer_addr for tx, _ in results]
+            self.assertEqual([slaves[0][0].qaddress, slaves[0][1].qaddress, slaves[0][2].qaddress,
+                              slaves[0][0].qaddress, slaves[0][1].qaddress], signers)
+
+            slaves = walletd.get_slave_list(qaddress)
+            self.assertEqual([2, 2, 6], [slave.index for slave in slaves[0]])
+
+            # The signed transactions are pushed in batches of walletd_push_batch_size
+            self.assertEqual(2, walletd._public_stub.PushTransactions.call_count)
+            walletd._public_stub.PushTransaction.assert_not_called()
+
+    def test_relay_batch_not_enough_ots(self):
+        with set_pur_dir("wallet_ver1"):
+            walletd = WalletD()
+            walletd._public_stub.PushTransaction = Mock(
+                return_value=pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED))
+            walletd._public_stub.PushTransactions = Mock(
+                side_effect=lambda request, timeout: pur_pb2.PushTransactionsResp(
+                    results=[pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED)
+                             for _ in request.transactions_signed]))
+
+            qaddress = walletd.add_new_address_with_slaves(height=8)
+            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
+            slaves = walletd.get_slave_list(qaddress)
+            for slave_index, slave in enumerate(slaves[0]):
+                addr_state.add_slave_pks_access_type(bytes(hstr2bin(slave.pk)), 0)
+                walletd._wallet.set_slave_ots_index(0, 0, slave_index, 255)
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
+
+            alice_purss = get_alice_purss(4)
+            transfers = [([alice_purss.qaddress], [1000000000], 100000000) for _ in range(3)]
+
+            # Only the first two slaves have an unused OTS index left, the last one keeps its last 5 indexes
+            with self.assertRaises(Exception):
+                walletd.relay_batch(transfers, qaddress)
+
+            self.assertEqual([255, 255, 255], [slave.index for slave in walletd.get_slave_list(qaddress)[0]])
+            walletd._public_stub.PushTransactions.assert_not_called()
+
+            results = walletd.relay_batch(transfers[:2], qaddress)
+            self.assertEqual(2, len(results))
+            self.assertEqual([256, 256, 255], [slave.index for slave in walletd.get_slave_list(qaddress)[0]])
+
     def test_relay_transfer_txn3_by_slave(self):
         with set_pur_dir("wallet_ver1"):
             walletd = WalletD()
@@ -559,10 +675,6 @@ class TestWalletD(TestCase):
                                                 unused_ots_index_found=True))
 
             qaddress = walletd.add_new_address_with_slaves(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -591,9 +703,6 @@ class TestWalletD(TestCase):
                 return_value=pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED))
 
             qaddress = walletd.add_new_address(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
             walletd._public_stub.GetOTS = Mock(
                 return_value=pur_pb2.GetOTSResp(next_unused_ots_index=0,
                                                 unused_ots_index_found=True))
@@ -616,8 +725,8 @@ class TestWalletD(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             tx = walletd.relay_message_txn_by_slave(message='Hello pur!',
                                                     fee=100000000,
@@ -635,9 +744,6 @@ class TestWalletD(TestCase):
                 return_value=pur_pb2.GetOTSResp(next_unused_ots_index=0,
                                                 unused_ots_index_found=True))
             qaddress = walletd.add_new_address(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -668,8 +774,8 @@ class TestWalletD(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -696,9 +802,6 @@ class TestWalletD(TestCase):
                 return_value=pur_pb2.GetOTSResp(next_unused_ots_index=0,
                                                 unused_ots_index_found=True))
             qaddress = walletd.add_new_address(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
 
             alice_purss = get_alice_purss(4)
             bob_purss = get_bob_purss(4)
@@ -727,8 +830,8 @@ class TestWalletD(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             alice_purss = get_alice_purss(4)
             bob_purss = get_bob_purss(4)
@@ -756,9 +859,6 @@ class TestWalletD(TestCase):
                 return_value=pur_pb2.GetOTSResp(next_unused_ots_index=0,
                                                 unused_ots_index_found=True))
             qaddress = walletd.add_new_address(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -804,8 +904,8 @@ class TestWalletD(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -848,9 +948,6 @@ class TestWalletD(TestCase):
                                                 unused_ots_index_found=True))
 
             qaddress = walletd.add_new_address(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -897,9 +994,6 @@ class TestWalletD(TestCase):
 
             walletd.add_new_address(height=8)
             qaddress = walletd.add_new_address_with_slaves(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -940,8 +1034,8 @@ class TestWalletD(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -979,9 +1073,6 @@ class TestWalletD(TestCase):
                                                 unused_ots_index_found=True))
 
             qaddress = walletd.add_new_address(height=8)
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
@@ -1018,8 +1109,8 @@ class TestWalletD(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             walletd.encrypt_wallet(self.passphrase)
             walletd.unlock_wallet(self.passphrase)
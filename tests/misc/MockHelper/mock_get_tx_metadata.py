@@ -1,6 +1,7 @@
 # coding=utf-8
 # Distributed under the MIT software license, see the accompanying
 # file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from pur.core.TransactionMetadata import TransactionMetadata
 from pur.core.txs.Transaction import Transaction
 
 
@@ -17,5 +18,16 @@ class GetTpuretadata:
 
         return None
 
+    def get_tx_metadata_list(self, _, txhashes):
+        tx_metadata_list = []
+        for txhash in txhashes:
+            if txhash not in self.data:
+                tx_metadata_list.append(None)
+                continue
+            tx, block_number = self.data[txhash]
+            tx_metadata_list.append(TransactionMetadata.create(tx, block_number, 0))
+
+        return tx_metadata_list
+
     def remove_txhash(self, txhash):
         del self.data[txhash]
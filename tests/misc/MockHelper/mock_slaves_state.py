@@ -0,0 +1,54 @@
+# coding=utf-8
+# Distributed under the MIT software license, see the accompanying
+# file LICENSE or http://www.opensource.org/licenses/mit-license.php.
+from pypurlib.pypurlib import purHelper
+
+from pur.core.AddressState import AddressState
+from pur.generated import pur_pb2
+
+
+class MockSlavesState:
+    """
+    Answers the GetOTS and GetSlavesState requests of walletd from AddressStates.
+    """
+    def __init__(self, public_stub=None):
+        self.data = dict()
+        if public_stub is not None:
+            public_stub.GetOTS = self.GetOTS
+            public_stub.GetSlavesState = self.GetSlavesState
+
+    def put(self, address_state: AddressState):
+        self.data[address_state.address] = address_state
+
+    def get(self, address: bytes) -> AddressState:
+        if address in self.data:
+            return self.data[address]
+
+        return AddressState.get_default(address)
+
+    def GetOTS(self, request, **kwargs):
+        unused_ots_index = self.get(request.address).get_unused_ots_index(request.unused_ots_index_from)
+        if unused_ots_index is None:
+            return pur_pb2.GetOTSResp(unused_ots_index_found=False)
+        return pur_pb2.GetOTSResp(next_unused_ots_index=unused_ots_index, unused_ots_index_found=True)
+
+    def GetSlavesState(self, request, **kwargs):
+        master_address_state = self.get(request.master_address)
+        slaves_state = []
+        for slave in request.slaves:
+            slave_state = pur_pb2.SlaveState(slave_pk=slave.slave_pk)
+
+            str_slave_pk = str(slave.slave_pk)
+            if str_slave_pk in master_address_state.slave_pks_access_type:
+                slave_state.is_slave = True
+                slave_state.access_type = master_address_state.slave_pks_access_type[str_slave_pk]
+
+            slave_address = bytes(purHelper.getAddress(slave.slave_pk))
+            unused_ots_index = self.get(slave_address).get_unused_ots_index(slave.unused_ots_index_from)
+            if unused_ots_index is not None:
+                slave_state.next_unused_ots_index = unused_ots_index
+                slave_state.unused_ots_index_found = True
+
+            slaves_state.append(slave_state)
+
+        return pur_pb2.GetSlavesStateResp(slaves_state=slaves_state)
@@ -31,6 +31,7 @@ class TestMiningAPI(TestCase):
         p2p_factory.pow = Mock()
         b = Block()
         self.chain_manager = Mock(spec=ChainManager)
+        self.chain_manager.snapshot = None
         self.chain_manager.height = 0
         self.chain_manager.get_last_block = MagicMock(return_value=b)
         self.chain_manager.get_block_header_hash_by_number = MagicMock(return_value=b.headerhash)
@@ -27,7 +27,7 @@ from pur.crypto.misc import sha256
 from pur.generated import pur_pb2
 from pur.services.PublicAPIService import PublicAPIService
 from tests.blockchain.MockedBlockchain import MockedBlockchain
-from tests.misc.helper import get_alice_purss, get_bob_purss, replacement_getTime, set_pur_dir
+from tests.misc.helper import get_alice_purss, get_bob_purss, get_slave_purss, replacement_getTime, set_pur_dir
 
 
 @patch('pur.core.misc.ntp.getTime', new=replacement_getTime)
@@ -42,6 +42,7 @@ class TestPublicAPI(TestCase):
         p2p_factory.pow = Mock()
 
         chain_manager = Mock(spec=ChainManager)
+        chain_manager.snapshot = None
         chain_manager.height = 0
         chain_manager.last_block = Block()
 
@@ -65,6 +66,7 @@ class TestPublicAPI(TestCase):
         p2p_factory.pow = Mock()
 
         chain_manager = Mock(spec=ChainManager)
+        chain_manager.snapshot = None
         chain_manager.height = 0
         chain_manager.last_block = Block()
 
@@ -252,7 +254,7 @@ class TestPublicAPI(TestCase):
                 purss_pk=bob_purss.pk,
                 master_addr=alice_purss.address)
 
-            chain_manager.tx_pool.transaction_pool = [(0, TransactionInfo(tx1, 0))]
+            chain_manager.tx_pool.add_tx_to_pool(tx1, 0)
 
             context = Mock(spec=ServicerContext)
             request = pur_pb2.GetObjectReq()
@@ -397,6 +399,7 @@ class TestPublicAPI(TestCase):
         p2p_factory.pow = Mock()
 
         chain_manager = Mock(spec=ChainManager)
+        chain_manager.snapshot = None
         chain_manager.height = 0
 
         purnode = purNode(mining_address=b'')
@@ -412,6 +415,49 @@ class TestPublicAPI(TestCase):
         self.assertEqual('010600b56d161c7de8aa741962e3e49b973b7e53456fa47f2443d69f17c632f29c8b1aab7d2491',
                          bin2hstr(response.address))
 
+    def test_pushTransactions(self):
+        chain_manager = Mock(spec=ChainManager)
+        chain_manager.snapshot = None
+        chain_manager.tx_pool = Mock()
+        chain_manager.tx_pool.is_full_pending_transaction_pool = Mock(return_value=False)
+
+        p2p_factory = Mock(spec=P2PFactory)
+
+        purnode = purNode(mining_address=b'')
+        purnode.set_chain_manager(chain_manager)
+        purnode._p2pfactory = p2p_factory
+
+        service = PublicAPIService(purnode)
+
+        alice_purss = get_alice_purss()
+        bob_purss = get_bob_purss()
+        signed_tx = TransferTransaction.create(addrs_to=[bob_purss.address],
+                                               amounts=[125],
+                                               message_data=None,
+                                               fee=19,
+                                               purss_pk=alice_purss.pk)
+        signed_tx.sign(alice_purss)
+        unsigned_tx = TransferTransaction.create(addrs_to=[bob_purss.address],
+                                                 amounts=[126],
+                                                 message_data=None,
+                                                 fee=19,
+                                                 purss_pk=alice_purss.pk)
+
+        context = Mock(spec=ServicerContext)
+        request = pur_pb2.PushTransactionsReq(transactions_signed=[signed_tx.pbdata, unsigned_tx.pbdata])
+        response = service.PushTransactions(request=request, context=context)
+        context.set_code.assert_not_called()
+
+        self.assertEqual(2, len(response.results))
+        self.assertEqual(pur_pb2.PushTransactionResp.SUBMITTED, response.results[0].error_code)
+        self.assertEqual(signed_tx.txhash, response.results[0].tx_hash)
+        self.assertEqual(pur_pb2.PushTransactionResp.VALIDATION_FAILED, response.results[1].error_code)
+        p2p_factory.add_unprocessed_txn.assert_called_once()
+
+        with patch.object(PublicAPIService, 'MAX_TRANSACTIONS_QUANTITY', 1):
+            service.PushTransactions(request=request, context=context)
+            context.set_code.assert_called()
+
     def test_GetTokenTxn_Error(self):
         p2p_factory = Mock(spec=P2PFactory)
         p2p_factory.sync_state = SyncState()
@@ -419,6 +465,7 @@ class TestPublicAPI(TestCase):
         p2p_factory.pow = Mock()
 
         chain_manager = Mock(spec=ChainManager)
+        chain_manager.snapshot = None
         chain_manager.height = 0
 
         purnode = purNode(mining_address=b'')
@@ -543,7 +590,7 @@ class TestPublicAPI(TestCase):
             purss_pk=bob_purss.pk,
             master_addr=alice_purss.address)
 
-        chain_manager.tx_pool.transaction_pool = [(0, TransactionInfo(tx1, 0))]
+        chain_manager.tx_pool.add_tx_to_pool(tx1, 0)
 
         context = Mock(spec=ServicerContext)
         request = pur_pb2.GetTransactionReq()
@@ -663,6 +710,79 @@ class TestPublicAPI(TestCase):
 
             self.assertEqual(6000, response.balance)
 
+    def test_getTotalBalance_chunked(self):
+        purnode = Mock()
+        purnode.get_optimized_addresses_state.side_effect = lambda addresses: [Mock(balance=10) for _ in addresses]
+        service = PublicAPIService(purnode)
+
+        with patch.object(PublicAPIService, 'MAX_ADDRESS_STATES_QUANTITY', 2):
+            context = Mock(spec=ServicerContext)
+            request = pur_pb2.GetTotalBalanceReq(addresses=[get_alice_purss().address] * 5)
+            response = service.GetTotalBalance(request=request, context=context)
+            context.set_code.assert_not_called()
+
+        self.assertEqual(50, response.balance)
+        self.assertEqual([2, 2, 1], [len(call[0][0]) for call in purnode.get_optimized_addresses_state.call_args_list])
+
+    def test_getAddressStates_limit(self):
+        purnode = Mock()
+        purnode.get_optimized_addresses_state.side_effect = lambda addresses: [OptimizedAddressState.get_default(address)
+                                                                               for address in addresses]
+        service = PublicAPIService(purnode)
+        address = get_alice_purss().address
+
+        context = Mock(spec=ServicerContext)
+        request = pur_pb2.GetAddressStatesReq(addresses=[address] * 50000)
+        response = service.GetAddressStates(request=request, context=context)
+        context.set_code.assert_not_called()
+        self.assertEqual(50000, len(response.states))
+
+        context = Mock(spec=ServicerContext)
+        request = pur_pb2.GetAddressStatesReq(addresses=[address] * 50001)
+        service.GetAddressStates(request=request, context=context)
+        context.set_code.assert_called()
+        purnode.get_optimized_addresses_state.assert_called_once()
+
+    def test_getAddressStates(self):
+        with set_pur_dir('no_data'):
+            db_state = State()
+
+            purss1 = get_alice_purss()
+            purss2 = get_bob_purss(4)
+            address_state1 = OptimizedAddressState.create(address=purss1.address,
+                                                          nonce=25,
+                                                          balance=1000,
+                                                          ots_bitfield_used_page=0,
+                                                          transaction_hash_count=0,
+                                                          tokens_count=0,
+                                                          lattice_pk_count=0,
+                                                          slaves_count=0,
+                                                          multi_sig_address_count=0)
+            AddressState.put_address_state(db_state, address_state1)
+
+            chain_manager = ChainManager(db_state)
+
+            purnode = purNode(mining_address=b'')
+            purnode.set_chain_manager(chain_manager)
+
+            service = PublicAPIService(purnode)
+
+            context = Mock(spec=ServicerContext)
+            request = pur_pb2.GetAddressStatesReq(addresses=[purss2.address, purss1.address, purss2.address])
+            response = service.GetAddressStates(request=request, context=context)
+            context.set_code.assert_not_called()
+
+            self.assertEqual([purss2.address, purss1.address, purss2.address],
+                             [state.address for state in response.states])
+            self.assertEqual([0, 1000, 0], [state.balance for state in response.states])
+            self.assertEqual(25, response.states[1].nonce)
+
+            context = Mock(spec=ServicerContext)
+            request = pur_pb2.GetAddressStatesReq(addresses=[purss1.address, b'invalid'])
+            service.GetAddressStates(request=request, context=context)
+            context.set_code.assert_called()
+            context.set_details.assert_called()
+
     def test_getOTS(self):
         with set_pur_dir('no_data'):
             db_state = State()
@@ -705,6 +825,58 @@ class TestPublicAPI(TestCase):
 
             self.assertEqual(1, response.next_unused_ots_index)
 
+    def test_getSlavesState(self):
+        with set_pur_dir('no_data'):
+            db_state = State()
+            alice_purss = get_alice_purss()
+            bob_purss = get_bob_purss()
+            slave_purss = get_slave_purss()
+            optimized_address_state = OptimizedAddressState.get_default(bob_purss.address)
+            addresses_state = {optimized_address_state.address: optimized_address_state}
+            AddressState.put_addresses_state(db_state, addresses_state)
+
+            paginated_bitfield = PaginatedBitfield(True, db_state._db)
+            paginated_bitfield.set_ots_key(addresses_state, bob_purss.address, 0)
+            paginated_bitfield.set_ots_key(addresses_state, bob_purss.address, 2)
+            paginated_bitfield.put_addresses_bitfield(None)
+
+            db_state._db.put_raw(State.generate_slave_key(alice_purss.address, bob_purss.pk),
+                                 pur_pb2.SlaveMetadata(access_type=0).SerializeToString())
+
+            purnode = purNode(mining_address=b'')
+            purnode.set_chain_manager(ChainManager(db_state))
+            purnode._p2pfactory = Mock(spec=P2PFactory)
+
+            service = PublicAPIService(purnode)
+
+            context = Mock(spec=ServicerContext)
+            request = pur_pb2.GetSlavesStateReq(
+                master_address=alice_purss.address,
+                slaves=[pur_pb2.GetSlavesStateReq.Slave(slave_pk=bob_purss.pk, unused_ots_index_from=2),
+                        pur_pb2.GetSlavesStateReq.Slave(slave_pk=slave_purss.pk)])
+            response = service.GetSlavesState(request=request, context=context)
+            context.set_code.assert_not_called()
+
+            self.assertEqual(2, len(response.slaves_state))
+
+            bob_state = response.slaves_state[0]
+            self.assertEqual(bob_purss.pk, bob_state.slave_pk)
+            self.assertTrue(bob_state.is_slave)
+            self.assertEqual(0, bob_state.access_type)
+            self.assertTrue(bob_state.unused_ots_index_found)
+            self.assertEqual(3, bob_state.next_unused_ots_index)
+
+            slave_state = response.slaves_state[1]
+            self.assertFalse(slave_state.is_slave)
+            self.assertTrue(slave_state.unused_ots_index_found)
+            self.assertEqual(0, slave_state.next_unused_ots_index)
+
+            request = pur_pb2.GetSlavesStateReq(master_address=b'invalid',
+                                                slaves=[pur_pb2.GetSlavesStateReq.Slave(slave_pk=bob_purss.pk)])
+            service.GetSlavesState(request=request, context=context)
+            context.set_code.assert_called()
+            context.set_details.assert_called()
+
     def test_getHeight(self):
         with set_pur_dir('no_data'):
             db_state = State()
@@ -12,6 +12,7 @@ from pur.daemon.walletd import WalletD
 from pur.generated import purwallet_pb2, pur_pb2
 from pur.services.WalletAPIService import WalletAPIService
 from tests.misc.helper import get_alice_purss, get_bob_purss, set_pur_dir, replacement_getTime
+from tests.misc.MockHelper.mock_slaves_state import MockSlavesState
 
 logger.initialize_default()
 
@@ -137,9 +138,6 @@ class TestWalletAPI(TestCase):
 
             resp = service.AddNewAddress(purwallet_pb2.AddNewAddressReq(), context=None)
             qaddress = resp.address
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
             walletd._public_stub.IsSlave = Mock(
                 return_value=pur_pb2.IsSlaveResp(result=True))
             walletd._public_stub.GetOTS = Mock(
@@ -178,8 +176,8 @@ class TestWalletAPI(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             alice_purss = get_alice_purss(4)
             bob_purss = get_bob_purss(4)
@@ -195,6 +193,49 @@ class TestWalletAPI(TestCase):
             self.assertEqual(resp.code, 0)
             self.assertIsNotNone(resp.tx)
 
+    def test_relayBatch(self):
+        with set_pur_dir("wallet_ver1"):
+            walletd = WalletD()
+            walletd._public_stub.PushTransaction = Mock(
+                return_value=pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED))
+            walletd._public_stub.PushTransactions = Mock(
+                side_effect=lambda request, timeout: pur_pb2.PushTransactionsResp(
+                    results=[pur_pb2.PushTransactionResp(error_code=pur_pb2.PushTransactionResp.SUBMITTED)
+                             for _ in request.transactions_signed]))
+
+            service = WalletAPIService(walletd)
+
+            resp = service.AddNewAddressWithSlaves(purwallet_pb2.AddNewAddressWithSlavesReq(), context=None)
+            qaddress = resp.address
+            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
+            slaves = walletd.get_slave_list(qaddress)
+
+            addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
+
+            alice_purss = get_alice_purss(4)
+            bob_purss = get_bob_purss(4)
+            transfers = [purwallet_pb2.RelayBatchReq.Transfer(addresses_to=[alice_purss.qaddress],
+                                                              amounts=[1000000000],
+                                                              fee=100000000),
+                         purwallet_pb2.RelayBatchReq.Transfer(addresses_to=[bob_purss.qaddress],
+                                                              amounts=[1000000000],
+                                                              fee=100000000)]
+
+            resp = service.RelayBatch(purwallet_pb2.RelayBatchReq(master_address=qaddress,
+                                                                  transfers=transfers), context=None)
+
+            self.assertEqual(resp.code, 0)
+            self.assertEqual(2, len(resp.results))
+            for result in resp.results:
+                self.assertEqual(result.code, 0)
+                self.assertEqual(result.tx.signer_addr, slaves[0][0].qaddress)
+
+            resp = service.RelayBatch(purwallet_pb2.RelayBatchReq(master_address=alice_purss.qaddress,
+                                                                  transfers=transfers), context=None)
+            self.assertEqual(resp.code, 1)
+
     def test_relayMessageTxn(self):
         with set_pur_dir("wallet_ver1"):
             walletd = WalletD()
@@ -205,9 +246,6 @@ class TestWalletAPI(TestCase):
 
             resp = service.AddNewAddress(purwallet_pb2.AddNewAddressReq(), context=None)
             qaddress = resp.address
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
             walletd._public_stub.GetOTS = Mock(
                 return_value=pur_pb2.GetOTSResp(next_unused_ots_index=0,
                                                 unused_ots_index_found=True))
@@ -236,8 +274,8 @@ class TestWalletAPI(TestCase):
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
 
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             resp = service.RelayMessageTxnBySlave(
                 purwallet_pb2.RelayMessageTxnReq(message=b'Hello pur!',
@@ -254,9 +292,6 @@ class TestWalletAPI(TestCase):
 
             resp = service.AddNewAddress(purwallet_pb2.AddNewAddressReq(), context=None)
             qaddress = resp.address
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
             walletd._public_stub.IsSlave = Mock(
                 return_value=pur_pb2.IsSlaveResp(result=True))
             walletd._public_stub.GetOTS = Mock(
@@ -299,8 +334,8 @@ class TestWalletAPI(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             alice_purss = get_alice_purss(4)
             bob_purss = get_bob_purss(4)
@@ -327,9 +362,6 @@ class TestWalletAPI(TestCase):
 
             resp = service.AddNewAddress(purwallet_pb2.AddNewAddressReq(), context=None)
             qaddress = resp.address
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
             walletd._public_stub.IsSlave = Mock(
                 return_value=pur_pb2.IsSlaveResp(result=True))
             walletd._public_stub.GetOTS = Mock(
@@ -369,8 +401,8 @@ class TestWalletAPI(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             alice_purss = get_alice_purss(4)
             bob_purss = get_bob_purss(4)
@@ -394,9 +426,6 @@ class TestWalletAPI(TestCase):
 
             resp = service.AddNewAddress(purwallet_pb2.AddNewAddressReq(), context=None)
             qaddress = resp.address
-            addr_state = AddressState.get_default(walletd.qaddress_to_address(qaddress))
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
             walletd._public_stub.IsSlave = Mock(
                 return_value=pur_pb2.IsSlaveResp(result=True))
             walletd._public_stub.GetOTS = Mock(
@@ -434,8 +463,8 @@ class TestWalletAPI(TestCase):
             slaves = walletd.get_slave_list(qaddress)
 
             addr_state.add_slave_pks_access_type(bytes(hstr2bin(slaves[0][0].pk)), 0)
-            walletd._public_stub.GetAddressState = Mock(
-                return_value=pur_pb2.GetAddressStateResp(state=addr_state.pbdata))
+            states = MockSlavesState(walletd._public_stub)
+            states.put(addr_state)
 
             alice_purss = get_alice_purss(4)
             slave_pks = [alice_purss.pk]